@@ -0,0 +1,227 @@
+"""
+Asyncio scraping engine
+Runs the search -> candidate filter -> validate loop for every product as coroutines
+
+Features:
+- Non-blocking HTTP client (aiohttp) for both Bing searches and image validation
+- Global concurrency semaphore plus per-host limits, searches paced by an optional HostRateLimiter
+- Candidates for a query are validated concurrently, first valid one wins in rank order
+- Same fallback / placeholder behaviour as fix_product_images.scrape_category
+- Optional SearchCache / VerdictCache shared with the threaded scrapers
+- Optional ScrapeJournal: finished products are recorded and skipped on resume
+"""
+
+import asyncio
+import urllib.parse
+from collections import defaultdict
+
+import aiohttp
+
+from bing_search import SKIP_DOMAINS, build_search_url, parse_murls
+from http_pool import DEFAULT_HEADERS
+from image_validation import conditional_headers, get_verdict_cache, is_valid_response, record_verdict
+from run_trace import product_span, span
+from scrape_dedup import DedupRegistry
+from scrape_metrics import record_product, record_search, record_validation_failure, timed_request
+
+PLACEHOLDER_URL = "https://placehold.co/800x1000/1a1a1a/d4af37?text={name}"
+
+
+class AsyncScrapeEngine:
+    """Event-loop engine keeping many searches and validations in flight at once"""
+
+    def __init__(self, qft="", concurrency=64, per_host=8, search_timeout=10, validate_timeout=5,
+                 placeholder=PLACEHOLDER_URL, cache=None, journal=None, limiter=None):
+        self.qft = qft
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.search_timeout = search_timeout
+        self.validate_timeout = validate_timeout
+        self.placeholder = placeholder
+        self.cache = cache
+        self.journal = journal
+        self.limiter = limiter
+        self._session = None
+        self._semaphore = None
+        self._host_limits = None
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.per_host)
+        self._session = aiohttp.ClientSession(connector=connector, headers=DEFAULT_HEADERS)
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._host_limits = defaultdict(lambda: asyncio.Semaphore(self.per_host))
+        return self
+
+    async def __aexit__(self, *exc):
+        await self._session.close()
+
+    def _host_limit(self, url):
+        return self._host_limits[urllib.parse.urlsplit(url).hostname or ""]
+
+    async def search(self, search_term, qft=None, limit=20):
+        """Fetch a Bing results page (or its cached candidates) and return the murl list"""
+        qft = self.qft if qft is None else qft
+        if self.cache is not None:
+            urls = self.cache.get(search_term, qft)
+            if urls is not None:
+                record_search("async", cached=True)
+                return urls[:limit] if limit else urls
+
+        record_search("async")
+        url = build_search_url(search_term, qft)
+        if self.limiter is not None:
+            with span("rate_limit.wait"):
+                await self.limiter.acquire_async(url)
+        timeout = aiohttp.ClientTimeout(total=self.search_timeout)
+        with span("search.http"):
+            async with self._semaphore, self._host_limit(url):
+                with timed_request("search", url):
+                    async with self._session.get(url, timeout=timeout) as response:
+                        response.raise_for_status()
+                        page_html = await response.text()
+
+        urls = parse_murls(page_html)
+        if self.cache is not None and urls:
+            self.cache.put(search_term, qft, urls)
+        return urls[:limit] if limit else urls
+
+    async def validate(self, url):
+        """Check that an image URL answers 200 with an image content-type"""
+        with span("validate"):
+            return await self._validate(url)
+
+    async def _validate(self, url):
+        verdicts = get_verdict_cache()
+        entry = verdicts.get(url) if verdicts is not None else None
+        if entry and entry["fresh"]:
+            return entry["valid"]
+
+        headers = conditional_headers(entry)
+        timeout = aiohttp.ClientTimeout(total=self.validate_timeout)
+        try:
+            async with self._semaphore, self._host_limit(url):
+                with timed_request("validate", url):
+                    async with self._session.head(url, timeout=timeout, allow_redirects=True,
+                                                  headers=headers) as response:
+                        status, response_headers = response.status, response.headers
+        except Exception:
+            record_validation_failure()
+            if verdicts is not None:
+                verdicts.put(url, False)
+            return False
+
+        if status == 304 and headers:
+            verdicts.touch(url)
+            return True
+
+        valid = is_valid_response(status, response_headers)
+        if not valid:
+            record_validation_failure(status)
+        if verdicts is not None:
+            record_verdict(verdicts, url, valid, status, response_headers)
+        return valid
+
+    async def claim(self, used_urls, url):
+        """Claim a URL; the perceptual stage downloads the image, so it runs off the event loop"""
+        if getattr(used_urls, "near_duplicates", None) is None:
+            return used_urls.claim(url)
+        return await asyncio.to_thread(used_urls.claim, url)
+
+    async def get_image(self, search_term, used_urls, validate=True, qft=None):
+        """Async counterpart of get_bing_image: first usable, unique candidate in rank order"""
+        try:
+            candidates = await self.search(search_term, qft)
+        except Exception as e:
+            print(f"    Error searching '{search_term}': {e}")
+            return None
+
+        candidates = [
+            url for url in candidates
+            if url not in used_urls
+            and url.startswith("http")
+            and not any(domain in url.lower() for domain in SKIP_DOMAINS)
+        ]
+
+        if not validate:
+            for url in candidates:
+                if await self.claim(used_urls, url):
+                    return url
+            return None
+
+        checks = [asyncio.ensure_future(self.validate(url)) for url in candidates]
+        try:
+            for url, check in zip(candidates, checks):
+                if await check and await self.claim(used_urls, url):
+                    return url
+        finally:
+            for check in checks:
+                check.cancel()
+        return None
+
+    async def find_image(self, name, search_query, used_urls):
+        """Validated search, then the simpler unvalidated query, then the placeholder; returns (url, tier)"""
+        with span("search.primary"):
+            url = await self.get_image(search_query, used_urls, validate=True)
+        if url:
+            print(f"    ✅ {search_query}: {url[:60]}...")
+            return url, "primary"
+
+        with span("search.fallback"):
+            url = await self.get_image(f"{name} luxury", used_urls, validate=False)
+        if url:
+            print(f"    ⚠️ {search_query}: fallback {url[:60]}...")
+            return url, "fallback"
+
+        print(f"    ❌ {search_query}: using placeholder")
+        return self.placeholder.format(name=urllib.parse.quote(name)), "placeholder"
+
+    async def scrape_product(self, name, suffix, used_urls, cat_slug=None, index=None):
+        """Find an image for one product, with the simpler-query fallback and placeholder"""
+        if self.journal is not None and cat_slug is not None:
+            done = self.journal.completed(cat_slug, index, name)
+            if done:
+                return done["url"]
+
+        search_query = f"{name} {suffix}"
+
+        with product_span(cat_slug, name):
+            url, tier = await self.find_image(name, search_query, used_urls)
+        record_product(tier)
+
+        if self.journal is not None and cat_slug is not None:
+            self.journal.record(cat_slug, index, name, url, tier)
+        return url
+
+    async def scrape_category(self, category_data, used_urls):
+        """Scrape every product of a category concurrently, keeping name order"""
+        suffix = category_data["search_suffix"]
+        cat_slug = category_data.get("cat_slug")
+        return list(await asyncio.gather(*(
+            self.scrape_product(name, suffix, used_urls, cat_slug, i)
+            for i, name in enumerate(category_data["names"])
+        )))
+
+    async def scrape_products(self, products, used_urls):
+        """Scrape a whole product definition dict, e.g. WOMENS_PRODUCTS"""
+        images = await asyncio.gather(*(
+            self.scrape_category(data, used_urls) for data in products.values()
+        ))
+        return {
+            category: {**data, "images": category_images}
+            for (category, data), category_images in zip(products.items(), images)
+        }
+
+
+def scrape_all(product_groups, qft="", concurrency=64, per_host=8, used_urls=None, cache=None, journal=None,
+               limiter=None):
+    """Run the engine over several product dicts at once; returns one result dict per group"""
+    used_urls = used_urls if used_urls is not None else DedupRegistry()
+
+    async def _run():
+        async with AsyncScrapeEngine(qft=qft, concurrency=concurrency, per_host=per_host,
+                                     cache=cache, journal=journal, limiter=limiter) as engine:
+            return await asyncio.gather(*(
+                engine.scrape_products(products, used_urls) for products in product_groups
+            ))
+
+    return asyncio.run(_run())
@@ -0,0 +1,354 @@
+"""
+Offline scraper benchmark
+Runs the real search / validation / scrape / codegen code against a local stand-in for Bing Images,
+so throughput can be measured reproducibly and engines compared without touching the network
+
+The fake server (127.0.0.1, random port) serves:
+- /images/search?q=...&qft=...  a results page of a.iusc anchors with Bing-style 'm' JSON (murl)
+- /img/<token>-<rank>-<w>x<h>.png  image endpoints answering HEAD/GET with a small PNG; the size
+  follows the aspect filter so header probing sees realistic shapes
+with configurable latency, transient error rate (HTTP 503) and dead links (HTTP 404) on image requests.
+Search pages never fail: a failed HTTP search would fall back to launching Chrome.
+
+Reports p50/p95 latency per phase, products/minute for the full scrape engines and peak RSS
+    python benchmark.py --latency 20 --error-rate 0.05 --dead-rate 0.1 --json bench.json
+"""
+
+import io
+import json
+import time
+import html
+import random
+import struct
+import zlib
+import hashlib
+import argparse
+import resource
+import sys
+import threading
+import contextlib
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import bing_search
+import fix_product_images
+import scrape_category_images
+from bing_search import BingSearch, search_http
+from image_validation import validate_image_url
+from rate_limit import HostRateLimiter
+from run_trace import percentile
+from scrape_dedup import DedupRegistry
+
+RESULTS_PER_PAGE = 20
+IMAGE_BYTES = 16 * 1024
+
+# Image size served for each aspect filter (width, height)
+SHAPES = {"aspect-tall": (900, 1200), "aspect-wide": (2400, 1000)}
+DEFAULT_SHAPE = (1000, 1250)
+
+
+def png_bytes(width, height, size=IMAGE_BYTES):
+    """A PNG signature + IHDR header for the given size, padded to size bytes"""
+    ihdr = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    chunk = struct.pack(">I", len(ihdr)) + b"IHDR" + ihdr + struct.pack(">I", zlib.crc32(b"IHDR" + ihdr))
+    head = b"\x89PNG\r\n\x1a\n" + chunk
+    return head + b"\0" * max(0, size - len(head))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, content_type, body, head=False):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+    def _search(self, query):
+        params = urllib.parse.parse_qs(query)
+        term = params.get("q", [""])[0]
+        qft = params.get("qft", [""])[0]
+        width, height = next((size for name, size in SHAPES.items() if name in qft), DEFAULT_SHAPE)
+        token = hashlib.md5(f"{term}|{qft}".encode("utf-8")).hexdigest()[:12]
+        anchors = []
+        for rank in range(self.server.results):
+            murl = f"{self.server.base_url}/img/{token}-{rank}-{width}x{height}.png"
+            m_attr = html.escape(json.dumps({"murl": murl, "t": term}), quote=True)
+            anchors.append(f'<a class="iusc" href="#" m="{m_attr}"></a>')
+        return ("<html><body>" + "".join(anchors) + "</body></html>").encode("utf-8")
+
+    def _image(self, path, head):
+        name = path.rsplit("/", 1)[-1]
+        try:
+            token, rank, size = name[:-len(".png")].split("-")
+            width, height = (int(v) for v in size.split("x"))
+        except ValueError:
+            return self._send(404, "text/plain", b"not found", head)
+        if self.server.is_dead(token, rank):
+            return self._send(404, "text/plain", b"gone", head)
+        if self.server.roll_error():
+            return self._send(503, "text/plain", b"busy", head)
+        self._send(200, "image/png", png_bytes(width, height, self.server.image_bytes), head)
+
+    def _handle(self, head):
+        split = urllib.parse.urlsplit(self.path)
+        if split.path == "/images/search":
+            self.server.delay(self.server.search_latency)
+            self.server.count("search")
+            return self._send(200, "text/html; charset=utf-8", self._search(split.query), head)
+        if split.path.startswith("/img/"):
+            self.server.delay(self.server.image_latency)
+            self.server.count("image")
+            return self._image(split.path, head)
+        self._send(404, "text/plain", b"not found", head)
+
+    def do_GET(self):
+        self._handle(head=False)
+
+    def do_HEAD(self):
+        self._handle(head=True)
+
+
+class FakeImageSearchServer(ThreadingHTTPServer):
+    """Local Bing Images stand-in; run it with start() / stop() or as a context manager"""
+
+    daemon_threads = True
+
+    def __init__(self, search_latency=0.05, image_latency=0.02, jitter=0.5, error_rate=0.0, dead_rate=0.0,
+                 results=RESULTS_PER_PAGE, image_bytes=IMAGE_BYTES, seed=0):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.search_latency = search_latency
+        self.image_latency = image_latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.dead_rate = dead_rate
+        self.results = results
+        self.image_bytes = image_bytes
+        self.requests = {"search": 0, "image": 0}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    @property
+    def search_url(self):
+        return f"{self.base_url}/images/search"
+
+    def delay(self, latency):
+        if latency:
+            with self._lock:
+                factor = 1 + self.jitter * (2 * self._rng.random() - 1)
+            time.sleep(latency * factor)
+
+    def roll_error(self):
+        with self._lock:
+            return self._rng.random() < self.error_rate
+
+    def is_dead(self, token, rank):
+        # Deterministic per URL, so a dead link stays dead across requests
+        bucket = int(hashlib.md5(f"{token}-{rank}".encode("utf-8")).hexdigest()[:8], 16) / 0xFFFFFFFF
+        return bucket < self.dead_rate
+
+    def count(self, kind):
+        with self._lock:
+            self.requests[kind] += 1
+
+    def handle_error(self, request, client_address):
+        # Clients drop connections on purpose (cancelled probes, early stop); not worth a traceback
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+@contextlib.contextmanager
+def searching(server):
+    """Point every Bing search (bing_search and the async engine) at the fake server"""
+    original = bing_search.BING_IMAGES_URL
+    bing_search.BING_IMAGES_URL = server.search_url
+    try:
+        yield
+    finally:
+        bing_search.BING_IMAGES_URL = original
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def _product_queries(limit):
+    queries = [
+        f"{name} {data['search_suffix']}"
+        for products in (fix_product_images.WOMENS_PRODUCTS, fix_product_images.MENS_PRODUCTS)
+        for data in products.values() for name in data["names"]
+    ]
+    return queries[:limit] if limit else queries
+
+
+def _summary(name, timings, items=None, elapsed=None):
+    summary = {"phase": name, "count": len(timings), "p50_ms": percentile(timings, 50) * 1000,
+               "p95_ms": percentile(timings, 95) * 1000, "peak_rss_mb": peak_rss_mb()}
+    if items is not None and elapsed:
+        summary["products_per_min"] = items / elapsed * 60
+    return summary
+
+
+def bench_search(queries):
+    """fix_product_images.get_bing_image per product query (search + concurrent HEAD validation)"""
+    search = BingSearch(backend="http")
+    used_urls = DedupRegistry()
+    timings = [_timed(fix_product_images.get_bing_image, search, query, used_urls)[0] for query in queries]
+    return _summary("get_bing_image", timings)
+
+
+def bench_validate(queries):
+    """validate_image_url on every candidate of a few result pages, one at a time"""
+    urls = [url for query in queries for url in search_http(query)]
+    timings = [_timed(validate_image_url, url)[0] for url in urls]
+    return _summary("validate_image_url", timings)
+
+
+def bench_product_categories():
+    """fix_product_images.scrape_category for every category (primary + fallback search per product)"""
+    search = BingSearch(backend="http")
+    used_urls = DedupRegistry()
+    timings, products = [], 0
+    categories = list(fix_product_images.WOMENS_PRODUCTS.values()) + list(fix_product_images.MENS_PRODUCTS.values())
+    for data in categories:
+        elapsed, images = _timed(fix_product_images.scrape_category, search, data, used_urls)
+        timings.append(elapsed)
+        products += len(images)
+    return _summary("scrape_category (products)", timings, products, sum(timings))
+
+
+def bench_category_art():
+    """scrape_category_images.scrape_category (tall + wide search with header probing)"""
+    search = BingSearch(backend="http")
+    used_urls = DedupRegistry()
+    timings = [_timed(scrape_category_images.scrape_category, search, cat, queries, used_urls)[0]
+               for cat, queries in scrape_category_images.CATEGORIES.items()]
+    return _summary("scrape_category (category art)", timings)
+
+
+def bench_engine(engine, workers, concurrency, per_host):
+    """A full product scrape with the threaded (HTTP backend) or asyncio engine"""
+    if engine == "async":
+        elapsed, (womens, mens) = _timed(fix_product_images.scrape_all_products_async, concurrency=concurrency,
+                                         per_host=per_host, limiter=HostRateLimiter(0))
+    else:
+        elapsed, (womens, mens) = _timed(fix_product_images.scrape_all_products, workers=workers, backend="http",
+                                         limiter=HostRateLimiter(0))
+    products = sum(len(data["images"]) for data in list(womens.values()) + list(mens.values()))
+    return _summary(f"engine: {engine}", [elapsed], products, elapsed), (womens, mens)
+
+
+def bench_codegen(womens, mens, repeat):
+    """generate_product_modules over a scraped catalog (in memory, nothing written)"""
+    timings = [_timed(fix_product_images.generate_product_modules, womens, mens)[0] for _ in range(repeat)]
+    return _summary("generate_product_modules", timings)
+
+
+def run_benchmarks(server, queries=50, workers=4, concurrency=64, per_host=8, codegen_repeat=20, verbose=False):
+    """Run every phase against a started FakeImageSearchServer; returns the list of phase summaries"""
+    results = []
+    query_list = _product_queries(queries)
+    scraped = None
+    with searching(server):
+        phases = [
+            lambda: bench_search(query_list),
+            lambda: bench_validate(query_list[:5]),
+            bench_product_categories,
+            bench_category_art,
+        ] + [
+            lambda engine=engine: bench_engine(engine, workers, concurrency, per_host)
+            for engine in ("threads", "async")
+        ]
+        for phase in phases:
+            output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+            with output:
+                summary = phase()
+            if isinstance(summary, tuple):
+                summary, scraped = summary
+            results.append(summary)
+            print_summary(summary)
+
+    if scraped:
+        summary = bench_codegen(*scraped, codegen_repeat)
+        results.append(summary)
+        print_summary(summary)
+    return results
+
+
+def print_summary(summary):
+    line = (f"  {summary['phase']:<32} n={summary['count']:<4} "
+            f"p50 {summary['p50_ms']:9.1f} ms   p95 {summary['p95_ms']:9.1f} ms")
+    if "products_per_min" in summary:
+        line += f"   {summary['products_per_min']:8.0f} products/min"
+    print(line + f"   peak RSS {summary['peak_rss_mb']:.0f} MB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the scrapers offline against a local fake Bing Images")
+    parser.add_argument("--latency", type=float, default=50, help="search page latency in ms")
+    parser.add_argument("--image-latency", type=float, default=20, help="image request latency in ms")
+    parser.add_argument("--jitter", type=float, default=0.5, help="latency varies by up to this fraction either way")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of image requests answered with 503")
+    parser.add_argument("--dead-rate", type=float, default=0.0, help="fraction of image URLs that are dead (404)")
+    parser.add_argument("--results", type=int, default=RESULTS_PER_PAGE, help="candidates per results page")
+    parser.add_argument("--queries", type=int, default=50, help="product queries for the per-query phase")
+    parser.add_argument("--workers", type=int, default=4, help="threaded engine: parallel workers")
+    parser.add_argument("--concurrency", type=int, default=64, help="async engine: maximum requests in flight")
+    parser.add_argument("--per-host", type=int, default=8, help="async engine: maximum requests to one host")
+    parser.add_argument("--seed", type=int, default=0, help="seed for latency jitter and error injection")
+    parser.add_argument("--json", default=None, help="also write the results to this JSON file")
+    parser.add_argument("--verbose", action="store_true", help="show the scrapers' own progress output")
+    args = parser.parse_args()
+
+    server = FakeImageSearchServer(
+        search_latency=args.latency / 1000, image_latency=args.image_latency / 1000, jitter=args.jitter,
+        error_rate=args.error_rate, dead_rate=args.dead_rate, results=args.results, seed=args.seed,
+    )
+    print("="*60)
+    print("  OFFLINE SCRAPER BENCHMARK")
+    print(f"  Fake Bing at {server.base_url} (latency {args.latency:g} ms, errors {args.error_rate:.0%}, "
+          f"dead {args.dead_rate:.0%})")
+    print("="*60)
+
+    with server:
+        results = run_benchmarks(server, args.queries, args.workers, args.concurrency, args.per_host,
+                                 verbose=args.verbose)
+
+    print(f"\n  Requests served: {server.requests['search']} searches, {server.requests['image']} images")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"config": vars(args), "requests": server.requests, "phases": results}, f, indent=2)
+        print(f"  📄 Results written to {args.json}")
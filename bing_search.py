@@ -0,0 +1,156 @@
+"""
+Bing Images search backends
+Returns the ordered list of full-size image URLs ("murl") for a query
+
+Backends:
+- selenium: loads the results page in Chrome and reads the 'm' attribute of every a.iusc anchor
+  in one scripted call (dom_extract)
+- http: fetches the same page over the pooled HTTP session and parses the anchors directly,
+  falling back to Selenium only when the plain HTML yields nothing
+
+Either backend can sit behind a scrape_cache.SearchCache so repeat runs skip the network,
+and network searches are paced by a shared rate_limit.HostRateLimiter rather than fixed sleeps.
+"""
+
+import re
+import html
+import json
+import threading
+import urllib.parse
+from selenium.webdriver.support.ui import WebDriverWait
+
+from dom_extract import parse_bing_metadata, read_bing_metadata
+from http_pool import get_session
+from run_trace import span
+from scrape_metrics import record_search, timed_request
+
+BING_IMAGES_URL = "https://www.bing.com/images/search"
+
+BACKENDS = ("selenium", "http")
+
+# Hosts whose image URLs are unreliable for hotlinking
+SKIP_DOMAINS = ("pinterest", "facebook", "instagram", "tiktok")
+
+# Opening tags of the result anchors and their 'm' metadata attribute
+_IUSC_ANCHOR_RE = re.compile(r'<a\s[^>]*?class="[^"]*\biusc\b[^"]*"[^>]*>', re.IGNORECASE)
+_M_ATTR_RE = re.compile(r'\sm="([^"]*)"')
+
+
+def build_search_url(search_term, qft=""):
+    """Build a Bing Images results URL; qft is the raw filter string, e.g. '+filterui:imagesize-large'"""
+    url = f"{BING_IMAGES_URL}?q={urllib.parse.quote(search_term)}"
+    if qft:
+        url += f"&qft={qft}"
+    return url
+
+
+def parse_murls(page_html, limit=None):
+    """Extract the murl of every a.iusc anchor from a results page, in rank order"""
+    urls = []
+    for anchor in _IUSC_ANCHOR_RE.finditer(page_html):
+        match = _M_ATTR_RE.search(anchor.group(0))
+        if not match:
+            continue
+        try:
+            m_data = json.loads(html.unescape(match.group(1)))
+        except ValueError:
+            continue
+        img_url = m_data.get("murl")
+        if img_url:
+            urls.append(img_url)
+            if limit and len(urls) >= limit:
+                break
+    return urls
+
+
+def search_http(search_term, qft="", limit=None, session=None, timeout=10):
+    """Fetch a results page without a browser and return its murl candidates"""
+    session = session or get_session()
+    url = build_search_url(search_term, qft)
+    with span("search.http"), timed_request("search", url):
+        response = session.get(url, timeout=timeout)
+        response.raise_for_status()
+    return parse_murls(response.text, limit)
+
+
+def search_selenium(driver, search_term, qft="", limit=None, timeout=10, poll=0.1):
+    """Load a results page in Chrome and return its murl candidates"""
+    url = build_search_url(search_term, qft)
+    with span("driver.get"), timed_request("search", url):
+        driver.get(url)
+
+    # Return as soon as the result anchors exist instead of sleeping a fixed time; each poll is one
+    # scripted call that already returns every anchor's metadata, so there are no per-element reads
+    with span("webdriver.wait"):
+        raw_metadata = WebDriverWait(driver, timeout, poll_frequency=poll).until(
+            lambda d: read_bing_metadata(d, limit)
+        )
+    return [record["url"] for record in parse_bing_metadata(raw_metadata)]
+
+
+class BingSearch:
+    """Per-worker search client; the browser is only started if a Selenium search is needed"""
+
+    def __init__(self, driver_factory=None, backend="selenium", session=None, cache=None, limiter=None):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown search backend '{backend}' (expected one of {', '.join(BACKENDS)})")
+        self.backend = backend
+        self.cache = cache
+        self.limiter = limiter
+        self._driver_factory = driver_factory
+        self._session = session
+        self._driver = None
+        self._driver_lock = threading.Lock()
+
+    @property
+    def driver(self):
+        with self._driver_lock:
+            if self._driver is None:
+                if self._driver_factory is None:
+                    raise RuntimeError("Selenium search requested but no driver factory was given")
+                self._driver = self._driver_factory()
+            return self._driver
+
+    def candidates(self, search_term, qft="", limit=None):
+        """Return the ordered murl candidates for a query, from the cache when possible"""
+        if self.cache is not None:
+            urls = self.cache.get(search_term, qft)
+            if urls is not None:
+                record_search(self.backend, cached=True)
+                return urls[:limit] if limit else urls
+
+        urls = self._fetch(search_term, qft)
+        if self.cache is not None and urls:
+            self.cache.put(search_term, qft, urls)
+        return urls[:limit] if limit else urls
+
+    def _pace(self):
+        # Shared per-host budget replaces the old fixed sleeps between searches
+        if self.limiter is not None:
+            with span("rate_limit.wait"):
+                self.limiter.acquire(BING_IMAGES_URL)
+
+    def _fetch(self, search_term, qft):
+        self._pace()
+        if self.backend == "http":
+            try:
+                record_search("http")
+                # The whole page is already downloaded, so keep every candidate for the cache
+                urls = search_http(search_term, qft, session=self._session)
+                if urls or self._driver_factory is None:
+                    return urls
+                print("    ↪ No results over HTTP, falling back to Selenium")
+            except Exception as e:
+                if self._driver_factory is None:
+                    raise
+                print(f"    ↪ HTTP search failed ({e}), falling back to Selenium")
+            self._pace()
+        record_search("selenium")
+        # Every anchor is read in the same script call, so cache them all and let candidates() slice
+        return search_selenium(self.driver, search_term, qft)
+
+    def close(self):
+        with self._driver_lock:
+            if self._driver is not None:
+                self._driver.quit()
+                self._driver = None
@@ -0,0 +1,280 @@
+"""
+Shared Chrome profiles for the scrapers
+We only read anchor attributes on the Bing results page, so the browser doesn't need
+to render thumbnails, fonts or stylesheets
+
+Profiles:
+- visible:  maximized window, full page load (the original behaviour)
+- headless: same as visible but without a window
+- lean:     headless, 'eager' page-load strategy, images/media/fonts/CSS blocked over CDP
+
+Long-lived session: `python browser_profile.py --serve` starts one Chrome with a remote-debugging
+endpoint and leaves it running; every later create_driver() call attaches to it (in its own tab)
+instead of cold-starting a browser. `--stop` shuts it down. Set SCRAPER_BROWSER=host:port to
+attach to an endpoint started some other way.
+
+Run `python browser_profile.py --benchmark` to compare page-load times between profiles.
+"""
+
+import os
+import json
+import time
+import argparse
+import statistics
+import urllib.request
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import SessionNotCreatedException
+
+from bing_search import build_search_url
+from driver_cache import forget_chromedriver, resolve_chromedriver
+from http_pool import USER_AGENT
+
+PROFILES = {
+    "visible": {"headless": False, "page_load_strategy": "normal", "block_resources": False},
+    "headless": {"headless": True, "page_load_strategy": "normal", "block_resources": False},
+    "lean": {"headless": True, "page_load_strategy": "eager", "block_resources": True},
+}
+
+DEFAULT_PROFILE = "visible"
+
+DEFAULT_DEBUG_PORT = 9222
+DEFAULT_SESSION_PATH = os.path.join(".cache", "browser_session.json")
+SESSION_USER_DATA_DIR = os.path.join(".cache", "chrome-session")
+SESSION_ENV = "SCRAPER_BROWSER"
+
+# URL patterns blocked with Network.setBlockedURLs in the lean profile
+BLOCKED_URL_PATTERNS = [
+    "*.jpg", "*.jpeg", "*.png", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.css",
+    "*.mp4", "*.webm", "*.m3u8",
+    "*/th?id=*", "*/th/id/*",  # Bing thumbnail endpoints have no file extension
+]
+
+
+def build_options(profile=DEFAULT_PROFILE):
+    """Chrome options for a named profile"""
+    settings = PROFILES[profile]
+    chrome_options = Options()
+    chrome_options.add_argument(f"user-agent={USER_AGENT}")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--disable-notifications")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+
+    if settings["headless"]:
+        chrome_options.add_argument("--headless=new")
+    else:
+        chrome_options.add_argument("--start-maximized")
+
+    chrome_options.page_load_strategy = settings["page_load_strategy"]
+
+    if settings["block_resources"]:
+        # Belt and braces: also stop Chrome from decoding images at all
+        chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
+    return chrome_options
+
+
+def block_resources(driver, patterns=BLOCKED_URL_PATTERNS):
+    """Block subresource URL patterns at the network layer via CDP"""
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+
+
+def start_chrome(options, driver_class=webdriver.Chrome):
+    """
+    Start a driver session with the cached chromedriver
+    A driver that no longer matches Chrome (it auto-updated) fails to create a session; the cached record is
+    then dropped and the driver resolved again, once
+    """
+    try:
+        return driver_class(service=Service(resolve_chromedriver()), options=options)
+    except SessionNotCreatedException:
+        print("    ↪ Cached chromedriver can't start a session (Chrome updated?), resolving it again")
+        forget_chromedriver()
+        return driver_class(service=Service(resolve_chromedriver(ttl=0)), options=options)
+
+
+class AttachedChrome(webdriver.Chrome):
+    """Driver attached to a long-lived browser; quit() closes only its own tab and leaves the browser up"""
+
+    def quit(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+        finally:
+            self.service.stop()
+
+
+def _endpoint_alive(address, timeout=0.5):
+    try:
+        with urllib.request.urlopen(f"http://{address}/json/version", timeout=timeout) as response:
+            return response.status == 200
+    except Exception:
+        return False
+
+
+def find_session(path=DEFAULT_SESSION_PATH):
+    """Return {'address', 'profile'} of a reachable long-lived browser, or None"""
+    address = os.environ.get(SESSION_ENV)
+    if address:
+        return {"address": address, "profile": None} if _endpoint_alive(address) else None
+    try:
+        with open(path, encoding="utf-8") as f:
+            session = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return session if _endpoint_alive(session["address"]) else None
+
+
+def attach_driver(address, profile=DEFAULT_PROFILE, session_profile=None):
+    """Attach to a running browser through its remote-debugging endpoint, in a fresh tab"""
+    chrome_options = Options()
+    chrome_options.debugger_address = address
+    chrome_options.page_load_strategy = PROFILES[profile]["page_load_strategy"]
+
+    driver = start_chrome(chrome_options, AttachedChrome)
+    driver.switch_to.new_window("tab")
+    # CDP blocking is per tab, so re-apply it for lean requests or a lean daemon
+    if PROFILES[profile]["block_resources"] or (session_profile and PROFILES[session_profile]["block_resources"]):
+        block_resources(driver)
+    return driver
+
+
+def create_driver(profile=DEFAULT_PROFILE, attach=True):
+    """Start Chrome with the given profile, or attach to the long-lived session when one is running"""
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown browser profile '{profile}' (expected one of {', '.join(PROFILES)})")
+
+    session = find_session() if attach else None
+    if session:
+        try:
+            return attach_driver(session["address"], profile, session.get("profile"))
+        except Exception as e:
+            print(f"    ↪ Could not attach to browser at {session['address']} ({e}), starting a new one")
+
+    driver = start_chrome(build_options(profile))
+
+    if PROFILES[profile]["block_resources"]:
+        block_resources(driver)
+    return driver
+
+
+def serve_browser(profile="headless", port=DEFAULT_DEBUG_PORT, path=DEFAULT_SESSION_PATH):
+    """Start a detached Chrome with a remote-debugging endpoint and record it for later runs"""
+    session = find_session(path)
+    if session:
+        print(f"🟢 Browser already running at {session['address']}")
+        return session["address"]
+
+    chrome_options = build_options(profile)
+    chrome_options.add_argument(f"--remote-debugging-port={port}")
+    chrome_options.add_argument(f"--user-data-dir={os.path.abspath(SESSION_USER_DATA_DIR)}")
+    # Keep Chrome alive after chromedriver exits
+    chrome_options.add_experimental_option("detach", True)
+
+    driver = start_chrome(chrome_options)
+    driver.service.stop()
+
+    address = f"127.0.0.1:{port}"
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"address": address, "profile": profile, "started_at": time.time()}, f, indent=2)
+    print(f"🟢 Browser ({profile}) listening at {address}; scrapers will attach to it")
+    return address
+
+
+def stop_browser(path=DEFAULT_SESSION_PATH):
+    """Close the long-lived browser and forget it"""
+    session = find_session(path)
+    if session:
+        chrome_options = Options()
+        chrome_options.debugger_address = session["address"]
+        driver = start_chrome(chrome_options)
+        try:
+            driver.execute_cdp_cmd("Browser.close", {})
+        except Exception:
+            pass
+        finally:
+            driver.service.stop()
+        print(f"🔴 Stopped browser at {session['address']}")
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def _transferred_kb(driver):
+    """Bytes the page pulled over the network according to the Resource Timing API"""
+    total = driver.execute_script(
+        "return performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'))"
+        ".reduce((sum, e) => sum + (e.transferSize || 0), 0);"
+    )
+    return (total or 0) / 1024
+
+
+def benchmark_profiles(queries, profiles=tuple(PROFILES), qft="+filterui:imagesize-large"):
+    """Load the same Bing result pages under each profile and report time-to-anchors and bytes transferred"""
+    results = {}
+    for profile in profiles:
+        print(f"\n⏱️  Profile: {profile}")
+        startup = time.perf_counter()
+        driver = create_driver(profile, attach=False)
+        startup = time.perf_counter() - startup
+        timings, transferred = [], []
+        try:
+            for query in queries:
+                start = time.perf_counter()
+                driver.get(build_search_url(query, qft))
+                WebDriverWait(driver, 10, poll_frequency=0.05).until(
+                    lambda d: d.find_elements(By.CSS_SELECTOR, "a.iusc")
+                )
+                timings.append(time.perf_counter() - start)
+                transferred.append(_transferred_kb(driver))
+                print(f"    {query[:40]:<40} {timings[-1]:.2f}s  {transferred[-1]:.0f} KB")
+        finally:
+            driver.quit()
+        results[profile] = {"startup": startup, "timings": timings, "transferred": transferred}
+
+    print("\n" + "=" * 72)
+    print(f"  {'PROFILE':<10} {'STARTUP':>8} {'MEAN':>8} {'P50':>8} {'MAX':>8} {'KB/PAGE':>10}")
+    print("=" * 72)
+    for profile, r in results.items():
+        if not r["timings"]:
+            continue
+        print(f"  {profile:<10} {r['startup']:>7.2f}s {statistics.mean(r['timings']):>7.2f}s "
+              f"{statistics.median(r['timings']):>7.2f}s {max(r['timings']):>7.2f}s "
+              f"{statistics.mean(r['transferred']):>10.0f}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage the scrapers' Chrome profiles and long-lived session")
+    parser.add_argument("--serve", action="store_true", help="start a long-lived browser that later runs attach to")
+    parser.add_argument("--stop", action="store_true", help="stop the long-lived browser")
+    parser.add_argument("--port", type=int, default=DEFAULT_DEBUG_PORT, help="remote-debugging port for --serve")
+    parser.add_argument("--profile", choices=PROFILES, default="headless", help="profile of the --serve browser")
+    parser.add_argument("--benchmark", action="store_true", help="run the page-load benchmark")
+    parser.add_argument("--profiles", nargs="+", choices=PROFILES, default=list(PROFILES))
+    parser.add_argument("--queries", nargs="+", default=[
+        "Quilted Shoulder Bag luxury leather women",
+        "Diamond Bracelet luxury gold jewelry",
+        "Chronograph Elite luxury mens watch",
+        "Silk Midi Dress luxury fashion women",
+        "Leather Briefcase luxury mens leather",
+    ])
+    args = parser.parse_args()
+
+    if args.serve:
+        serve_browser(args.profile, args.port)
+    elif args.stop:
+        stop_browser()
+    elif args.benchmark:
+        benchmark_profiles(args.queries, args.profiles)
+    else:
+        parser.print_help()
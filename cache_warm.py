@@ -0,0 +1,152 @@
+"""
+Redis cache warming for the product API
+After a catalog sync, computes the responses of the cached product routes and writes them under the
+exact keys server/middleware/redisMiddleware.js reads (cache:<originalUrl>), so the first visitors
+after a refresh don't all fall through to a cold MongoDB
+
+- Payloads come from the same queries the controllers run (server/controllers/productController.js),
+  serialized the way Express/Mongoose would (ObjectIds as hex, dates as ISO strings, category populated)
+- Stale cache:/api/products* keys from the previous catalog are dropped
+- Writes are pipelined in batches; works against redis-server or fakeredis
+"""
+
+import os
+import json
+import argparse
+import datetime
+import math
+
+import redis
+from bson import ObjectId
+
+import catalog_db
+
+DEFAULT_REDIS_URI = "redis://127.0.0.1:6379"
+# cacheMiddleware(3600) on every product route
+CACHE_TTL = 3600
+CACHE_PREFIX = "cache:"
+PRODUCTS_ROUTE = "/api/products"
+BATCH_SIZE = 500
+
+# Controller defaults: getProducts limit 12, featured / new arrivals limit 8
+PAGE_SIZE = 12
+HIGHLIGHT_LIMIT = 8
+
+# Schema defaults Mongoose fills in for paths missing from a stored document
+PRODUCT_DEFAULTS = {
+    "compareAtPrice": 0, "images": [], "stock": 0, "isNew": False, "isFeatured": False, "isActive": True,
+    "rating": 0, "numReviews": 0, "tags": [], "specifications": [],
+}
+
+
+def connect(uri=None):
+    return redis.Redis.from_url(uri or os.environ.get("REDIS_URI") or DEFAULT_REDIS_URI)
+
+
+def _json_value(value):
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, datetime.datetime):
+        # JavaScript Date#toJSON: UTC with millisecond precision
+        if value.tzinfo is not None:
+            value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        return value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}Z"
+    if isinstance(value, dict):
+        return {key: _json_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_json_value(item) for item in value]
+    return value
+
+
+def serialize_product(doc, categories):
+    """A product as res.json() sends it after .populate('category', 'name slug')"""
+    product = dict(doc)
+    for key, default in PRODUCT_DEFAULTS.items():
+        product.setdefault(key, default)
+    product["category"] = categories.get(doc.get("category"))
+    return _json_value(product)
+
+
+def cache_key(path):
+    return f"{CACHE_PREFIX}{path}"
+
+
+def _encode(body):
+    # Same bytes JSON.stringify produces
+    return json.dumps(body, ensure_ascii=False, separators=(",", ":"))
+
+
+def product_payloads(db, page_size=PAGE_SIZE, highlight_limit=HIGHLIGHT_LIMIT):
+    """{cache key: JSON body} for the product list pages, featured, new arrivals and every product by slug / id"""
+    categories = {doc["_id"]: {"_id": doc["_id"], "name": doc.get("name"), "slug": doc.get("slug")}
+                  for doc in db.categories.find({}, {"name": 1, "slug": 1})}
+    payloads = {}
+
+    # getProducts: { isActive: true } sorted by createdAt desc, paginated
+    active = {"isActive": True}
+    total = db.products.count_documents(active)
+    pages = math.ceil(total / page_size)
+    for page in range(1, max(pages, 1) + 1):
+        docs = db.products.find(active).sort("createdAt", -1).skip((page - 1) * page_size).limit(page_size)
+        body = {
+            "success": True,
+            "data": [serialize_product(doc, categories) for doc in docs],
+            "pagination": {"page": page, "limit": page_size, "total": total, "pages": pages},
+        }
+        if page == 1:
+            payloads[cache_key(PRODUCTS_ROUTE)] = _encode(body)
+        payloads[cache_key(f"{PRODUCTS_ROUTE}?page={page}")] = _encode(body)
+
+    # getFeaturedProducts / getNewArrivals
+    featured = db.products.find({"isFeatured": True, "isActive": True}).limit(highlight_limit)
+    payloads[cache_key(f"{PRODUCTS_ROUTE}/featured")] = _encode(
+        {"success": True, "data": [serialize_product(doc, categories) for doc in featured]}
+    )
+    new = db.products.find({"isNew": True, "isActive": True}).sort("createdAt", -1).limit(highlight_limit)
+    payloads[cache_key(f"{PRODUCTS_ROUTE}/new")] = _encode(
+        {"success": True, "data": [serialize_product(doc, categories) for doc in new]}
+    )
+
+    # getProductBySlug / getProduct (no isActive filter on either)
+    for doc in db.products.find({}):
+        body = _encode({"success": True, "data": serialize_product(doc, categories)})
+        if doc.get("slug"):
+            payloads[cache_key(f"{PRODUCTS_ROUTE}/slug/{doc['slug']}")] = body
+        payloads[cache_key(f"{PRODUCTS_ROUTE}/{doc['_id']}")] = body
+    return payloads
+
+
+def warm_cache(client, payloads, ttl=CACHE_TTL, batch_size=BATCH_SIZE):
+    """
+    Replace every cached product response with payloads; returns {'written', 'dropped'}
+    Cached variants we don't recompute (other sorts, filters, searches) would be stale, so they are dropped
+    """
+    stale = [key for key in client.scan_iter(match=f"{CACHE_PREFIX}{PRODUCTS_ROUTE}*", count=batch_size)
+             if (key.decode("utf-8") if isinstance(key, bytes) else key) not in payloads]
+    for start in range(0, len(stale), batch_size):
+        client.delete(*stale[start:start + batch_size])
+
+    items = list(payloads.items())
+    for start in range(0, len(items), batch_size):
+        pipe = client.pipeline(transaction=False)
+        for key, body in items[start:start + batch_size]:
+            pipe.set(key, body, ex=ttl)
+        pipe.execute()
+    return {"written": len(items), "dropped": len(stale)}
+
+
+def warm_from_db(db, client, ttl=CACHE_TTL):
+    totals = warm_cache(client, product_payloads(db), ttl)
+    print(f"  🔥 Redis: {totals['written']} product responses cached, {totals['dropped']} stale keys dropped")
+    return totals
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Warm the product API cache in Redis from MongoDB")
+    parser.add_argument("--mongo-uri", default=None, help="MongoDB URI (default: $MONGODB_URI or localhost)")
+    parser.add_argument("--redis-uri", default=None, help="Redis URI (default: $REDIS_URI or localhost)")
+    parser.add_argument("--ttl", type=int, default=CACHE_TTL, help="seconds a warmed response stays cached")
+    args = parser.parse_args()
+
+    print("\n🔥 Warming the product API cache...")
+    warm_from_db(catalog_db.connect(args.mongo_uri), connect(args.redis_uri), args.ttl)
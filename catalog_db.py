@@ -0,0 +1,220 @@
+"""
+MongoDB sink for the scraped catalog
+Upserts categories and products straight into the collections behind server/models/Category.js
+and server/models/Product.js, so a catalog refresh reaches the API in the same run
+
+- Batched bulk_write of UpdateOne(upsert=True), ordered=False (the server applies a batch in one
+  round trip and one bad document doesn't stop the rest)
+- Documents are matched the way the server identifies them: categories by their unique name, products
+  by (categoryName, name). Slugs are only written on insert, with the Mongoose pre-save slug function,
+  so documents seeded by server/seeders or created in the admin UI keep their slug (and URL)
+- Products are built by product_codegen.build_catalogs, so the API serves the same precomputed
+  prices / ratings / stock as the static src/data modules
+- Works against anything with the pymongo Database API (a real mongod or mongomock)
+"""
+
+import os
+import re
+import argparse
+from datetime import datetime, timezone
+
+from pymongo import ASCENDING, MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError
+
+import fix_product_images
+from product_codegen import CATALOG_SEED, build_catalogs, read_generated_images, read_generated_mirrored
+
+DEFAULT_MONGODB_URI = "mongodb://localhost:27017/lumiere"
+DEFAULT_DB_NAME = "lumiere"
+BATCH_SIZE = 500
+
+# Only used when a category document is first created; edits made through the admin UI are kept
+CATEGORY_DESCRIPTIONS = {
+    "handbags": "Elegant designer handbags for the modern woman",
+    "jewelry": "Exquisite fine jewelry and accessories",
+    "shoes": "Luxury footwear for every occasion",
+    "dresses": "Stunning designer dresses for all occasions",
+    "accessories": "Premium accessories to complete your look",
+    "fragrances": "Captivating scents for every personality",
+    "mens-watches": "Luxury timepieces for the distinguished gentleman",
+    "mens-bags": "Premium leather briefcases and messenger bags",
+    "mens-shoes": "Sophisticated footwear for every occasion",
+    "mens-suits": "Bespoke suits and designer blazers",
+    "mens-accessories": "Luxury ties, cufflinks, wallets and belts",
+}
+
+# Product fields stored in MongoDB (the rest of a MockProduct only exists in the static build)
+PRODUCT_FIELDS = (
+    "name", "description", "price", "compareAtPrice", "categoryName", "images", "image",
+    "stock", "isNew", "isFeatured", "isActive", "rating", "numReviews", "tags",
+)
+
+# Fields that identify an existing document
+CATEGORY_KEY = ("name",)
+PRODUCT_KEY = ("categoryName", "name")
+
+
+def connect(uri=None):
+    """Database named in the URI (MONGODB_URI by default), falling back to 'lumiere'"""
+    client = MongoClient(uri or os.environ.get("MONGODB_URI") or DEFAULT_MONGODB_URI)
+    return client.get_default_database(default=DEFAULT_DB_NAME)
+
+
+def server_slug(name):
+    """The slug Category / Product pre('save') hooks derive from a name, e.g. "Men's Watches" -> men-s-watches"""
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def ensure_indexes(db):
+    """Mongoose declares the unique indexes; the compound one keeps the product upsert filter indexed"""
+    db.categories.create_index([("name", ASCENDING)], unique=True)
+    db.categories.create_index([("slug", ASCENDING)], unique=True)
+    db.products.create_index([("slug", ASCENDING)], unique=True)
+    db.products.create_index([("categoryName", ASCENDING), ("name", ASCENDING)])
+
+
+def document_key(doc, key):
+    return tuple(doc[field] for field in key)
+
+
+def insert_slugs(collection, docs, key, prefix=None):
+    """
+    {key: slug} for the docs that don't exist in the collection yet
+    Slugs are server_slug(name), unique against the collection and each other; a taken slug is tried with
+    prefix(doc) in front (e.g. the category), then with a counter
+    """
+    existing = set()
+    taken = set()
+    for doc in collection.find({}, {**{field: 1 for field in key}, "slug": 1}):
+        if all(field in doc for field in key):
+            existing.add(document_key(doc, key))
+        if doc.get("slug"):
+            taken.add(doc["slug"])
+
+    slugs = {}
+    for doc in docs:
+        doc_key = document_key(doc, key)
+        if doc_key in existing or doc_key in slugs:
+            continue
+        base = server_slug(doc["name"])
+        candidates = [base] + ([f"{server_slug(prefix(doc))}-{base}"] if prefix else [])
+        slug = next((candidate for candidate in candidates if candidate not in taken), None)
+        counter = 2
+        while slug is None:
+            candidate = f"{candidates[-1]}-{counter}"
+            slug = candidate if candidate not in taken else None
+            counter += 1
+        taken.add(slug)
+        slugs[doc_key] = slug
+    return slugs
+
+
+def bulk_upsert(collection, docs, key, batch_size=BATCH_SIZE, now=None, insert_only=None):
+    """
+    Upsert docs matched on the key fields in unordered batches; returns {'matched', 'modified', 'upserted', 'errors'}
+    insert_only maps a doc's key values -> fields written only when the document is created
+    """
+    now = now or datetime.now(timezone.utc)
+    insert_only = insert_only or {}
+    totals = {"matched": 0, "modified": 0, "upserted": 0, "errors": 0}
+    ops = [
+        UpdateOne(
+            {field: doc[field] for field in key},
+            {"$set": {**doc, "updatedAt": now},
+             "$setOnInsert": {**insert_only.get(document_key(doc, key), {}), "createdAt": now, "__v": 0}},
+            upsert=True,
+        )
+        for doc in docs
+    ]
+    for start in range(0, len(ops), batch_size):
+        try:
+            result = collection.bulk_write(ops[start:start + batch_size], ordered=False)
+            details = result.bulk_api_result
+        except BulkWriteError as e:
+            details = e.details
+            for error in details.get("writeErrors", []):
+                print(f"    ❌ {collection.name}: {error.get('errmsg')}")
+            totals["errors"] += len(details.get("writeErrors", []))
+        totals["matched"] += details.get("nMatched", 0)
+        totals["modified"] += details.get("nModified", 0)
+        totals["upserted"] += details.get("nUpserted", 0)
+    return totals
+
+
+def category_documents(womens_data, mens_data, category_images=None):
+    """Category docs for every product category; category_images is scrape_categories() output"""
+    category_images = category_images or {}
+    docs = []
+    for data in (womens_data, mens_data):
+        for cat_data in data.values():
+            doc = {"name": cat_data["cat_name"], "isActive": True, "productCount": len(cat_data["names"])}
+            image = category_images.get(cat_data["cat_slug"], {}).get("image")
+            if image:
+                doc["image"] = image
+            docs.append(doc)
+    return docs
+
+
+def product_documents(catalog, category_ids):
+    """Product docs from build_catalogs output, with the category reference (looked up by name) as an ObjectId"""
+    docs = []
+    for products in catalog.values():
+        for product in products:
+            doc = {field: product[field] for field in PRODUCT_FIELDS if field in product}
+            # The schema defaults compareAtPrice to 0 when there's no discount
+            doc.setdefault("compareAtPrice", 0)
+            doc["category"] = category_ids[product["category"]["name"]]
+            docs.append(doc)
+    return docs
+
+
+def sync_catalog(db, womens_data, mens_data, category_images=None, mirrored=None, seed=CATALOG_SEED,
+                 batch_size=BATCH_SIZE):
+    """
+    Upsert categories, then the products of every category that carries scraped "images"
+    Returns {'categories': totals, 'products': totals}
+    """
+    now = datetime.now(timezone.utc)
+    ensure_indexes(db)
+
+    categories = category_documents(womens_data, mens_data, category_images)
+    descriptions = {cat_data["cat_name"]: CATEGORY_DESCRIPTIONS.get(cat_data["cat_slug"], "")
+                    for data in (womens_data, mens_data) for cat_data in data.values()}
+    insert_only = {}
+    for doc_key, slug in insert_slugs(db.categories, categories, CATEGORY_KEY).items():
+        insert_only[doc_key] = {"slug": slug, "description": descriptions[doc_key[0]]}
+    for doc in categories:
+        if "image" not in doc and document_key(doc, CATEGORY_KEY) in insert_only:
+            insert_only[document_key(doc, CATEGORY_KEY)]["image"] = ""
+    category_totals = bulk_upsert(db.categories, categories, CATEGORY_KEY, batch_size, now, insert_only)
+    category_ids = {
+        doc["name"]: doc["_id"]
+        for doc in db.categories.find({"name": {"$in": [c["name"] for c in categories]}}, {"name": 1})
+    }
+
+    womens_catalog, mens_catalog = build_catalogs(womens_data, mens_data, mirrored, seed)
+    products = product_documents({**womens_catalog, **mens_catalog}, category_ids)
+    insert_only = {doc_key: {"slug": slug}
+                   for doc_key, slug in insert_slugs(db.products, products, PRODUCT_KEY,
+                                                     prefix=lambda doc: doc["categoryName"]).items()}
+    product_totals = bulk_upsert(db.products, products, PRODUCT_KEY, batch_size, now, insert_only)
+    return {"categories": category_totals, "products": product_totals}
+
+
+def print_totals(totals):
+    for name, counts in totals.items():
+        print(f"  🗄️  {name}: {counts['upserted']} inserted, {counts['matched']} updated, {counts['errors']} failed")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Upsert the current generated catalog into MongoDB")
+    parser.add_argument("--mongo-uri", default=None, help="MongoDB URI (default: $MONGODB_URI or localhost)")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="operations per bulk_write")
+    args = parser.parse_args()
+
+    womens = read_generated_images(fix_product_images.WOMENS_PRODUCTS)
+    mens = read_generated_images(fix_product_images.MENS_PRODUCTS)
+
+    print("\n🗄️  Syncing catalog to MongoDB...")
+    mirrored = read_generated_mirrored(fix_product_images.WOMENS_PRODUCTS, fix_product_images.MENS_PRODUCTS)
+    print_totals(sync_catalog(connect(args.mongo_uri), womens, mens, mirrored=mirrored, batch_size=args.batch_size))
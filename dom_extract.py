@@ -0,0 +1,78 @@
+"""
+Bulk extraction of image-result metadata from a loaded results page
+One execute_script call returns every candidate on the page, instead of find_elements followed by a
+WebDriver round trip per element (get_attribute, click + wait)
+
+- Bing: the 'm' JSON of every a.iusc anchor, parsed into records
+- Google Images: the full-size [url, height, width] entries embedded in the page's inline result data,
+  after any large preview <img> already in the DOM
+Records: {'url', 'thumbnail', 'page', 'title', 'width', 'height'} (fields the page doesn't carry are None)
+"""
+
+import json
+
+# Raw 'm' attribute of every result anchor, in rank order (arguments[0] caps the count)
+_BING_SCRIPT = """
+const anchors = Array.from(document.querySelectorAll('a.iusc'));
+return (arguments[0] ? anchors.slice(0, arguments[0]) : anchors).map(a => a.getAttribute('m'));
+"""
+
+# Preview srcs, then every http(s) [url, height, width] triple in the inline scripts (URLs still JSON-escaped)
+_GOOGLE_SCRIPT = r"""
+const previews = Array.from(document.querySelectorAll('img.sFlh5c'), img => [img.src, null, null]);
+const pattern = /\["(https?:\/\/[^"]+)",(\d+),(\d+)\]/g;
+const found = [];
+for (const script of document.scripts) {
+    for (const match of script.textContent.matchAll(pattern)) {
+        found.push([match[1], Number(match[2]), Number(match[3])]);
+    }
+}
+return previews.concat(found);
+"""
+
+# Thumbnail hosts; only the original image is worth downloading
+_THUMBNAIL_MARKERS = ("encrypted-tbn", "gstatic.com")
+
+
+def _record(url, thumbnail=None, page=None, title=None, width=None, height=None):
+    return {"url": url, "thumbnail": thumbnail, "page": page, "title": title, "width": width, "height": height}
+
+
+def read_bing_metadata(driver, limit=None):
+    """Raw 'm' attributes of the a.iusc anchors (empty until the results render, so usable as a wait condition)"""
+    return driver.execute_script(_BING_SCRIPT, limit or 0) or []
+
+
+def parse_bing_metadata(raw_metadata):
+    """Records for the anchors whose 'm' JSON carries a murl"""
+    records = []
+    for m_attr in raw_metadata:
+        if not m_attr:
+            continue
+        try:
+            m_data = json.loads(m_attr)
+        except ValueError:
+            continue
+        if m_data.get("murl"):
+            records.append(_record(m_data["murl"], m_data.get("turl"), m_data.get("purl"), m_data.get("t")))
+    return records
+
+
+def _unescape(url):
+    try:
+        return json.loads(f'"{url}"')
+    except ValueError:
+        return url
+
+
+def google_image_records(driver):
+    """Full-size image candidates of a Google Images results page, deduplicated, previews first"""
+    records = []
+    seen = set()
+    for url, height, width in driver.execute_script(_GOOGLE_SCRIPT) or []:
+        url = _unescape(url or "")
+        if not url.startswith("http") or url in seen or any(marker in url for marker in _THUMBNAIL_MARKERS):
+            continue
+        seen.add(url)
+        records.append(_record(url, width=width, height=height))
+    return records
@@ -0,0 +1,154 @@
+"""
+High-throughput parallel downloader
+Takes (url, destination) pairs and fetches them concurrently over the pooled session
+
+- Large chunks (1 MB) so a download costs a handful of Python iterations per MB
+- Partial files (<dest>.part) are resumed with an HTTP Range request; If-Range makes the
+  server send the whole file instead if it changed in the meantime, and a 206 whose Content-Range
+  doesn't start where the partial file ends is discarded (the next attempt starts from zero)
+- Retries with exponential backoff, continuing from whatever already arrived
+- SHA-256 computed while streaming; the finished file is renamed into place atomically
+"""
+
+import os
+import json
+import time
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+from http_pool import get_session
+
+CHUNK_SIZE = 1024 * 1024
+DEFAULT_WORKERS = 16
+DEFAULT_RETRIES = 3
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Response headers passed back to callers (e.g. the image store's type sniffing and revalidation)
+KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+class DownloadError(Exception):
+    pass
+
+
+def _read_validator(meta_path):
+    try:
+        with open(meta_path, encoding="utf-8") as f:
+            return json.load(f).get("validator")
+    except (OSError, ValueError):
+        return None
+
+
+def _write_validator(meta_path, validator):
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump({"validator": validator}, f)
+
+
+def _hash_existing(path, sha256):
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            sha256.update(chunk)
+
+
+def _range_start(content_range):
+    """First byte of a 'bytes start-end/total' Content-Range, or None if it can't be parsed"""
+    try:
+        unit, spec = content_range.split(" ", 1)
+        return int(spec.split("-", 1)[0]) if unit == "bytes" else None
+    except (AttributeError, ValueError):
+        return None
+
+
+def _discard_partial(part_path, meta_path):
+    for path in (part_path, meta_path):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _attempt(url, dest, session, timeout, chunk_size):
+    """One pass at a download, resuming <dest>.part when possible; returns (status, size, sha256, headers)"""
+    part_path = f"{dest}.part"
+    meta_path = f"{dest}.part.json"
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    validator = _read_validator(meta_path) if offset else None
+
+    # Ranges only make sense on the raw bytes, so don't let the server compress them
+    headers = {"Accept-Encoding": "identity"}
+    if offset and validator:
+        headers["Range"] = f"bytes={offset}-"
+        headers["If-Range"] = validator
+
+    with session.get(url, headers=headers, timeout=timeout, stream=True) as response:
+        if response.status_code in RETRY_STATUSES:
+            raise DownloadError(f"HTTP {response.status_code}")
+        if response.status_code == 416:
+            # Our partial file no longer matches the resource; start over next attempt
+            os.remove(part_path)
+            raise DownloadError("HTTP 416")
+        kept = {name: response.headers[name] for name in KEPT_HEADERS if name in response.headers}
+        if response.status_code not in (200, 206):
+            return response.status_code, None, None, kept
+
+        if response.status_code == 206 and _range_start(response.headers.get("Content-Range")) != offset:
+            # Appending would corrupt the file; start over next attempt
+            _discard_partial(part_path, meta_path)
+            raise DownloadError(f"Content-Range {response.headers.get('Content-Range')!r} doesn't resume at {offset}")
+
+        sha256 = hashlib.sha256()
+        if response.status_code == 206:
+            _hash_existing(part_path, sha256)
+            mode, size = "ab", offset
+        else:
+            mode, size = "wb", 0
+            new_validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+            if new_validator:
+                _write_validator(meta_path, new_validator)
+            elif os.path.exists(meta_path):
+                os.remove(meta_path)
+
+        with open(part_path, mode) as f:
+            for chunk in response.iter_content(chunk_size):
+                sha256.update(chunk)
+                f.write(chunk)
+                size += len(chunk)
+
+    os.replace(part_path, dest)
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+    return response.status_code, size, sha256.hexdigest(), kept
+
+
+def download_file(url, dest, session=None, timeout=30, retries=DEFAULT_RETRIES, chunk_size=CHUNK_SIZE):
+    """Download one URL to dest; returns {'url', 'dest', 'ok', 'status', 'size', 'sha256', 'headers', 'error'}"""
+    session = session or get_session()
+    directory = os.path.dirname(dest)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    result = {"url": url, "dest": dest, "ok": False, "status": None, "size": None, "sha256": None, "headers": {},
+              "error": None}
+    for attempt in range(retries + 1):
+        try:
+            status, size, digest, headers = _attempt(url, dest, session, timeout, chunk_size)
+            result.update(status=status, size=size, sha256=digest, headers=headers, ok=digest is not None, error=None)
+            if digest is None:
+                result["error"] = f"HTTP {status}"
+            return result
+        except Exception as e:
+            result["error"] = str(e)
+            if attempt < retries:
+                time.sleep(0.5 * 2 ** attempt)
+    return result
+
+
+def download_many(pairs, workers=DEFAULT_WORKERS, session=None, timeout=30, retries=DEFAULT_RETRIES,
+                  chunk_size=CHUNK_SIZE):
+    """Download (url, dest) pairs concurrently; results come back in input order"""
+    pairs = list(pairs)
+    if not pairs:
+        return []
+    session = session or get_session()
+    with ThreadPoolExecutor(max_workers=min(workers, len(pairs))) as executor:
+        return list(executor.map(
+            lambda pair: download_file(pair[0], pair[1], session, timeout, retries, chunk_size), pairs
+        ))
@@ -0,0 +1,67 @@
+"""
+Cached chromedriver resolution
+ChromeDriverManager().install() checks the latest release online on every call;
+this remembers the resolved binary locally and only re-resolves when it is stale,
+missing, or the pinned version changes
+
+Pin a version with the CHROMEDRIVER_VERSION environment variable (e.g. "120.0.6099.109").
+When Chrome auto-updates past the cached driver, browser_profile drops the record (forget_chromedriver)
+and resolves again.
+"""
+
+import os
+import json
+import time
+import threading
+from webdriver_manager.chrome import ChromeDriverManager
+
+DEFAULT_DRIVER_CACHE_PATH = os.path.join(".cache", "chromedriver.json")
+DEFAULT_DRIVER_CACHE_TTL = 7 * 24 * 3600
+
+_lock = threading.Lock()
+
+
+def _read_entry(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_entry(path, entry):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(entry, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def forget_chromedriver(path=DEFAULT_DRIVER_CACHE_PATH):
+    """Drop the local record, e.g. after the cached driver no longer matches the installed Chrome"""
+    with _lock:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def resolve_chromedriver(version=None, path=DEFAULT_DRIVER_CACHE_PATH, ttl=DEFAULT_DRIVER_CACHE_TTL):
+    """Return a chromedriver binary path, resolving it online only when the local record can't be used"""
+    version = version or os.environ.get("CHROMEDRIVER_VERSION") or None
+    with _lock:
+        entry = _read_entry(path)
+        if (
+            entry
+            and entry.get("version") == version
+            and os.path.exists(entry.get("path", ""))
+            # A pinned version never goes stale; "latest" is re-checked after the TTL
+            and (version is not None or time.time() - entry.get("resolved_at", 0) < ttl)
+        ):
+            return entry["path"]
+
+        driver_path = ChromeDriverManager(driver_version=version).install()
+        _write_entry(path, {"path": driver_path, "version": version, "resolved_at": time.time()})
+        return driver_path
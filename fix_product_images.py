@@ -5,24 +5,43 @@ Uses Bing Images with optimized search queries
 
 Features:
 - Uses exact product names as search queries
-- Validates image URLs before saving
+- Validates image URLs before saving (all candidates checked concurrently)
 - Supports both women's and men's products
-- Generates TypeScript files directly
+- Shards categories across a pool of parallel browser workers
+- Optional browser-free HTTP search backend (--backend http)
+- Shared browser profiles, e.g. headless with blocked subresources (--profile lean)
+- Optional asyncio engine with bounded concurrency (--engine async)
+- Bing results and image validation verdicts cached on disk, so re-runs skip the network
+- Progress journaled after every product; --resume picks up an interrupted run
+- Searches paced by a shared per-host token bucket instead of fixed sleeps
+- Optional perceptual-hash dedup that catches the same photo under different URLs (--near-dup)
+- Optional local mirroring into responsive WebP/AVIF variants (--mirror)
+- Generates TypeScript directly, one lazily loadable module per category (see product_codegen)
 """
 
 import os
-import time
-import json
-import random
+import queue
+import argparse
+import functools
+import threading
 import urllib.parse
-import requests
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+
+import async_engine
+import scrape_metrics
+from browser_profile import DEFAULT_PROFILE, PROFILES, create_driver
+from bing_search import BACKENDS, SKIP_DOMAINS, BingSearch
+from image_hash import DEFAULT_MAX_DISTANCE, HASH_FUNCTIONS, NearDuplicateIndex
+from image_mirror import mirror_images
+from image_validation import iter_valid_images, use_verdict_cache, validate_image_url  # noqa: F401 (re-exported)
+from product_codegen import (  # noqa: F401 (re-exported)
+    generate_mens_typescript, generate_product_modules, generate_womens_typescript, read_generated_images,
+    write_modules,
+)
+from rate_limit import DEFAULT_SEARCH_BURST, DEFAULT_SEARCH_RATE, HostRateLimiter, pacing_note
+from run_trace import DEFAULT_TRACE_PATH, RunTrace, product_span, span, use_trace
+from scrape_cache import DEFAULT_SEARCH_TTL, SearchCache, VerdictCache
+from scrape_dedup import DedupRegistry
+from scrape_journal import DEFAULT_JOURNAL_PATH, ScrapeJournal
 
 # ============================================
 # WOMEN'S PRODUCT DEFINITIONS
@@ -39,7 +58,8 @@ WOMENS_PRODUCTS = {
         "cat_id": "cat-1",
         "cat_name": "Handbags",
         "cat_slug": "handbags",
-        "base_price": 850
+        "base_price": 850,
+        "price_step": 80
     },
     "jewelry": {
         "names": ["Diamond Bracelet", "Pearl Earrings", "Gold Necklace", "Sapphire Ring", "Tennis Bracelet", 
@@ -51,7 +71,8 @@ WOMENS_PRODUCTS = {
         "cat_id": "cat-2",
         "cat_name": "Jewelry",
         "cat_slug": "jewelry",
-        "base_price": 1200
+        "base_price": 1200,
+        "price_step": 150
     },
     "shoes": {
         "names": ["Patent Pumps", "Embellished Sandals", "Suede Boots", "Strappy Mules", "Ballet Flats", 
@@ -63,7 +84,8 @@ WOMENS_PRODUCTS = {
         "cat_id": "cat-3",
         "cat_name": "Shoes",
         "cat_slug": "shoes",
-        "base_price": 395
+        "base_price": 395,
+        "price_step": 40
     },
     "dresses": {
         "names": ["Silk Midi Dress", "Velvet Gown", "Lace Cocktail Dress", "Satin Slip Dress", "Sequin Mini Dress", 
@@ -75,7 +97,8 @@ WOMENS_PRODUCTS = {
         "cat_id": "cat-4",
         "cat_name": "Dresses",
         "cat_slug": "dresses",
-        "base_price": 450
+        "base_price": 450,
+        "price_step": 60
     },
     "accessories": {
         "names": ["Silk Scarf", "Leather Belt", "Designer Sunglasses", "Cashmere Gloves", "Pearl Hair Clip", 
@@ -87,7 +110,20 @@ WOMENS_PRODUCTS = {
         "cat_id": "cat-5",
         "cat_name": "Accessories",
         "cat_slug": "accessories",
-        "base_price": 150
+        "base_price": 150,
+        "price_step": 50
+    },
+    "fragrances": {
+        "names": ["Rose & Oud", "Midnight Jasmine", "Citrus Burst", "Vanilla Noir", "Ocean Breeze",
+                  "Amber Wood", "Floral Symphony", "Cedar Mystique", "Spiced Santal", "Bergamot Bloom",
+                  "Velvet Musk", "Golden Amber", "White Tea & Sage", "Black Orchid", "Neroli Portofino",
+                  "Saffron Spice", "Patchouli Intense", "Lavender Fields", "Peony Blush", "Vetiver Essence"],
+        "search_suffix": "luxury perfume bottle",
+        "cat_id": "cat-11",
+        "cat_name": "Fragrances",
+        "cat_slug": "fragrances",
+        "base_price": 120,
+        "price_step": 40
     }
 }
 
@@ -104,7 +140,8 @@ MENS_PRODUCTS = {
         "cat_id": "cat-6",
         "cat_name": "Men's Watches",
         "cat_slug": "mens-watches",
-        "base_price": 2500
+        "base_price": 2500,
+        "price_step": 200
     },
     "mens-bags": {
         "names": ["Leather Briefcase", "Messenger Bag", "Laptop Portfolio", "Weekend Duffel", "Leather Backpack", 
@@ -115,7 +152,8 @@ MENS_PRODUCTS = {
         "cat_id": "cat-7",
         "cat_name": "Men's Bags",
         "cat_slug": "mens-bags",
-        "base_price": 450
+        "base_price": 450,
+        "price_step": 80
     },
     "mens-shoes": {
         "names": ["Oxford Dress Shoes", "Derby Brogues", "Leather Loafers", "Chelsea Boots", "Monk Strap", 
@@ -126,7 +164,8 @@ MENS_PRODUCTS = {
         "cat_id": "cat-8",
         "cat_name": "Men's Shoes",
         "cat_slug": "mens-shoes",
-        "base_price": 350
+        "base_price": 350,
+        "price_step": 50
     },
     "mens-suits": {
         "names": ["Classic Navy Suit", "Charcoal Pinstripe", "Slim Fit Black", "Italian Wool", "Double Breasted", 
@@ -137,7 +176,8 @@ MENS_PRODUCTS = {
         "cat_id": "cat-9",
         "cat_name": "Men's Suits",
         "cat_slug": "mens-suits",
-        "base_price": 1200
+        "base_price": 1200,
+        "price_step": 150
     },
     "mens-accessories": {
         "names": ["Silk Tie", "Leather Belt", "Cufflinks Set", "Pocket Square", "Leather Wallet", 
@@ -148,401 +188,269 @@ MENS_PRODUCTS = {
         "cat_id": "cat-10",
         "cat_name": "Men's Accessories",
         "cat_slug": "mens-accessories",
-        "base_price": 95
+        "base_price": 95,
+        "price_step": 40
     }
 }
 
+# Bing qft filters for product shots: large, portrait images
+PRODUCT_QFT = "+filterui:imagesize-large+filterui:aspect-tall"
 
-def setup_driver():
-    """Setup Chrome driver with options to avoid detection"""
-    chrome_options = Options()
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("--start-maximized")
-    chrome_options.add_argument("--disable-notifications")
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    # Run headless for faster execution
-    # chrome_options.add_argument("--headless")
-
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    return driver
-
-
-def validate_image_url(url, timeout=5):
-    """Check if an image URL is valid and accessible"""
-    try:
-        response = requests.head(url, timeout=timeout, allow_redirects=True)
-        content_type = response.headers.get('content-type', '')
-        return response.status_code == 200 and 'image' in content_type
-    except:
-        return False
+def setup_driver(profile=DEFAULT_PROFILE):
+    """Setup Chrome driver with options to avoid detection (see browser_profile)"""
+    return create_driver(profile)
 
 
-def get_bing_image(driver, search_term, used_urls, validate=True):
+def get_bing_image(search, search_term, used_urls, validate=True):
     """Get a unique high-quality image URL from Bing Images"""
     try:
-        encoded_term = urllib.parse.quote(search_term)
-        url = f"https://www.bing.com/images/search?q={encoded_term}&qft=+filterui:imagesize-large+filterui:aspect-tall"
+        candidates = search.candidates(search_term, PRODUCT_QFT, limit=20)  # Check more results for better options
         
-        driver.get(url)
-        time.sleep(2)
+        candidates = [
+            img_url for img_url in candidates
+            if img_url not in used_urls
+            and img_url.startswith("http")
+            # Skip certain problematic domains
+            and not any(domain in img_url.lower() for domain in SKIP_DOMAINS)
+        ]
         
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "a.iusc"))
-        )
+        # Validate all candidates at once if requested; still picked in rank order
+        if validate:
+            candidates = iter_valid_images(candidates)
         
-        elements = driver.find_elements(By.CSS_SELECTOR, "a.iusc")
-        
-        for element in elements[:20]:  # Check more results for better options
-            try:
-                m_attr = element.get_attribute("m")
-                if not m_attr:
-                    continue
-                    
-                m_data = json.loads(m_attr)
-                img_url = m_data.get("murl")
-                
-                if not img_url:
-                    continue
-                    
-                if img_url in used_urls:
-                    continue
-                
-                if not img_url.startswith("http"):
-                    continue
-                
-                # Skip certain problematic domains
-                skip_domains = ['pinterest', 'facebook', 'instagram', 'tiktok']
-                if any(domain in img_url.lower() for domain in skip_domains):
-                    continue
-                
-                # Validate URL if requested
-                if validate:
-                    if not validate_image_url(img_url):
-                        continue
-                
+        for img_url in candidates:
+            # Another worker may have taken it while we were validating
+            if used_urls.claim(img_url):
                 return img_url
                 
-            except Exception:
-                continue
-                
     except Exception as e:
         print(f"    Error searching '{search_term}': {e}")
         
     return None
 
 
-def scrape_category(driver, category_data, used_urls, is_mens=False):
+def find_product_image(search, name, search_query, used_urls):
+    """Validated search, then a simpler unvalidated query, then a placeholder; returns (url, tier)"""
+    with span("search.primary"):
+        url = get_bing_image(search, search_query, used_urls, validate=True)
+    if url:
+        print(f"    ✅ Found: {url[:60]}...")
+        used_urls.add(url)
+        return url, "primary"
+    
+    # Fallback: try simpler search
+    with span("search.fallback"):
+        url = get_bing_image(search, f"{name} luxury", used_urls, validate=False)
+    if url:
+        print(f"    ⚠️ Fallback found: {url[:60]}...")
+        used_urls.add(url)
+        return url, "fallback"
+    
+    print(f"    ❌ Using placeholder")
+    return f"https://placehold.co/800x1000/1a1a1a/d4af37?text={urllib.parse.quote(name)}", "placeholder"
+
+
+def scrape_category(search, category_data, used_urls, is_mens=False, journal=None):
     """Scrape images for a single category"""
     images = []
     names = category_data["names"]
     suffix = category_data["search_suffix"]
+    cat_slug = category_data["cat_slug"]
     
     for i, name in enumerate(names):
+        # Resumed run: reuse the image chosen before the interruption
+        done = journal.completed(cat_slug, i, name) if journal is not None else None
+        if done:
+            print(f"  [{i+1}/{len(names)}] ⏭️ Already done: {name}")
+            images.append(done["url"])
+            continue
+        
         search_query = f"{name} {suffix}"
         print(f"  [{i+1}/{len(names)}] Searching: {search_query}")
         
-        url = get_bing_image(driver, search_query, used_urls, validate=True)
-        
-        if url:
-            print(f"    ✅ Found: {url[:60]}...")
-            used_urls.add(url)
-            images.append(url)
-        else:
-            # Fallback: try simpler search
-            url = get_bing_image(driver, f"{name} luxury", used_urls, validate=False)
-            if url:
-                print(f"    ⚠️ Fallback found: {url[:60]}...")
-                used_urls.add(url)
-                images.append(url)
-            else:
-                print(f"    ❌ Using placeholder")
-                placeholder = f"https://placehold.co/800x1000/1a1a1a/d4af37?text={urllib.parse.quote(name)}"
-                images.append(placeholder)
+        with product_span(cat_slug, name):
+            url, tier = find_product_image(search, name, search_query, used_urls)
+        scrape_metrics.record_product(tier)
         
-        time.sleep(random.uniform(0.8, 1.5))
+        images.append(url)
+        if journal is not None:
+            journal.record(cat_slug, i, name, url, tier)
     
     return images
 
 
-def scrape_all_products():
-    """Scrape images for all products"""
-    print("🚀 Starting Improved Product Image Scraper...")
-    
-    driver = setup_driver()
-    used_urls = set()
-    womens_data = {}
-    mens_data = {}
-    
+def pending_products(products, journal=None):
+    """Number of products in a definition dict that still need a search (journaled ones are skipped)"""
+    return sum(
+        1
+        for data in products.values()
+        for i, name in enumerate(data["names"])
+        if not (journal is not None and journal.completed(data["cat_slug"], i, name))
+    )
+
+
+def _scrape_worker(worker_id, tasks, used_urls, results, errors, backend, cache, journal, limiter, profile):
+    """Pull categories off the shared queue and scrape them with a private search client"""
+    search = BingSearch(functools.partial(setup_driver, profile), backend=backend, cache=cache, limiter=limiter)
     try:
-        # Scrape Women's Products
-        print("\n" + "="*50)
-        print("👗 WOMEN'S PRODUCTS")
-        print("="*50)
-        
-        for category, data in WOMENS_PRODUCTS.items():
-            print(f"\n📂 Category: {data['cat_name'].upper()}")
-            images = scrape_category(driver, data, used_urls)
-            womens_data[category] = {**data, "images": images}
-        
-        # Scrape Men's Products
-        print("\n" + "="*50)
-        print("👔 MEN'S PRODUCTS")
-        print("="*50)
-        
-        for category, data in MENS_PRODUCTS.items():
-            print(f"\n📂 Category: {data['cat_name'].upper()}")
-            images = scrape_category(driver, data, used_urls, is_mens=True)
-            mens_data[category] = {**data, "images": images}
+        while True:
+            try:
+                gender, category, data = tasks.get_nowait()
+            except queue.Empty:
+                return
             
+            print(f"\n📂 [worker {worker_id}] Category: {data['cat_name'].upper()}")
+            images = scrape_category(search, data, used_urls, is_mens=(gender == "mens"), journal=journal)
+            results[(gender, category)] = {**data, "images": images}
+    except Exception as e:
+        errors.append(e)
     finally:
-        driver.quit()
-        
-    return womens_data, mens_data
-
+        search.close()
 
-def generate_womens_typescript(data):
-    """Generate mockProducts.ts content"""
-    ts = '''// Women's luxury products - 125 unique items with Selenium-scraped Unique Images
-export interface MockProduct {
-    _id: string;
-    name: string;
-    slug: string;
-    description: string;
-    price: number;
-    compareAtPrice?: number;
-    category: { _id: string; name: string; slug: string; };
-    categoryName: string;
-    image: string;
-    images: string[];
-    stock: number;
-    isNew: boolean;
-    isFeatured: boolean;
-    isActive: boolean;
-    rating: number;
-    numReviews: number;
-    tags: string[];
-}
 
-'''
+def scrape_all_products(workers=1, backend="selenium", cache=None, journal=None, limiter=None,
+                        profile=DEFAULT_PROFILE, near_duplicates=None):
+    """Scrape images for all products, sharding categories across browser workers"""
+    print(f"🚀 Starting Improved Product Image Scraper ({workers} worker(s), {backend} backend)...")
     
-    # Image arrays
-    var_map = {
-        "handbags": "handbagsImages",
-        "jewelry": "jewelryImages", 
-        "shoes": "shoesImages",
-        "dresses": "dressesImages",
-        "accessories": "accessoriesImages"
-    }
+    # On resume the dedup set is rebuilt from the journal
+    used_urls = DedupRegistry(journal.used_urls() if journal is not None else None, near_duplicates)
+    # One search budget for Bing, shared by every worker
+    limiter = limiter if limiter is not None else HostRateLimiter()
+    results = {}
+    errors = []
+    scrape_metrics.progress.start(pending_products(WOMENS_PRODUCTS, journal) + pending_products(MENS_PRODUCTS, journal))
     
-    for cat, cat_data in data.items():
-        var_name = var_map.get(cat, cat + "Images")
-        ts += f"const {var_name} = [\n"
-        for url in cat_data["images"]:
-            ts += f'    "{url}",\n'
-        ts += "];\n\n"
+    tasks = queue.Queue()
+    for category, data in WOMENS_PRODUCTS.items():
+        tasks.put(("womens", category, data))
+    for category, data in MENS_PRODUCTS.items():
+        tasks.put(("mens", category, data))
     
-    # Name arrays and create function
-    ts += '''const handbagNames = ["Quilted Shoulder Bag", "Structured Tote", "Mini Crossbody", "Woven Clutch", "Saddle Bag", "Bucket Bag", "Chain Link Bag", "Envelope Clutch", "Doctor Bag", "Shopper Tote", "Flap Bag", "Hobo Bag", "Box Bag", "Baguette Bag", "Camera Bag", "Top Handle Bag", "Drawstring Bag", "Frame Bag", "Bowling Bag", "Satchel Bag", "Pouch Bag", "Circle Bag", "Belt Bag", "Trunk Bag", "Kelly Style Bag"];
-
-const jewelryNames = ["Diamond Bracelet", "Pearl Earrings", "Gold Necklace", "Sapphire Ring", "Tennis Bracelet", "Layered Necklace", "Emerald Earrings", "Bangle Set", "Pendant Necklace", "Cocktail Ring", "Charm Bracelet", "Hoop Earrings", "Chain Necklace", "Statement Ring", "Cuff Bracelet", "Drop Earrings", "Choker Necklace", "Eternity Ring", "Link Bracelet", "Stud Earrings", "Lariat Necklace", "Signet Ring", "Bar Bracelet", "Chandelier Earrings", "Collar Necklace"];
-
-const shoeNames = ["Patent Pumps", "Embellished Sandals", "Suede Boots", "Strappy Mules", "Ballet Flats", "Kitten Slingbacks", "Platform Loafers", "Velvet Pumps", "Block Heel Sandals", "Ankle Booties", "Pointed Stilettos", "Lace-Up Heels", "Slip-On Mules", "Wedge Sandals", "Combat Boots", "Mary Jane Pumps", "Espadrille Wedges", "Gladiator Sandals", "Chelsea Boots", "D'Orsay Pumps", "Cage Heels", "Knee-High Boots", "Slide Sandals", "Oxford Flats", "Peep Toe Heels"];
-
-const dressNames = ["Silk Midi Dress", "Velvet Gown", "Lace Cocktail Dress", "Satin Slip Dress", "Sequin Mini Dress", "Chiffon Maxi Dress", "Bodycon Dress", "A-Line Dress", "Wrap Dress", "Shirt Dress", "Pleated Dress", "Ruffle Dress", "Off-Shoulder Dress", "Halter Dress", "Blazer Dress", "Knit Dress", "Tiered Dress", "Column Dress", "Bandage Dress", "Tea Dress", "Shift Dress", "Fit Flare Dress", "Asymmetric Dress", "Cutout Dress", "Embroidered Dress"];
-
-const accessoryNames = ["Silk Scarf", "Leather Belt", "Designer Sunglasses", "Cashmere Gloves", "Pearl Hair Clip", "Luxury Watch", "Wool Hat", "Designer Wallet", "Travel Organizer", "Leather Keychain", "Phone Case", "Card Holder", "Makeup Pouch", "Passport Cover", "Jewelry Box", "Headband", "Hair Bow", "Brooch Pin", "Tie Pin", "Cufflinks Set", "Money Clip", "Valet Tray", "Umbrella", "Pocket Square", "Watch Strap"];
-
-function createProduct(id: number, name: string, catId: string, catName: string, catSlug: string, image: string, basePrice: number): MockProduct {
-    const price = basePrice + Math.floor(Math.random() * 500);
-    const hasDiscount = Math.random() > 0.7;
-    const isNew = Math.random() > 0.6;
-    const isFeatured = Math.random() > 0.7;
-
-    // Ensure slug is clean
-    const slug = name.toLowerCase().replace(/\\s+/g, '-').replace(/[^a-z0-9-]/g, '');
-
-    return {
-        _id: `prod-${id}`,
-        name,
-        slug,
-        description: `Exquisite ${name.toLowerCase()} crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.`,
-        price,
-        compareAtPrice: hasDiscount ? price + Math.floor(Math.random() * 300) + 100 : undefined,
-        category: { _id: catId, name: catName, slug: catSlug },
-        categoryName: catName,
-        image,
-        images: [image],
-        stock: Math.floor(Math.random() * 30) + 5,
-        isNew,
-        isFeatured,
-        isActive: true,
-        rating: 4 + Math.random(),
-        numReviews: Math.floor(Math.random() * 150) + 10,
-        tags: [catSlug, "luxury", "women", "designer", isNew ? "new-arrival" : "", isFeatured ? "featured" : ""].filter(Boolean)
-    };
-}
-
-// Import men's products
-import { mockMensProducts } from './mockMensProducts';
-
-// Women's products
-const womensProducts: MockProduct[] = [
-    // HANDBAGS
-    ...handbagNames.map((name, i) => createProduct(i + 1, name, "cat-1", "Handbags", "handbags", handbagsImages[i], 850 + i * 80)),
-
-    // JEWELRY
-    ...jewelryNames.map((name, i) => createProduct(i + 26, name, "cat-2", "Jewelry", "jewelry", jewelryImages[i], 1200 + i * 150)),
-
-    // SHOES
-    ...shoeNames.map((name, i) => createProduct(i + 51, name, "cat-3", "Shoes", "shoes", shoesImages[i], 395 + i * 40)),
-
-    // DRESSES
-    ...dressNames.map((name, i) => createProduct(i + 76, name, "cat-4", "Dresses", "dresses", dressesImages[i], 450 + i * 60)),
-
-    // ACCESSORIES
-    ...accessoryNames.map((name, i) => createProduct(i + 101, name, "cat-5", "Accessories", "accessories", accessoriesImages[i], 150 + i * 50))
-];
-
-// Combined products (Women's + Men's)
-export const mockProducts: MockProduct[] = [
-    ...womensProducts,
-    ...mockMensProducts as unknown as MockProduct[]
-];
-
-export default mockProducts;
-'''
-    return ts
-
-
-def generate_mens_typescript(data):
-    """Generate mockMensProducts.ts content"""
-    ts = '''// Men's luxury products - 100 unique items with high-quality images
-export interface MockProduct {
-    _id: string;
-    name: string;
-    slug: string;
-    description: string;
-    price: number;
-    compareAtPrice?: number;
-    category: { _id: string; name: string; slug: string; };
-    categoryName: string;
-    image: string;
-    images: string[];
-    stock: number;
-    isNew: boolean;
-    isFeatured: boolean;
-    isActive: boolean;
-    rating: number;
-    numReviews: number;
-    tags: string[];
-    gender: 'men';
-}
-
-'''
+    workers = max(1, min(workers, tasks.qsize()))
+    threads = [
+        threading.Thread(target=_scrape_worker, args=(i + 1, tasks, used_urls, results, errors, backend, cache, journal, limiter,
+                                                       profile),
+                         daemon=True)
+        for i in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
     
-    var_map = {
-        "mens-watches": "watchesImages",
-        "mens-bags": "mensBagsImages",
-        "mens-shoes": "mensShoesImages",
-        "mens-suits": "suitImages",
-        "mens-accessories": "mensAccessoriesImages"
-    }
+    if errors:
+        raise errors[0]
     
-    for cat, cat_data in data.items():
-        var_name = var_map.get(cat, cat.replace("-", "_") + "Images")
-        ts += f"// {cat_data['cat_name']} Images\n"
-        ts += f"const {var_name} = [\n"
-        for url in cat_data["images"]:
-            ts += f'    "{url}",\n'
-        ts += "];\n\n"
+    # Rebuild the outputs in definition order regardless of completion order
+    womens_data = {cat: results[("womens", cat)] for cat in WOMENS_PRODUCTS}
+    mens_data = {cat: results[("mens", cat)] for cat in MENS_PRODUCTS}
     
-    ts += '''// Product Names
-const watchNames = ["Chronograph Elite", "Classic Automatic", "Diver's Professional", "Dress Watch", "Sport Chronometer", "Pilot Watch", "Skeleton Watch", "Moon Phase", "GMT Master", "Day-Date", "Perpetual Calendar", "Tourbillon", "Racing Chronograph", "Vintage Dress", "Military Field", "Nautical Timer", "Executive Gold", "Minimalist Steel", "Heritage Bronze", "Modern Ceramic"];
-
-const mensBagNames = ["Leather Briefcase", "Messenger Bag", "Laptop Portfolio", "Weekend Duffel", "Leather Backpack", "Document Case", "Travel Carry-On", "Crossbody Satchel", "Slim Folio", "Overnight Bag", "Executive Attache", "Convertible Tote", "Tech Backpack", "Garment Bag", "Duffle Weekender", "Shoulder Messenger", "Leather Holdall", "Business Bag", "Vintage Satchel", "Premium Carryall"];
-
-const mensShoeNames = ["Oxford Dress Shoes", "Derby Brogues", "Leather Loafers", "Chelsea Boots", "Monk Strap", "Penny Loafers", "Wingtip Oxfords", "Suede Loafers", "Dress Boots", "Cap Toe Oxfords", "Tassel Loafers", "Chukka Boots", "Whole Cut", "Double Monk", "Venetian Loafers", "Jodhpur Boots", "Bit Loafers", "Longwing Brogues", "Side Zip Boots", "Opera Pumps"];
-
-const suitNames = ["Classic Navy Suit", "Charcoal Pinstripe", "Slim Fit Black", "Italian Wool", "Double Breasted", "Peak Lapel", "Windowpane Check", "Herringbone Tweed", "Linen Summer", "Velvet Evening", "Tuxedo Set", "Three Piece", "Morning Coat", "Business Gray", "Midnight Blue", "Designer Blazer", "Cashmere Blend", "Sport Coat", "Dinner Jacket", "Modern Fit"];
-
-const mensAccessoryNames = ["Silk Tie", "Leather Belt", "Cufflinks Set", "Pocket Square", "Leather Wallet", "Tie Bar", "Lapel Pin", "Sunglasses", "Money Clip", "Card Holder", "Collar Stays", "Bracelet", "Ring", "Handkerchief Set", "Suspenders", "Bow Tie", "Watch Band", "Passport Holder", "Key Holder", "Collar Pin"];
-
-function createMensProduct(id: number, name: string, catId: string, catName: string, catSlug: string, image: string, basePrice: number): MockProduct {
-    const price = basePrice + Math.floor(Math.random() * 500);
-    const hasDiscount = Math.random() > 0.7;
-    const isNew = Math.random() > 0.6;
-    const isFeatured = Math.random() > 0.7;
-
-    const slug = name.toLowerCase().replace(/\\s+/g, '-').replace(/[^a-z0-9-]/g, '');
-
-    return {
-        _id: `mens-prod-${id}`,
-        name,
-        slug,
-        description: `Premium ${name.toLowerCase()} crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.`,
-        price,
-        compareAtPrice: hasDiscount ? price + Math.floor(Math.random() * 300) + 100 : undefined,
-        category: { _id: catId, name: catName, slug: catSlug },
-        categoryName: catName,
-        image,
-        images: [image],
-        stock: Math.floor(Math.random() * 30) + 5,
-        isNew,
-        isFeatured,
-        isActive: true,
-        rating: 4 + Math.random(),
-        numReviews: Math.floor(Math.random() * 150) + 10,
-        tags: [catSlug, "luxury", "men", "designer", isNew ? "new-arrival" : "", isFeatured ? "featured" : ""].filter(Boolean),
-        gender: 'men'
-    };
-}
-
-export const mockMensProducts: MockProduct[] = [
-    // WATCHES
-    ...watchNames.map((name, i) => createMensProduct(i + 1, name, "cat-6", "Men's Watches", "mens-watches", watchesImages[i], 2500 + i * 200)),
-
-    // BAGS
-    ...mensBagNames.map((name, i) => createMensProduct(i + 21, name, "cat-7", "Men's Bags", "mens-bags", mensBagsImages[i], 450 + i * 80)),
-
-    // SHOES
-    ...mensShoeNames.map((name, i) => createMensProduct(i + 41, name, "cat-8", "Men's Shoes", "mens-shoes", mensShoesImages[i], 350 + i * 50)),
-
-    // SUITS
-    ...suitNames.map((name, i) => createMensProduct(i + 61, name, "cat-9", "Men's Suits", "mens-suits", suitImages[i], 1200 + i * 150)),
+    return womens_data, mens_data
 
-    // ACCESSORIES
-    ...mensAccessoryNames.map((name, i) => createMensProduct(i + 81, name, "cat-10", "Men's Accessories", "mens-accessories", mensAccessoriesImages[i], 95 + i * 40))
-];
 
-export default mockMensProducts;
-'''
-    return ts
+def scrape_all_products_async(concurrency=64, per_host=8, cache=None, journal=None, limiter=None,
+                              near_duplicates=None):
+    """Scrape images for all products with the asyncio engine (HTTP search, no browser)"""
+    print(f"🚀 Starting Async Product Image Scraper (concurrency {concurrency}, {per_host} per host)...")
+    
+    used_urls = DedupRegistry(journal.used_urls() if journal is not None else None, near_duplicates)
+    scrape_metrics.progress.start(pending_products(WOMENS_PRODUCTS, journal) + pending_products(MENS_PRODUCTS, journal))
+    womens_data, mens_data = async_engine.scrape_all(
+        [WOMENS_PRODUCTS, MENS_PRODUCTS], qft=PRODUCT_QFT, concurrency=concurrency, per_host=per_host,
+        used_urls=used_urls, cache=cache, journal=journal, limiter=limiter
+    )
+    return womens_data, mens_data
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrape product images and regenerate the mock data files")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="number of parallel browser workers (categories are sharded across them)")
+    parser.add_argument("--backend", choices=BACKENDS, default="selenium",
+                        help="image search backend; 'http' skips the browser and only falls back to Selenium when needed")
+    parser.add_argument("--profile", choices=PROFILES, default=DEFAULT_PROFILE,
+                        help="browser profile: 'lean' runs headless with eager loading and blocked subresources")
+    parser.add_argument("--engine", choices=("threads", "async"), default="threads",
+                        help="'async' runs every search and validation as coroutines over HTTP")
+    parser.add_argument("--concurrency", type=int, default=64,
+                        help="async engine: maximum requests in flight")
+    parser.add_argument("--per-host", type=int, default=8,
+                        help="async engine: maximum concurrent requests to a single host")
+    parser.add_argument("--cache-ttl", type=float, default=DEFAULT_SEARCH_TTL / 3600,
+                        help="hours a cached Bing result list stays fresh")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="always query Bing and re-validate every image, ignore the on-disk caches")
+    parser.add_argument("--rate", type=float, default=DEFAULT_SEARCH_RATE,
+                        help="Bing searches per second for the whole run, shared by every worker, so it also caps "
+                             "how far extra workers speed up searching (0 disables pacing)")
+    parser.add_argument("--burst", type=int, default=DEFAULT_SEARCH_BURST,
+                        help="searches allowed back-to-back before pacing kicks in")
+    parser.add_argument("--resume", action="store_true",
+                        help="skip products already recorded in the journal of an interrupted run")
+    parser.add_argument("--journal", default=DEFAULT_JOURNAL_PATH, help="path of the JSONL progress journal")
+    parser.add_argument("--near-dup", action="store_true",
+                        help="also reject images that are perceptual near-duplicates of one already used")
+    parser.add_argument("--near-dup-distance", type=int, default=DEFAULT_MAX_DISTANCE,
+                        help="max Hamming distance (out of 64 bits) that still counts as the same photo")
+    parser.add_argument("--hash", choices=HASH_FUNCTIONS, default="dhash", help="perceptual hash for --near-dup")
+    parser.add_argument("--mirror", action="store_true",
+                        help="download the chosen images into responsive local WebP/AVIF variants under public/")
+    parser.add_argument("--trace", nargs="?", const=DEFAULT_TRACE_PATH, default=None,
+                        help=f"record per-stage timing spans to a JSONL trace (default path {DEFAULT_TRACE_PATH}) "
+                             "and print a summary table at the end")
+    parser.add_argument("--metrics-port", type=int, default=None,
+                        help=f"serve live Prometheus metrics on this port (e.g. {scrape_metrics.DEFAULT_METRICS_PORT})")
+    args = parser.parse_args()
+    
+    if args.metrics_port:
+        scrape_metrics.serve(args.metrics_port)
+    trace = RunTrace(args.trace) if args.trace else None
+    use_trace(trace)
+    
+    limiter = HostRateLimiter(args.rate, args.burst)
+    print(pacing_note(args.rate))
+    journal = ScrapeJournal(args.journal, resume=args.resume)
+    if args.resume:
+        print(f"↩️  Resuming: {len(journal)} product(s) already done according to {args.journal}")
+    
+    cache = None
+    if not args.no_cache:
+        cache = SearchCache(ttl=args.cache_ttl * 3600)
+        use_verdict_cache(VerdictCache())
+    
+    near_duplicates = NearDuplicateIndex(args.near_dup_distance, args.hash) if args.near_dup else None
+    
     print("="*60)
     print("  IMPROVED PRODUCT IMAGE SCRAPER")
     print("  Fetches images matching exact product descriptions")
     print("="*60)
     
-    womens_data, mens_data = scrape_all_products()
+    try:
+        if args.engine == "async":
+            womens_data, mens_data = scrape_all_products_async(concurrency=args.concurrency, per_host=args.per_host,
+                                                                cache=cache, journal=journal, limiter=limiter,
+                                                                near_duplicates=near_duplicates)
+        else:
+            womens_data, mens_data = scrape_all_products(workers=args.workers, backend=args.backend,
+                                                          cache=cache, journal=journal, limiter=limiter,
+                                                          profile=args.profile, near_duplicates=near_duplicates)
+    finally:
+        journal.close()
+    
+    mirrored = None
+    if args.mirror:
+        mirrored = mirror_images([url for data in (womens_data, mens_data)
+                                  for cat in data.values() for url in cat["images"]])
     
     # Generate TypeScript files
     print("\n📝 Generating TypeScript files...")
+    with span("codegen"):
+        write_modules(generate_product_modules(womens_data, mens_data, mirrored))
     
-    womens_ts = generate_womens_typescript(womens_data)
-    with open("src/data/mockProducts.ts", "w", encoding="utf-8") as f:
-        f.write(womens_ts)
-    print("  ✅ Updated src/data/mockProducts.ts")
-    
-    mens_ts = generate_mens_typescript(mens_data)
-    with open("src/data/mockMensProducts.ts", "w", encoding="utf-8") as f:
-        f.write(mens_ts)
-    print("  ✅ Updated src/data/mockMensProducts.ts")
+    if trace:
+        trace.print_summary()
+        trace.close()
     
     print("\n" + "="*60)
     print("  🎉 COMPLETE!")
@@ -0,0 +1,56 @@
+"""
+Diff-aware writes for generated source files
+Output is compared by content hash with what is on disk and only changed files are written,
+so an unchanged catalog doesn't trigger a dev-server rebuild / HMR; writes go through a temp
+file and a rename so nothing ever reads a half-written module
+"""
+
+import os
+import hashlib
+import tempfile
+
+
+def content_digest(content):
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _disk_digest(path):
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def write_if_changed(path, content):
+    """
+    Write content only if its hash differs from the file on disk; returns True if the file changed
+    Goes through a temp file and a rename, so a dev server never reads a half-written module
+    """
+    if _disk_digest(path) == content_digest(content):
+        return False
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # A unique hidden name per writer (no .ts suffix, so Vite / tsc never pick it up), removed if the write fails
+    fd, tmp_path = tempfile.mkstemp(dir=directory or None, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content.encode("utf-8"))
+        # mkstemp creates the file owner-only
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return True
+
+
+def write_modules(files):
+    """Write only the generated files that changed and return their paths; unchanged files keep their mtime"""
+    changed = [path for path, content in files.items() if write_if_changed(path, content)]
+    for path in changed:
+        print(f"  ✅ Updated {path}")
+    if len(changed) < len(files):
+        print(f"  ⏭️  {len(files) - len(changed)} module(s) unchanged")
+    return changed
@@ -0,0 +1,194 @@
+"""
+Perceptual image hashing and near-duplicate lookup
+Exact URL matching misses the same photo served from another CDN, resized, or with a
+different query string; a perceptual hash of the pixels doesn't
+
+- dhash / phash: 64-bit fingerprints computed with NumPy
+- BKTree: metric tree over Hamming distance, so lookups stay sub-linear as the catalog grows
+- NearDuplicateIndex: fetches an accepted image, hashes it and rejects anything within
+  max_distance bits of an image already in the catalog
+"""
+
+import io
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+from http_pool import get_session
+
+HASH_SIZE = 8
+
+# Hamming distance (out of 64 bits) at or below which two images count as the same photo: a resized,
+# JPEG q60 re-encoded CDN copy lands around 7-8 bits away, unrelated photos 25+
+DEFAULT_MAX_DISTANCE = 10
+
+# Don't pull more than this much of an image just to fingerprint it
+MAX_IMAGE_BYTES = 8 * 1024 * 1024
+
+
+def _grayscale(image, width, height):
+    # Let the JPEG decoder downscale while decoding; much cheaper than a full-size decode
+    image.draft("L", (width * 4, height * 4))
+    return np.asarray(image.convert("L").resize((width, height), Image.LANCZOS), dtype=np.float32)
+
+
+def _pack(bits):
+    return int.from_bytes(np.packbits(bits.ravel()).tobytes(), "big")
+
+
+@functools.lru_cache(maxsize=None)
+def _dct_matrix(size):
+    n = np.arange(size)
+    matrix = np.cos(np.pi * (2 * n[None, :] + 1) * n[:, None] / (2 * size))
+    matrix[0] /= np.sqrt(2)
+    return matrix * np.sqrt(2 / size)
+
+
+def dhash(image, hash_size=HASH_SIZE):
+    """Difference hash: one bit per horizontally adjacent pixel pair of a tiny grayscale copy"""
+    pixels = _grayscale(image, hash_size + 1, hash_size)
+    return _pack(pixels[:, 1:] > pixels[:, :-1])
+
+
+def phash(image, hash_size=HASH_SIZE, highfreq_factor=4):
+    """DCT hash: sign of the low-frequency coefficients against their median; sturdier under re-encoding"""
+    size = hash_size * highfreq_factor
+    pixels = _grayscale(image, size, size)
+    dct = _dct_matrix(size)
+    low = (dct @ pixels @ dct.T)[:hash_size, :hash_size]
+    # The DC term only tracks overall brightness, keep it out of the median
+    return _pack(low > np.median(low.ravel()[1:]))
+
+
+HASH_FUNCTIONS = {"dhash": dhash, "phash": phash}
+
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
+
+
+class BKTree:
+    """Burkhard-Keller tree over integer hashes; search() only visits branches that can be in range"""
+
+    def __init__(self, distance=hamming):
+        self.distance = distance
+        self._root = None
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def add(self, key, item=None):
+        # Nodes are [key, item, {distance: child}]
+        node = [key, item, {}]
+        self._size += 1
+        if self._root is None:
+            self._root = node
+            return
+        current = self._root
+        while True:
+            d = self.distance(key, current[0])
+            child = current[2].get(d)
+            if child is None:
+                current[2][d] = node
+                return
+            current = child
+
+    def search(self, key, radius):
+        """Return [(distance, item)] for every key within radius, closest first"""
+        if self._root is None:
+            return []
+        matches = []
+        stack = [self._root]
+        while stack:
+            node_key, item, children = stack.pop()
+            d = self.distance(key, node_key)
+            if d <= radius:
+                matches.append((d, item))
+            # Triangle inequality: only children at distance d±radius can hold a match
+            for child_distance, child in children.items():
+                if d - radius <= child_distance <= d + radius:
+                    stack.append(child)
+        return sorted(matches, key=lambda match: match[0])
+
+
+class NearDuplicateIndex:
+    """Thread-safe perceptual index of accepted images; claim() rejects near-duplicates"""
+
+    def __init__(self, max_distance=DEFAULT_MAX_DISTANCE, hash_func="dhash", session=None, timeout=5):
+        self.max_distance = max_distance
+        self.hash_func = HASH_FUNCTIONS[hash_func] if isinstance(hash_func, str) else hash_func
+        self.session = session
+        self.timeout = timeout
+        self._tree = BKTree()
+        self._hashes = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._tree)
+
+    def fingerprint(self, url):
+        """Download an image and return its perceptual hash, or None if it can't be fetched or decoded"""
+        with self._lock:
+            if url in self._hashes:
+                return self._hashes[url]
+        session = self.session or get_session()
+        try:
+            with session.get(url, timeout=self.timeout, stream=True) as response:
+                if response.status_code != 200:
+                    return None
+                data = bytearray()
+                for chunk in response.iter_content(64 * 1024):
+                    data.extend(chunk)
+                    if len(data) > MAX_IMAGE_BYTES:
+                        return None
+            with Image.open(io.BytesIO(data)) as image:
+                fingerprint = self.hash_func(image)
+        except Exception:
+            return None
+        with self._lock:
+            self._hashes[url] = fingerprint
+        return fingerprint
+
+    def find(self, fingerprint):
+        """Closest (distance, url) already indexed within max_distance, or None"""
+        with self._lock:
+            matches = self._tree.search(fingerprint, self.max_distance)
+        return matches[0] if matches else None
+
+    def add(self, url, fingerprint=None):
+        fingerprint = fingerprint if fingerprint is not None else self.fingerprint(url)
+        if fingerprint is None:
+            return False
+        with self._lock:
+            self._tree.add(fingerprint, url)
+        return True
+
+    def claim(self, url):
+        """Index an image unless it is a near-duplicate of one already indexed"""
+        fingerprint = self.fingerprint(url)
+        # Unreadable images can't be compared; the exact-URL check is all we have for them
+        if fingerprint is None:
+            return True
+        with self._lock:
+            matches = self._tree.search(fingerprint, self.max_distance)
+            if not matches:
+                self._tree.add(fingerprint, url)
+                return True
+        distance, original = matches[0]
+        print(f"    ♻️ Near-duplicate ({distance} bits) of {original[:60]}...")
+        return False
+
+    def seed(self, urls, workers=16):
+        """Hash already-assigned images (e.g. from a resumed journal) concurrently"""
+        urls = list(urls)
+        if not urls:
+            return
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for url, fingerprint in zip(urls, executor.map(self.fingerprint, urls)):
+                if fingerprint is not None:
+                    self.add(url, fingerprint)
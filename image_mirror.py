@@ -0,0 +1,204 @@
+"""
+Local image mirroring with responsive variants
+The scrapers pick full-size third-party images (often several MB); this stage downloads
+each chosen URL once and transcodes it into a fixed ladder of widths so the site serves
+right-sized local files instead of hotlinking
+
+- Downloads run on a thread pool (I/O bound) through the resumable downloader, transcoding
+  on a process pool (CPU bound)
+- Originals are kept in a private content-addressed store (.cache/originals), so an
+  unchanged image is never downloaded twice
+- Every image becomes WebP (and AVIF when Pillow supports it) at each ladder width
+  no wider than the original
+- A manifest remembers what was mirrored, so re-runs only process new URLs, and a later partial
+  regeneration (load_mirrored) can rebuild the srcsets of images it didn't mirror itself
+
+Output: public/images/products/<digest>/<width>.<format>, served as /images/products/...
+(keyed by the content digest, so the same photo from two URLs is transcoded once)
+"""
+
+import os
+import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from PIL import Image, ImageOps, features
+
+from image_store import ImageStore
+from scrape_journal import DEFAULT_JOURNAL_PATH, ScrapeJournal
+
+WIDTHS = (320, 640, 960, 1280)
+FORMATS = ("avif", "webp") if features.check("avif") else ("webp",)
+QUALITY = {"avif": 50, "webp": 78}
+
+# Width used for the plain `image` field, i.e. browsers without srcset support
+DEFAULT_SRC_WIDTH = 960
+
+DEFAULT_MIRROR_DIR = os.path.join("public", "images", "products")
+DEFAULT_PUBLIC_ROOT = "public"
+DEFAULT_MANIFEST_PATH = os.path.join(".cache", "image_mirror.json")
+
+# Full-size originals stay out of public/; only the variants are served
+ORIGINALS_DIR = os.path.join(".cache", "originals")
+ORIGINALS_INDEX_PATH = os.path.join(ORIGINALS_DIR, "index.sqlite3")
+
+
+def mirror_key(digest):
+    """Directory name for an original's variants"""
+    return digest[:16]
+
+
+def transcode(source_path, dest_dir, widths=WIDTHS, formats=FORMATS):
+    """Write the width ladder for one image (runs in a worker process); returns its variant metadata"""
+    with Image.open(source_path) as image:
+        image = ImageOps.exif_transpose(image)
+        image = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+        width, height = image.size
+
+        # Never upscale; an image narrower than the smallest rung gets just its own width
+        ladder = [w for w in widths if w < width] + [min(width, max(widths))]
+        ladder = sorted(set(ladder))
+
+        os.makedirs(dest_dir, exist_ok=True)
+        variants = {fmt: [] for fmt in formats}
+        for w in ladder:
+            h = round(height * w / width)
+            resized = image if w == width else image.resize((w, h), Image.LANCZOS)
+            for fmt in formats:
+                path = os.path.join(dest_dir, f"{w}.{fmt}")
+                resized.save(path, fmt.upper(), quality=QUALITY[fmt])
+                variants[fmt].append([w, path])
+    return {"width": width, "height": height, "variants": variants}
+
+
+def public_path(path, public_root=DEFAULT_PUBLIC_ROOT):
+    """Filesystem path under public/ -> URL path the site serves it from"""
+    return "/" + os.path.relpath(path, public_root).replace(os.sep, "/")
+
+
+def srcset(entry, fmt, public_root=DEFAULT_PUBLIC_ROOT):
+    return ", ".join(f"{public_path(path, public_root)} {w}w" for w, path in entry["variants"].get(fmt, []))
+
+
+def default_src(entry, public_root=DEFAULT_PUBLIC_ROOT, width=DEFAULT_SRC_WIDTH):
+    """Largest WebP rung not wider than `width` (or the smallest one)"""
+    rungs = entry["variants"]["webp"]
+    fitting = [r for r in rungs if r[0] <= width] or rungs[:1]
+    return public_path(fitting[-1][1], public_root)
+
+
+def image_source(url, mirrored, public_root=DEFAULT_PUBLIC_ROOT):
+    """Fields the TypeScript generators emit for one image: local src/srcset/size, or the remote URL"""
+    entry = mirrored.get(url) if mirrored else None
+    if not entry:
+        return {"src": url}
+    source = {
+        "src": default_src(entry, public_root),
+        "srcSet": srcset(entry, "webp", public_root),
+        "width": entry["width"],
+        "height": entry["height"],
+    }
+    if entry["variants"].get("avif"):
+        source["avifSrcSet"] = srcset(entry, "avif", public_root)
+    return source
+
+
+def _load_manifest(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_manifest(path, manifest):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _is_complete(entry):
+    return all(os.path.exists(path) for rungs in entry["variants"].values() for _, path in rungs)
+
+
+def load_mirrored(urls=None, manifest_path=DEFAULT_MANIFEST_PATH):
+    """{url: entry} of the already mirrored images (all of them, or just `urls`) whose variants still exist"""
+    manifest = _load_manifest(manifest_path)
+    if urls is not None:
+        manifest = {url: manifest[url] for url in urls if url in manifest}
+    return {url: entry for url, entry in manifest.items() if _is_complete(entry)}
+
+
+def mirror_images(urls, dest_root=DEFAULT_MIRROR_DIR, manifest_path=DEFAULT_MANIFEST_PATH, processes=None,
+                  download_workers=16, widths=WIDTHS, formats=FORMATS):
+    """Mirror every http(s) URL; returns {url: {width, height, variants}} for the ones that succeeded"""
+    manifest = _load_manifest(manifest_path)
+    pending = []
+    for url in dict.fromkeys(urls):
+        if not url or not url.startswith("http") or "placehold.co" in url:
+            continue
+        entry = manifest.get(url)
+        if entry and _is_complete(entry):
+            continue
+        pending.append(url)
+
+    print(f"🖼️  Mirroring {len(pending)} image(s) ({len(manifest)} already local)...")
+    if pending:
+        store = ImageStore(root=ORIGINALS_DIR, index_path=ORIGINALS_INDEX_PATH)
+        # Variants already produced for the same bytes under another URL
+        by_digest = {entry["digest"]: entry for entry in manifest.values() if "digest" in entry and _is_complete(entry)}
+        with ThreadPoolExecutor(max_workers=download_workers) as downloads, \
+                ProcessPoolExecutor(max_workers=processes) as transcoders:
+            # Hand each download to the process pool as soon as it lands
+            fetches = {downloads.submit(store.fetch, url): url for url in pending}
+            jobs = {}
+            aliases = []
+            for fetch in as_completed(fetches):
+                url = fetches[fetch]
+                try:
+                    original = fetch.result()
+                except Exception as e:
+                    print(f"    ❌ Download failed: {url[:60]}... ({e})")
+                    continue
+                digest = original["digest"]
+                if digest in by_digest:
+                    manifest[url] = by_digest[digest]
+                    continue
+                if any(job_digest == digest for job_digest, _ in jobs.values()):
+                    aliases.append((url, digest))
+                    continue
+                source_path = store.path_for(digest, original["ext"])
+                dest_dir = os.path.join(dest_root, mirror_key(digest))
+                jobs[url] = (digest, transcoders.submit(transcode, source_path, dest_dir, widths, formats))
+
+            for url, (digest, job) in jobs.items():
+                try:
+                    manifest[url] = {**job.result(), "digest": digest}
+                except Exception as e:
+                    print(f"    ❌ Transcode failed: {url[:60]}... ({e})")
+            done = {entry["digest"]: entry for entry in manifest.values() if "digest" in entry}
+            for url, digest in aliases:
+                if digest in done:
+                    manifest[url] = done[digest]
+        store.close()
+        _save_manifest(manifest_path, manifest)
+
+    return {url: manifest[url] for url in urls if url in manifest}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mirror the images of a journal run into responsive local variants")
+    parser.add_argument("urls", nargs="*", help="image URLs (defaults to every URL in the scrape journal)")
+    parser.add_argument("--processes", type=int, default=None, help="transcoding processes (default: one per core)")
+    args = parser.parse_args()
+
+    urls = args.urls
+    if not urls:
+        urls = [r["url"] for r in ScrapeJournal.load(DEFAULT_JOURNAL_PATH).values()]
+
+    mirrored = mirror_images(urls, processes=args.processes)
+    print(f"✅ {len(mirrored)} image(s) available locally under {DEFAULT_MIRROR_DIR}")
@@ -0,0 +1,145 @@
+"""
+Header-only image probing
+Fetches just the first few KB of an image with a Range request and parses the
+JPEG / PNG / WebP / GIF header for the real format, width and height
+
+Used to reject candidates with the wrong aspect ratio or too low a resolution
+without downloading the full file (Bing's aspect/size filters are only hints)
+"""
+
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from http_pool import get_session
+from run_trace import span, submit
+from scrape_metrics import timed_request
+
+# Most headers fit in the first few KB; JPEGs with big EXIF/ICC blocks need more
+PROBE_BYTES = 64 * 1024
+CHUNK_SIZE = 4096
+MAX_WORKERS = 32
+
+# JPEG start-of-frame markers (everything in C0-CF except DHT, JPG and DAC)
+_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _parse_jpeg(data):
+    i = 2
+    while i + 4 <= len(data):
+        if data[i] != 0xFF:
+            # Lost sync: not a well-formed marker stream
+            return None
+        marker = data[i + 1]
+        if marker == 0xFF:
+            # Fill byte
+            i += 1
+            continue
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+            i += 2
+            continue
+        if marker in _SOF_MARKERS:
+            if i + 9 > len(data):
+                return None
+            height, width = struct.unpack(">HH", data[i + 5:i + 9])
+            return width, height
+        (length,) = struct.unpack(">H", data[i + 2:i + 4])
+        i += 2 + length
+    return None
+
+
+def _parse_webp(data):
+    chunk = data[12:16]
+    if chunk == b"VP8 " and len(data) >= 30:
+        width, height = struct.unpack("<HH", data[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L" and len(data) >= 25:
+        b0, b1, b2, b3 = data[21:25]
+        return 1 + (((b1 & 0x3F) << 8) | b0), 1 + (((b3 & 0x0F) << 10) | (b2 << 2) | ((b1 & 0xC0) >> 6))
+    if chunk == b"VP8X" and len(data) >= 30:
+        return 1 + int.from_bytes(data[24:27], "little"), 1 + int.from_bytes(data[27:30], "little")
+    return None
+
+
+def parse_image_header(data):
+    """Return {'format', 'width', 'height'} from the leading bytes of an image, or None if not (yet) parseable"""
+    size = None
+    if data[:3] == b"\xff\xd8\xff":
+        fmt, size = "jpeg", _parse_jpeg(data)
+    elif data[:8] == b"\x89PNG\r\n\x1a\n" and data[12:16] == b"IHDR" and len(data) >= 24:
+        fmt, size = "png", struct.unpack(">II", data[16:24])
+    elif data[:6] in (b"GIF87a", b"GIF89a") and len(data) >= 10:
+        fmt, size = "gif", struct.unpack("<HH", data[6:10])
+    elif data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        fmt, size = "webp", _parse_webp(data)
+    if not size:
+        return None
+    return {"format": fmt, "width": size[0], "height": size[1]}
+
+
+def probe_image(url, timeout=5, session=None, max_bytes=PROBE_BYTES):
+    """Read just enough of an image to parse its header; returns {'format', 'width', 'height'} or None"""
+    with span("probe"):
+        return _probe_image(url, timeout, session, max_bytes)
+
+
+def _probe_image(url, timeout, session, max_bytes):
+    session = session or get_session()
+    headers = {"Range": f"bytes=0-{max_bytes - 1}", "Accept-Encoding": "identity"}
+    try:
+        with timed_request("probe", url), session.get(url, headers=headers, timeout=timeout,
+                                                      stream=True) as response:
+            if response.status_code not in (200, 206):
+                return None
+            data = b""
+            # Servers that ignore Range send the whole file; we still stop once the header parses
+            for chunk in response.iter_content(CHUNK_SIZE):
+                data += chunk
+                info = parse_image_header(data)
+                if info or len(data) >= max_bytes:
+                    return info
+            return parse_image_header(data)
+    except Exception:
+        return None
+
+
+def fits(info, min_width=0, min_height=0, min_ratio=None, max_ratio=None):
+    """Whether probed dimensions meet a minimum size and a width/height ratio range"""
+    if not info or not info["width"] or not info["height"]:
+        return False
+    if info["width"] < min_width or info["height"] < min_height:
+        return False
+    ratio = info["width"] / info["height"]
+    if min_ratio is not None and ratio < min_ratio:
+        return False
+    if max_ratio is not None and ratio > max_ratio:
+        return False
+    return True
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="probe")
+        return _executor
+
+
+def iter_fitting_images(urls, timeout=5, session=None, **constraints):
+    """
+    Probe every candidate concurrently and yield (url, info) for those that fit, in rank order.
+    Probes still queued are cancelled once the caller stops iterating.
+    """
+    executor = _get_executor()
+    futures = [submit(executor, probe_image, url, timeout, session) for url in urls]
+    try:
+        for url, future in zip(urls, futures):
+            info = future.result()
+            if fits(info, **constraints):
+                yield url, info
+    finally:
+        for future in futures:
+            future.cancel()
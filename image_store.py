@@ -0,0 +1,202 @@
+"""
+Content-addressed on-disk image store
+Files are named by the SHA-256 of their bytes, so an asset URL never changes meaning
+and the site can serve it with a cache-forever header
+
+- Sharded layout: <root>/ab/cd/<sha256>.<ext> (keeps directories small)
+- Identical bytes from different URLs are stored once; fixed legacy paths
+  (e.g. public/assets/story/atelier_story.jpg) become hardlinks to the stored file
+- SQLite index (scrape_cache.ImageIndex): source URL -> digest, with ETag/Last-Modified,
+  so an image that was already stored is never downloaded again
+- Downloads go through downloader (parallel, resumable, hashed while streaming)
+"""
+
+import os
+import shutil
+import hashlib
+import tempfile
+import urllib.parse
+
+from downloader import DEFAULT_WORKERS, DownloadError, download_file, download_many
+from http_pool import get_session
+from scrape_cache import DEFAULT_CACHE_PATH, ImageIndex
+
+DEFAULT_STORE_DIR = os.path.join("public", "assets", "cas")
+# Partial downloads live outside public/ so they can never end up in a site build
+DEFAULT_STAGING_DIR = os.path.join(".cache", "image_staging")
+DEFAULT_PUBLIC_ROOT = "public"
+
+# Served for everything under the store root (see netlify.toml / vercel.json)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Leading bytes -> extension; the URL and Content-Type of scraped images are unreliable
+_SIGNATURES = (
+    (b"\xff\xd8\xff", "jpg"),
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"GIF87a", "gif"),
+    (b"GIF89a", "gif"),
+)
+
+_CONTENT_TYPES = {
+    "image/jpeg": "jpg", "image/png": "png", "image/gif": "gif",
+    "image/webp": "webp", "image/avif": "avif", "image/svg+xml": "svg",
+}
+
+
+def sniff_extension(head, content_type=None, url=None):
+    """File extension from the first bytes, falling back to Content-Type and then the URL path"""
+    for signature, ext in _SIGNATURES:
+        if head.startswith(signature):
+            return ext
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "webp"
+    if head[4:8] == b"ftyp" and head[8:12] in (b"avif", b"avis"):
+        return "avif"
+    if content_type:
+        ext = _CONTENT_TYPES.get(content_type.split(";")[0].strip().lower())
+        if ext:
+            return ext
+    if url:
+        ext = os.path.splitext(urllib.parse.urlsplit(url).path)[1].lstrip(".").lower()
+        if ext in ("jpg", "jpeg", "png", "gif", "webp", "avif"):
+            return "jpg" if ext == "jpeg" else ext
+    return "bin"
+
+
+class ImageStore:
+    """Content-addressed store rooted under public/, indexed by source URL"""
+
+    def __init__(self, root=DEFAULT_STORE_DIR, index_path=DEFAULT_CACHE_PATH, public_root=DEFAULT_PUBLIC_ROOT,
+                 staging_dir=DEFAULT_STAGING_DIR):
+        self.root = root
+        self.public_root = public_root
+        self.index = ImageIndex(index_path)
+        self._tmp_dir = staging_dir
+        os.makedirs(self._tmp_dir, exist_ok=True)
+
+    def path_for(self, digest, ext):
+        return os.path.join(self.root, digest[:2], digest[2:4], f"{digest}.{ext}")
+
+    def public_url(self, entry):
+        """Immutable URL the site serves a stored image from"""
+        path = self.path_for(entry["digest"], entry["ext"])
+        return "/" + os.path.relpath(path, self.public_root).replace(os.sep, "/")
+
+    def lookup(self, url):
+        """Index entry for a source URL whose bytes are still on disk, or None"""
+        entry = self.index.get(url)
+        if entry and os.path.exists(self.path_for(entry["digest"], entry["ext"])):
+            return entry
+        return None
+
+    def commit(self, tmp_path, digest, ext):
+        """Move a fully written temp file into place; if the digest is already stored, keep the existing copy"""
+        final_path = self.path_for(digest, ext)
+        if os.path.exists(final_path):
+            os.remove(tmp_path)
+            return final_path
+        os.makedirs(os.path.dirname(final_path), exist_ok=True)
+        os.replace(tmp_path, final_path)
+        return final_path
+
+    def put_bytes(self, data, url=None, content_type=None, etag=None, last_modified=None):
+        """Store in-memory bytes; returns the index entry"""
+        digest = hashlib.sha256(data).hexdigest()
+        ext = sniff_extension(data[:16], content_type, url)
+        fd, tmp_path = tempfile.mkstemp(dir=self._tmp_dir)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        self.commit(tmp_path, digest, ext)
+        entry = {"digest": digest, "ext": ext, "size": len(data), "etag": etag, "last_modified": last_modified}
+        if url:
+            self.index.put(url, digest, ext, len(data), etag, last_modified)
+        return entry
+
+    def _staging_path(self, url):
+        # Stable per URL, so an interrupted download is resumed by the next run
+        return os.path.join(self._tmp_dir, hashlib.sha256(url.encode("utf-8")).hexdigest()[:32])
+
+    def _unchanged(self, url, entry, session, timeout):
+        """Conditional HEAD against the stored validators; True if the origin says 304"""
+        headers = {}
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+        if not headers:
+            return False
+        try:
+            response = session.head(url, headers=headers, timeout=timeout, allow_redirects=True)
+        except Exception:
+            return False
+        return response.status_code == 304
+
+    def _store_download(self, result):
+        """Commit one finished downloader result into the store and index it"""
+        with open(result["dest"], "rb") as f:
+            head = f.read(16)
+        headers = result["headers"]
+        ext = sniff_extension(head, headers.get("Content-Type"), result["url"])
+        self.commit(result["dest"], result["sha256"], ext)
+        etag, last_modified = headers.get("ETag"), headers.get("Last-Modified")
+        self.index.put(result["url"], result["sha256"], ext, result["size"], etag, last_modified)
+        return {"digest": result["sha256"], "ext": ext, "size": result["size"], "etag": etag,
+                "last_modified": last_modified}
+
+    def fetch_many(self, urls, session=None, timeout=30, revalidate=False, workers=DEFAULT_WORKERS):
+        """
+        Return {url: entry} for every URL that is (or now is) stored; failures are left out
+        Only URLs not stored yet are downloaded, in parallel; revalidate=True also re-checks stored ones
+        """
+        session = session or get_session()
+        entries = {}
+        missing = []
+        for url in dict.fromkeys(urls):
+            entry = self.lookup(url)
+            if entry and (not revalidate or self._unchanged(url, entry, session, timeout)):
+                entries[url] = entry
+            else:
+                missing.append(url)
+
+        pairs = [(url, self._staging_path(url)) for url in missing]
+        for result in download_many(pairs, workers=workers, session=session, timeout=timeout):
+            if result["ok"]:
+                entries[result["url"]] = self._store_download(result)
+            else:
+                print(f"    ❌ Download failed: {result['url'][:60]}... ({result['error']})")
+        return entries
+
+    def fetch(self, url, session=None, timeout=15, revalidate=False):
+        """
+        Return the index entry for a URL, downloading only if it isn't stored yet
+        revalidate=True asks the origin with If-None-Match/If-Modified-Since and re-downloads on change
+        """
+        session = session or get_session()
+        entry = self.lookup(url)
+        if entry and (not revalidate or self._unchanged(url, entry, session, timeout)):
+            return entry
+
+        result = download_file(url, self._staging_path(url), session=session, timeout=timeout)
+        if not result["ok"]:
+            raise DownloadError(f"{url}: {result['error']}")
+        return self._store_download(result)
+
+    def link(self, entry, dest_path):
+        """Expose a stored image at a fixed path as a hardlink (copy if the filesystem can't link)"""
+        source = self.path_for(entry["digest"], entry["ext"])
+        directory = os.path.dirname(dest_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{dest_path}.tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        try:
+            os.link(source, tmp_path)
+        except OSError:
+            shutil.copyfile(source, tmp_path)
+        # Swap atomically so a reader never sees a half-written alias
+        os.replace(tmp_path, dest_path)
+        return dest_path
+
+    def close(self):
+        self.index.close()
@@ -0,0 +1,130 @@
+"""
+Image URL validation
+HEAD-checks candidate image URLs over the pooled keep-alive session
+
+Features:
+- Single-URL check (status 200 + image content-type)
+- Batch check: all candidates of a query validated concurrently,
+  yielded in rank order as soon as each verdict is known
+- Optional VerdictCache: fresh verdicts are served from disk, stale positive ones are
+  re-checked with If-None-Match / If-Modified-Since instead of a plain HEAD
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from http_pool import get_session
+from run_trace import span, submit
+from scrape_metrics import record_validation_failure, timed_request
+
+MAX_WORKERS = 32
+
+_executor = None
+_executor_lock = threading.Lock()
+
+_verdicts = None
+
+
+def use_verdict_cache(verdicts):
+    """Route every validation in this process through a scrape_cache.VerdictCache (None disables)"""
+    global _verdicts
+    _verdicts = verdicts
+
+
+def get_verdict_cache():
+    return _verdicts
+
+
+def conditional_headers(entry):
+    """Validator headers for re-checking a previously valid URL"""
+    headers = {}
+    if entry and entry["valid"]:
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def is_valid_response(status, headers):
+    return status == 200 and 'image' in headers.get('content-type', '')
+
+
+def record_verdict(verdicts, url, valid, status, headers):
+    """Persist a fresh verdict along with the response's cache validators"""
+    content_length = headers.get('content-length')
+    verdicts.put(
+        url,
+        valid,
+        status=status,
+        content_type=headers.get('content-type'),
+        etag=headers.get('etag'),
+        last_modified=headers.get('last-modified'),
+        content_length=int(content_length) if content_length and content_length.isdigit() else None,
+    )
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="validate")
+        return _executor
+
+
+def validate_image_url(url, timeout=5, session=None):
+    """Check if an image URL is valid and accessible"""
+    with span("validate"):
+        return _validate_image_url(url, timeout, session)
+
+
+def _validate_image_url(url, timeout, session):
+    verdicts = _verdicts
+    entry = verdicts.get(url) if verdicts is not None else None
+    if entry and entry["fresh"]:
+        return entry["valid"]
+
+    headers = conditional_headers(entry)
+    try:
+        session = session or get_session()
+        with timed_request("validate", url):
+            response = session.head(url, timeout=timeout, allow_redirects=True, headers=headers)
+    except Exception:
+        record_validation_failure()
+        if verdicts is not None:
+            verdicts.put(url, False)
+        return False
+
+    # Unchanged since the last positive verdict
+    if response.status_code == 304 and headers:
+        verdicts.touch(url)
+        return True
+
+    valid = is_valid_response(response.status_code, response.headers)
+    if not valid:
+        record_validation_failure(response.status_code)
+    if verdicts is not None:
+        record_verdict(verdicts, url, valid, response.status_code, response.headers)
+    return valid
+
+
+def iter_valid_images(urls, timeout=5, session=None):
+    """
+    Validate every candidate concurrently and yield the valid ones in rank order.
+    Each URL is yielded as soon as it and all higher-ranked candidates have a verdict;
+    checks still queued are cancelled once the caller stops iterating.
+    """
+    executor = _get_executor()
+    futures = [submit(executor, validate_image_url, url, timeout, session) for url in urls]
+    try:
+        for url, future in zip(urls, futures):
+            if future.result():
+                yield url
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def first_valid_image(urls, timeout=5, session=None):
+    """Return the highest-ranked valid image URL, or None"""
+    return next(iter_valid_images(urls, timeout, session), None)
@@ -0,0 +1,379 @@
+"""
+TypeScript generation for the mock product catalog
+Emits one module per category so the frontend can lazy-load just the category being viewed
+
+Layout (all under src/data):
+- products/types.ts       MockProduct interface
+- products/<slug>.ts      one category: its products as a literal array (default export)
+- products/manifest.ts    category list + loadCategoryProducts(slug) / loadAllProducts() via dynamic import()
+- mockProducts.ts         women's categories + men's, combined (static; importing it bundles every category)
+- mockMensProducts.ts     men's categories, combined
+
+Storefront code goes through the manifest loaders; nothing in src imports the aggregators, so each
+category stays a separate chunk that is only fetched when a view needs it.
+
+`data` arguments are the product definition dicts (e.g. WOMENS_PRODUCTS) where each
+category may carry the scraped "images"; categories without images keep their current module.
+Price, discount, stock, rating etc. are precomputed here from a fixed seed (see build_product), so the
+browser does no work at module load and the values are the same on every build and page load.
+"""
+
+import os
+import re
+import json
+import random
+import urllib.parse
+
+from async_engine import PLACEHOLDER_URL
+from generated_files import write_if_changed, write_modules  # noqa: F401 (re-exported)
+from image_mirror import image_source, load_mirrored
+
+DATA_DIR = os.path.join("src", "data")
+PRODUCTS_DIR = os.path.join(DATA_DIR, "products")
+
+TYPES_MODULE = '''// Generated by product_codegen.py - shared product types
+export interface MockProduct {
+    _id: string;
+    name: string;
+    slug: string;
+    description: string;
+    price: number;
+    compareAtPrice?: number;
+    category: { _id: string; name: string; slug: string; };
+    categoryName: string;
+    image: string;
+    images: string[];
+    imageSrcSet?: string;
+    imageAvifSrcSet?: string;
+    imageWidth?: number;
+    imageHeight?: number;
+    imageSource?: string;
+    stock: number;
+    isNew: boolean;
+    isFeatured: boolean;
+    isActive: boolean;
+    rating: number;
+    numReviews: number;
+    tags: string[];
+    gender?: 'men';
+}
+'''
+
+# Seed for the precomputed price/discount/stock/rating fields; change it to reshuffle the whole catalog
+CATALOG_SEED = "luxe-catalog"
+
+DESCRIPTIONS = {
+    False: "Exquisite {name} crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.",
+    True: "Premium {name} crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.",
+}
+
+
+def slugify(name):
+    """Same slug the storefront derives from a product name"""
+    return re.sub(r"[^a-z0-9-]", "", re.sub(r"\s+", "-", name.lower()))
+
+
+def unique_slugs(womens_data, mens_data):
+    """
+    {(category slug, product name): slug} across the whole catalog
+    A name that appears in several categories keeps the plain slug for its first occurrence (women's
+    first, definition order); later ones are prefixed with their category slug, e.g. mens-shoes-chelsea-boots
+    """
+    slugs = {}
+    taken = set()
+    for data in (womens_data, mens_data):
+        for cat_data in data.values():
+            for name in cat_data["names"]:
+                slug = slugify(name)
+                if slug in taken:
+                    slug = f"{cat_data['cat_slug']}-{slug}"
+                taken.add(slug)
+                slugs[(cat_data["cat_slug"], name)] = slug
+    return slugs
+
+
+def build_product(cat_data, index, product_id, url, is_mens=False, mirrored=None, seed=CATALOG_SEED, slug=None):
+    """
+    One product as a plain dict (the MockProduct shape)
+    The "random" attributes come from a generator seeded per product, so every build yields the same values
+    """
+    name = cat_data["names"][index]
+    rng = random.Random(f"{seed}:{cat_data['cat_slug']}:{slugify(name)}")
+    slug = slug or slugify(name)
+
+    price = cat_data["base_price"] + index * cat_data["price_step"] + rng.randrange(500)
+    has_discount = rng.random() > 0.7
+    is_new = rng.random() > 0.6
+    is_featured = rng.random() > 0.7
+    compare_at_price = price + rng.randrange(300) + 100 if has_discount else None
+
+    source = image_source(url, mirrored)
+    product = {
+        "_id": f"{'mens-prod' if is_mens else 'prod'}-{product_id}",
+        "name": name,
+        "slug": slug,
+        "description": DESCRIPTIONS[is_mens].format(name=name.lower()),
+        "price": price,
+    }
+    if compare_at_price is not None:
+        product["compareAtPrice"] = compare_at_price
+    product.update({
+        "category": {"_id": cat_data["cat_id"], "name": cat_data["cat_name"], "slug": cat_data["cat_slug"]},
+        "categoryName": cat_data["cat_name"],
+        "image": source["src"],
+        "images": [source["src"]],
+    })
+    for key, field in (("srcSet", "imageSrcSet"), ("avifSrcSet", "imageAvifSrcSet"),
+                       ("width", "imageWidth"), ("height", "imageHeight")):
+        if key in source:
+            product[field] = source[key]
+    if source["src"] != url:
+        # The remote original, so a later regeneration can find the mirrored variants again
+        product["imageSource"] = url
+    product.update({
+        "stock": rng.randrange(30) + 5,
+        "isNew": is_new,
+        "isFeatured": is_featured,
+        "isActive": True,
+        "rating": round(4 + rng.random(), 1),
+        "numReviews": rng.randrange(150) + 10,
+        "tags": [cat_data["cat_slug"], "luxury", "men" if is_mens else "women", "designer"]
+        + (["new-arrival"] if is_new else []) + (["featured"] if is_featured else []),
+    })
+    if is_mens:
+        product["gender"] = "men"
+    return product
+
+
+def build_category_products(cat_data, first_id, is_mens=False, mirrored=None, seed=CATALOG_SEED, slugs=None):
+    """Every product of one category; ids start at first_id, slugs (see unique_slugs) override the plain ones"""
+    slugs = slugs or {}
+    names = cat_data["names"]
+    # Every product needs an image; a short list is padded with the scraper's placeholder
+    images = list(cat_data["images"][:len(names)])
+    images += [PLACEHOLDER_URL.format(name=urllib.parse.quote(name)) for name in names[len(images):]]
+    return [build_product(cat_data, i, first_id + i, url, is_mens, mirrored, seed,
+                          slugs.get((cat_data["cat_slug"], names[i]))) for i, url in enumerate(images)]
+
+
+def first_ids(data):
+    """Product id of the first item in each category; ids run on across categories in definition order"""
+    ids = {}
+    next_id = 1
+    for cat, cat_data in data.items():
+        ids[cat] = next_id
+        next_id += len(cat_data["names"])
+    return ids
+
+
+def build_catalog(data, is_mens=False, mirrored=None, seed=CATALOG_SEED, slugs=None):
+    """{category: [product dicts]} for every category that carries scraped images"""
+    ids = first_ids(data)
+    return {cat: build_category_products(cat_data, ids[cat], is_mens, mirrored, seed, slugs)
+            for cat, cat_data in data.items() if "images" in cat_data}
+
+
+def build_catalogs(womens_data, mens_data, mirrored=None, seed=CATALOG_SEED):
+    """(women's catalog, men's catalog) with product slugs unique across both"""
+    slugs = unique_slugs(womens_data, mens_data)
+    return (build_catalog(womens_data, False, mirrored, seed, slugs),
+            build_catalog(mens_data, True, mirrored, seed, slugs))
+
+
+def read_generated_products(cat_slug):
+    """Product dicts of one generated category module (None if it doesn't exist)"""
+    path = os.path.join(PRODUCTS_DIR, f"{cat_slug}.ts")
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        # generate_category_module writes one JSON object per line
+        return [json.loads(line.strip().rstrip(",")) for line in f if line.startswith("    {")]
+
+
+def read_generated_images(data):
+    """
+    Copy of a product definition dict with each category's "images" read back from its generated module
+    Mirrored products give back their source URL, not the local path (see image_mirror.load_mirrored)
+    """
+    data = {cat: dict(cat_data) for cat, cat_data in data.items()}
+    for cat_data in data.values():
+        products = read_generated_products(cat_data["cat_slug"])
+        if products is not None:
+            cat_data["images"] = [product.get("imageSource", product["image"]) for product in products]
+    return data
+
+
+def read_generated_mirrored(*datas):
+    """image_mirror entries for the images that the current modules of these definitions serve mirrored"""
+    sources = [product["imageSource"] for data in datas for cat_data in data.values()
+               for product in read_generated_products(cat_data["cat_slug"]) or () if "imageSource" in product]
+    return load_mirrored(sources)
+
+
+def generate_category_module(cat_data, products):
+    """One category's module: its precomputed products as a literal array (no work at module load)"""
+    lines = [
+        f"// {cat_data['cat_name']} - {len(products)} products (generated by product_codegen.py)",
+        "import type { MockProduct } from './types';",
+        "",
+        "const products: MockProduct[] = [",
+    ]
+    lines += [f"    {json.dumps(product, ensure_ascii=False)}," for product in products]
+    lines += [
+        "];",
+        "",
+        "export default products;",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def generate_manifest(womens_data, mens_data):
+    """Category list plus a dynamic-import loader per category (one chunk each)"""
+    groups = (("women", womens_data), ("men", mens_data))
+    parts = ['''// Generated by product_codegen.py - load only the category being viewed
+import type { MockProduct } from './types';
+
+export interface ProductCategoryEntry {
+    _id: string;
+    name: string;
+    slug: string;
+    gender: 'women' | 'men';
+    count: number;
+}
+
+export const productCategories: ProductCategoryEntry[] = [
+''']
+    for gender, data in groups:
+        for cat_data in data.values():
+            parts.append(
+                f"    {{ _id: {json.dumps(cat_data['cat_id'])}, "
+                f"name: {json.dumps(cat_data['cat_name'], ensure_ascii=False)}, "
+                f"slug: {json.dumps(cat_data['cat_slug'])}, gender: '{gender}', count: {len(cat_data['names'])} }},\n"
+            )
+    parts.append("];\n\n")
+
+    parts.append("const loaders: Record<string, () => Promise<{ default: MockProduct[] }>> = {\n")
+    for _, data in groups:
+        for cat_data in data.values():
+            parts.append(f"    {json.dumps(cat_data['cat_slug'])}: () => import('./{cat_data['cat_slug']}'),\n")
+    parts.append("};\n\n")
+
+    parts.append('''export function loadCategoryProducts(slug: string): Promise<MockProduct[]> {
+    const load = loaders[slug];
+    return load ? load().then(module => module.default) : Promise.resolve([]);
+}
+
+export function loadProducts(slugs: string[]): Promise<MockProduct[]> {
+    return Promise.all(slugs.map(loadCategoryProducts)).then(groups => groups.flat());
+}
+
+export function findProductCategory(category: string): ProductCategoryEntry | undefined {
+    const name = category.toLowerCase();
+    return productCategories.find(c => c.slug === category || c._id === category || c.name.toLowerCase() === name);
+}
+
+// Every category, fetched once and shared (search, cart, chatbot)
+let allProducts: Promise<MockProduct[]> | undefined;
+
+export function loadAllProducts(): Promise<MockProduct[]> {
+    if (!allProducts) {
+        allProducts = loadProducts(productCategories.map(c => c.slug));
+    }
+    return allProducts;
+}
+''')
+    return "".join(parts)
+
+
+def _module_var(cat_slug):
+    parts = cat_slug.split("-")
+    return parts[0] + "".join(part.capitalize() for part in parts[1:]) + "Products"
+
+
+def _aggregator_lines(data):
+    """Import and spread lines for the category modules an aggregator combines"""
+    imports = [f"import {_module_var(cat_data['cat_slug'])} from './products/{cat_data['cat_slug']}';"
+               for cat_data in data.values()]
+    spreads = [f"    ...{_module_var(cat_data['cat_slug'])}," for cat_data in data.values()]
+    return imports, spreads
+
+
+def generate_womens_typescript(data):
+    """mockProducts.ts: every women's category plus the men's catalog"""
+    total = sum(len(cat_data["names"]) for cat_data in data.values())
+    imports, spreads = _aggregator_lines(data)
+    lines = [
+        f"// Women's luxury products - {total} unique items, one module per category under ./products",
+        "import type { MockProduct } from './products/types';",
+        *imports,
+        "import { mockMensProducts } from './mockMensProducts';",
+        "",
+        "export type { MockProduct } from './products/types';",
+        "",
+        "// Women's products",
+        "const womensProducts: MockProduct[] = [",
+        *spreads,
+        "];",
+        "",
+        "// Combined products (Women's + Men's)",
+        "export const mockProducts: MockProduct[] = [",
+        "    ...womensProducts,",
+        "    ...mockMensProducts",
+        "];",
+        "",
+        "export default mockProducts;",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def generate_mens_typescript(data):
+    """mockMensProducts.ts: every men's category"""
+    total = sum(len(cat_data["names"]) for cat_data in data.values())
+    imports, spreads = _aggregator_lines(data)
+    lines = [
+        f"// Men's luxury products - {total} unique items, one module per category under ./products",
+        "import type { MockProduct } from './products/types';",
+        *imports,
+        "",
+        "export type { MockProduct } from './products/types';",
+        "",
+        "export const mockMensProducts: MockProduct[] = [",
+        *spreads,
+        "];",
+        "",
+        "export default mockMensProducts;",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def generate_product_modules(womens_data, mens_data, mirrored=None, seed=CATALOG_SEED):
+    """Every generated file as {path: content}; categories without scraped "images" are left out"""
+    files = {
+        os.path.join(PRODUCTS_DIR, "types.ts"): TYPES_MODULE,
+        os.path.join(PRODUCTS_DIR, "manifest.ts"): generate_manifest(womens_data, mens_data),
+        os.path.join(DATA_DIR, "mockProducts.ts"): generate_womens_typescript(womens_data),
+        os.path.join(DATA_DIR, "mockMensProducts.ts"): generate_mens_typescript(mens_data),
+    }
+    catalogs = build_catalogs(womens_data, mens_data, mirrored, seed)
+    for data, catalog in zip((womens_data, mens_data), catalogs):
+        for cat, products in catalog.items():
+            path = os.path.join(PRODUCTS_DIR, f"{data[cat]['cat_slug']}.ts")
+            files[path] = generate_category_module(data[cat], products)
+    return files
+
+
+def update_category_images(images, womens_data, mens_data):
+    """
+    Regenerate the catalog with new image lists for some categories ({category: [urls]}); the other
+    categories keep the images already in their modules, mirrored ones included. Returns the paths that changed
+    """
+    mirrored = read_generated_mirrored(womens_data, mens_data)
+    womens_data, mens_data = read_generated_images(womens_data), read_generated_images(mens_data)
+    for data in (womens_data, mens_data):
+        for cat, urls in images.items():
+            if cat in data:
+                data[cat]["images"] = urls
+    return write_modules(generate_product_modules(womens_data, mens_data, mirrored))
@@ -0,0 +1,86 @@
+"""
+Per-host token-bucket rate limiting
+Replaces the fixed "polite" sleeps: callers only wait when the rate budget for a host is spent
+
+One bucket per host is shared by every worker and coroutine, so the rate is a cap on the whole run:
+at the default 1 search/s, more --workers (or the async engine) only overlap the validation and
+download work around searches, not the searches themselves. Raise --rate to search faster.
+"""
+
+import time
+import asyncio
+import threading
+import urllib.parse
+
+# Bing searches per second (per host) and how many may go out back-to-back
+DEFAULT_SEARCH_RATE = 1.0
+DEFAULT_SEARCH_BURST = 2
+
+
+def pacing_note(rate):
+    """Startup reminder of the shared search budget"""
+    if not rate:
+        return "⏱️  Search pacing disabled (--rate 0)"
+    return f"⏱️  Bing searches capped at {rate:g}/s shared by all workers (raise --rate to search faster)"
+
+
+class TokenBucket:
+    """Thread-safe token bucket; tokens may go negative, which queues callers fairly"""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Take one token and return how many seconds the caller must wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self):
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+class HostRateLimiter:
+    """One token bucket per host; a rate of None or 0 disables limiting"""
+
+    def __init__(self, rate=DEFAULT_SEARCH_RATE, burst=DEFAULT_SEARCH_BURST):
+        self.rate = rate
+        self.burst = burst
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url):
+        host = urllib.parse.urlsplit(url).hostname or ""
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.burst)
+            return self._buckets[host]
+
+    def acquire(self, url):
+        """Block until a request to this URL's host fits the budget; returns the time waited"""
+        if not self.rate:
+            return 0.0
+        return self.bucket(url).acquire()
+
+    async def acquire_async(self, url):
+        if not self.rate:
+            return 0.0
+        return await self.bucket(url).acquire_async()
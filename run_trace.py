@@ -0,0 +1,135 @@
+"""
+Lightweight per-stage timing for scrape runs
+Scraper code wraps its stages in span("stage"); when a RunTrace is active every span is appended
+to a JSON-lines trace and aggregated, and print_summary() shows where the run's time went
+
+Stages recorded by the scrapers:
+- driver.get / webdriver.wait: Selenium page load, then the wait for results (which also extracts
+  the candidates in one scripted call, see dom_extract)
+- search.http / rate_limit.wait: plain-HTTP search and time spent waiting for the Bing budget
+- validate / probe: HEAD validation and header probing of one candidate
+- search.primary / search.fallback: the two search tiers of a product in scrape_category
+- product: one product end to end
+- sleep: remaining fixed sleeps (story scraper)
+
+Trace line: {"stage", "ms", "ts", "category", "product", "thread", ...attrs}
+Without an active trace (the default) span() records nothing.
+"""
+
+import os
+import json
+import math
+import time
+import threading
+import contextlib
+import contextvars
+
+DEFAULT_TRACE_PATH = os.path.join(".cache", "scrape_trace.jsonl")
+
+_trace = None
+
+# (category, product name) the current thread / task is working on
+_product = contextvars.ContextVar("product", default=(None, None))
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers (0 for an empty list)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+class RunTrace:
+    """Thread-safe span sink: JSONL file (optional) plus in-memory durations per stage"""
+
+    def __init__(self, path=DEFAULT_TRACE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._durations = {}
+        self._file = None
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(path, "w", encoding="utf-8")
+
+    def record(self, stage, seconds, started, **attrs):
+        category, product = _product.get()
+        record = {"stage": stage, "ms": round(seconds * 1000, 3), "ts": started, "category": category,
+                  "product": product, "thread": threading.current_thread().name, **attrs}
+        with self._lock:
+            self._durations.setdefault(stage, []).append(seconds)
+            if self._file:
+                self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def summary(self):
+        """[{stage, count, total_s, p50_ms, p95_ms, max_ms}] sorted by total time"""
+        with self._lock:
+            durations = {stage: list(values) for stage, values in self._durations.items()}
+        rows = [
+            {"stage": stage, "count": len(values), "total_s": sum(values),
+             "p50_ms": percentile(values, 50) * 1000, "p95_ms": percentile(values, 95) * 1000,
+             "max_ms": max(values) * 1000}
+            for stage, values in durations.items()
+        ]
+        return sorted(rows, key=lambda row: row["total_s"], reverse=True)
+
+    def print_summary(self):
+        rows = self.summary()
+        if not rows:
+            return
+        print("\n⏱️  Time by stage (spans overlap across workers, so totals can exceed wall time)")
+        print(f"  {'stage':<18} {'count':>7} {'total s':>10} {'p50 ms':>10} {'p95 ms':>10} {'max ms':>10}")
+        for row in rows:
+            print(f"  {row['stage']:<18} {row['count']:>7} {row['total_s']:>10.2f} {row['p50_ms']:>10.1f} "
+                  f"{row['p95_ms']:>10.1f} {row['max_ms']:>10.1f}")
+        if self.path:
+            print(f"  📄 Trace written to {self.path}")
+
+    def close(self):
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+
+def use_trace(trace):
+    """Route every span in this process to a RunTrace (None disables tracing)"""
+    global _trace
+    _trace = trace
+
+
+def get_trace():
+    return _trace
+
+
+@contextlib.contextmanager
+def span(stage, **attrs):
+    """Time the enclosed block as one span of the given stage"""
+    trace = _trace
+    if trace is None:
+        yield
+        return
+    started = time.time()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.record(stage, time.perf_counter() - start, started, **attrs)
+
+
+@contextlib.contextmanager
+def product_span(category, name):
+    """Attribute the spans inside the block to one product"""
+    token = _product.set((category, name))
+    try:
+        with span("product"):
+            yield
+    finally:
+        _product.reset(token)
+
+
+def submit(executor, func, *args):
+    """executor.submit that keeps the caller's product context, so worker-thread spans are attributed"""
+    return executor.submit(contextvars.copy_context().run, func, *args)
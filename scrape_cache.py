@@ -0,0 +1,214 @@
+"""
+Persistent on-disk caches for the scrapers (SQLite)
+
+- SearchCache: ordered murl candidate list per (query, qft filters), with TTL and size-bounded eviction
+- VerdictCache: last validation result per image URL (status, content-type, validators, size),
+  negative verdicts expire sooner than positive ones
+- ImageIndex: source URL -> SHA-256 digest of the bytes held in the content-addressed image store
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+
+DEFAULT_CACHE_PATH = os.path.join(".cache", "scrape_cache.sqlite3")
+DEFAULT_SEARCH_TTL = 7 * 24 * 3600
+DEFAULT_MAX_SEARCH_ENTRIES = 5000
+DEFAULT_VERDICT_TTL = 3 * 24 * 3600
+DEFAULT_NEGATIVE_VERDICT_TTL = 6 * 3600
+
+
+class _SqliteStore:
+    """One SQLite connection shared by all threads, serialized with a lock"""
+
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class SearchCache(_SqliteStore):
+    """Cache of Bing result candidates so repeated runs don't touch the network"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=DEFAULT_SEARCH_TTL, max_entries=DEFAULT_MAX_SEARCH_ENTRIES):
+        super().__init__(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        with self._lock, self._conn:
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS search_results (
+                       query TEXT NOT NULL,
+                       qft TEXT NOT NULL,
+                       urls TEXT NOT NULL,
+                       fetched_at REAL NOT NULL,
+                       PRIMARY KEY (query, qft)
+                   )"""
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_search_results_fetched ON search_results (fetched_at)"
+            )
+
+    def get(self, query, qft=""):
+        """Return the cached candidate list, or None if missing or older than the TTL"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT urls, fetched_at FROM search_results WHERE query = ? AND qft = ?", (query, qft)
+            ).fetchone()
+        if row is None:
+            return None
+        urls, fetched_at = row
+        if self.ttl is not None and time.time() - fetched_at > self.ttl:
+            return None
+        return json.loads(urls)
+
+    def put(self, query, qft, urls):
+        """Store the full ordered candidate list for a query"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_results (query, qft, urls, fetched_at) VALUES (?, ?, ?, ?)",
+                (query, qft, json.dumps(list(urls)), time.time()),
+            )
+            if self.max_entries:
+                # Drop the oldest entries beyond the size cap
+                self._conn.execute(
+                    """DELETE FROM search_results WHERE rowid IN (
+                           SELECT rowid FROM search_results ORDER BY fetched_at DESC LIMIT -1 OFFSET ?
+                       )""",
+                    (self.max_entries,),
+                )
+
+    def evict_expired(self):
+        """Delete every entry older than the TTL; returns the number removed"""
+        if self.ttl is None:
+            return 0
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM search_results WHERE fetched_at < ?", (time.time() - self.ttl,)
+            )
+            return cursor.rowcount
+
+
+class VerdictCache(_SqliteStore):
+    """Cache of image URL validation results, with ETag/Last-Modified kept for conditional re-checks"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=DEFAULT_VERDICT_TTL, negative_ttl=DEFAULT_NEGATIVE_VERDICT_TTL):
+        super().__init__(path)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        with self._lock, self._conn:
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS image_verdicts (
+                       url TEXT PRIMARY KEY,
+                       valid INTEGER NOT NULL,
+                       status INTEGER,
+                       content_type TEXT,
+                       etag TEXT,
+                       last_modified TEXT,
+                       content_length INTEGER,
+                       checked_at REAL NOT NULL,
+                       expires_at REAL NOT NULL
+                   )"""
+            )
+
+    def get(self, url):
+        """Return the stored verdict as a dict (with a 'fresh' flag), or None"""
+        with self._lock:
+            row = self._conn.execute(
+                """SELECT valid, status, content_type, etag, last_modified, content_length, checked_at, expires_at
+                   FROM image_verdicts WHERE url = ?""",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        valid, status, content_type, etag, last_modified, content_length, checked_at, expires_at = row
+        return {
+            "valid": bool(valid),
+            "status": status,
+            "content_type": content_type,
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_length": content_length,
+            "checked_at": checked_at,
+            "fresh": time.time() < expires_at,
+        }
+
+    def put(self, url, valid, status=None, content_type=None, etag=None, last_modified=None, content_length=None):
+        """Record a verdict; negative verdicts get the shorter TTL"""
+        now = time.time()
+        expires_at = now + (self.ttl if valid else self.negative_ttl)
+        with self._lock, self._conn:
+            self._conn.execute(
+                """INSERT OR REPLACE INTO image_verdicts
+                   (url, valid, status, content_type, etag, last_modified, content_length, checked_at, expires_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (url, int(bool(valid)), status, content_type, etag, last_modified, content_length, now, expires_at),
+            )
+
+    def touch(self, url):
+        """Extend a positive verdict after the server confirmed it unchanged (304)"""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE image_verdicts SET checked_at = ?, expires_at = ? WHERE url = ?",
+                (now, now + self.ttl, url),
+            )
+
+    def evict_expired(self):
+        """Delete every expired verdict; returns the number removed"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM image_verdicts WHERE expires_at < ?", (time.time(),))
+            return cursor.rowcount
+
+
+class ImageIndex(_SqliteStore):
+    """Maps a source image URL to the digest of its bytes in image_store, plus validators for revalidation"""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH):
+        super().__init__(path)
+        with self._lock, self._conn:
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS image_store (
+                       url TEXT PRIMARY KEY,
+                       digest TEXT NOT NULL,
+                       ext TEXT NOT NULL,
+                       size INTEGER NOT NULL,
+                       etag TEXT,
+                       last_modified TEXT,
+                       stored_at REAL NOT NULL
+                   )"""
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_image_store_digest ON image_store (digest)")
+
+    def get(self, url):
+        """Return {'digest', 'ext', 'size', 'etag', 'last_modified', 'stored_at'} for a URL, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT digest, ext, size, etag, last_modified, stored_at FROM image_store WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(("digest", "ext", "size", "etag", "last_modified", "stored_at"), row))
+
+    def put(self, url, digest, ext, size, etag=None, last_modified=None):
+        with self._lock, self._conn:
+            self._conn.execute(
+                """INSERT OR REPLACE INTO image_store (url, digest, ext, size, etag, last_modified, stored_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (url, digest, ext, size, etag, last_modified, time.time()),
+            )
+
+    def urls_for(self, digest):
+        """Every source URL known to have served these bytes"""
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT url FROM image_store WHERE digest = ?", (digest,))]
@@ -3,20 +3,19 @@ Bing Category Images Scraper (Selenium)
 Scrapes specific 4K Editorial Images for Categories
 - Vertical (Portrait) for Category Cards
 - Horizontal (Landscape) for Shop Hero Banners
+- Real dimensions checked from the image header (Range probe), so wrong shapes
+  and low-resolution results are skipped without downloading them
 """
 
 import os
-import time
-import json
-import random
-import urllib.parse
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+import argparse
+import functools
+
+from browser_profile import DEFAULT_PROFILE, PROFILES, create_driver
+from bing_search import BACKENDS, BingSearch
+from generated_files import write_if_changed
+from image_probe import iter_fitting_images
+from rate_limit import HostRateLimiter
 
 # Category Search Terms
 # [Vertical Query, Horizontal Query]
@@ -43,110 +42,89 @@ CATEGORIES = {
     ]
 }
 
-def setup_driver():
-    """Setup Chrome driver"""
-    chrome_options = Options()
-    # Masking
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-    chrome_options.add_argument("--disable-notifications")
-    chrome_options.add_argument("--start-maximized")
-    
-    # Run visibly to ensure loading
-    # chrome_options.add_argument("--headless") 
+# What each aspect filter must actually deliver (width/height ratio and minimum pixels)
+SHAPES = {
+    "aspect-tall": {"max_ratio": 0.85, "min_width": 600, "min_height": 800},
+    "aspect-wide": {"min_ratio": 1.6, "min_width": 1600, "min_height": 500},
+}
 
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    return driver
+def setup_driver(profile=DEFAULT_PROFILE):
+    """Setup Chrome driver (visible by default to ensure loading)"""
+    return create_driver(profile)
 
-def get_bing_image(driver, search_term, aspect_filter):
+def get_bing_image(search, search_term, aspect_filter, used_urls=None):
     """
     Get a high-quality image URL from Bing Images
     aspect_filter: 'aspect-tall' (Vertical) or 'aspect-wide' (Horizontal)
+    used_urls: optional shared DedupRegistry, so category art never repeats a product image
     """
     try:
-        encoded_term = urllib.parse.quote(search_term)
         # qft filters: 
         # filterui:imagesize-wallpaper (High Res)
         # filterui:aspect-tall or aspect-wide
-        url = f"https://www.bing.com/images/search?q={encoded_term}&qft=+filterui:imagesize-wallpaper+filterui:{aspect_filter}"
-        
         print(f"    Searching: {search_term} ({aspect_filter})")
-        driver.get(url)
-        time.sleep(2)
+        candidates = search.candidates(search_term, f"+filterui:imagesize-wallpaper+filterui:{aspect_filter}", limit=15)
+        candidates = [
+            img_url for img_url in candidates # Check first 15
+            if img_url.startswith("http") and (used_urls is None or img_url not in used_urls)
+        ]
         
-        # Wait for images
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "a.iusc"))
-        )
-        
-        elements = driver.find_elements(By.CSS_SELECTOR, "a.iusc")
-        
-        for element in elements[:15]: # Check first 15
-            try:
-                m_attr = element.get_attribute("m")
-                if not m_attr: continue
-                
-                m_data = json.loads(m_attr)
-                img_url = m_data.get("murl")
-                
-                if not img_url or not img_url.startswith("http"): continue
-                
-                # Simple check to avoid very long data URLs or tracked URLs if possible, 
-                # but Bing direct URLs are usually fine.
-                
-                return img_url
-                
-            except:
+        # Probe headers concurrently; still picked in rank order
+        for img_url, info in iter_fitting_images(candidates, **SHAPES[aspect_filter]):
+            if used_urls is not None and not used_urls.claim(img_url):
                 continue
+            
+            print(f"    📐 {info['width']}x{info['height']} {info['format']}")
+            return img_url
                 
     except Exception as e:
         print(f"    Error: {e}")
         
     return None
 
-def scrape_categories():
-    print("🚀 Starting Bing Category Image Scraper...")
-    driver = setup_driver()
+def scrape_category(search, cat, queries, used_urls=None):
+    """Scrape the vertical card image and horizontal hero image for one category"""
+    print(f"\n📂 Processing: {cat.upper()}")
+    
+    # Scrape Vertical (Card)
+    vertical_url = get_bing_image(search, queries[0], "aspect-tall", used_urls)
+    if vertical_url:
+        print(f"    ✅ Vertical: {vertical_url[:50]}...")
+    else:
+        vertical_url = f"https://placehold.co/600x800/f8f4f0/333?text={cat}+Vertical"
+        print("    ⚠️ No vertical found")
+    
+    # Scrape Horizontal (Hero)
+    horizontal_url = get_bing_image(search, queries[1], "aspect-wide", used_urls)
+    if horizontal_url:
+        print(f"    ✅ Horizontal: {horizontal_url[:50]}...")
+    else:
+        horizontal_url = f"https://placehold.co/1920x600/f8f4f0/333?text={cat}+Hero"
+        print("    ⚠️ No horizontal found")
+
+    return {
+        "image": vertical_url,
+        "heroImage": horizontal_url
+    }
+
+def scrape_categories(backend="selenium", profile=DEFAULT_PROFILE):
+    print(f"🚀 Starting Bing Category Image Scraper ({backend} backend)...")
+    search = BingSearch(functools.partial(setup_driver, profile), backend=backend, limiter=HostRateLimiter())
     results = {}
     
     try:
         for cat, queries in CATEGORIES.items():
-            print(f"\n📂 Processing: {cat.upper()}")
-            
-            # Scrape Vertical (Card)
-            vertical_url = get_bing_image(driver, queries[0], "aspect-tall")
-            if vertical_url:
-                print(f"    ✅ Vertical: {vertical_url[:50]}...")
-            else:
-                vertical_url = f"https://placehold.co/600x800/f8f4f0/333?text={cat}+Vertical"
-                print("    ⚠️ No vertical found")
-                
-            time.sleep(1)
-            
-            # Scrape Horizontal (Hero)
-            horizontal_url = get_bing_image(driver, queries[1], "aspect-wide")
-            if horizontal_url:
-                print(f"    ✅ Horizontal: {horizontal_url[:50]}...")
-            else:
-                horizontal_url = f"https://placehold.co/1920x600/f8f4f0/333?text={cat}+Hero"
-                print("    ⚠️ No horizontal found")
-
-            results[cat] = {
-                "image": vertical_url,
-                "heroImage": horizontal_url
-            }
-            
-            time.sleep(random.uniform(1, 2))
+            results[cat] = scrape_category(search, cat, queries)
             
     finally:
-        driver.quit()
+        search.close()
         
     return results
 
 def update_mock_categories(data):
     """Generate the updated mockCategories.ts file"""
     
-    content = """// Women's luxury product categories with unique hero images and 4K scraped content
+    parts = ["""// Women's luxury product categories with unique hero images and 4K scraped content
 export interface Category {
     _id: string;
     name: string;
@@ -158,7 +136,7 @@ export interface Category {
 }
 
 export const mockCategories: Category[] = [
-"""
+"""]
     
     # Map slug to ID and static data
     cat_meta = {
@@ -175,7 +153,7 @@ export const mockCategories: Category[] = [
         meta = cat_meta[slug]
         img_data = data.get(slug, {"image": "", "heroImage": ""})
         
-        content += f"""    {{
+        parts.append(f"""    {{
         _id: "{meta['id']}",
         name: "{meta['name']}",
         slug: "{slug}",
@@ -183,21 +161,28 @@ export const mockCategories: Category[] = [
         image: "{img_data['image']}",
         heroImage: "{img_data['heroImage']}"
     }},
-"""
+""")
 
-    content += """];
+    parts.append("""];
 
 export default mockCategories;
-"""
+""")
     
-    return content
+    return "".join(parts)
 
 if __name__ == "__main__":
-    data = scrape_categories()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", choices=BACKENDS, default="selenium",
+                        help="image search backend; 'http' skips the browser and only falls back to Selenium when needed")
+    parser.add_argument("--profile", choices=PROFILES, default=DEFAULT_PROFILE,
+                        help="browser profile: 'lean' runs headless with eager loading and blocked subresources")
+    args = parser.parse_args()
+    
+    data = scrape_categories(backend=args.backend, profile=args.profile)
     
     ts_content = update_mock_categories(data)
     
-    with open("src/data/mockCategories.ts", "w", encoding="utf-8") as f:
-        f.write(ts_content)
-        
-    print("\n✅ Successfully updated src/data/mockCategories.ts with 4K images!")
+    if write_if_changed("src/data/mockCategories.ts", ts_content):
+        print("\n✅ Successfully updated src/data/mockCategories.ts with 4K images!")
+    else:
+        print("\n⏭️  src/data/mockCategories.ts is already up to date")
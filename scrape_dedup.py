@@ -0,0 +1,52 @@
+"""
+Shared de-duplication registry for the image scrapers
+Keeps every chosen image URL unique across categories and workers
+
+Features:
+- Thread-safe set of used URLs (lock-protected)
+- Atomic claim() so two workers can never pick the same image
+- Optional perceptual stage (image_hash.NearDuplicateIndex) that also rejects
+  the same photo under a different URL
+"""
+
+import threading
+
+
+class DedupRegistry:
+    """Lock-protected set of image URLs already assigned to a product"""
+
+    def __init__(self, urls=None, near_duplicates=None):
+        self._lock = threading.Lock()
+        self._urls = set(urls or ())
+        self.near_duplicates = near_duplicates
+        if near_duplicates is not None and self._urls:
+            near_duplicates.seed(self._urls)
+
+    def __contains__(self, url):
+        with self._lock:
+            return url in self._urls
+
+    def __len__(self):
+        with self._lock:
+            return len(self._urls)
+
+    def add(self, url):
+        with self._lock:
+            self._urls.add(url)
+
+    def claim(self, url):
+        """Reserve a URL; returns False if another product already owns it (or a near-duplicate of it)"""
+        with self._lock:
+            if url in self._urls:
+                return False
+            self._urls.add(url)
+        # Hashing downloads the image, so it runs outside the lock; a rejected URL stays
+        # reserved so no other worker spends a download on it
+        if self.near_duplicates is not None and not self.near_duplicates.claim(url):
+            return False
+        return True
+
+    def snapshot(self):
+        """Return a plain set copy of all used URLs"""
+        with self._lock:
+            return set(self._urls)
@@ -5,17 +5,16 @@ Targets Bing Images which is more reliable for scraping than Google
 """
 
 import os
-import time
-import json
-import random
+import argparse
+import functools
 import urllib.parse
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+
+import fix_product_images
+from browser_profile import DEFAULT_PROFILE, PROFILES, create_driver
+from bing_search import BACKENDS, BingSearch
+from product_codegen import update_category_images
+from rate_limit import HostRateLimiter
+from scrape_cache import DEFAULT_SEARCH_TTL, SearchCache
 
 # Product search terms - optimized for visual clarity
 PRODUCTS = {
@@ -78,80 +77,37 @@ PRODUCTS = {
 
 OUTPUT_DIR = "scraped_data"
 
-def setup_driver():
-    """Setup Chrome driver with basic options"""
-    chrome_options = Options()
-    
-    # Random realistic user agent
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-    
-    # Basic options
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("--start-maximized")
-    chrome_options.add_argument("--disable-notifications")
-    
-    # To run visibly (not headless) for best results
-    # chrome_options.add_argument("--headless") 
-
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    return driver
+def setup_driver(profile=DEFAULT_PROFILE):
+    """Setup Chrome driver for the chosen browser profile"""
+    return create_driver(profile)
 
-def get_bing_image(driver, search_term, used_urls):
+def get_bing_image(search, search_term, used_urls):
     """Get a unique high-quality image URL from Bing Images"""
     try:
-        encoded_term = urllib.parse.quote(search_term)
-        url = f"https://www.bing.com/images/search?q={encoded_term}&qft=+filterui:imagesize-large"
+        # Bing stores metadata in the 'm' attribute of 'a.iusc'; the backend returns its murls
+        candidates = search.candidates(search_term, "+filterui:imagesize-large", limit=10)
         
-        driver.get(url)
-        # Wait for potential redirects or load
-        time.sleep(1.5)
-        
-        # Wait for image containers
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "a.iusc"))
-        )
-        
-        # Find image elements (Bing stores metadata in 'm' attribute of 'a.iusc')
-        elements = driver.find_elements(By.CSS_SELECTOR, "a.iusc")
-        
-        for element in elements[:10]: # Check first 10 results
-            try:
-                m_attr = element.get_attribute("m")
-                if not m_attr:
-                    continue
-                    
-                m_data = json.loads(m_attr)
-                img_url = m_data.get("murl")
-                
-                if not img_url:
-                    continue
-                    
-                # Check uniqueness
-                if img_url in used_urls:
-                    continue
-                
-                # Basic validation
-                if not img_url.startswith("http"):
-                    continue
-                    
-                # We found a good, unique URL
-                return img_url
-                
-            except Exception as e:
-                # print(f"Error parsing element: {e}")
+        for img_url in candidates: # Check first 10 results
+            # Check uniqueness
+            if img_url in used_urls:
+                continue
+            
+            # Basic validation
+            if not img_url.startswith("http"):
                 continue
                 
+            # We found a good, unique URL
+            return img_url
+                
     except Exception as e:
         print(f"    Error searching '{search_term}': {e}")
         
     return None
 
-def scrape_all():
-    print("🚀 Starting Bing Images Scraper (Selenium)...")
+def scrape_all(backend="selenium", cache=None, profile=DEFAULT_PROFILE):
+    print(f"🚀 Starting Bing Images Scraper ({backend} backend)...")
     
-    driver = setup_driver()
+    search = BingSearch(functools.partial(setup_driver, profile), backend=backend, cache=cache, limiter=HostRateLimiter())
     used_urls = set()
     all_data = {}
     
@@ -163,7 +119,7 @@ def scrape_all():
             for i, item in enumerate(items):
                 print(f"  [{i+1}/{len(items)}] Searching: {item}")
                 
-                url = get_bing_image(driver, item, used_urls)
+                url = get_bing_image(search, item, used_urls)
                 
                 if url:
                     print(f"    ✅ Found: {url[:60]}...")
@@ -174,120 +130,32 @@ def scrape_all():
                     # Fallback unique placeholder
                     placeholder = f"https://placehold.co/800x1000/FAFAFA/333333?text={urllib.parse.quote(item)}"
                     category_images.append(placeholder)
-                
-                # Polite delay
-                time.sleep(random.uniform(0.5, 1.5))
             
             all_data[category] = category_images
             
     finally:
-        driver.quit()
+        search.close()
         
     return all_data
 
-def generate_typescript(data):
-    """Generates the mockProducts.ts file content"""
-    
-    ts_content = """// Women's luxury products - 125 unique items with Selenium-scraped Unique Images
-export interface MockProduct {
-    _id: string;
-    name: string;
-    slug: string;
-    description: string;
-    price: number;
-    compareAtPrice?: number;
-    category: { _id: string; name: string; slug: string; };
-    categoryName: string;
-    image: string;
-    images: string[];
-    stock: number;
-    isNew: boolean;
-    isFeatured: boolean;
-    isActive: boolean;
-    rating: number;
-    numReviews: number;
-    tags: string[];
-}
-"""
-
-    # Create image arrays
-    for category, urls in data.items():
-        ts_content += f"\nconst {category}Images = [\n"
-        for url in urls:
-            ts_content += f'    "{url}",\n'
-        ts_content += "];\n"
-
-    # Add the static names arrays from the original file (recreating them here for completeness)
-    ts_content += """
-const handbagNames = ["Quilted Shoulder Bag", "Structured Tote", "Mini Crossbody", "Woven Clutch", "Saddle Bag", "Bucket Bag", "Chain Link Bag", "Envelope Clutch", "Doctor Bag", "Shopper Tote", "Flap Bag", "Hobo Bag", "Box Bag", "Baguette Bag", "Camera Bag", "Top Handle Bag", "Drawstring Bag", "Frame Bag", "Bowling Bag", "Satchel Bag", "Pouch Bag", "Circle Bag", "Belt Bag", "Trunk Bag", "Kelly Style Bag"];
-
-const jewelryNames = ["Diamond Bracelet", "Pearl Earrings", "Gold Necklace", "Sapphire Ring", "Tennis Bracelet", "Layered Necklace", "Emerald Earrings", "Bangle Set", "Pendant Necklace", "Cocktail Ring", "Charm Bracelet", "Hoop Earrings", "Chain Necklace", "Statement Ring", "Cuff Bracelet", "Drop Earrings", "Choker Necklace", "Eternity Ring", "Link Bracelet", "Stud Earrings", "Lariat Necklace", "Signet Ring", "Bar Bracelet", "Chandelier Earrings", "Collar Necklace"];
-
-const shoeNames = ["Patent Pumps", "Embellished Sandals", "Suede Boots", "Strappy Mules", "Ballet Flats", "Kitten Slingbacks", "Platform Loafers", "Velvet Pumps", "Block Heel Sandals", "Ankle Booties", "Pointed Stilettos", "Lace-Up Heels", "Slip-On Mules", "Wedge Sandals", "Combat Boots", "Mary Jane Pumps", "Espadrille Wedges", "Gladiator Sandals", "Chelsea Boots", "D'Orsay Pumps", "Cage Heels", "Knee-High Boots", "Slide Sandals", "Oxford Flats", "Peep Toe Heels"];
-
-const dressNames = ["Silk Midi Dress", "Velvet Gown", "Lace Cocktail Dress", "Satin Slip Dress", "Sequin Mini Dress", "Chiffon Maxi Dress", "Bodycon Dress", "A-Line Dress", "Wrap Dress", "Shirt Dress", "Pleated Dress", "Ruffle Dress", "Off-Shoulder Dress", "Halter Dress", "Blazer Dress", "Knit Dress", "Tiered Dress", "Column Dress", "Bandage Dress", "Tea Dress", "Shift Dress", "Fit Flare Dress", "Asymmetric Dress", "Cutout Dress", "Embroidered Dress"];
-
-const accessoryNames = ["Silk Scarf", "Leather Belt", "Designer Sunglasses", "Cashmere Gloves", "Pearl Hair Clip", "Luxury Watch", "Wool Hat", "Designer Wallet", "Travel Organizer", "Leather Keychain", "Phone Case", "Card Holder", "Makeup Pouch", "Passport Cover", "Jewelry Box", "Headband", "Hair Bow", "Brooch Pin", "Tie Pin", "Cufflinks Set", "Money Clip", "Valet Tray", "Umbrella", "Pocket Square", "Watch Strap"];
-
-function createProduct(id: number, name: string, catId: string, catName: string, catSlug: string, image: string, basePrice: number): MockProduct {
-    const price = basePrice + Math.floor(Math.random() * 500);
-    const hasDiscount = Math.random() > 0.7;
-    const isNew = Math.random() > 0.6;
-    const isFeatured = Math.random() > 0.7;
-    
-    // Ensure slug is clean
-    const slug = name.toLowerCase().replace(/\\s+/g, '-').replace(/[^a-z0-9-]/g, '');
-
-    return {
-        _id: `prod-${id}`,
-        name,
-        slug,
-        description: `Exquisite ${name.toLowerCase()} crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.`,
-        price,
-        compareAtPrice: hasDiscount ? price + Math.floor(Math.random() * 300) + 100 : undefined,
-        category: { _id: catId, name: catName, slug: catSlug },
-        categoryName: catName,
-        image,
-        images: [image],
-        stock: Math.floor(Math.random() * 30) + 5,
-        isNew,
-        isFeatured,
-        isActive: true,
-        rating: 4 + Math.random(),
-        numReviews: Math.floor(Math.random() * 150) + 10,
-        tags: [catSlug, "luxury", "women", "designer", isNew ? "new-arrival" : "", isFeatured ? "featured" : ""].filter(Boolean)
-    };
-}
-
-export const mockProducts: MockProduct[] = [
-    // HANDBAGS
-    ...handbagNames.map((name, i) => createProduct(i + 1, name, "cat-1", "Handbags", "handbags", handbagImages[i], 850 + i * 80)),
-
-    // JEWELRY
-    ...jewelryNames.map((name, i) => createProduct(i + 26, name, "cat-2", "Jewelry", "jewelry", jewelryImages[i], 1200 + i * 150)),
-
-    // SHOES
-    ...shoeNames.map((name, i) => createProduct(i + 51, name, "cat-3", "Shoes", "shoes", shoeImages[i], 395 + i * 40)),
-
-    // DRESSES
-    ...dressNames.map((name, i) => createProduct(i + 76, name, "cat-4", "Dresses", "dresses", dressImages[i], 450 + i * 60)),
-
-    // ACCESSORIES
-    ...accessoryNames.map((name, i) => createProduct(i + 101, name, "cat-5", "Accessories", "accessories", accessoryImages[i], 150 + i * 50))
-];
-
-export default mockProducts;
-"""
-    return ts_content
-
 if __name__ == "__main__":
-    data = scrape_all()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", choices=BACKENDS, default="selenium",
+                        help="image search backend; 'http' skips the browser and only falls back to Selenium when needed")
+    parser.add_argument("--profile", choices=PROFILES, default=DEFAULT_PROFILE,
+                        help="browser profile: 'lean' runs headless with eager loading and blocked subresources")
+    parser.add_argument("--cache-ttl", type=float, default=DEFAULT_SEARCH_TTL / 3600,
+                        help="hours a cached Bing result list stays fresh")
+    parser.add_argument("--no-cache", action="store_true", help="always query Bing, ignore the search cache")
+    args = parser.parse_args()
     
-    # Generate Mock Data
-    ts_code = generate_typescript(data)
+    cache = None if args.no_cache else SearchCache(ttl=args.cache_ttl * 3600)
     
-    # Save to file
-    with open("src/data/mockProducts.ts", "w", encoding="utf-8") as f:
-        f.write(ts_code)
-        
-    print("\\n✅ Successfully updated src/data/mockProducts.ts with 125 unique images!")
+    data = scrape_all(backend=args.backend, cache=cache, profile=args.profile)
+    
+    # Regenerate the per-category modules (see product_codegen) with the new images
+    print("\n📝 Generating TypeScript files...")
+    if update_category_images(data, fix_product_images.WOMENS_PRODUCTS, fix_product_images.MENS_PRODUCTS):
+        print(f"\n✅ Successfully updated the product modules with {sum(map(len, data.values()))} images!")
+    else:
+        print("\n⏭️  The product modules are already up to date")
@@ -0,0 +1,79 @@
+"""
+Append-only JSONL journal of scrape progress
+One line per finished product, written as soon as its image is chosen,
+so an interrupted run can resume without redoing completed products
+
+Record fields:
+- category: category slug, e.g. "handbags" or "mens-watches"
+- index / name: position and name of the product within the category
+- url: the chosen image URL
+- tier: "primary" (validated search), "fallback" (simpler query) or "placeholder"
+"""
+
+import os
+import json
+import time
+import threading
+
+DEFAULT_JOURNAL_PATH = os.path.join(".cache", "scrape_journal.jsonl")
+
+TIERS = ("primary", "fallback", "placeholder")
+
+
+class ScrapeJournal:
+    """Thread-safe append-only journal; load() replays it for --resume"""
+
+    def __init__(self, path=DEFAULT_JOURNAL_PATH, resume=False):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._records = self.load(path) if resume else {}
+        # A fresh run starts a fresh journal
+        self._file = open(path, "a" if resume else "w", encoding="utf-8")
+
+    @staticmethod
+    def load(path):
+        """Read a journal into {(category, index): record}; later lines win, a torn last line is ignored"""
+        records = {}
+        if not os.path.exists(path):
+            return records
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                records[(record["category"], record["index"])] = record
+        return records
+
+    def __len__(self):
+        with self._lock:
+            return len(self._records)
+
+    def completed(self, category, index, name=None):
+        """Return the journal record for a finished product, or None"""
+        with self._lock:
+            record = self._records.get((category, index))
+        if record is None or (name is not None and record["name"] != name):
+            return None
+        return record
+
+    def used_urls(self):
+        """Every real (non-placeholder) image URL already assigned, to rebuild the dedup registry"""
+        with self._lock:
+            return {r["url"] for r in self._records.values() if r["tier"] != "placeholder"}
+
+    def record(self, category, index, name, url, tier):
+        """Append one finished product and flush it to disk immediately"""
+        record = {"category": category, "index": index, "name": name, "url": url, "tier": tier, "ts": time.time()}
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            self._records[(category, index)] = record
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
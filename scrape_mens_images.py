@@ -4,17 +4,16 @@ Scrapes high-quality, UNIQUE images for Men's luxury products
 """
 
 import os
-import time
-import json
-import random
+import argparse
+import functools
 import urllib.parse
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+
+import fix_product_images
+from browser_profile import DEFAULT_PROFILE, PROFILES, create_driver
+from bing_search import BACKENDS, BingSearch
+from product_codegen import update_category_images
+from rate_limit import HostRateLimiter
+from scrape_cache import DEFAULT_SEARCH_TTL, SearchCache
 
 # Men's product search terms
 MENS_PRODUCTS = {
@@ -65,67 +64,33 @@ MENS_PRODUCTS = {
     ]
 }
 
-def setup_driver():
-    """Setup Chrome driver with basic options"""
-    chrome_options = Options()
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("--start-maximized")
-    chrome_options.add_argument("--disable-notifications")
-    # chrome_options.add_argument("--headless")  # Uncomment for headless mode
-
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    return driver
+def setup_driver(profile=DEFAULT_PROFILE):
+    """Setup Chrome driver for the chosen browser profile"""
+    return create_driver(profile)
 
-def get_bing_image(driver, search_term, used_urls):
+def get_bing_image(search, search_term, used_urls):
     """Get a unique high-quality image URL from Bing Images"""
     try:
-        encoded_term = urllib.parse.quote(search_term)
-        url = f"https://www.bing.com/images/search?q={encoded_term}&qft=+filterui:imagesize-large"
-        
-        driver.get(url)
-        time.sleep(1.5)
-        
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "a.iusc"))
-        )
-        
-        elements = driver.find_elements(By.CSS_SELECTOR, "a.iusc")
+        candidates = search.candidates(search_term, "+filterui:imagesize-large", limit=15)
         
-        for element in elements[:15]:
-            try:
-                m_attr = element.get_attribute("m")
-                if not m_attr:
-                    continue
-                    
-                m_data = json.loads(m_attr)
-                img_url = m_data.get("murl")
-                
-                if not img_url:
-                    continue
-                    
-                if img_url in used_urls:
-                    continue
-                
-                if not img_url.startswith("http"):
-                    continue
-                    
-                return img_url
-                
-            except Exception as e:
+        for img_url in candidates:
+            if img_url in used_urls:
+                continue
+            
+            if not img_url.startswith("http"):
                 continue
                 
+            return img_url
+                
     except Exception as e:
         print(f"    Error searching '{search_term}': {e}")
         
     return None
 
-def scrape_mens_images():
-    print("🚀 Starting Men's Products Image Scraper (Selenium)...")
+def scrape_mens_images(backend="selenium", cache=None, profile=DEFAULT_PROFILE):
+    print(f"🚀 Starting Men's Products Image Scraper ({backend} backend)...")
     
-    driver = setup_driver()
+    search = BingSearch(functools.partial(setup_driver, profile), backend=backend, cache=cache, limiter=HostRateLimiter())
     used_urls = set()
     all_data = {}
     
@@ -137,7 +102,7 @@ def scrape_mens_images():
             for i, item in enumerate(items):
                 print(f"  [{i+1}/{len(items)}] Searching: {item}")
                 
-                url = get_bing_image(driver, item, used_urls)
+                url = get_bing_image(search, item, used_urls)
                 
                 if url:
                     print(f"    ✅ Found: {url[:60]}...")
@@ -147,130 +112,32 @@ def scrape_mens_images():
                     print(f"    ⚠️ No unique image found (using placeholder)")
                     placeholder = f"https://placehold.co/800x1000/2C2C2C/D4AF37?text={urllib.parse.quote(item)}"
                     category_images.append(placeholder)
-                
-                time.sleep(random.uniform(0.5, 1.5))
             
             all_data[category] = category_images
             
     finally:
-        driver.quit()
+        search.close()
         
     return all_data
 
-def generate_typescript(data):
-    """Generates updated mockMensProducts.ts content"""
-    
-    ts_content = """// Men's luxury products - 100 unique items with Selenium-scraped images
-export interface MockProduct {
-    _id: string;
-    name: string;
-    slug: string;
-    description: string;
-    price: number;
-    compareAtPrice?: number;
-    category: { _id: string; name: string; slug: string; };
-    categoryName: string;
-    image: string;
-    images: string[];
-    stock: number;
-    isNew: boolean;
-    isFeatured: boolean;
-    isActive: boolean;
-    rating: number;
-    numReviews: number;
-    tags: string[];
-    gender: 'men';
-}
-"""
-
-    # Category mappings
-    cat_var_names = {
-        "mens-watches": "watchesImages",
-        "mens-bags": "mensBagsImages",
-        "mens-shoes": "mensShoesImages",
-        "mens-suits": "suitImages",
-        "mens-accessories": "mensAccessoriesImages"
-    }
-
-    # Create image arrays
-    for category, urls in data.items():
-        var_name = cat_var_names.get(category, category.replace("-", "_") + "Images")
-        ts_content += f"\nconst {var_name} = [\n"
-        for url in urls:
-            ts_content += f'    "{url}",\n'
-        ts_content += "];\n"
-
-    # Add product names and create function (same as original)
-    ts_content += """
-const watchNames = ["Chronograph Elite", "Classic Automatic", "Diver's Professional", "Dress Watch", "Sport Chronometer", "Pilot Watch", "Skeleton Watch", "Moon Phase", "GMT Master", "Day-Date", "Perpetual Calendar", "Tourbillon", "Racing Chronograph", "Vintage Dress", "Military Field", "Nautical Timer", "Executive Gold", "Minimalist Steel", "Heritage Bronze", "Modern Ceramic"];
-
-const mensBagNames = ["Leather Briefcase", "Messenger Bag", "Laptop Portfolio", "Weekend Duffel", "Leather Backpack", "Document Case", "Travel Carry-On", "Crossbody Satchel", "Slim Folio", "Overnight Bag", "Executive Attache", "Convertible Tote", "Tech Backpack", "Garment Bag", "Duffle Weekender", "Shoulder Messenger", "Leather Holdall", "Business Bag", "Vintage Satchel", "Premium Carryall"];
-
-const mensShoeNames = ["Oxford Dress Shoes", "Derby Brogues", "Leather Loafers", "Chelsea Boots", "Monk Strap", "Penny Loafers", "Wingtip Oxfords", "Suede Loafers", "Dress Boots", "Cap Toe Oxfords", "Tassel Loafers", "Chukka Boots", "Whole Cut", "Double Monk", "Venetian Loafers", "Jodhpur Boots", "Bit Loafers", "Longwing Brogues", "Side Zip Boots", "Opera Pumps"];
-
-const suitNames = ["Classic Navy Suit", "Charcoal Pinstripe", "Slim Fit Black", "Italian Wool", "Double Breasted", "Peak Lapel", "Windowpane Check", "Herringbone Tweed", "Linen Summer", "Velvet Evening", "Tuxedo Set", "Three Piece", "Morning Coat", "Business Gray", "Midnight Blue", "Designer Blazer", "Cashmere Blend", "Sport Coat", "Dinner Jacket", "Modern Fit"];
-
-const mensAccessoryNames = ["Silk Tie", "Leather Belt", "Cufflinks Set", "Pocket Square", "Leather Wallet", "Tie Bar", "Lapel Pin", "Sunglasses", "Money Clip", "Card Holder", "Collar Stays", "Bracelet", "Ring", "Handkerchief Set", "Suspenders", "Bow Tie", "Watch Band", "Passport Holder", "Key Holder", "Collar Pin"];
-
-function createMensProduct(id: number, name: string, catId: string, catName: string, catSlug: string, image: string, basePrice: number): MockProduct {
-    const price = basePrice + Math.floor(Math.random() * 500);
-    const hasDiscount = Math.random() > 0.7;
-    const isNew = Math.random() > 0.6;
-    const isFeatured = Math.random() > 0.7;
-
-    const slug = name.toLowerCase().replace(/\\s+/g, '-').replace(/[^a-z0-9-]/g, '');
-
-    return {
-        _id: `mens-prod-${id}`,
-        name,
-        slug,
-        description: `Premium ${name.toLowerCase()} crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.`,
-        price,
-        compareAtPrice: hasDiscount ? price + Math.floor(Math.random() * 300) + 100 : undefined,
-        category: { _id: catId, name: catName, slug: catSlug },
-        categoryName: catName,
-        image,
-        images: [image],
-        stock: Math.floor(Math.random() * 30) + 5,
-        isNew,
-        isFeatured,
-        isActive: true,
-        rating: 4 + Math.random(),
-        numReviews: Math.floor(Math.random() * 150) + 10,
-        tags: [catSlug, "luxury", "men", "designer", isNew ? "new-arrival" : "", isFeatured ? "featured" : ""].filter(Boolean),
-        gender: 'men'
-    };
-}
-
-export const mockMensProducts: MockProduct[] = [
-    // WATCHES
-    ...watchNames.map((name, i) => createMensProduct(i + 1, name, "cat-6", "Men's Watches", "mens-watches", watchesImages[i], 2500 + i * 200)),
-
-    // BAGS
-    ...mensBagNames.map((name, i) => createMensProduct(i + 21, name, "cat-7", "Men's Bags", "mens-bags", mensBagsImages[i], 450 + i * 80)),
-
-    // SHOES
-    ...mensShoeNames.map((name, i) => createMensProduct(i + 41, name, "cat-8", "Men's Shoes", "mens-shoes", mensShoesImages[i], 350 + i * 50)),
-
-    // SUITS
-    ...suitNames.map((name, i) => createMensProduct(i + 61, name, "cat-9", "Men's Suits", "mens-suits", suitImages[i], 1200 + i * 150)),
-
-    // ACCESSORIES
-    ...mensAccessoryNames.map((name, i) => createMensProduct(i + 81, name, "cat-10", "Men's Accessories", "mens-accessories", mensAccessoriesImages[i], 95 + i * 40))
-];
-
-export default mockMensProducts;
-"""
-    return ts_content
-
 if __name__ == "__main__":
-    data = scrape_mens_images()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", choices=BACKENDS, default="selenium",
+                        help="image search backend; 'http' skips the browser and only falls back to Selenium when needed")
+    parser.add_argument("--profile", choices=PROFILES, default=DEFAULT_PROFILE,
+                        help="browser profile: 'lean' runs headless with eager loading and blocked subresources")
+    parser.add_argument("--cache-ttl", type=float, default=DEFAULT_SEARCH_TTL / 3600,
+                        help="hours a cached Bing result list stays fresh")
+    parser.add_argument("--no-cache", action="store_true", help="always query Bing, ignore the search cache")
+    args = parser.parse_args()
     
-    # Generate TypeScript
-    ts_code = generate_typescript(data)
+    cache = None if args.no_cache else SearchCache(ttl=args.cache_ttl * 3600)
     
-    # Save to file
-    with open("src/data/mockMensProducts.ts", "w", encoding="utf-8") as f:
-        f.write(ts_code)
-        
-    print("\n✅ Successfully updated src/data/mockMensProducts.ts with 100 unique men's product images!")
+    data = scrape_mens_images(backend=args.backend, cache=cache, profile=args.profile)
+    
+    # Regenerate the per-category modules (see product_codegen) with the new images
+    print("\n📝 Generating TypeScript files...")
+    if update_category_images(data, fix_product_images.WOMENS_PRODUCTS, fix_product_images.MENS_PRODUCTS):
+        print(f"\n✅ Successfully updated the men's product modules with {sum(map(len, data.values()))} images!")
+    else:
+        print("\n⏭️  The men's product modules are already up to date")
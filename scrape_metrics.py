@@ -0,0 +1,124 @@
+"""
+Live Prometheus metrics for long scrape runs
+The scrapers update these as they go; serve() exposes them on a local /metrics endpoint so
+throttling and throughput can be watched (and concurrency tuned) while a refresh is running
+
+Metrics:
+- scrape_search_queries_total{engine}           searches that went to the network
+- scrape_search_cache_hits_total                 searches answered by the SearchCache
+- scrape_validation_failures_total{reason}       http_4xx / http_5xx / not_image / network
+- scrape_products_total{tier}                    primary / fallback / placeholder
+- scrape_request_seconds{kind,host}              search / validate / probe latency per host
+- scrape_products_done, scrape_products_expected, scrape_throughput_per_minute, scrape_eta_seconds
+"""
+
+import time
+import threading
+import contextlib
+import urllib.parse
+
+from prometheus_client import Counter, Gauge, Histogram, start_http_server
+
+DEFAULT_METRICS_PORT = 9464
+
+SEARCH_QUERIES = Counter("scrape_search_queries_total", "Image searches sent to the network", ["engine"])
+SEARCH_CACHE_HITS = Counter("scrape_search_cache_hits_total", "Image searches answered by the search cache")
+VALIDATION_FAILURES = Counter("scrape_validation_failures_total", "Rejected image candidates", ["reason"])
+PRODUCTS = Counter("scrape_products_total", "Products finished, by how their image was found", ["tier"])
+REQUEST_SECONDS = Histogram(
+    "scrape_request_seconds", "Latency of outgoing scraper requests", ["kind", "host"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30),
+)
+
+
+class Progress:
+    """Products done vs expected for the current run; feeds the throughput and ETA gauges"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.expected = 0
+        self.done = 0
+        self.started = None
+
+    def start(self, expected):
+        with self._lock:
+            self.expected += expected
+            if self.started is None:
+                self.started = time.monotonic()
+
+    def advance(self, count=1):
+        with self._lock:
+            self.done += count
+
+    def per_minute(self):
+        with self._lock:
+            if not self.started or not self.done:
+                return 0.0
+            return self.done / max(time.monotonic() - self.started, 1e-9) * 60
+
+    def eta_seconds(self):
+        rate = self.per_minute()
+        with self._lock:
+            remaining = max(self.expected - self.done, 0)
+        return remaining / rate * 60 if rate else float("nan")
+
+
+progress = Progress()
+
+Gauge("scrape_products_done", "Products finished in this run").set_function(lambda: progress.done)
+Gauge("scrape_products_expected", "Products this run is expected to finish").set_function(lambda: progress.expected)
+Gauge("scrape_throughput_per_minute", "Products finished per minute since the run started").set_function(
+    progress.per_minute
+)
+Gauge("scrape_eta_seconds", "Estimated seconds until every expected product is done").set_function(
+    progress.eta_seconds
+)
+
+
+def serve(port=DEFAULT_METRICS_PORT, addr="127.0.0.1"):
+    """Start the /metrics endpoint on a background thread"""
+    start_http_server(port, addr=addr)
+    print(f"📈 Metrics at http://{addr}:{port}/metrics")
+
+
+def _host(url):
+    return urllib.parse.urlsplit(url).hostname or ""
+
+
+@contextlib.contextmanager
+def timed_request(kind, url):
+    """Observe the enclosed request's latency under its host"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        REQUEST_SECONDS.labels(kind, _host(url)).observe(time.perf_counter() - start)
+
+
+def record_search(engine, cached=False):
+    if cached:
+        SEARCH_CACHE_HITS.inc()
+    else:
+        SEARCH_QUERIES.labels(engine).inc()
+
+
+def validation_failure_reason(status=None):
+    """Label for a rejected candidate: http_4xx / http_5xx / not_image, or network when there was no response"""
+    if status is None:
+        return "network"
+    if status >= 500:
+        return "http_5xx"
+    if status >= 400:
+        return "http_4xx"
+    if status != 200:
+        return f"http_{status // 100}xx"
+    return "not_image"
+
+
+def record_validation_failure(status=None):
+    VALIDATION_FAILURES.labels(validation_failure_reason(status)).inc()
+
+
+def record_product(tier):
+    PRODUCTS.labels(tier).inc()
+    progress.advance()
@@ -0,0 +1,264 @@
+"""
+Catalog refresh orchestrator
+Runs the women's products, men's products, category and story jobs as stages of ONE pipeline
+
+Every stage shares:
+- the pool of search workers (one lazily-started browser each, or none with --backend http)
+- the on-disk search and validation caches
+- the per-host rate limiter
+- the dedup registry, so the same image never lands on a product AND a category card
+  (with --near-dup, not even the same photo under another URL)
+
+Product searches use the definitions in fix_product_images (which supersede the older
+scrape_images / scrape_mens_images query lists); categories come from scrape_category_images
+and the story image from scrape_story_image.
+"""
+
+import queue
+import argparse
+import functools
+import threading
+
+import cache_warm
+import catalog_db
+import fix_product_images
+import scrape_category_images
+import scrape_metrics
+import scrape_story_image
+from bing_search import BACKENDS, BingSearch
+from browser_profile import DEFAULT_PROFILE, PROFILES, create_driver
+from image_hash import DEFAULT_MAX_DISTANCE, HASH_FUNCTIONS, NearDuplicateIndex
+from image_mirror import mirror_images
+from image_validation import use_verdict_cache
+from product_codegen import read_generated_images, read_generated_mirrored
+from rate_limit import DEFAULT_SEARCH_BURST, DEFAULT_SEARCH_RATE, HostRateLimiter, pacing_note
+from run_trace import DEFAULT_TRACE_PATH, RunTrace, span, use_trace
+from scrape_cache import DEFAULT_SEARCH_TTL, SearchCache, VerdictCache
+from scrape_dedup import DedupRegistry
+from scrape_journal import DEFAULT_JOURNAL_PATH, ScrapeJournal
+
+STAGES = ("womens", "mens", "categories", "story")
+PRODUCT_STAGES = (("womens", fix_product_images.WOMENS_PRODUCTS), ("mens", fix_product_images.MENS_PRODUCTS))
+PLACEHOLDER_HOST = "https://placehold.co/"
+
+
+def build_tasks(stages, used_urls, journal=None):
+    """Flatten the selected stages into (stage, key, job) tasks; job(search) returns the stage result"""
+    tasks = []
+    if "womens" in stages:
+        for category, data in fix_product_images.WOMENS_PRODUCTS.items():
+            tasks.append(("womens", category, functools.partial(
+                fix_product_images.scrape_category, category_data=data, used_urls=used_urls, journal=journal)))
+    if "mens" in stages:
+        for category, data in fix_product_images.MENS_PRODUCTS.items():
+            tasks.append(("mens", category, functools.partial(
+                fix_product_images.scrape_category, category_data=data, used_urls=used_urls, is_mens=True,
+                journal=journal)))
+    if "categories" in stages:
+        for cat, queries in scrape_category_images.CATEGORIES.items():
+            tasks.append(("categories", cat, functools.partial(
+                scrape_category_images.scrape_category, cat=cat, queries=queries, used_urls=used_urls)))
+    if "story" in stages:
+        # The story scraper drives Google directly, so it borrows the worker's browser
+        tasks.append(("story", "atelier", lambda search: scrape_story_image.scrape_story_image(
+            driver=search.driver, used_urls=used_urls)))
+    return tasks
+
+
+def _pipeline_worker(worker_id, tasks, results, errors, make_search):
+    search = make_search()
+    try:
+        while True:
+            try:
+                stage, key, job = tasks.get_nowait()
+            except queue.Empty:
+                return
+            print(f"\n🔧 [worker {worker_id}] {stage}: {key}")
+            results[(stage, key)] = job(search)
+    except Exception as e:
+        errors.append(e)
+    finally:
+        search.close()
+
+
+def published_product_images(stages):
+    """
+    Image URLs already in the generated modules of the product stages that won't be re-scraped
+    (the source URLs of mirrored images, which is what search candidates are compared against)
+    """
+    urls = set()
+    for stage, products in PRODUCT_STAGES:
+        if stage not in stages:
+            for cat_data in read_generated_images(products).values():
+                urls.update(url for url in cat_data.get("images", []) if not url.startswith(PLACEHOLDER_HOST))
+    return urls
+
+
+def run_pipeline(stages=STAGES, workers=2, backend="selenium", profile=DEFAULT_PROFILE,
+                 cache=None, limiter=None, journal=None, used_urls=None, near_duplicates=None):
+    """Run every task of the selected stages over one shared worker pool; returns {stage: {key: result}}"""
+    if used_urls is None:
+        # Skipped product stages keep their published images, so category / story art must not reuse them
+        urls = published_product_images(stages)
+        if journal is not None:
+            urls |= journal.used_urls()
+        used_urls = DedupRegistry(urls, near_duplicates)
+    limiter = limiter if limiter is not None else HostRateLimiter()
+
+    for stage, products in PRODUCT_STAGES:
+        if stage in stages:
+            scrape_metrics.progress.start(fix_product_images.pending_products(products, journal))
+
+    tasks = queue.Queue()
+    for task in build_tasks(stages, used_urls, journal):
+        tasks.put(task)
+
+    def make_search():
+        return BingSearch(functools.partial(create_driver, profile), backend=backend, cache=cache, limiter=limiter)
+
+    results = {}
+    errors = []
+    workers = max(1, min(workers, tasks.qsize()))
+    threads = [
+        threading.Thread(target=_pipeline_worker, args=(i + 1, tasks, results, errors, make_search), daemon=True)
+        for i in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+    by_stage = {stage: {} for stage in stages}
+    for (stage, key), result in results.items():
+        by_stage[stage][key] = result
+    return by_stage
+
+
+def publish(by_stage, mirror=False, mongo_uri=None, redis_uri=None):
+    """
+    Regenerate the src/data modules for every stage that ran (product images mirrored locally if asked)
+    With mongo_uri, the published catalog is also upserted into MongoDB, and with redis_uri the
+    product API responses are then precomputed into the Redis cache
+    """
+    mirrored = None
+    if mirror:
+        mirrored = mirror_images([url for stage in ("womens", "mens") for images in by_stage.get(stage, {}).values()
+                                  for url in images])
+
+    print("\n📝 Generating TypeScript files...")
+
+    if "womens" in by_stage or "mens" in by_stage:
+        # A stage that didn't run keeps its current category modules
+        womens = {cat: {**d, **({"images": by_stage["womens"][cat]} if "womens" in by_stage else {})}
+                  for cat, d in fix_product_images.WOMENS_PRODUCTS.items()}
+        mens = {cat: {**d, **({"images": by_stage["mens"][cat]} if "mens" in by_stage else {})}
+                for cat, d in fix_product_images.MENS_PRODUCTS.items()}
+        fix_product_images.write_modules(fix_product_images.generate_product_modules(womens, mens, mirrored))
+
+    if "categories" in by_stage:
+        fix_product_images.write_modules(
+            {"src/data/mockCategories.ts": scrape_category_images.update_mock_categories(by_stage["categories"])}
+        )
+
+    if mongo_uri:
+        # Sync exactly what was just published, including the modules of stages that didn't run
+        print("\n🗄️  Syncing catalog to MongoDB...")
+        db = catalog_db.connect(mongo_uri)
+        catalog_db.print_totals(catalog_db.sync_catalog(
+            db,
+            fix_product_images.read_generated_images(fix_product_images.WOMENS_PRODUCTS),
+            fix_product_images.read_generated_images(fix_product_images.MENS_PRODUCTS),
+            category_images=by_stage.get("categories"),
+            mirrored=read_generated_mirrored(fix_product_images.WOMENS_PRODUCTS, fix_product_images.MENS_PRODUCTS),
+        ))
+        if redis_uri:
+            print("\n🔥 Warming the product API cache...")
+            cache_warm.warm_from_db(db, cache_warm.connect(redis_uri))
+
+    if "story" in by_stage and by_stage["story"].get("atelier"):
+        print(f"  ✅ Story image stored at {by_stage['story']['atelier']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Refresh the whole catalog (products, categories, story) in one run")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES), help="stages to run")
+    parser.add_argument("--workers", type=int, default=2, help="number of parallel search workers")
+    parser.add_argument("--backend", choices=BACKENDS, default="selenium",
+                        help="image search backend; 'http' skips the browser and only falls back to Selenium when needed")
+    parser.add_argument("--profile", choices=PROFILES, default=DEFAULT_PROFILE,
+                        help="browser profile: 'lean' runs headless with eager loading and blocked subresources")
+    parser.add_argument("--rate", type=float, default=DEFAULT_SEARCH_RATE,
+                        help="Bing searches per second for the whole run, shared by every worker, so it also caps "
+                             "how far extra workers speed up searching (0 disables pacing)")
+    parser.add_argument("--burst", type=int, default=DEFAULT_SEARCH_BURST,
+                        help="searches allowed back-to-back before pacing kicks in")
+    parser.add_argument("--cache-ttl", type=float, default=DEFAULT_SEARCH_TTL / 3600,
+                        help="hours a cached Bing result list stays fresh")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="always query Bing and re-validate every image, ignore the on-disk caches")
+    parser.add_argument("--resume", action="store_true",
+                        help="skip products already recorded in the journal of an interrupted run")
+    parser.add_argument("--journal", default=DEFAULT_JOURNAL_PATH, help="path of the JSONL progress journal")
+    parser.add_argument("--near-dup", action="store_true",
+                        help="also reject images that are perceptual near-duplicates of one already used")
+    parser.add_argument("--near-dup-distance", type=int, default=DEFAULT_MAX_DISTANCE,
+                        help="max Hamming distance (out of 64 bits) that still counts as the same photo")
+    parser.add_argument("--hash", choices=HASH_FUNCTIONS, default="dhash", help="perceptual hash for --near-dup")
+    parser.add_argument("--mirror", action="store_true",
+                        help="download the chosen product images into responsive local WebP/AVIF variants under public/")
+    parser.add_argument("--mongo-uri", default=None,
+                        help="also upsert the published catalog into this MongoDB (e.g. $MONGODB_URI)")
+    parser.add_argument("--redis-uri", default=None,
+                        help="after the MongoDB sync, precompute the product API responses into this Redis")
+    parser.add_argument("--trace", nargs="?", const=DEFAULT_TRACE_PATH, default=None,
+                        help=f"record per-stage timing spans to a JSONL trace (default path {DEFAULT_TRACE_PATH}) "
+                             "and print a summary table at the end")
+    parser.add_argument("--metrics-port", type=int, default=None,
+                        help=f"serve live Prometheus metrics on this port (e.g. {scrape_metrics.DEFAULT_METRICS_PORT})")
+    args = parser.parse_args()
+    if args.redis_uri and not args.mongo_uri:
+        parser.error("--redis-uri needs --mongo-uri (responses are computed from the synced database)")
+
+    if args.metrics_port:
+        scrape_metrics.serve(args.metrics_port)
+    trace = RunTrace(args.trace) if args.trace else None
+    use_trace(trace)
+
+    print("="*60)
+    print("  CATALOG REFRESH PIPELINE")
+    print(f"  Stages: {', '.join(args.stages)}")
+    print("="*60)
+    print(pacing_note(args.rate))
+
+    cache = None
+    if not args.no_cache:
+        cache = SearchCache(ttl=args.cache_ttl * 3600)
+        use_verdict_cache(VerdictCache())
+
+    # Only the product stages are journaled; don't truncate a product journal on a categories-only run
+    journal = None
+    if "womens" in args.stages or "mens" in args.stages:
+        journal = ScrapeJournal(args.journal, resume=args.resume)
+    try:
+        by_stage = run_pipeline(
+            stages=args.stages, workers=args.workers, backend=args.backend, profile=args.profile,
+            cache=cache, limiter=HostRateLimiter(args.rate, args.burst), journal=journal,
+            near_duplicates=NearDuplicateIndex(args.near_dup_distance, args.hash) if args.near_dup else None,
+        )
+    finally:
+        if journal is not None:
+            journal.close()
+
+    with span("publish"):
+        publish(by_stage, mirror=args.mirror, mongo_uri=args.mongo_uri, redis_uri=args.redis_uri)
+
+    if trace:
+        trace.print_summary()
+        trace.close()
+
+    print("\n" + "="*60)
+    print("  🎉 COMPLETE!")
+    print("="*60)
@@ -1,37 +1,59 @@
 
 import os
 import time
-import requests
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 
-def setup_driver():
-    options = webdriver.ChromeOptions()
-    options.add_argument("--headless")
-    options.add_argument("--window-size=1920,1080")
-    options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-    service = Service(ChromeDriverManager().install())
-    return webdriver.Chrome(service=service, options=options)
+from browser_profile import create_driver
+from dom_extract import google_image_records
+from image_store import ImageStore
+from run_trace import span
 
-def download_image(url, save_path):
+def setup_driver(profile="headless"):
+    return create_driver(profile)
+
+def download_image(url, save_path, store=None, claim=None):
+    """
+    Keep the image in the content-addressed store and expose it at save_path (hardlink)
+    Returns its immutable /assets/cas/... URL, or None; an unchanged image is not downloaded again
+    claim (e.g. DedupRegistry.claim) is only asked once the download succeeded; a refused image isn't linked
+    """
+    store = store or ImageStore()
     try:
-        response = requests.get(url, stream=True, timeout=10)
-        if response.status_code == 200:
-            with open(save_path, 'wb') as file:
-                for chunk in response.iter_content(1024):
-                    file.write(chunk)
-            print(f"Downloaded: {save_path}")
-            return True
+        entry = store.fetch(url, timeout=10)
+        if claim is not None and not claim(url):
+            print(f"Skipped {url}: already used")
+            return None
+        store.link(entry, save_path)
+        asset_url = store.public_url(entry)
+        print(f"Downloaded: {save_path} ({asset_url})")
+        return asset_url
     except Exception as e:
         print(f"Failed to download {url}: {e}")
-        return False
+        return None
+
+def _claim_and_download(src, save_dir, used_urls=None):
+    if not src or not src.startswith("http") or "encrypted" in src:
+        return None
+    # Don't reuse an image already placed on a product or category; the URL is only claimed after a
+    # successful download, so a failed one stays available to the rest of the run
+    if used_urls is not None and src in used_urls:
+        return None
+    asset_url = download_image(src, os.path.join(save_dir, "atelier_story.jpg"),
+                               claim=used_urls.claim if used_urls is not None else None)
+    if asset_url:
+        print("Successfully downloaded image!")
+    return asset_url
 
-def scrape_story_image():
-    driver = setup_driver()
+def scrape_story_image(driver=None, used_urls=None):
+    """
+    Download the atelier story image and return its immutable asset URL (or None)
+    An injected driver (e.g. from scrape_pipeline) is left running
+    """
+    owns_driver = driver is None
+    if owns_driver:
+        driver = setup_driver()
     search_query = "luxury fashion atelier craftsmanship high resolution"
     url = f"https://www.google.com/search?q={search_query.replace(' ', '+')}&tbm=isch&tbs=isz:l" # Large images only
     
@@ -39,38 +61,47 @@ def scrape_story_image():
     os.makedirs(save_dir, exist_ok=True)
     
     try:
-        driver.get(url)
-        time.sleep(2)
+        with span("driver.get"):
+            driver.get(url)
         
-        # Click the first relevant looking image (skipping potential ads/logos if possible, but first result usually okay for this query)
+        # The results page already embeds the full-size URLs; read them all in one scripted call
+        # instead of clicking thumbnails one by one
+        try:
+            with span("webdriver.wait"):
+                candidates = WebDriverWait(driver, 10, poll_frequency=0.2).until(google_image_records)
+        except TimeoutException:
+            candidates = []
+        for record in candidates[:5]:
+            asset_url = _claim_and_download(record["url"], save_dir, used_urls)
+            if asset_url:
+                return asset_url
+        
+        # Fallback when the page carries no embedded data: click the first relevant looking image (skipping potential ads/logos if possible, but first result usually okay for this query)
         images = driver.find_elements(By.CSS_SELECTOR, "div.bg0cfb") # Standard Google Image class, usually reliable or tries generic img
         if not images:
              images = driver.find_elements(By.TAG_NAME, "img")
 
         # Try to find a good candidate
-        count = 0
         for img in images[:5]: 
             try:
                 img.click()
-                time.sleep(2)
-                
-                # Find the large image
-                # Selector strategy for Google Images large preview
-                large_imgs = driver.find_elements(By.CSS_SELECTOR, "img.sFlh5c")
+                with span("sleep"):
+                    time.sleep(2)
                 
-                for large_img in large_imgs:
-                    src = large_img.get_attribute("src")
-                    if src and src.startswith("http") and not "encrypted" in src:
-                        if download_image(src, os.path.join(save_dir, "atelier_story.jpg")):
-                            print("Successfully downloaded image!")
-                            return
+                # Find the large image: the opened preview (img.sFlh5c) comes back from the same scripted call
+                for record in google_image_records(driver):
+                    asset_url = _claim_and_download(record["url"], save_dir, used_urls)
+                    if asset_url:
+                        return asset_url
             except:
                 continue
                 
     except Exception as e:
         print(f"Error scraping: {e}")
     finally:
-        driver.quit()
+        if owns_driver:
+            driver.quit()
+    return None
 
 if __name__ == "__main__":
     scrape_story_image()
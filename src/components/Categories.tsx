@@ -1,14 +1,14 @@
 import { Link } from "react-router-dom";
 import { ArrowUpRight } from "lucide-react";
 import { mockCategories } from "@/data/mockCategories";
-import { mockProducts } from "@/data/mockProducts";
+import { productCategories } from "@/data/products/manifest";
 import { Button } from "@/components/ui/button";
 
 const Categories = () => {
   // Calculate product count for each category
   const categoriesWithCount = mockCategories.map(cat => ({
     ...cat,
-    productCount: mockProducts.filter(p => p.category._id === cat._id).length
+    productCount: productCategories.find(c => c._id === cat._id)?.count ?? 0
   }));
 
   return (
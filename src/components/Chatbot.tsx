@@ -3,14 +3,15 @@ import { useNavigate } from "react-router-dom";
 import { MessageCircle, X, Send, Bot, User, ShoppingBag, Sparkles, ArrowRight, Heart, TrendingUp, Package, HelpCircle, Truck, RotateCcw, CreditCard, Ruler, Gift, Clock, Star, Zap } from "lucide-react";
 import { Button } from "@/components/ui/button";
 import { Input } from "@/components/ui/input";
-import { mockProducts } from "@/data/mockProducts";
+import { loadAllProducts } from "@/data/products/manifest";
+import type { MockProduct } from "@/data/products/types";
 import { orderService, Order } from "@/services/orderService";
 
 interface Message {
     id: string;
     type: "user" | "bot";
     content: string;
-    products?: typeof mockProducts;
+    products?: MockProduct[];
     quickReplies?: string[];
     actions?: { label: string; action: string; icon?: React.ReactNode }[];
 }
@@ -34,6 +35,7 @@ const Chatbot = () => {
     const [isTyping, setIsTyping] = useState(false);
     const [context, setContext] = useState<ConversationContext>({ conversationHistory: [] });
     const [awaitingOrderId, setAwaitingOrderId] = useState(false);
+    const [catalog, setCatalog] = useState<MockProduct[]>([]);
     const messagesEndRef = useRef<HTMLDivElement>(null);
 
     const scrollToBottom = () => {
@@ -44,6 +46,13 @@ const Chatbot = () => {
         scrollToBottom();
     }, [messages]);
 
+    // Fetch the catalog the first time the chat opens, not with the page
+    useEffect(() => {
+        if (isOpen && catalog.length === 0) {
+            loadAllProducts().then(setCatalog);
+        }
+    }, [isOpen, catalog.length]);
+
     // Initial greeting when chat opens
     useEffect(() => {
         if (isOpen && messages.length === 0) {
@@ -105,7 +114,7 @@ const Chatbot = () => {
     };
 
     // Smart product matching with context awareness
-    const findProducts = (query: string, ctx: ConversationContext): typeof mockProducts => {
+    const findProducts = (query: string, ctx: ConversationContext): MockProduct[] => {
         const lowerQuery = query.toLowerCase();
         let hasFilter = false;
 
@@ -156,7 +165,7 @@ const Chatbot = () => {
             "gift": ["jewelry", "handbag", "accessories", "luxury"]
         };
 
-        let results = mockProducts.filter(p => p.price >= priceMin && p.price <= priceMax);
+        let results = catalog.filter(p => p.price >= priceMin && p.price <= priceMax);
 
         // Category matching
         const categoryKeywords: Record<string, string[]> = {
@@ -300,7 +309,7 @@ const Chatbot = () => {
         const products = findProducts(userMessage, context);
 
         if (products.length > 0) {
-            const totalMatches = mockProducts.filter(p =>
+            const totalMatches = catalog.filter(p =>
                 p.name.toLowerCase().includes(lowerMessage) ||
                 p.categoryName.toLowerCase().includes(lowerMessage)
             ).length;
@@ -316,7 +325,7 @@ const Chatbot = () => {
 
         // Check for "new" or "arrivals"
         if (lowerMessage.includes("new") || lowerMessage.includes("arrival") || lowerMessage.includes("latest")) {
-            const newProducts = mockProducts.filter(p => p.isNew).slice(0, 4);
+            const newProducts = catalog.filter(p => p.isNew).slice(0, 4);
             return {
                 id: Date.now().toString(),
                 type: "bot",
@@ -328,7 +337,7 @@ const Chatbot = () => {
 
         // Check for "sale" or "discount"
         if (lowerMessage.includes("sale") || lowerMessage.includes("discount") || lowerMessage.includes("offer") || lowerMessage.includes("deal")) {
-            const saleProducts = mockProducts.filter(p => p.compareAtPrice && p.compareAtPrice > p.price).slice(0, 4);
+            const saleProducts = catalog.filter(p => p.compareAtPrice && p.compareAtPrice > p.price).slice(0, 4);
             return {
                 id: Date.now().toString(),
                 type: "bot",
@@ -340,7 +349,7 @@ const Chatbot = () => {
 
         // Check for "featured" or "best" or "popular"
         if (lowerMessage.includes("featured") || lowerMessage.includes("best") || lowerMessage.includes("popular") || lowerMessage.includes("trending")) {
-            const featuredProducts = mockProducts.filter(p => p.isFeatured).slice(0, 4);
+            const featuredProducts = catalog.filter(p => p.isFeatured).slice(0, 4);
             return {
                 id: Date.now().toString(),
                 type: "bot",
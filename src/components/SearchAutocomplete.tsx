@@ -2,7 +2,8 @@ import { useState, useEffect, useRef } from "react";
 import { useNavigate } from "react-router-dom";
 import { Search, Clock, TrendingUp, X, ArrowRight, Sparkles, Filter, Star, Tag } from "lucide-react";
 import { Input } from "@/components/ui/input";
-import { mockProducts } from "@/data/mockProducts";
+import { loadAllProducts } from "@/data/products/manifest";
+import type { MockProduct } from "@/data/products/types";
 
 interface SearchAutocompleteProps {
     onClose?: () => void;
@@ -18,6 +19,7 @@ const SearchAutocomplete = ({ onClose, isMobile = false }: SearchAutocompletePro
     const [isOpen, setIsOpen] = useState(false);
     const [recentSearches, setRecentSearches] = useState<string[]>([]);
     const [selectedCategory, setSelectedCategory] = useState<string | null>(null);
+    const [products, setProducts] = useState<MockProduct[]>([]);
     const inputRef = useRef<HTMLInputElement>(null);
     const containerRef = useRef<HTMLDivElement>(null);
 
@@ -52,6 +54,17 @@ const SearchAutocomplete = ({ onClose, isMobile = false }: SearchAutocompletePro
         }
     }, []);
 
+    // The catalog is only fetched once the search opens
+    useEffect(() => {
+        let active = true;
+        loadAllProducts().then(all => {
+            if (active) setProducts(all);
+        });
+        return () => {
+            active = false;
+        };
+    }, []);
+
     useEffect(() => {
         const handleClickOutside = (e: MouseEvent) => {
             if (containerRef.current && !containerRef.current.contains(e.target as Node)) {
@@ -64,7 +77,7 @@ const SearchAutocomplete = ({ onClose, isMobile = false }: SearchAutocompletePro
 
     // Filter products based on query and category
     const filteredProducts = query.length >= 2
-        ? mockProducts
+        ? products
             .filter(p => {
                 const matchesQuery = p.name.toLowerCase().includes(query.toLowerCase()) ||
                     p.categoryName.toLowerCase().includes(query.toLowerCase()) ||
@@ -1,5 +1,5 @@
 import React, { createContext, useContext, useState, useEffect, ReactNode } from 'react';
-import { mockProducts } from '@/data/mockProducts';
+import { loadAllProducts } from '@/data/products/manifest';
 import { toast } from 'sonner';
 
 export interface CartItem {
@@ -85,7 +85,7 @@ export const CartProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
         setIsLoading(true);
         try {
             // Find product from mock data
-            const product = mockProducts.find(p => p._id === productId);
+            const product = (await loadAllProducts()).find(p => p._id === productId);
             if (!product) {
                 toast.error('Product not found');
                 return;
@@ -1,5 +1,5 @@
 import React, { createContext, useContext, useState, useEffect, ReactNode } from 'react';
-import { mockProducts } from '@/data/mockProducts';
+import { loadAllProducts } from '@/data/products/manifest';
 import { toast } from 'sonner';
 
 export interface WishlistItem {
@@ -14,7 +14,7 @@ export interface WishlistItem {
 interface WishlistContextType {
     items: WishlistItem[];
     isLoading: boolean;
-    addToWishlist: (productId: string) => void;
+    addToWishlist: (productId: string) => Promise<void>;
     removeFromWishlist: (productId: string) => void;
     isInWishlist: (productId: string) => boolean;
     clearWishlist: () => void;
@@ -52,15 +52,15 @@ export const WishlistProvider: React.FC<{ children: ReactNode }> = ({ children }
         saveWishlistToStorage(items);
     }, [items]);
 
-    const addToWishlist = (productId: string) => {
-        const product = mockProducts.find(p => p._id === productId);
-        if (!product) {
-            toast.error('Product not found');
+    const addToWishlist = async (productId: string) => {
+        if (items.some(item => item.productId === productId)) {
+            toast.info('Already in wishlist');
             return;
         }
 
-        if (items.some(item => item.productId === productId)) {
-            toast.info('Already in wishlist');
+        const product = (await loadAllProducts()).find(p => p._id === productId);
+        if (!product) {
+            toast.error('Product not found');
             return;
         }
 
@@ -0,0 +1,32 @@
+// Accessories - 25 products (generated by product_codegen.py)
+import type { MockProduct } from './types';
+
+const products: MockProduct[] = [
+    {"_id": "prod-101", "name": "Silk Scarf", "slug": "silk-scarf", "description": "Exquisite silk scarf crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 336, "category": {"_id": "cat-5", "name": "Accessories", "slug": "accessories"}, "categoryName": "Accessories", "image": "https://www.itysilk.com/media/catalog/p/cache/1/image/9df78eab33525d08d6e5fb8d27136e95/1/b/1b203-white-2.jpg", "images": ["https://www.itysilk.com/media/catalog/p/cache/1/image/9df78eab33525d08d6e5fb8d27136e95/1/b/1b203-white-2.jpg"], "stock": 16, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.8, "numReviews": 36, "tags": ["accessories", "luxury", "women", "designer"]},
+    {"_id": "prod-102", "name": "Leather Belt", "slug": "leather-belt", "description": "Exquisite leather belt crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 224, "category": {"_id": "cat-5", "name": "Accessories", "slug": "accessories"}, "categoryName": "Accessories", "image": "https://i.pinimg.com/736x/23/7a/09/237a09f57290e0e142df1bc7750657a7.jpg", "images": ["https://i.pinimg.com/736x/23/7a/09/237a09f57290e0e142df1bc7750657a7.jpg"], "stock": 18, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.4, "numReviews": 132, "tags": ["accessories", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-103", "name": "Designer Sunglasses", "slug": "designer-sunglasses", "description": "Exquisite designer sunglasses crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 296, "compareAtPrice": 461, "category": {"_id": "cat-5", "name": "Accessories", "slug": "accessories"}, "categoryName": "Accessories", "image": "https://cdn.shopify.com/s/files/1/0670/0433/files/Kicker_Limited_Edition_09062018.jpg?v=1536268406", "images": ["https://cdn.shopify.com/s/files/1/0670/0433/files/Kicker_Limited_Edition_09062018.jpg?v=1536268406"], "stock": 13, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.4, "numReviews": 55, "tags": ["accessories", "luxury", "women", "designer", "new-arrival", "featured"]},
+    {"_id": "prod-104", "name": "Cashmere Gloves", "slug": "cashmere-gloves", "description": "Exquisite cashmere gloves crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 425, "compareAtPrice": 612, "category": {"_id": "cat-5", "name": "Accessories", "slug": "accessories"}, "categoryName": "Accessories", "image": "https://assets.maisoncashmere.com/media/catalog/product/mobilegallery/ribbed-gloves-cashmere-womens-long.jpg", "images": ["https://assets.maisoncashmere.com/media/catalog/product/mobilegallery/ribbed-gloves-cashmere-womens-long.jpg"], "stock": 18, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.2, "numReviews": 113, "tags": ["accessories", "luxury", "women", "designer"]},
+    {"_id": "prod-105", "name": "Pearl Hair Clip", "slug": "pearl-hair-clip", "description": "Exquisite pearl hair clip crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 582, "category": {"_id": "cat-5", "name": "Accessories", "slug": "accessories"}, "categoryName": "Accessories", "image": "https://www.lulus.com/images/product/xlarge/7290141_1481236.jpg?w=560", "images": ["https://www.lulus.com/images/product/xlarge/7290141_1481236.jpg?w=560"], "stock": 12, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.7, "numReviews": 47, "tags": ["accessories", "luxury", "women", "designer"]},
+    {"_id": "prod-106", "name": "Luxury Watch", "slug": "luxury-watch", "description": "Exquisite luxury watch crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 460, "category": {"_id": "cat-5", "name": "Accessories", "slug": "accessories"}, "categoryName": "Accessories", "image": "https://wallpapercave.com/wp/wp8824864.png", "images": ["https://wallpapercave.com/wp/wp8824864.png"], "stock": 7, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.6, "numReviews": 59, "tags": ["accessories", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-107", "name": "Wool Hat", "slug": "wool-hat", "description": "Exquisite wool hat crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 593, "category": {"_id": "cat-5", "name": "Accessories", "slug": "accessories"}, "categoryName": "Accessories", "image": "https://images.squarespace-cdn.com/content/v1/53dcd8fee4b071b54b3296c9/1564348592934-A1XR18ZG46R45KYRLCXQ/Light+Grey+designer+lambswool+pom+pom+hat%2C+by+Collingwood-Norris.+Luxury+Knitwear+made+in+Scotland.jpg", "images": ["https://images.squarespace-cdn.com/content/v1/53dcd8fee4b071b54b3296c9/1564348592934-A1XR18ZG46R45KYRLCXQ/Light+Grey+designer+lambswool+pom+pom+hat%2C+by+Collingwood-Norris.+Luxury+Knitwear+made+in+Scotland.jpg"], "stock": 25, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.3, "numReviews": 58, "tags": ["accessories", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-108", "name": "Designer Wallet", "slug": "designer-wallet", "description": "Exquisite designer wallet crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 864, "compareAtPrice": 1246, "category": {"_id": "cat-5", "name": "Accessories", "slug": "accessories"}, "categoryName": "Accessories", "image": "https://cdn.cliqueinc.com/posts/281389/best-designer-wallets-281389-1616619919451-main.750x0c.jpg?interlace=true&quality=70", "images": ["https://cdn.cliqueinc.com/posts/281389/best-designer-wallets-281389-1616619919451-main.750x0c.jpg?interlace=true&quality=70"], "stock": 18, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.8, "numReviews": 42, "tags": ["accessories", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-109", "name": "Travel Organizer", "slug": "travel-organizer", "description": "Exquisite travel organizer crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 579, "category": {"_id": "cat-5", "name": "Accessories", "slug": "accessories"}, "categoryName": "Accessories", "image": "https://www.kcchicdesigns.com/cdn/shop/files/AL1A5025.jpg?v=1703258876&width=1445", "images": ["https://www.kcchicdesigns.com/cdn/shop/files/AL1A5025.jpg?v=1703258876&width=1445"], "stock": 33, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.8, "numReviews": 17, "tags": ["accessories", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-110", "name": "Leather Keychain", "slug": "leather-keychain", "description": "Exquisite leather keychain crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 869, "category": {"_id": "cat-5", "name": "Accessories", "slug": "accessories"}, "categoryName": "Accessories", "image": "https://raven.contrado.app/resources/images/2020-6/149334/luxury-leather-keychain-906656_l.jpg?w=550&h=800&fit=crop&dpr=1", "images": ["https://raven.contrado.app/resources/images/2020-6/149334/luxury-leather-keychain-906656_l.jpg?w=550&h=800&fit=crop&dpr=1"], "stock": 20, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.1, "numReviews": 65, "tags": ["accessories", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-111", "name": "Phone Case", "slug": "phone-case", "description": "Exquisite phone case crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 728, "category": {"_id": "cat-5", "name": "Accessories", "slug": "accessories"}, "categoryName": "Accessories", "image": "https://i.etsystatic.com/25593781/r/il/02fb5c/2935988799/il_1140xN.2935988799_sdxt.jpg", "images": ["https://i.etsystatic.com/25593781/r/il/02fb5c/2935988799/il_1140xN.2935988799_sdxt.jpg"], "stock": 32, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.1, "numReviews": 45, "tags": ["accessories", "luxury", "women", "designer"]},
+    {"_id": "prod-112", "name": "Card Holder", "slug": "card-holder", "description": "Exquisite card holder crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1056, "compareAtPrice": 1169, "category": {"_id": "cat-5", "name": "Accessories", "slug": "accessories"}, "categoryName": "Accessories", "image": "https://sp-ao.shortpixel.ai/client/to_webp,q_lossless,ret_img,w_683,h_1024/https://thegraydetails.com/wp-content/uploads/2023/03/luxury-card-case-holders-683x1024.png", "images": ["https://sp-ao.shortpixel.ai/client/to_webp,q_lossless,ret_img,w_683,h_1024/https://thegraydetails.com/wp-content/uploads/2023/03/luxury-card-case-holders-683x1024.png"], "stock": 8, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.2, "numReviews": 18, "tags": ["accessories", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-113", "name": "Makeup Pouch", "slug": "makeup-pouch", "description": "Exquisite makeup pouch crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 943, "category": {"_id": "cat-5", "name": "Accessories", "slug": "accessories"}, "categoryName": "Accessories", "image": "https://cdna.lystit.com/photos/aedc-2014/06/26/mango-pink-nylon-cosmetic-bag-product-1-21177803-2-551453296-normal.jpeg", "images": ["https://cdna.lystit.com/photos/aedc-2014/06/26/mango-pink-nylon-cosmetic-bag-product-1-21177803-2-551453296-normal.jpeg"], "stock": 25, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.2, "numReviews": 74, "tags": ["accessories", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-114", "name": "Passport Cover", "slug": "passport-cover", "description": "Exquisite passport cover crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1014, "category": {"_id": "cat-5", "name": "Accessories", "slug": "accessories"}, "categoryName": "Accessories", "image": "https://imagedelivery.net/0ObHXyjKhN5YJrtuYFSvjQ/i-10c9a16f-17fa-4022-bd15-695c8609d31c-luxury-leather-passport-cover-with-card-slots-hide-handmade/display", "images": ["https://imagedelivery.net/0ObHXyjKhN5YJrtuYFSvjQ/i-10c9a16f-17fa-4022-bd15-695c8609d31c-luxury-leather-passport-cover-with-card-slots-hide-handmade/display"], "stock": 24, "isNew": false, "isFeatured": false, "isActive": true, "rating": 5.0, "numReviews": 18, "tags": ["accessories", "luxury", "women", "designer"]},
+    {"_id": "prod-115", "name": "Jewelry Box", "slug": "jewelry-box", "description": "Exquisite jewelry box crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1176, "compareAtPrice": 1546, "category": {"_id": "cat-5", "name": "Accessories", "slug": "accessories"}, "categoryName": "Accessories", "image": "https://selenichast.com/cdn/shop/products/26_e4c4177f-802b-41be-926e-08494fa876c0_1800x1800.jpg?v=1636442645", "images": ["https://selenichast.com/cdn/shop/products/26_e4c4177f-802b-41be-926e-08494fa876c0_1800x1800.jpg?v=1636442645"], "stock": 34, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.1, "numReviews": 74, "tags": ["accessories", "luxury", "women", "designer"]},
+    {"_id": "prod-116", "name": "Headband", "slug": "headband", "description": "Exquisite headband crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 958, "category": {"_id": "cat-5", "name": "Accessories", "slug": "accessories"}, "categoryName": "Accessories", "image": "https://cdn.cliqueinc.com/posts/299189/best-designer-headbands-299189-1649880213171-main.700x0c.jpg", "images": ["https://cdn.cliqueinc.com/posts/299189/best-designer-headbands-299189-1649880213171-main.700x0c.jpg"], "stock": 27, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.7, "numReviews": 28, "tags": ["accessories", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-117", "name": "Hair Bow", "slug": "hair-bow", "description": "Exquisite hair bow crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1138, "category": {"_id": "cat-5", "name": "Accessories", "slug": "accessories"}, "categoryName": "Accessories", "image": "https://aoifemullane.ie/wp-content/uploads/2023/01/59ca7eb3-1240-4034-bc5a-91e36fa9bbe3.jpeg", "images": ["https://aoifemullane.ie/wp-content/uploads/2023/01/59ca7eb3-1240-4034-bc5a-91e36fa9bbe3.jpeg"], "stock": 33, "isNew": false, "isFeatured": true, "isActive": true, "rating": 5.0, "numReviews": 115, "tags": ["accessories", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-118", "name": "Brooch Pin", "slug": "brooch-pin", "description": "Exquisite brooch pin crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1248, "category": {"_id": "cat-5", "name": "Accessories", "slug": "accessories"}, "categoryName": "Accessories", "image": "https://i.pinimg.com/originals/d2/dc/97/d2dc97aa5486d63bdb050a67a27e31bc.jpg", "images": ["https://i.pinimg.com/originals/d2/dc/97/d2dc97aa5486d63bdb050a67a27e31bc.jpg"], "stock": 27, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.9, "numReviews": 145, "tags": ["accessories", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-119", "name": "Tie Pin", "slug": "tie-pin", "description": "Exquisite tie pin crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1527, "category": {"_id": "cat-5", "name": "Accessories", "slug": "accessories"}, "categoryName": "Accessories", "image": "https://uniworthdress.com/uploads/product/TIP2312.....jpg", "images": ["https://uniworthdress.com/uploads/product/TIP2312.....jpg"], "stock": 17, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.8, "numReviews": 59, "tags": ["accessories", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-120", "name": "Cufflinks Set", "slug": "cufflinks-set", "description": "Exquisite cufflinks set crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1389, "category": {"_id": "cat-5", "name": "Accessories", "slug": "accessories"}, "categoryName": "Accessories", "image": "https://images.stockcake.com/public/9/e/1/9e1fc968-4350-4831-ad56-ea19e67dbf69_large/elegant-cufflinks-set-stockcake.jpg", "images": ["https://images.stockcake.com/public/9/e/1/9e1fc968-4350-4831-ad56-ea19e67dbf69_large/elegant-cufflinks-set-stockcake.jpg"], "stock": 18, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.5, "numReviews": 96, "tags": ["accessories", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-121", "name": "Money Clip", "slug": "money-clip", "description": "Exquisite money clip crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1355, "category": {"_id": "cat-5", "name": "Accessories", "slug": "accessories"}, "categoryName": "Accessories", "image": "https://i.pinimg.com/originals/e9/f2/4c/e9f24c020d4152842e3bc33a6dc5f71a.png", "images": ["https://i.pinimg.com/originals/e9/f2/4c/e9f24c020d4152842e3bc33a6dc5f71a.png"], "stock": 29, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.9, "numReviews": 55, "tags": ["accessories", "luxury", "women", "designer"]},
+    {"_id": "prod-122", "name": "Valet Tray", "slug": "valet-tray", "description": "Exquisite valet tray crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1634, "category": {"_id": "cat-5", "name": "Accessories", "slug": "accessories"}, "categoryName": "Accessories", "image": "https://2jour-concierge.com/cdn/shop/collections/HV380M_GU_Polo_marble_rectangular_mini_valet_tray_GREEN_GUATEMALA_BRASS_LIFESTYLE01.jpg?v=1707244618&width=1070", "images": ["https://2jour-concierge.com/cdn/shop/collections/HV380M_GU_Polo_marble_rectangular_mini_valet_tray_GREEN_GUATEMALA_BRASS_LIFESTYLE01.jpg?v=1707244618&width=1070"], "stock": 8, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.0, "numReviews": 42, "tags": ["accessories", "luxury", "women", "designer"]},
+    {"_id": "prod-123", "name": "Umbrella", "slug": "umbrella", "description": "Exquisite umbrella crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1681, "category": {"_id": "cat-5", "name": "Accessories", "slug": "accessories"}, "categoryName": "Accessories", "image": "https://i.pinimg.com/originals/3b/2c/cf/3b2ccfcb09565cfbed74af167f6a3931.jpg", "images": ["https://i.pinimg.com/originals/3b/2c/cf/3b2ccfcb09565cfbed74af167f6a3931.jpg"], "stock": 15, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.3, "numReviews": 150, "tags": ["accessories", "luxury", "women", "designer"]},
+    {"_id": "prod-124", "name": "Pocket Square", "slug": "pocket-square", "description": "Exquisite pocket square crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1514, "compareAtPrice": 1637, "category": {"_id": "cat-5", "name": "Accessories", "slug": "accessories"}, "categoryName": "Accessories", "image": "https://blucheez.fashion/cdn/shop/files/BPS-002-SG-WEB-01.webp?v=1724839271&width=600", "images": ["https://blucheez.fashion/cdn/shop/files/BPS-002-SG-WEB-01.webp?v=1724839271&width=600"], "stock": 13, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.5, "numReviews": 83, "tags": ["accessories", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-125", "name": "Watch Strap", "slug": "watch-strap", "description": "Exquisite watch strap crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1803, "category": {"_id": "cat-5", "name": "Accessories", "slug": "accessories"}, "categoryName": "Accessories", "image": "https://oracleoftime.com/wp-content/uploads/2023/11/The-Strap-Tailor-Ostrich-Shin-Strap-1-768x1024.jpg", "images": ["https://oracleoftime.com/wp-content/uploads/2023/11/The-Strap-Tailor-Ostrich-Shin-Strap-1-768x1024.jpg"], "stock": 5, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.8, "numReviews": 19, "tags": ["accessories", "luxury", "women", "designer"]},
+];
+
+export default products;
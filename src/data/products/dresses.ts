@@ -0,0 +1,32 @@
+// Dresses - 25 products (generated by product_codegen.py)
+import type { MockProduct } from './types';
+
+const products: MockProduct[] = [
+    {"_id": "prod-76", "name": "Silk Midi Dress", "slug": "silk-midi-dress", "description": "Exquisite silk midi dress crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 645, "compareAtPrice": 903, "category": {"_id": "cat-4", "name": "Dresses", "slug": "dresses"}, "categoryName": "Dresses", "image": "https://i.pinimg.com/originals/02/5b/62/025b628f22c7bb943ca4f55884b742e5.jpg", "images": ["https://i.pinimg.com/originals/02/5b/62/025b628f22c7bb943ca4f55884b742e5.jpg"], "stock": 33, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.6, "numReviews": 112, "tags": ["dresses", "luxury", "women", "designer"]},
+    {"_id": "prod-77", "name": "Velvet Gown", "slug": "velvet-gown", "description": "Exquisite velvet gown crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 938, "category": {"_id": "cat-4", "name": "Dresses", "slug": "dresses"}, "categoryName": "Dresses", "image": "https://i.pinimg.com/originals/d8/ff/b4/d8ffb49807827c1390f2c5864cbeb806.jpg", "images": ["https://i.pinimg.com/originals/d8/ff/b4/d8ffb49807827c1390f2c5864cbeb806.jpg"], "stock": 12, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.1, "numReviews": 98, "tags": ["dresses", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-78", "name": "Lace Cocktail Dress", "slug": "lace-cocktail-dress", "description": "Exquisite lace cocktail dress crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1024, "compareAtPrice": 1131, "category": {"_id": "cat-4", "name": "Dresses", "slug": "dresses"}, "categoryName": "Dresses", "image": "https://i.pinimg.com/originals/5e/b7/ed/5eb7ed9bd55e6dad3cc39d826b235c53.png", "images": ["https://i.pinimg.com/originals/5e/b7/ed/5eb7ed9bd55e6dad3cc39d826b235c53.png"], "stock": 11, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.4, "numReviews": 132, "tags": ["dresses", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-79", "name": "Satin Slip Dress", "slug": "satin-slip-dress", "description": "Exquisite satin slip dress crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 779, "category": {"_id": "cat-4", "name": "Dresses", "slug": "dresses"}, "categoryName": "Dresses", "image": "https://serenabutelondon.com/cdn/shop/files/SS25_Satin_Slip_Dress_Charcoal_1.jpg?v=1740502078", "images": ["https://serenabutelondon.com/cdn/shop/files/SS25_Satin_Slip_Dress_Charcoal_1.jpg?v=1740502078"], "stock": 18, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.4, "numReviews": 120, "tags": ["dresses", "luxury", "women", "designer"]},
+    {"_id": "prod-80", "name": "Sequin Mini Dress", "slug": "sequin-mini-dress", "description": "Exquisite sequin mini dress crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1012, "category": {"_id": "cat-4", "name": "Dresses", "slug": "dresses"}, "categoryName": "Dresses", "image": "https://i.pinimg.com/736x/20/6f/03/206f0315fd3df243997809d4f40277db.jpg", "images": ["https://i.pinimg.com/736x/20/6f/03/206f0315fd3df243997809d4f40277db.jpg"], "stock": 34, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.2, "numReviews": 35, "tags": ["dresses", "luxury", "women", "designer", "new-arrival", "featured"]},
+    {"_id": "prod-81", "name": "Chiffon Maxi Dress", "slug": "chiffon-maxi-dress", "description": "Exquisite chiffon maxi dress crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1197, "category": {"_id": "cat-4", "name": "Dresses", "slug": "dresses"}, "categoryName": "Dresses", "image": "https://40aee210544b5b2e713c-30cd56842bbd3fae7d05b019155315a5.ssl.cf2.rackcdn.com/product-hugerect-491734-13575-1429199491-1fcf80b06474f5a5f9ddda10a0e49f3f.jpg", "images": ["https://40aee210544b5b2e713c-30cd56842bbd3fae7d05b019155315a5.ssl.cf2.rackcdn.com/product-hugerect-491734-13575-1429199491-1fcf80b06474f5a5f9ddda10a0e49f3f.jpg"], "stock": 22, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.2, "numReviews": 26, "tags": ["dresses", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-82", "name": "Bodycon Dress", "slug": "bodycon-dress", "description": "Exquisite bodycon dress crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 920, "compareAtPrice": 1151, "category": {"_id": "cat-4", "name": "Dresses", "slug": "dresses"}, "categoryName": "Dresses", "image": "https://stylesatlife.com/wp-content/uploads/2022/08/Bandage-bodycon-spaghetti-strap-dress.jpg", "images": ["https://stylesatlife.com/wp-content/uploads/2022/08/Bandage-bodycon-spaghetti-strap-dress.jpg"], "stock": 6, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.6, "numReviews": 60, "tags": ["dresses", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-83", "name": "A-Line Dress", "slug": "a-line-dress", "description": "Exquisite a-line dress crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1310, "category": {"_id": "cat-4", "name": "Dresses", "slug": "dresses"}, "categoryName": "Dresses", "image": "http://image26.stylesimo.com/o_img/2017/11/22/246945-10488297/women-s-v-neck-half-sleeve-a-line-prom-dress.jpg", "images": ["http://image26.stylesimo.com/o_img/2017/11/22/246945-10488297/women-s-v-neck-half-sleeve-a-line-prom-dress.jpg"], "stock": 19, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.7, "numReviews": 131, "tags": ["dresses", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-84", "name": "Wrap Dress", "slug": "wrap-dress", "description": "Exquisite wrap dress crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1274, "category": {"_id": "cat-4", "name": "Dresses", "slug": "dresses"}, "categoryName": "Dresses", "image": "https://xcdn.next.co.uk/common/Items/Default/Default/ItemImages/AltItemZoom/989545s4.jpg", "images": ["https://xcdn.next.co.uk/common/Items/Default/Default/ItemImages/AltItemZoom/989545s4.jpg"], "stock": 24, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.7, "numReviews": 11, "tags": ["dresses", "luxury", "women", "designer"]},
+    {"_id": "prod-85", "name": "Shirt Dress", "slug": "shirt-dress", "description": "Exquisite shirt dress crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1287, "compareAtPrice": 1399, "category": {"_id": "cat-4", "name": "Dresses", "slug": "dresses"}, "categoryName": "Dresses", "image": "https://img.shopstyle-cdn.com/sim/27/8b/278bbf827b914f7fa90ca467625493d3_best/harmony-floral-shirtdress.jpg", "images": ["https://img.shopstyle-cdn.com/sim/27/8b/278bbf827b914f7fa90ca467625493d3_best/harmony-floral-shirtdress.jpg"], "stock": 34, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.7, "numReviews": 126, "tags": ["dresses", "luxury", "women", "designer"]},
+    {"_id": "prod-86", "name": "Pleated Dress", "slug": "pleated-dress", "description": "Exquisite pleated dress crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1118, "compareAtPrice": 1260, "category": {"_id": "cat-4", "name": "Dresses", "slug": "dresses"}, "categoryName": "Dresses", "image": "https://i.pinimg.com/originals/be/4b/47/be4b47471c3134036bdc58fb90e0e438.jpg", "images": ["https://i.pinimg.com/originals/be/4b/47/be4b47471c3134036bdc58fb90e0e438.jpg"], "stock": 17, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.5, "numReviews": 88, "tags": ["dresses", "luxury", "women", "designer"]},
+    {"_id": "prod-87", "name": "Ruffle Dress", "slug": "ruffle-dress", "description": "Exquisite ruffle dress crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1444, "compareAtPrice": 1644, "category": {"_id": "cat-4", "name": "Dresses", "slug": "dresses"}, "categoryName": "Dresses", "image": "https://www.monsoon.co.uk/dw/image/v2/BDLV_PRD/on/demandware.static/-/Sites-monsoon-master-catalog/default/dw78c49308/images/large/23_20000630046_3.jpg?sw=1920&sh=2460&sm=cut", "images": ["https://www.monsoon.co.uk/dw/image/v2/BDLV_PRD/on/demandware.static/-/Sites-monsoon-master-catalog/default/dw78c49308/images/large/23_20000630046_3.jpg?sw=1920&sh=2460&sm=cut"], "stock": 31, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.9, "numReviews": 147, "tags": ["dresses", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-88", "name": "Off-Shoulder Dress", "slug": "off-shoulder-dress", "description": "Exquisite off-shoulder dress crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1579, "compareAtPrice": 1872, "category": {"_id": "cat-4", "name": "Dresses", "slug": "dresses"}, "categoryName": "Dresses", "image": "https://www.sentani.com.au/cdn/shop/products/carmi-fitted-off-shoulder-satin-formal-dress-po979-975895.jpg", "images": ["https://www.sentani.com.au/cdn/shop/products/carmi-fitted-off-shoulder-satin-formal-dress-po979-975895.jpg"], "stock": 16, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.0, "numReviews": 98, "tags": ["dresses", "luxury", "women", "designer"]},
+    {"_id": "prod-89", "name": "Halter Dress", "slug": "halter-dress", "description": "Exquisite halter dress crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1413, "compareAtPrice": 1535, "category": {"_id": "cat-4", "name": "Dresses", "slug": "dresses"}, "categoryName": "Dresses", "image": "https://i.pinimg.com/736x/53/cd/21/53cd21c0b787d32af97249cba33223a7.jpg", "images": ["https://i.pinimg.com/736x/53/cd/21/53cd21c0b787d32af97249cba33223a7.jpg"], "stock": 8, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.6, "numReviews": 125, "tags": ["dresses", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-90", "name": "Blazer Dress", "slug": "blazer-dress", "description": "Exquisite blazer dress crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1593, "category": {"_id": "cat-4", "name": "Dresses", "slug": "dresses"}, "categoryName": "Dresses", "image": "https://cdn-img.prettylittlething.com/f/b/d/f/fbdf9b824eb68e6376d6de7f4f11e1e089f250a0_CLW5331_1.jpg", "images": ["https://cdn-img.prettylittlething.com/f/b/d/f/fbdf9b824eb68e6376d6de7f4f11e1e089f250a0_CLW5331_1.jpg"], "stock": 11, "isNew": false, "isFeatured": false, "isActive": true, "rating": 5.0, "numReviews": 133, "tags": ["dresses", "luxury", "women", "designer"]},
+    {"_id": "prod-91", "name": "Knit Dress", "slug": "knit-dress", "description": "Exquisite knit dress crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1392, "compareAtPrice": 1724, "category": {"_id": "cat-4", "name": "Dresses", "slug": "dresses"}, "categoryName": "Dresses", "image": "https://cdn.cliqueinc.com/posts/289030/best-knit-dresses-289030-1697171389901-main.1200x0c.jpg?interlace=true&quality=70", "images": ["https://cdn.cliqueinc.com/posts/289030/best-knit-dresses-289030-1697171389901-main.1200x0c.jpg?interlace=true&quality=70"], "stock": 11, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.4, "numReviews": 89, "tags": ["dresses", "luxury", "women", "designer"]},
+    {"_id": "prod-92", "name": "Tiered Dress", "slug": "tiered-dress", "description": "Exquisite tiered dress crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1551, "category": {"_id": "cat-4", "name": "Dresses", "slug": "dresses"}, "categoryName": "Dresses", "image": "https://n.nordstrommedia.com/it/ba3a8c1a-545b-40fe-acad-45c7a236cd0d.jpeg?h=368&w=240&dpr=2", "images": ["https://n.nordstrommedia.com/it/ba3a8c1a-545b-40fe-acad-45c7a236cd0d.jpeg?h=368&w=240&dpr=2"], "stock": 28, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.7, "numReviews": 29, "tags": ["dresses", "luxury", "women", "designer"]},
+    {"_id": "prod-93", "name": "Column Dress", "slug": "column-dress", "description": "Exquisite column dress crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1757, "category": {"_id": "cat-4", "name": "Dresses", "slug": "dresses"}, "categoryName": "Dresses", "image": "https://www.theknot.com/tk-media/images/8b3e57b1-cb16-4ac3-920d-c17744fa886b~rs_768.h", "images": ["https://www.theknot.com/tk-media/images/8b3e57b1-cb16-4ac3-920d-c17744fa886b~rs_768.h"], "stock": 20, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.7, "numReviews": 78, "tags": ["dresses", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-94", "name": "Bandage Dress", "slug": "bandage-dress", "description": "Exquisite bandage dress crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1718, "category": {"_id": "cat-4", "name": "Dresses", "slug": "dresses"}, "categoryName": "Dresses", "image": "https://i.pinimg.com/originals/e3/db/04/e3db04c5dd182f17744b01ae40178238.jpg", "images": ["https://i.pinimg.com/originals/e3/db/04/e3db04c5dd182f17744b01ae40178238.jpg"], "stock": 18, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.7, "numReviews": 44, "tags": ["dresses", "luxury", "women", "designer"]},
+    {"_id": "prod-95", "name": "Tea Dress", "slug": "tea-dress", "description": "Exquisite tea dress crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1641, "category": {"_id": "cat-4", "name": "Dresses", "slug": "dresses"}, "categoryName": "Dresses", "image": "https://i.pinimg.com/736x/05/79/f8/0579f8d9c9e3d8010b4c361d93e2d651.jpg", "images": ["https://i.pinimg.com/736x/05/79/f8/0579f8d9c9e3d8010b4c361d93e2d651.jpg"], "stock": 25, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.6, "numReviews": 127, "tags": ["dresses", "luxury", "women", "designer"]},
+    {"_id": "prod-96", "name": "Shift Dress", "slug": "shift-dress", "description": "Exquisite shift dress crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1754, "category": {"_id": "cat-4", "name": "Dresses", "slug": "dresses"}, "categoryName": "Dresses", "image": "https://i.pinimg.com/originals/38/10/19/381019a0aee0fc542c03b0d21cd271fa.png", "images": ["https://i.pinimg.com/originals/38/10/19/381019a0aee0fc542c03b0d21cd271fa.png"], "stock": 25, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.5, "numReviews": 111, "tags": ["dresses", "luxury", "women", "designer", "new-arrival", "featured"]},
+    {"_id": "prod-97", "name": "Fit Flare Dress", "slug": "fit-flare-dress", "description": "Exquisite fit flare dress crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 2188, "category": {"_id": "cat-4", "name": "Dresses", "slug": "dresses"}, "categoryName": "Dresses", "image": "https://www.veromoda.in/cdn/shop/files/131924201_g2.jpg?v=1745661690&width=1080", "images": ["https://www.veromoda.in/cdn/shop/files/131924201_g2.jpg?v=1745661690&width=1080"], "stock": 13, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.8, "numReviews": 122, "tags": ["dresses", "luxury", "women", "designer"]},
+    {"_id": "prod-98", "name": "Asymmetric Dress", "slug": "asymmetric-dress", "description": "Exquisite asymmetric dress crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 2149, "category": {"_id": "cat-4", "name": "Dresses", "slug": "dresses"}, "categoryName": "Dresses", "image": "https://i.pinimg.com/originals/2b/7f/a5/2b7fa5a2d7c77a894acb38d2135144c5.jpg", "images": ["https://i.pinimg.com/originals/2b/7f/a5/2b7fa5a2d7c77a894acb38d2135144c5.jpg"], "stock": 9, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.6, "numReviews": 10, "tags": ["dresses", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-99", "name": "Cutout Dress", "slug": "cutout-dress", "description": "Exquisite cutout dress crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 2262, "category": {"_id": "cat-4", "name": "Dresses", "slug": "dresses"}, "categoryName": "Dresses", "image": "https://cdn-img.prettylittlething.com/c/d/a/e/cdaeae5614053fb67bc361a1ea6b8a6c6c775927_cnl5739_1.jpg?imwidth=600", "images": ["https://cdn-img.prettylittlething.com/c/d/a/e/cdaeae5614053fb67bc361a1ea6b8a6c6c775927_cnl5739_1.jpg?imwidth=600"], "stock": 15, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.0, "numReviews": 115, "tags": ["dresses", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-100", "name": "Embroidered Dress", "slug": "embroidered-dress", "description": "Exquisite embroidered dress crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 2061, "compareAtPrice": 2215, "category": {"_id": "cat-4", "name": "Dresses", "slug": "dresses"}, "categoryName": "Dresses", "image": "https://www.pocoko.com/wp-content/uploads/2025/02/Forest-Green-with-Red-Flowers-Floral-Lace-Embroidered-Dress-8-878x1536.jpeg", "images": ["https://www.pocoko.com/wp-content/uploads/2025/02/Forest-Green-with-Red-Flowers-Floral-Lace-Embroidered-Dress-8-878x1536.jpeg"], "stock": 18, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.4, "numReviews": 83, "tags": ["dresses", "luxury", "women", "designer", "featured"]},
+];
+
+export default products;
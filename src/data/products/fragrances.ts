@@ -0,0 +1,27 @@
+// Fragrances - 20 products (generated by product_codegen.py)
+import type { MockProduct } from './types';
+
+const products: MockProduct[] = [
+    {"_id": "prod-126", "name": "Rose & Oud", "slug": "rose--oud", "description": "Exquisite rose & oud crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 457, "compareAtPrice": 590, "category": {"_id": "cat-11", "name": "Fragrances", "slug": "fragrances"}, "categoryName": "Fragrances", "image": "https://images.unsplash.com/photo-1541643600914-78b084683601?q=80&w=800&auto=format&fit=crop", "images": ["https://images.unsplash.com/photo-1541643600914-78b084683601?q=80&w=800&auto=format&fit=crop"], "stock": 15, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.1, "numReviews": 99, "tags": ["fragrances", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-127", "name": "Midnight Jasmine", "slug": "midnight-jasmine", "description": "Exquisite midnight jasmine crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 318, "compareAtPrice": 591, "category": {"_id": "cat-11", "name": "Fragrances", "slug": "fragrances"}, "categoryName": "Fragrances", "image": "https://images.unsplash.com/photo-1523293182086-7651a899d37f?q=80&w=800&auto=format&fit=crop", "images": ["https://images.unsplash.com/photo-1523293182086-7651a899d37f?q=80&w=800&auto=format&fit=crop"], "stock": 26, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.8, "numReviews": 58, "tags": ["fragrances", "luxury", "women", "designer", "new-arrival", "featured"]},
+    {"_id": "prod-128", "name": "Citrus Burst", "slug": "citrus-burst", "description": "Exquisite citrus burst crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 567, "category": {"_id": "cat-11", "name": "Fragrances", "slug": "fragrances"}, "categoryName": "Fragrances", "image": "https://images.unsplash.com/photo-1592945403244-b3fbafd7f539?q=80&w=800&auto=format&fit=crop", "images": ["https://images.unsplash.com/photo-1592945403244-b3fbafd7f539?q=80&w=800&auto=format&fit=crop"], "stock": 16, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.2, "numReviews": 92, "tags": ["fragrances", "luxury", "women", "designer", "new-arrival", "featured"]},
+    {"_id": "prod-129", "name": "Vanilla Noir", "slug": "vanilla-noir", "description": "Exquisite vanilla noir crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 724, "category": {"_id": "cat-11", "name": "Fragrances", "slug": "fragrances"}, "categoryName": "Fragrances", "image": "https://images.unsplash.com/photo-1588405748880-12d1d2a59f75?q=80&w=800&auto=format&fit=crop", "images": ["https://images.unsplash.com/photo-1588405748880-12d1d2a59f75?q=80&w=800&auto=format&fit=crop"], "stock": 28, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.7, "numReviews": 151, "tags": ["fragrances", "luxury", "women", "designer"]},
+    {"_id": "prod-130", "name": "Ocean Breeze", "slug": "ocean-breeze", "description": "Exquisite ocean breeze crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 360, "category": {"_id": "cat-11", "name": "Fragrances", "slug": "fragrances"}, "categoryName": "Fragrances", "image": "https://images.unsplash.com/photo-1616951849649-74dd2dd7e662?q=80&w=800&auto=format&fit=crop", "images": ["https://images.unsplash.com/photo-1616951849649-74dd2dd7e662?q=80&w=800&auto=format&fit=crop"], "stock": 10, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.6, "numReviews": 147, "tags": ["fragrances", "luxury", "women", "designer"]},
+    {"_id": "prod-131", "name": "Amber Wood", "slug": "amber-wood", "description": "Exquisite amber wood crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 598, "category": {"_id": "cat-11", "name": "Fragrances", "slug": "fragrances"}, "categoryName": "Fragrances", "image": "https://images.unsplash.com/photo-1595535373192-fc04375b997a?q=80&w=800&auto=format&fit=crop", "images": ["https://images.unsplash.com/photo-1595535373192-fc04375b997a?q=80&w=800&auto=format&fit=crop"], "stock": 19, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.9, "numReviews": 117, "tags": ["fragrances", "luxury", "women", "designer"]},
+    {"_id": "prod-132", "name": "Floral Symphony", "slug": "floral-symphony", "description": "Exquisite floral symphony crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 705, "compareAtPrice": 883, "category": {"_id": "cat-11", "name": "Fragrances", "slug": "fragrances"}, "categoryName": "Fragrances", "image": "https://images.unsplash.com/photo-1615160737976-4d3752697b0a?q=80&w=800&auto=format&fit=crop", "images": ["https://images.unsplash.com/photo-1615160737976-4d3752697b0a?q=80&w=800&auto=format&fit=crop"], "stock": 6, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.5, "numReviews": 118, "tags": ["fragrances", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-133", "name": "Cedar Mystique", "slug": "cedar-mystique", "description": "Exquisite cedar mystique crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 738, "category": {"_id": "cat-11", "name": "Fragrances", "slug": "fragrances"}, "categoryName": "Fragrances", "image": "https://images.unsplash.com/photo-1587017539504-67cfbddac569?q=80&w=800&auto=format&fit=crop", "images": ["https://images.unsplash.com/photo-1587017539504-67cfbddac569?q=80&w=800&auto=format&fit=crop"], "stock": 28, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.9, "numReviews": 96, "tags": ["fragrances", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-134", "name": "Spiced Santal", "slug": "spiced-santal", "description": "Exquisite spiced santal crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 731, "compareAtPrice": 1067, "category": {"_id": "cat-11", "name": "Fragrances", "slug": "fragrances"}, "categoryName": "Fragrances", "image": "https://images.unsplash.com/photo-1622618991746-fe6004db3d47?q=80&w=800&auto=format&fit=crop", "images": ["https://images.unsplash.com/photo-1622618991746-fe6004db3d47?q=80&w=800&auto=format&fit=crop"], "stock": 32, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.1, "numReviews": 61, "tags": ["fragrances", "luxury", "women", "designer"]},
+    {"_id": "prod-135", "name": "Bergamot Bloom", "slug": "bergamot-bloom", "description": "Exquisite bergamot bloom crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 566, "category": {"_id": "cat-11", "name": "Fragrances", "slug": "fragrances"}, "categoryName": "Fragrances", "image": "https://images.unsplash.com/photo-1585386959984-a4155224a1ad?q=80&w=800&auto=format&fit=crop", "images": ["https://images.unsplash.com/photo-1585386959984-a4155224a1ad?q=80&w=800&auto=format&fit=crop"], "stock": 30, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.0, "numReviews": 100, "tags": ["fragrances", "luxury", "women", "designer"]},
+    {"_id": "prod-136", "name": "Velvet Musk", "slug": "velvet-musk", "description": "Exquisite velvet musk crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1000, "compareAtPrice": 1283, "category": {"_id": "cat-11", "name": "Fragrances", "slug": "fragrances"}, "categoryName": "Fragrances", "image": "https://images.unsplash.com/photo-1605553610931-c2770d7ee85d?q=80&w=800&auto=format&fit=crop", "images": ["https://images.unsplash.com/photo-1605553610931-c2770d7ee85d?q=80&w=800&auto=format&fit=crop"], "stock": 7, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.1, "numReviews": 156, "tags": ["fragrances", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-137", "name": "Golden Amber", "slug": "golden-amber", "description": "Exquisite golden amber crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 988, "category": {"_id": "cat-11", "name": "Fragrances", "slug": "fragrances"}, "categoryName": "Fragrances", "image": "https://images.unsplash.com/photo-1582211584512-d8b4dc6f16f7?q=80&w=800&auto=format&fit=crop", "images": ["https://images.unsplash.com/photo-1582211584512-d8b4dc6f16f7?q=80&w=800&auto=format&fit=crop"], "stock": 24, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.3, "numReviews": 121, "tags": ["fragrances", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-138", "name": "White Tea & Sage", "slug": "white-tea--sage", "description": "Exquisite white tea & sage crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 774, "category": {"_id": "cat-11", "name": "Fragrances", "slug": "fragrances"}, "categoryName": "Fragrances", "image": "https://images.unsplash.com/photo-1512777190995-52bb63e170e1?q=80&w=800&auto=format&fit=crop", "images": ["https://images.unsplash.com/photo-1512777190995-52bb63e170e1?q=80&w=800&auto=format&fit=crop"], "stock": 5, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.3, "numReviews": 76, "tags": ["fragrances", "luxury", "women", "designer", "new-arrival", "featured"]},
+    {"_id": "prod-139", "name": "Black Orchid", "slug": "black-orchid", "description": "Exquisite black orchid crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1081, "compareAtPrice": 1269, "category": {"_id": "cat-11", "name": "Fragrances", "slug": "fragrances"}, "categoryName": "Fragrances", "image": "https://images.unsplash.com/photo-1594035910387-fea4779426e9?q=80&w=800&auto=format&fit=crop", "images": ["https://images.unsplash.com/photo-1594035910387-fea4779426e9?q=80&w=800&auto=format&fit=crop"], "stock": 29, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.1, "numReviews": 62, "tags": ["fragrances", "luxury", "women", "designer"]},
+    {"_id": "prod-140", "name": "Neroli Portofino", "slug": "neroli-portofino", "description": "Exquisite neroli portofino crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 981, "compareAtPrice": 1085, "category": {"_id": "cat-11", "name": "Fragrances", "slug": "fragrances"}, "categoryName": "Fragrances", "image": "https://images.unsplash.com/photo-1588669462333-82c5f0a3597d?q=80&w=800&auto=format&fit=crop", "images": ["https://images.unsplash.com/photo-1588669462333-82c5f0a3597d?q=80&w=800&auto=format&fit=crop"], "stock": 25, "isNew": true, "isFeatured": true, "isActive": true, "rating": 5.0, "numReviews": 103, "tags": ["fragrances", "luxury", "women", "designer", "new-arrival", "featured"]},
+    {"_id": "prod-141", "name": "Saffron Spice", "slug": "saffron-spice", "description": "Exquisite saffron spice crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1205, "category": {"_id": "cat-11", "name": "Fragrances", "slug": "fragrances"}, "categoryName": "Fragrances", "image": "https://images.unsplash.com/photo-1630570077744-88390885e332?q=80&w=800&auto=format&fit=crop", "images": ["https://images.unsplash.com/photo-1630570077744-88390885e332?q=80&w=800&auto=format&fit=crop"], "stock": 27, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.6, "numReviews": 11, "tags": ["fragrances", "luxury", "women", "designer", "new-arrival", "featured"]},
+    {"_id": "prod-142", "name": "Patchouli Intense", "slug": "patchouli-intense", "description": "Exquisite patchouli intense crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 986, "category": {"_id": "cat-11", "name": "Fragrances", "slug": "fragrances"}, "categoryName": "Fragrances", "image": "https://images.unsplash.com/photo-1563170351-be82bc888aa4?q=80&w=800&auto=format&fit=crop", "images": ["https://images.unsplash.com/photo-1563170351-be82bc888aa4?q=80&w=800&auto=format&fit=crop"], "stock": 26, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.1, "numReviews": 144, "tags": ["fragrances", "luxury", "women", "designer"]},
+    {"_id": "prod-143", "name": "Lavender Fields", "slug": "lavender-fields", "description": "Exquisite lavender fields crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1009, "category": {"_id": "cat-11", "name": "Fragrances", "slug": "fragrances"}, "categoryName": "Fragrances", "image": "https://images.unsplash.com/photo-1592914610354-fd354ea45e48?q=80&w=800&auto=format&fit=crop", "images": ["https://images.unsplash.com/photo-1592914610354-fd354ea45e48?q=80&w=800&auto=format&fit=crop"], "stock": 11, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.4, "numReviews": 37, "tags": ["fragrances", "luxury", "women", "designer"]},
+    {"_id": "prod-144", "name": "Peony Blush", "slug": "peony-blush", "description": "Exquisite peony blush crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1162, "category": {"_id": "cat-11", "name": "Fragrances", "slug": "fragrances"}, "categoryName": "Fragrances", "image": "https://images.unsplash.com/photo-1605625455822-79469550b71a?q=80&w=800&auto=format&fit=crop", "images": ["https://images.unsplash.com/photo-1605625455822-79469550b71a?q=80&w=800&auto=format&fit=crop"], "stock": 7, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.5, "numReviews": 118, "tags": ["fragrances", "luxury", "women", "designer"]},
+    {"_id": "prod-145", "name": "Vetiver Essence", "slug": "vetiver-essence", "description": "Exquisite vetiver essence crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1313, "category": {"_id": "cat-11", "name": "Fragrances", "slug": "fragrances"}, "categoryName": "Fragrances", "image": "https://images.unsplash.com/photo-1533230408706-d89e5f560c5a?q=80&w=800&auto=format&fit=crop", "images": ["https://images.unsplash.com/photo-1533230408706-d89e5f560c5a?q=80&w=800&auto=format&fit=crop"], "stock": 25, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.1, "numReviews": 16, "tags": ["fragrances", "luxury", "women", "designer", "new-arrival", "featured"]},
+];
+
+export default products;
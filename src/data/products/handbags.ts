@@ -0,0 +1,32 @@
+// Handbags - 25 products (generated by product_codegen.py)
+import type { MockProduct } from './types';
+
+const products: MockProduct[] = [
+    {"_id": "prod-1", "name": "Quilted Shoulder Bag", "slug": "quilted-shoulder-bag", "description": "Exquisite quilted shoulder bag crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1306, "category": {"_id": "cat-1", "name": "Handbags", "slug": "handbags"}, "categoryName": "Handbags", "image": "https://i.pinimg.com/originals/12/82/d4/1282d4a666200ed84175c475f2467aca.jpg", "images": ["https://i.pinimg.com/originals/12/82/d4/1282d4a666200ed84175c475f2467aca.jpg"], "stock": 27, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.6, "numReviews": 83, "tags": ["handbags", "luxury", "women", "designer"]},
+    {"_id": "prod-2", "name": "Structured Tote", "slug": "structured-tote", "description": "Exquisite structured tote crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1081, "compareAtPrice": 1183, "category": {"_id": "cat-1", "name": "Handbags", "slug": "handbags"}, "categoryName": "Handbags", "image": "https://urbanarticle.com/cdn/shop/products/A7FA186D-B87C-43DB-865F-90BAFD6E9530.jpg?v=1628187950&width=823", "images": ["https://urbanarticle.com/cdn/shop/products/A7FA186D-B87C-43DB-865F-90BAFD6E9530.jpg?v=1628187950&width=823"], "stock": 15, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.0, "numReviews": 39, "tags": ["handbags", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-3", "name": "Mini Crossbody", "slug": "mini-crossbody", "description": "Exquisite mini crossbody crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1392, "compareAtPrice": 1669, "category": {"_id": "cat-1", "name": "Handbags", "slug": "handbags"}, "categoryName": "Handbags", "image": "https://i.etsystatic.com/38156933/r/il/c80c49/6006087927/il_1080xN.6006087927_93iy.jpg", "images": ["https://i.etsystatic.com/38156933/r/il/c80c49/6006087927/il_1080xN.6006087927_93iy.jpg"], "stock": 16, "isNew": true, "isFeatured": false, "isActive": true, "rating": 5.0, "numReviews": 23, "tags": ["handbags", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-4", "name": "Woven Clutch", "slug": "woven-clutch", "description": "Exquisite woven clutch crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1178, "category": {"_id": "cat-1", "name": "Handbags", "slug": "handbags"}, "categoryName": "Handbags", "image": "https://m.media-amazon.com/images/I/714HTHemYZL._AC_UL1500_.jpg", "images": ["https://m.media-amazon.com/images/I/714HTHemYZL._AC_UL1500_.jpg"], "stock": 32, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.7, "numReviews": 78, "tags": ["handbags", "luxury", "women", "designer"]},
+    {"_id": "prod-5", "name": "Saddle Bag", "slug": "saddle-bag", "description": "Exquisite saddle bag crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1497, "compareAtPrice": 1622, "category": {"_id": "cat-1", "name": "Handbags", "slug": "handbags"}, "categoryName": "Handbags", "image": "https://i.etsystatic.com/28420428/r/il/549713/3934249829/il_1080xN.3934249829_1vgd.jpg", "images": ["https://i.etsystatic.com/28420428/r/il/549713/3934249829/il_1080xN.3934249829_1vgd.jpg"], "stock": 31, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.7, "numReviews": 16, "tags": ["handbags", "luxury", "women", "designer"]},
+    {"_id": "prod-6", "name": "Bucket Bag", "slug": "bucket-bag", "description": "Exquisite bucket bag crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1416, "category": {"_id": "cat-1", "name": "Handbags", "slug": "handbags"}, "categoryName": "Handbags", "image": "https://cdnc.lystit.com/photos/466c-2015/08/12/anya-hindmarch-flame-red-vaughan-leather-bucket-bag-red-product-2-363413322-normal.jpeg", "images": ["https://cdnc.lystit.com/photos/466c-2015/08/12/anya-hindmarch-flame-red-vaughan-leather-bucket-bag-red-product-2-363413322-normal.jpeg"], "stock": 18, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.7, "numReviews": 115, "tags": ["handbags", "luxury", "women", "designer"]},
+    {"_id": "prod-7", "name": "Chain Link Bag", "slug": "chain-link-bag", "description": "Exquisite chain link bag crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1789, "category": {"_id": "cat-1", "name": "Handbags", "slug": "handbags"}, "categoryName": "Handbags", "image": "https://product-images.therealreal.com/BOT315691_2_enlarged.jpg", "images": ["https://product-images.therealreal.com/BOT315691_2_enlarged.jpg"], "stock": 25, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.6, "numReviews": 151, "tags": ["handbags", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-8", "name": "Envelope Clutch", "slug": "envelope-clutch", "description": "Exquisite envelope clutch crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1841, "category": {"_id": "cat-1", "name": "Handbags", "slug": "handbags"}, "categoryName": "Handbags", "image": "https://i.etsystatic.com/14236499/r/il/3648b2/2218098125/il_1080xN.2218098125_4h22.jpg", "images": ["https://i.etsystatic.com/14236499/r/il/3648b2/2218098125/il_1080xN.2218098125_4h22.jpg"], "stock": 23, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.9, "numReviews": 37, "tags": ["handbags", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-9", "name": "Doctor Bag", "slug": "doctor-bag", "description": "Exquisite doctor bag crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1851, "category": {"_id": "cat-1", "name": "Handbags", "slug": "handbags"}, "categoryName": "Handbags", "image": "https://ileatherhandbag.com/cdn/shop/files/05_1d7a1c6b-8234-4e9c-9498-d907d84e9baf_1024x1024.jpg?v=1703570646", "images": ["https://ileatherhandbag.com/cdn/shop/files/05_1d7a1c6b-8234-4e9c-9498-d907d84e9baf_1024x1024.jpg?v=1703570646"], "stock": 28, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.6, "numReviews": 156, "tags": ["handbags", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-10", "name": "Shopper Tote", "slug": "shopper-tote", "description": "Exquisite shopper tote crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1745, "compareAtPrice": 1846, "category": {"_id": "cat-1", "name": "Handbags", "slug": "handbags"}, "categoryName": "Handbags", "image": "https://i.pinimg.com/736x/22/66/02/226602ffdb1d8988fe3ed4dd6e243548.jpg", "images": ["https://i.pinimg.com/736x/22/66/02/226602ffdb1d8988fe3ed4dd6e243548.jpg"], "stock": 31, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.6, "numReviews": 49, "tags": ["handbags", "luxury", "women", "designer", "new-arrival", "featured"]},
+    {"_id": "prod-11", "name": "Flap Bag", "slug": "flap-bag", "description": "Exquisite flap bag crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1752, "category": {"_id": "cat-1", "name": "Handbags", "slug": "handbags"}, "categoryName": "Handbags", "image": "https://www.alexanderwang.com/on/demandware.static/-/Sites-master/default/dwd1497f64/hi-res/20425K55L001K.jpg", "images": ["https://www.alexanderwang.com/on/demandware.static/-/Sites-master/default/dwd1497f64/hi-res/20425K55L001K.jpg"], "stock": 28, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.9, "numReviews": 140, "tags": ["handbags", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-12", "name": "Hobo Bag", "slug": "hobo-bag", "description": "Exquisite hobo bag crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1937, "compareAtPrice": 2208, "category": {"_id": "cat-1", "name": "Handbags", "slug": "handbags"}, "categoryName": "Handbags", "image": "https://hips.hearstapps.com/vader-prod.s3.amazonaws.com/1691429393-84334317_030_b.jpg?crop=1xw:1xh;center,top&resize=980:*", "images": ["https://hips.hearstapps.com/vader-prod.s3.amazonaws.com/1691429393-84334317_030_b.jpg?crop=1xw:1xh;center,top&resize=980:*"], "stock": 21, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.4, "numReviews": 23, "tags": ["handbags", "luxury", "women", "designer"]},
+    {"_id": "prod-13", "name": "Box Bag", "slug": "box-bag", "description": "Exquisite box bag crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1932, "category": {"_id": "cat-1", "name": "Handbags", "slug": "handbags"}, "categoryName": "Handbags", "image": "https://cdn.ferragamo.com/wcsstore/FerragamoCatalogAssetStore/images/products/757942/757942_05_r20.jpg", "images": ["https://cdn.ferragamo.com/wcsstore/FerragamoCatalogAssetStore/images/products/757942/757942_05_r20.jpg"], "stock": 23, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.3, "numReviews": 43, "tags": ["handbags", "luxury", "women", "designer"]},
+    {"_id": "prod-14", "name": "Baguette Bag", "slug": "baguette-bag", "description": "Exquisite baguette bag crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 2305, "category": {"_id": "cat-1", "name": "Handbags", "slug": "handbags"}, "categoryName": "Handbags", "image": "https://i.etsystatic.com/18379019/r/il/e71c2b/6536210238/il_1080xN.6536210238_r69a.jpg", "images": ["https://i.etsystatic.com/18379019/r/il/e71c2b/6536210238/il_1080xN.6536210238_r69a.jpg"], "stock": 34, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.7, "numReviews": 95, "tags": ["handbags", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-15", "name": "Camera Bag", "slug": "camera-bag", "description": "Exquisite camera bag crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 2439, "category": {"_id": "cat-1", "name": "Handbags", "slug": "handbags"}, "categoryName": "Handbags", "image": "https://media.neimanmarcus.com/f_auto,q_auto:low,ar_4:5,c_fill,dpr_2.0,w_790/01/nm_4668291_100297_c", "images": ["https://media.neimanmarcus.com/f_auto,q_auto:low,ar_4:5,c_fill,dpr_2.0,w_790/01/nm_4668291_100297_c"], "stock": 28, "isNew": false, "isFeatured": true, "isActive": true, "rating": 5.0, "numReviews": 66, "tags": ["handbags", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-16", "name": "Top Handle Bag", "slug": "top-handle-bag", "description": "Exquisite top handle bag crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 2254, "category": {"_id": "cat-1", "name": "Handbags", "slug": "handbags"}, "categoryName": "Handbags", "image": "https://product-images.therealreal.com/TOD164125_2_enlarged.jpg", "images": ["https://product-images.therealreal.com/TOD164125_2_enlarged.jpg"], "stock": 9, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.7, "numReviews": 82, "tags": ["handbags", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-17", "name": "Drawstring Bag", "slug": "drawstring-bag", "description": "Exquisite drawstring bag crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 2511, "category": {"_id": "cat-1", "name": "Handbags", "slug": "handbags"}, "categoryName": "Handbags", "image": "https://product-images.therealreal.com/WHM21153_3_enlarged.jpg", "images": ["https://product-images.therealreal.com/WHM21153_3_enlarged.jpg"], "stock": 14, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.3, "numReviews": 98, "tags": ["handbags", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-18", "name": "Frame Bag", "slug": "frame-bag", "description": "Exquisite frame bag crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 2673, "compareAtPrice": 3004, "category": {"_id": "cat-1", "name": "Handbags", "slug": "handbags"}, "categoryName": "Handbags", "image": "https://product-images.therealreal.com/PRA154331_3_enlarged.jpg", "images": ["https://product-images.therealreal.com/PRA154331_3_enlarged.jpg"], "stock": 16, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.9, "numReviews": 63, "tags": ["handbags", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-19", "name": "Bowling Bag", "slug": "bowling-bag", "description": "Exquisite bowling bag crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 2534, "compareAtPrice": 2905, "category": {"_id": "cat-1", "name": "Handbags", "slug": "handbags"}, "categoryName": "Handbags", "image": "https://product-images.therealreal.com/PRA114304_3_enlarged.jpg", "images": ["https://product-images.therealreal.com/PRA114304_3_enlarged.jpg"], "stock": 9, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.1, "numReviews": 103, "tags": ["handbags", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-20", "name": "Satchel Bag", "slug": "satchel-bag", "description": "Exquisite satchel bag crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 2791, "compareAtPrice": 3147, "category": {"_id": "cat-1", "name": "Handbags", "slug": "handbags"}, "categoryName": "Handbags", "image": "https://media.neimanmarcus.com/f_auto,q_auto:low,ar_4:5,c_fill,dpr_2.0,w_790/01/nm_4466716_100106_m", "images": ["https://media.neimanmarcus.com/f_auto,q_auto:low,ar_4:5,c_fill,dpr_2.0,w_790/01/nm_4466716_100106_m"], "stock": 12, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.7, "numReviews": 147, "tags": ["handbags", "luxury", "women", "designer"]},
+    {"_id": "prod-21", "name": "Pouch Bag", "slug": "pouch-bag", "description": "Exquisite pouch bag crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 2694, "category": {"_id": "cat-1", "name": "Handbags", "slug": "handbags"}, "categoryName": "Handbags", "image": "https://cdnd.lystit.com/photos/2012/11/08/topshop-tan-leather-pouch-crossbody-bag-product-1-5177063-046317118.jpeg", "images": ["https://cdnd.lystit.com/photos/2012/11/08/topshop-tan-leather-pouch-crossbody-bag-product-1-5177063-046317118.jpeg"], "stock": 13, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.2, "numReviews": 39, "tags": ["handbags", "luxury", "women", "designer"]},
+    {"_id": "prod-22", "name": "Circle Bag", "slug": "circle-bag", "description": "Exquisite circle bag crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 2829, "compareAtPrice": 2965, "category": {"_id": "cat-1", "name": "Handbags", "slug": "handbags"}, "categoryName": "Handbags", "image": "https://i.pinimg.com/originals/cd/f0/22/cdf022bc8bb832a775668c5079ecfc66.jpg", "images": ["https://i.pinimg.com/originals/cd/f0/22/cdf022bc8bb832a775668c5079ecfc66.jpg"], "stock": 23, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.6, "numReviews": 132, "tags": ["handbags", "luxury", "women", "designer"]},
+    {"_id": "prod-23", "name": "Belt Bag", "slug": "belt-bag", "description": "Exquisite belt bag crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 3056, "compareAtPrice": 3212, "category": {"_id": "cat-1", "name": "Handbags", "slug": "handbags"}, "categoryName": "Handbags", "image": "https://i.pinimg.com/originals/11/d4/ea/11d4ea47fa19a93d59483b1c467a686c.png", "images": ["https://i.pinimg.com/originals/11/d4/ea/11d4ea47fa19a93d59483b1c467a686c.png"], "stock": 6, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.0, "numReviews": 133, "tags": ["handbags", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-24", "name": "Trunk Bag", "slug": "trunk-bag", "description": "Exquisite trunk bag crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 2959, "category": {"_id": "cat-1", "name": "Handbags", "slug": "handbags"}, "categoryName": "Handbags", "image": "https://i.pinimg.com/736x/64/de/61/64de61fe0dd281196aaf7b1033bdaa3a.jpg", "images": ["https://i.pinimg.com/736x/64/de/61/64de61fe0dd281196aaf7b1033bdaa3a.jpg"], "stock": 13, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.8, "numReviews": 28, "tags": ["handbags", "luxury", "women", "designer"]},
+    {"_id": "prod-25", "name": "Kelly Style Bag", "slug": "kelly-style-bag", "description": "Exquisite kelly style bag crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 3149, "category": {"_id": "cat-1", "name": "Handbags", "slug": "handbags"}, "categoryName": "Handbags", "image": "https://i.pinimg.com/originals/4a/a4/4f/4aa44f9f644956d9bb5265d73bb6b7e8.jpg", "images": ["https://i.pinimg.com/originals/4a/a4/4f/4aa44f9f644956d9bb5265d73bb6b7e8.jpg"], "stock": 29, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.5, "numReviews": 84, "tags": ["handbags", "luxury", "women", "designer"]},
+];
+
+export default products;
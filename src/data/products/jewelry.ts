@@ -0,0 +1,32 @@
+// Jewelry - 25 products (generated by product_codegen.py)
+import type { MockProduct } from './types';
+
+const products: MockProduct[] = [
+    {"_id": "prod-26", "name": "Diamond Bracelet", "slug": "diamond-bracelet", "description": "Exquisite diamond bracelet crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1351, "compareAtPrice": 1491, "category": {"_id": "cat-2", "name": "Jewelry", "slug": "jewelry"}, "categoryName": "Jewelry", "image": "https://a.1stdibscdn.com/870-carats-diamonds-18k-gold-modern-bracelet-for-sale/j_26992/j_227829721715244684727/IMG_6649_org.jpeg?disable=upscale&auto=webp&quality=60&width=1400", "images": ["https://a.1stdibscdn.com/870-carats-diamonds-18k-gold-modern-bracelet-for-sale/j_26992/j_227829721715244684727/IMG_6649_org.jpeg?disable=upscale&auto=webp&quality=60&width=1400"], "stock": 13, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.2, "numReviews": 123, "tags": ["jewelry", "luxury", "women", "designer"]},
+    {"_id": "prod-27", "name": "Pearl Earrings", "slug": "pearl-earrings", "description": "Exquisite pearl earrings crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1355, "compareAtPrice": 1609, "category": {"_id": "cat-2", "name": "Jewelry", "slug": "jewelry"}, "categoryName": "Jewelry", "image": "https://i.etsystatic.com/6512327/r/il/a665df/2962210646/il_fullxfull.2962210646_4377.jpg", "images": ["https://i.etsystatic.com/6512327/r/il/a665df/2962210646/il_fullxfull.2962210646_4377.jpg"], "stock": 28, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.4, "numReviews": 26, "tags": ["jewelry", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-28", "name": "Gold Necklace", "slug": "gold-necklace", "description": "Exquisite gold necklace crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1931, "category": {"_id": "cat-2", "name": "Jewelry", "slug": "jewelry"}, "categoryName": "Jewelry", "image": "https://i.pinimg.com/736x/ff/90/4b/ff904bf09d7375de0e9f493ff0eef8ec.jpg", "images": ["https://i.pinimg.com/736x/ff/90/4b/ff904bf09d7375de0e9f493ff0eef8ec.jpg"], "stock": 28, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.7, "numReviews": 79, "tags": ["jewelry", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-29", "name": "Sapphire Ring", "slug": "sapphire-ring", "description": "Exquisite sapphire ring crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 2128, "category": {"_id": "cat-2", "name": "Jewelry", "slug": "jewelry"}, "categoryName": "Jewelry", "image": "https://i.pinimg.com/736x/f6/82/27/f68227f59bfabea0a3a219fbf3461a68--sapphire-engagement-ring-jewelry-sets.jpg", "images": ["https://i.pinimg.com/736x/f6/82/27/f68227f59bfabea0a3a219fbf3461a68--sapphire-engagement-ring-jewelry-sets.jpg"], "stock": 15, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.9, "numReviews": 149, "tags": ["jewelry", "luxury", "women", "designer"]},
+    {"_id": "prod-30", "name": "Tennis Bracelet", "slug": "tennis-bracelet", "description": "Exquisite tennis bracelet crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1918, "category": {"_id": "cat-2", "name": "Jewelry", "slug": "jewelry"}, "categoryName": "Jewelry", "image": "https://i.etsystatic.com/6886004/r/il/9875f8/4177960304/il_1080xN.4177960304_q36s.jpg", "images": ["https://i.etsystatic.com/6886004/r/il/9875f8/4177960304/il_1080xN.4177960304_q36s.jpg"], "stock": 20, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.8, "numReviews": 129, "tags": ["jewelry", "luxury", "women", "designer"]},
+    {"_id": "prod-31", "name": "Layered Necklace", "slug": "layered-necklace", "description": "Exquisite layered necklace crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 2078, "category": {"_id": "cat-2", "name": "Jewelry", "slug": "jewelry"}, "categoryName": "Jewelry", "image": "https://i.etsystatic.com/16794142/r/il/9963f3/1578050123/il_1080xN.1578050123_2j2m.jpg", "images": ["https://i.etsystatic.com/16794142/r/il/9963f3/1578050123/il_1080xN.1578050123_2j2m.jpg"], "stock": 11, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.4, "numReviews": 48, "tags": ["jewelry", "luxury", "women", "designer"]},
+    {"_id": "prod-32", "name": "Emerald Earrings", "slug": "emerald-earrings", "description": "Exquisite emerald earrings crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 2535, "category": {"_id": "cat-2", "name": "Jewelry", "slug": "jewelry"}, "categoryName": "Jewelry", "image": "https://i.etsystatic.com/6374506/r/il/d3a590/819776218/il_1588xN.819776218_rklj.jpg", "images": ["https://i.etsystatic.com/6374506/r/il/d3a590/819776218/il_1588xN.819776218_rklj.jpg"], "stock": 5, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.3, "numReviews": 117, "tags": ["jewelry", "luxury", "women", "designer"]},
+    {"_id": "prod-33", "name": "Bangle Set", "slug": "bangle-set", "description": "Exquisite bangle set crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 2425, "category": {"_id": "cat-2", "name": "Jewelry", "slug": "jewelry"}, "categoryName": "Jewelry", "image": "https://i.pinimg.com/originals/93/5d/99/935d996195b1de176c7aac1a40bfaa39.jpg", "images": ["https://i.pinimg.com/originals/93/5d/99/935d996195b1de176c7aac1a40bfaa39.jpg"], "stock": 5, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.2, "numReviews": 43, "tags": ["jewelry", "luxury", "women", "designer", "new-arrival", "featured"]},
+    {"_id": "prod-34", "name": "Pendant Necklace", "slug": "pendant-necklace", "description": "Exquisite pendant necklace crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 2442, "category": {"_id": "cat-2", "name": "Jewelry", "slug": "jewelry"}, "categoryName": "Jewelry", "image": "https://cdn.shopify.com/s/files/1/2579/7674/products/1Ana-Luisa-Jewelry-Necklaces-Pendants-Gold-Pendant-Necklace-Pebble-Gold.jpg?v=1678973216", "images": ["https://cdn.shopify.com/s/files/1/2579/7674/products/1Ana-Luisa-Jewelry-Necklaces-Pendants-Gold-Pendant-Necklace-Pebble-Gold.jpg?v=1678973216"], "stock": 8, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.5, "numReviews": 69, "tags": ["jewelry", "luxury", "women", "designer"]},
+    {"_id": "prod-35", "name": "Cocktail Ring", "slug": "cocktail-ring", "description": "Exquisite cocktail ring crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 2633, "category": {"_id": "cat-2", "name": "Jewelry", "slug": "jewelry"}, "categoryName": "Jewelry", "image": "https://i.pinimg.com/originals/85/38/2c/85382c8236b4581d7b8e7db0d02b776a.jpg", "images": ["https://i.pinimg.com/originals/85/38/2c/85382c8236b4581d7b8e7db0d02b776a.jpg"], "stock": 30, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.0, "numReviews": 10, "tags": ["jewelry", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-36", "name": "Charm Bracelet", "slug": "charm-bracelet", "description": "Exquisite charm bracelet crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 2785, "category": {"_id": "cat-2", "name": "Jewelry", "slug": "jewelry"}, "categoryName": "Jewelry", "image": "https://i.pinimg.com/originals/89/35/9c/89359c3b2daa0fa5e675671e4265c790.jpg", "images": ["https://i.pinimg.com/originals/89/35/9c/89359c3b2daa0fa5e675671e4265c790.jpg"], "stock": 30, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.2, "numReviews": 23, "tags": ["jewelry", "luxury", "women", "designer", "new-arrival", "featured"]},
+    {"_id": "prod-37", "name": "Hoop Earrings", "slug": "hoop-earrings", "description": "Exquisite hoop earrings crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 2887, "category": {"_id": "cat-2", "name": "Jewelry", "slug": "jewelry"}, "categoryName": "Jewelry", "image": "https://i.pinimg.com/originals/03/26/f7/0326f7ecaf6eabb43c52bfe2247b19ea.jpg", "images": ["https://i.pinimg.com/originals/03/26/f7/0326f7ecaf6eabb43c52bfe2247b19ea.jpg"], "stock": 23, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.8, "numReviews": 62, "tags": ["jewelry", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-38", "name": "Chain Necklace", "slug": "chain-necklace", "description": "Exquisite chain necklace crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 3356, "compareAtPrice": 3679, "category": {"_id": "cat-2", "name": "Jewelry", "slug": "jewelry"}, "categoryName": "Jewelry", "image": "https://assets.vogue.com/photos/649448aa321e5a10a0c8bc89/master/w_2560%2Cc_limit/w2000_q60%2520(1).jpeg", "images": ["https://assets.vogue.com/photos/649448aa321e5a10a0c8bc89/master/w_2560%2Cc_limit/w2000_q60%2520(1).jpeg"], "stock": 24, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.2, "numReviews": 73, "tags": ["jewelry", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-39", "name": "Statement Ring", "slug": "statement-ring", "description": "Exquisite statement ring crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 3574, "compareAtPrice": 3886, "category": {"_id": "cat-2", "name": "Jewelry", "slug": "jewelry"}, "categoryName": "Jewelry", "image": "https://i.etsystatic.com/25184901/r/il/199b60/5805033425/il_1080xN.5805033425_id72.jpg", "images": ["https://i.etsystatic.com/25184901/r/il/199b60/5805033425/il_1080xN.5805033425_id72.jpg"], "stock": 12, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.4, "numReviews": 74, "tags": ["jewelry", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-40", "name": "Cuff Bracelet", "slug": "cuff-bracelet", "description": "Exquisite cuff bracelet crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 3753, "compareAtPrice": 3899, "category": {"_id": "cat-2", "name": "Jewelry", "slug": "jewelry"}, "categoryName": "Jewelry", "image": "https://m.media-amazon.com/images/I/61JkwRCwGxL._AC_SL1500_.jpg", "images": ["https://m.media-amazon.com/images/I/61JkwRCwGxL._AC_SL1500_.jpg"], "stock": 34, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.3, "numReviews": 82, "tags": ["jewelry", "luxury", "women", "designer", "new-arrival", "featured"]},
+    {"_id": "prod-41", "name": "Drop Earrings", "slug": "drop-earrings", "description": "Exquisite drop earrings crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 3861, "compareAtPrice": 4254, "category": {"_id": "cat-2", "name": "Jewelry", "slug": "jewelry"}, "categoryName": "Jewelry", "image": "https://i.pinimg.com/originals/79/4f/81/794f81016eb60fdd6e59c392b53d43d9.jpg", "images": ["https://i.pinimg.com/originals/79/4f/81/794f81016eb60fdd6e59c392b53d43d9.jpg"], "stock": 19, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.2, "numReviews": 107, "tags": ["jewelry", "luxury", "women", "designer"]},
+    {"_id": "prod-42", "name": "Choker Necklace", "slug": "choker-necklace", "description": "Exquisite choker necklace crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 3801, "category": {"_id": "cat-2", "name": "Jewelry", "slug": "jewelry"}, "categoryName": "Jewelry", "image": "https://i.etsystatic.com/22223184/r/il/007a46/3172346451/il_fullxfull.3172346451_axul.jpg", "images": ["https://i.etsystatic.com/22223184/r/il/007a46/3172346451/il_fullxfull.3172346451_axul.jpg"], "stock": 16, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.6, "numReviews": 34, "tags": ["jewelry", "luxury", "women", "designer"]},
+    {"_id": "prod-43", "name": "Eternity Ring", "slug": "eternity-ring", "description": "Exquisite eternity ring crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 3947, "category": {"_id": "cat-2", "name": "Jewelry", "slug": "jewelry"}, "categoryName": "Jewelry", "image": "https://i.etsystatic.com/9792770/r/il/2f1af3/3893289742/il_794xN.3893289742_q3wf.jpg", "images": ["https://i.etsystatic.com/9792770/r/il/2f1af3/3893289742/il_794xN.3893289742_q3wf.jpg"], "stock": 18, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.0, "numReviews": 74, "tags": ["jewelry", "luxury", "women", "designer"]},
+    {"_id": "prod-44", "name": "Link Bracelet", "slug": "link-bracelet", "description": "Exquisite link bracelet crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 4171, "compareAtPrice": 4554, "category": {"_id": "cat-2", "name": "Jewelry", "slug": "jewelry"}, "categoryName": "Jewelry", "image": "https://i.etsystatic.com/48714312/r/il/29fdf4/5678881323/il_1140xN.5678881323_ofq6.jpg", "images": ["https://i.etsystatic.com/48714312/r/il/29fdf4/5678881323/il_1140xN.5678881323_ofq6.jpg"], "stock": 8, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.9, "numReviews": 95, "tags": ["jewelry", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-45", "name": "Stud Earrings", "slug": "stud-earrings", "description": "Exquisite stud earrings crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 4304, "category": {"_id": "cat-2", "name": "Jewelry", "slug": "jewelry"}, "categoryName": "Jewelry", "image": "https://obyjewelry.com/cdn/shop/files/HammerTextureStudEarrings_1_063dc7d4-5977-44fa-9747-503229edd44f.webp?v=1714030287", "images": ["https://obyjewelry.com/cdn/shop/files/HammerTextureStudEarrings_1_063dc7d4-5977-44fa-9747-503229edd44f.webp?v=1714030287"], "stock": 14, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.6, "numReviews": 97, "tags": ["jewelry", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-46", "name": "Lariat Necklace", "slug": "lariat-necklace", "description": "Exquisite lariat necklace crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 4405, "category": {"_id": "cat-2", "name": "Jewelry", "slug": "jewelry"}, "categoryName": "Jewelry", "image": "https://cdn.shopify.com/s/files/1/0591/5689/products/N2076.G_6e5c898d-3e82-4f98-88fb-bc1bf86d56a3_2000x2000.jpg?v=1613016209", "images": ["https://cdn.shopify.com/s/files/1/0591/5689/products/N2076.G_6e5c898d-3e82-4f98-88fb-bc1bf86d56a3_2000x2000.jpg?v=1613016209"], "stock": 28, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.5, "numReviews": 87, "tags": ["jewelry", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-47", "name": "Signet Ring", "slug": "signet-ring", "description": "Exquisite signet ring crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 4410, "category": {"_id": "cat-2", "name": "Jewelry", "slug": "jewelry"}, "categoryName": "Jewelry", "image": "https://i.etsystatic.com/50555161/r/il/d06110/6275367724/il_1080xN.6275367724_l1f4.jpg", "images": ["https://i.etsystatic.com/50555161/r/il/d06110/6275367724/il_1080xN.6275367724_l1f4.jpg"], "stock": 30, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.5, "numReviews": 29, "tags": ["jewelry", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-48", "name": "Bar Bracelet", "slug": "bar-bracelet", "description": "Exquisite bar bracelet crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 4709, "category": {"_id": "cat-2", "name": "Jewelry", "slug": "jewelry"}, "categoryName": "Jewelry", "image": "https://hellosupply.com/wp-content/uploads/2015/12/Gold-Bar-Pave-Bracelet-.jpg", "images": ["https://hellosupply.com/wp-content/uploads/2015/12/Gold-Bar-Pave-Bracelet-.jpg"], "stock": 28, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.6, "numReviews": 122, "tags": ["jewelry", "luxury", "women", "designer"]},
+    {"_id": "prod-49", "name": "Chandelier Earrings", "slug": "chandelier-earrings", "description": "Exquisite chandelier earrings crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 5096, "category": {"_id": "cat-2", "name": "Jewelry", "slug": "jewelry"}, "categoryName": "Jewelry", "image": "https://i.pinimg.com/originals/35/88/74/358874595ace66e9f8851a7d679e9f5e.jpg", "images": ["https://i.pinimg.com/originals/35/88/74/358874595ace66e9f8851a7d679e9f5e.jpg"], "stock": 5, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.2, "numReviews": 117, "tags": ["jewelry", "luxury", "women", "designer"]},
+    {"_id": "prod-50", "name": "Collar Necklace", "slug": "collar-necklace", "description": "Exquisite collar necklace crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 4911, "category": {"_id": "cat-2", "name": "Jewelry", "slug": "jewelry"}, "categoryName": "Jewelry", "image": "https://product-images.therealreal.com/NECKL261693_1_enlarged.jpg", "images": ["https://product-images.therealreal.com/NECKL261693_1_enlarged.jpg"], "stock": 16, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.5, "numReviews": 50, "tags": ["jewelry", "luxury", "women", "designer", "new-arrival", "featured"]},
+];
+
+export default products;
@@ -0,0 +1,62 @@
+// Generated by product_codegen.py - load only the category being viewed
+import type { MockProduct } from './types';
+
+export interface ProductCategoryEntry {
+    _id: string;
+    name: string;
+    slug: string;
+    gender: 'women' | 'men';
+    count: number;
+}
+
+export const productCategories: ProductCategoryEntry[] = [
+    { _id: "cat-1", name: "Handbags", slug: "handbags", gender: 'women', count: 25 },
+    { _id: "cat-2", name: "Jewelry", slug: "jewelry", gender: 'women', count: 25 },
+    { _id: "cat-3", name: "Shoes", slug: "shoes", gender: 'women', count: 25 },
+    { _id: "cat-4", name: "Dresses", slug: "dresses", gender: 'women', count: 25 },
+    { _id: "cat-5", name: "Accessories", slug: "accessories", gender: 'women', count: 25 },
+    { _id: "cat-11", name: "Fragrances", slug: "fragrances", gender: 'women', count: 20 },
+    { _id: "cat-6", name: "Men's Watches", slug: "mens-watches", gender: 'men', count: 20 },
+    { _id: "cat-7", name: "Men's Bags", slug: "mens-bags", gender: 'men', count: 20 },
+    { _id: "cat-8", name: "Men's Shoes", slug: "mens-shoes", gender: 'men', count: 20 },
+    { _id: "cat-9", name: "Men's Suits", slug: "mens-suits", gender: 'men', count: 20 },
+    { _id: "cat-10", name: "Men's Accessories", slug: "mens-accessories", gender: 'men', count: 20 },
+];
+
+const loaders: Record<string, () => Promise<{ default: MockProduct[] }>> = {
+    "handbags": () => import('./handbags'),
+    "jewelry": () => import('./jewelry'),
+    "shoes": () => import('./shoes'),
+    "dresses": () => import('./dresses'),
+    "accessories": () => import('./accessories'),
+    "fragrances": () => import('./fragrances'),
+    "mens-watches": () => import('./mens-watches'),
+    "mens-bags": () => import('./mens-bags'),
+    "mens-shoes": () => import('./mens-shoes'),
+    "mens-suits": () => import('./mens-suits'),
+    "mens-accessories": () => import('./mens-accessories'),
+};
+
+export function loadCategoryProducts(slug: string): Promise<MockProduct[]> {
+    const load = loaders[slug];
+    return load ? load().then(module => module.default) : Promise.resolve([]);
+}
+
+export function loadProducts(slugs: string[]): Promise<MockProduct[]> {
+    return Promise.all(slugs.map(loadCategoryProducts)).then(groups => groups.flat());
+}
+
+export function findProductCategory(category: string): ProductCategoryEntry | undefined {
+    const name = category.toLowerCase();
+    return productCategories.find(c => c.slug === category || c._id === category || c.name.toLowerCase() === name);
+}
+
+// Every category, fetched once and shared (search, cart, chatbot)
+let allProducts: Promise<MockProduct[]> | undefined;
+
+export function loadAllProducts(): Promise<MockProduct[]> {
+    if (!allProducts) {
+        allProducts = loadProducts(productCategories.map(c => c.slug));
+    }
+    return allProducts;
+}
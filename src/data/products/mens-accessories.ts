@@ -0,0 +1,27 @@
+// Men's Accessories - 20 products (generated by product_codegen.py)
+import type { MockProduct } from './types';
+
+const products: MockProduct[] = [
+    {"_id": "mens-prod-81", "name": "Silk Tie", "slug": "silk-tie", "description": "Premium silk tie crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 483, "compareAtPrice": 596, "category": {"_id": "cat-10", "name": "Men's Accessories", "slug": "mens-accessories"}, "categoryName": "Men's Accessories", "image": "https://i.pinimg.com/736x/e0/bf/44/e0bf447e38c488ca98c3cf1db99e5c6d--designer-ties-neck-ties.jpg", "images": ["https://i.pinimg.com/736x/e0/bf/44/e0bf447e38c488ca98c3cf1db99e5c6d--designer-ties-neck-ties.jpg"], "stock": 15, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.4, "numReviews": 143, "tags": ["mens-accessories", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-82", "name": "Leather Belt", "slug": "mens-accessories-leather-belt", "description": "Premium leather belt crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 492, "compareAtPrice": 682, "category": {"_id": "cat-10", "name": "Men's Accessories", "slug": "mens-accessories"}, "categoryName": "Men's Accessories", "image": "https://i.etsystatic.com/42123138/r/il/0fc956/6130426131/il_fullxfull.6130426131_4ced.jpg", "images": ["https://i.etsystatic.com/42123138/r/il/0fc956/6130426131/il_fullxfull.6130426131_4ced.jpg"], "stock": 6, "isNew": false, "isFeatured": false, "isActive": true, "rating": 5.0, "numReviews": 99, "tags": ["mens-accessories", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-83", "name": "Cufflinks Set", "slug": "mens-accessories-cufflinks-set", "description": "Premium cufflinks set crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 346, "category": {"_id": "cat-10", "name": "Men's Accessories", "slug": "mens-accessories"}, "categoryName": "Men's Accessories", "image": "https://media.neimanmarcus.com/f_auto,q_auto/01/nm_4488750_100109_m", "images": ["https://media.neimanmarcus.com/f_auto,q_auto/01/nm_4488750_100109_m"], "stock": 9, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.5, "numReviews": 97, "tags": ["mens-accessories", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-84", "name": "Pocket Square", "slug": "mens-accessories-pocket-square", "description": "Premium pocket square crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 339, "compareAtPrice": 620, "category": {"_id": "cat-10", "name": "Men's Accessories", "slug": "mens-accessories"}, "categoryName": "Men's Accessories", "image": "https://www.faribasoltani.com/wp-content/uploads/2018/07/Navy-Geometric-Silk-Pocket-Square-1-700x905.jpg", "images": ["https://www.faribasoltani.com/wp-content/uploads/2018/07/Navy-Geometric-Silk-Pocket-Square-1-700x905.jpg"], "stock": 34, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.1, "numReviews": 132, "tags": ["mens-accessories", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-85", "name": "Leather Wallet", "slug": "leather-wallet", "description": "Premium leather wallet crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 398, "category": {"_id": "cat-10", "name": "Men's Accessories", "slug": "mens-accessories"}, "categoryName": "Men's Accessories", "image": "https://static.toiimg.com/photo/109371406/109371406.jpg", "images": ["https://static.toiimg.com/photo/109371406/109371406.jpg"], "stock": 28, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.0, "numReviews": 52, "tags": ["mens-accessories", "luxury", "men", "designer", "new-arrival", "featured"], "gender": "men"},
+    {"_id": "mens-prod-86", "name": "Tie Bar", "slug": "tie-bar", "description": "Premium tie bar crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 595, "category": {"_id": "cat-10", "name": "Men's Accessories", "slug": "mens-accessories"}, "categoryName": "Men's Accessories", "image": "https://image.menswearhouse.com/is/image/TMW/TMW_837B_25_PRONTO_UOMO_TIE_BARS_TIE_CHAINS_SILVER_MAIN", "images": ["https://image.menswearhouse.com/is/image/TMW/TMW_837B_25_PRONTO_UOMO_TIE_BARS_TIE_CHAINS_SILVER_MAIN"], "stock": 15, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.4, "numReviews": 113, "tags": ["mens-accessories", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-87", "name": "Lapel Pin", "slug": "lapel-pin", "description": "Premium lapel pin crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 661, "category": {"_id": "cat-10", "name": "Men's Accessories", "slug": "mens-accessories"}, "categoryName": "Men's Accessories", "image": "https://i.etsystatic.com/54717487/r/il/72fbde/6459088557/il_1080xN.6459088557_kv4g.jpg", "images": ["https://i.etsystatic.com/54717487/r/il/72fbde/6459088557/il_1080xN.6459088557_kv4g.jpg"], "stock": 27, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.9, "numReviews": 64, "tags": ["mens-accessories", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-88", "name": "Sunglasses", "slug": "sunglasses", "description": "Premium sunglasses crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 677, "category": {"_id": "cat-10", "name": "Men's Accessories", "slug": "mens-accessories"}, "categoryName": "Men's Accessories", "image": "https://i.pinimg.com/originals/a3/71/51/a37151d924dc909fbc5e0c3911237637.png", "images": ["https://i.pinimg.com/originals/a3/71/51/a37151d924dc909fbc5e0c3911237637.png"], "stock": 30, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.5, "numReviews": 27, "tags": ["mens-accessories", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-89", "name": "Money Clip", "slug": "mens-accessories-money-clip", "description": "Premium money clip crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 546, "category": {"_id": "cat-10", "name": "Men's Accessories", "slug": "mens-accessories"}, "categoryName": "Men's Accessories", "image": "https://i.pinimg.com/originals/36/51/cd/3651cd311aa591c564a86573e21ebd9d.jpg", "images": ["https://i.pinimg.com/originals/36/51/cd/3651cd311aa591c564a86573e21ebd9d.jpg"], "stock": 26, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.6, "numReviews": 41, "tags": ["mens-accessories", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-90", "name": "Card Holder", "slug": "mens-accessories-card-holder", "description": "Premium card holder crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 862, "compareAtPrice": 1219, "category": {"_id": "cat-10", "name": "Men's Accessories", "slug": "mens-accessories"}, "categoryName": "Men's Accessories", "image": "https://www.aeuluxury.com/wp-content/uploads/2024/01/975804_BLAC_1__52902.1700140167.jpg", "images": ["https://www.aeuluxury.com/wp-content/uploads/2024/01/975804_BLAC_1__52902.1700140167.jpg"], "stock": 11, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.6, "numReviews": 38, "tags": ["mens-accessories", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-91", "name": "Collar Stays", "slug": "collar-stays", "description": "Premium collar stays crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 574, "category": {"_id": "cat-10", "name": "Men's Accessories", "slug": "mens-accessories"}, "categoryName": "Men's Accessories", "image": "https://www.tommyowenseyewear.com/cdn/shop/products/collarstays-male-model-collar-tommyowens_1800x.jpg?v=1646693525", "images": ["https://www.tommyowenseyewear.com/cdn/shop/products/collarstays-male-model-collar-tommyowens_1800x.jpg?v=1646693525"], "stock": 31, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.3, "numReviews": 106, "tags": ["mens-accessories", "luxury", "men", "designer", "featured"], "gender": "men"},
+    {"_id": "mens-prod-92", "name": "Bracelet", "slug": "bracelet", "description": "Premium bracelet crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 602, "category": {"_id": "cat-10", "name": "Men's Accessories", "slug": "mens-accessories"}, "categoryName": "Men's Accessories", "image": "https://chiqueandsleekin.com/wp-content/uploads/2020/06/il_fullxfull.1948429017_3vgz-scaled-1.jpg", "images": ["https://chiqueandsleekin.com/wp-content/uploads/2020/06/il_fullxfull.1948429017_3vgz-scaled-1.jpg"], "stock": 31, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.7, "numReviews": 17, "tags": ["mens-accessories", "luxury", "men", "designer", "featured"], "gender": "men"},
+    {"_id": "mens-prod-93", "name": "Ring", "slug": "ring", "description": "Premium ring crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 801, "compareAtPrice": 942, "category": {"_id": "cat-10", "name": "Men's Accessories", "slug": "mens-accessories"}, "categoryName": "Men's Accessories", "image": "https://i.pinimg.com/originals/2f/d9/86/2fd9866a2fd74c5685bcbe5efa19212f.jpg", "images": ["https://i.pinimg.com/originals/2f/d9/86/2fd9866a2fd74c5685bcbe5efa19212f.jpg"], "stock": 30, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.5, "numReviews": 14, "tags": ["mens-accessories", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-94", "name": "Handkerchief Set", "slug": "handkerchief-set", "description": "Premium handkerchief set crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 866, "category": {"_id": "cat-10", "name": "Men's Accessories", "slug": "mens-accessories"}, "categoryName": "Men's Accessories", "image": "https://images.nexusapp.co/assets/83/63/8f/55466066.jpg", "images": ["https://images.nexusapp.co/assets/83/63/8f/55466066.jpg"], "stock": 7, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.8, "numReviews": 71, "tags": ["mens-accessories", "luxury", "men", "designer", "new-arrival", "featured"], "gender": "men"},
+    {"_id": "mens-prod-95", "name": "Suspenders", "slug": "suspenders", "description": "Premium suspenders crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 775, "category": {"_id": "cat-10", "name": "Men's Accessories", "slug": "mens-accessories"}, "categoryName": "Men's Accessories", "image": "https://i.pinimg.com/736x/f6/67/64/f667649f10c91bc3c8d5f65c173b4107.jpg", "images": ["https://i.pinimg.com/736x/f6/67/64/f667649f10c91bc3c8d5f65c173b4107.jpg"], "stock": 22, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.4, "numReviews": 157, "tags": ["mens-accessories", "luxury", "men", "designer", "new-arrival", "featured"], "gender": "men"},
+    {"_id": "mens-prod-96", "name": "Bow Tie", "slug": "bow-tie", "description": "Premium bow tie crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 817, "category": {"_id": "cat-10", "name": "Men's Accessories", "slug": "mens-accessories"}, "categoryName": "Men's Accessories", "image": "https://media.neimanmarcus.com/f_auto,q_auto/01/nm_4335557_100134_m", "images": ["https://media.neimanmarcus.com/f_auto,q_auto/01/nm_4335557_100134_m"], "stock": 7, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.6, "numReviews": 121, "tags": ["mens-accessories", "luxury", "men", "designer", "featured"], "gender": "men"},
+    {"_id": "mens-prod-97", "name": "Watch Band", "slug": "watch-band", "description": "Premium watch band crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1198, "category": {"_id": "cat-10", "name": "Men's Accessories", "slug": "mens-accessories"}, "categoryName": "Men's Accessories", "image": "https://longvadon.com/cdn/shop/files/closeup_apple_watch_mens_leather_v1logo_4x5_a82e1635-67f3-4678-aa65-a77a1c2ba200.jpg?v=1744970036", "images": ["https://longvadon.com/cdn/shop/files/closeup_apple_watch_mens_leather_v1logo_4x5_a82e1635-67f3-4678-aa65-a77a1c2ba200.jpg?v=1744970036"], "stock": 17, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.6, "numReviews": 98, "tags": ["mens-accessories", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-98", "name": "Passport Holder", "slug": "passport-holder", "description": "Premium passport holder crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 911, "category": {"_id": "cat-10", "name": "Men's Accessories", "slug": "mens-accessories"}, "categoryName": "Men's Accessories", "image": "https://i.pinimg.com/originals/27/46/c4/2746c4e006f2a01a338cd43eda39ec5e.jpg", "images": ["https://i.pinimg.com/originals/27/46/c4/2746c4e006f2a01a338cd43eda39ec5e.jpg"], "stock": 5, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.9, "numReviews": 119, "tags": ["mens-accessories", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-99", "name": "Key Holder", "slug": "key-holder", "description": "Premium key holder crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 942, "category": {"_id": "cat-10", "name": "Men's Accessories", "slug": "mens-accessories"}, "categoryName": "Men's Accessories", "image": "https://product-images.therealreal.com/LOU117012_1_enlarged.jpg", "images": ["https://product-images.therealreal.com/LOU117012_1_enlarged.jpg"], "stock": 8, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.8, "numReviews": 103, "tags": ["mens-accessories", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-100", "name": "Collar Pin", "slug": "collar-pin", "description": "Premium collar pin crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1008, "category": {"_id": "cat-10", "name": "Men's Accessories", "slug": "mens-accessories"}, "categoryName": "Men's Accessories", "image": "https://i.etsystatic.com/46290522/r/il/bb7d6d/5800104386/il_1080xN.5800104386_amio.jpg", "images": ["https://i.etsystatic.com/46290522/r/il/bb7d6d/5800104386/il_1080xN.5800104386_amio.jpg"], "stock": 10, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.4, "numReviews": 90, "tags": ["mens-accessories", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+];
+
+export default products;
@@ -0,0 +1,27 @@
+// Men's Bags - 20 products (generated by product_codegen.py)
+import type { MockProduct } from './types';
+
+const products: MockProduct[] = [
+    {"_id": "mens-prod-21", "name": "Leather Briefcase", "slug": "leather-briefcase", "description": "Premium leather briefcase crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 532, "compareAtPrice": 656, "category": {"_id": "cat-7", "name": "Men's Bags", "slug": "mens-bags"}, "categoryName": "Men's Bags", "image": "https://i.etsystatic.com/8115148/r/il/03d916/1741333308/il_fullxfull.1741333308_tfr4.jpg", "images": ["https://i.etsystatic.com/8115148/r/il/03d916/1741333308/il_fullxfull.1741333308_tfr4.jpg"], "stock": 21, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.7, "numReviews": 31, "tags": ["mens-bags", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-22", "name": "Messenger Bag", "slug": "messenger-bag", "description": "Premium messenger bag crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 987, "category": {"_id": "cat-7", "name": "Men's Bags", "slug": "mens-bags"}, "categoryName": "Men's Bags", "image": "https://i.pinimg.com/originals/ea/ad/43/eaad437f338db02cc1fe2ed1d34d5660.png", "images": ["https://i.pinimg.com/originals/ea/ad/43/eaad437f338db02cc1fe2ed1d34d5660.png"], "stock": 27, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.3, "numReviews": 29, "tags": ["mens-bags", "luxury", "men", "designer", "new-arrival", "featured"], "gender": "men"},
+    {"_id": "mens-prod-23", "name": "Laptop Portfolio", "slug": "laptop-portfolio", "description": "Premium laptop portfolio crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1092, "category": {"_id": "cat-7", "name": "Men's Bags", "slug": "mens-bags"}, "categoryName": "Men's Bags", "image": "https://www.hugme.fashion/image/cache/catalog/Leather Bag/LB57/amb74_3-800x1019.jpg", "images": ["https://www.hugme.fashion/image/cache/catalog/Leather Bag/LB57/amb74_3-800x1019.jpg"], "stock": 13, "isNew": false, "isFeatured": true, "isActive": true, "rating": 5.0, "numReviews": 66, "tags": ["mens-bags", "luxury", "men", "designer", "featured"], "gender": "men"},
+    {"_id": "mens-prod-24", "name": "Weekend Duffel", "slug": "weekend-duffel", "description": "Premium weekend duffel crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 981, "category": {"_id": "cat-7", "name": "Men's Bags", "slug": "mens-bags"}, "categoryName": "Men's Bags", "image": "https://mensflair.com/wp-content/uploads/2022/12/WeekenderBagsEdit5.jpg", "images": ["https://mensflair.com/wp-content/uploads/2022/12/WeekenderBagsEdit5.jpg"], "stock": 20, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.0, "numReviews": 88, "tags": ["mens-bags", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-25", "name": "Leather Backpack", "slug": "leather-backpack", "description": "Premium leather backpack crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1156, "category": {"_id": "cat-7", "name": "Men's Bags", "slug": "mens-bags"}, "categoryName": "Men's Bags", "image": "https://i.etsystatic.com/10661967/r/il/9a0256/4244557858/il_fullxfull.4244557858_240p.jpg", "images": ["https://i.etsystatic.com/10661967/r/il/9a0256/4244557858/il_fullxfull.4244557858_240p.jpg"], "stock": 17, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.7, "numReviews": 44, "tags": ["mens-bags", "luxury", "men", "designer", "new-arrival", "featured"], "gender": "men"},
+    {"_id": "mens-prod-26", "name": "Document Case", "slug": "document-case", "description": "Premium document case crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1227, "category": {"_id": "cat-7", "name": "Men's Bags", "slug": "mens-bags"}, "categoryName": "Men's Bags", "image": "https://cdna.lystit.com/400/500/tr/photos/harrods/ba3608a6/dunhill-black-Leather-Cadogan-Document-Case.jpeg", "images": ["https://cdna.lystit.com/400/500/tr/photos/harrods/ba3608a6/dunhill-black-Leather-Cadogan-Document-Case.jpeg"], "stock": 12, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.9, "numReviews": 130, "tags": ["mens-bags", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-27", "name": "Travel Carry-On", "slug": "travel-carry-on", "description": "Premium travel carry-on crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1080, "category": {"_id": "cat-7", "name": "Men's Bags", "slug": "mens-bags"}, "categoryName": "Men's Bags", "image": "https://m.media-amazon.com/images/I/71O5XNpebbL._AC_SL1500_.jpg", "images": ["https://m.media-amazon.com/images/I/71O5XNpebbL._AC_SL1500_.jpg"], "stock": 18, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.5, "numReviews": 82, "tags": ["mens-bags", "luxury", "men", "designer", "new-arrival", "featured"], "gender": "men"},
+    {"_id": "mens-prod-28", "name": "Crossbody Satchel", "slug": "crossbody-satchel", "description": "Premium crossbody satchel crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1325, "category": {"_id": "cat-7", "name": "Men's Bags", "slug": "mens-bags"}, "categoryName": "Men's Bags", "image": "https://cdna.lystit.com/photos/matchesfashion/14af3055/gucci-black-Gg-Supreme-Leather-Cross-body-Bag.jpeg", "images": ["https://cdna.lystit.com/photos/matchesfashion/14af3055/gucci-black-Gg-Supreme-Leather-Cross-body-Bag.jpeg"], "stock": 32, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.7, "numReviews": 137, "tags": ["mens-bags", "luxury", "men", "designer", "featured"], "gender": "men"},
+    {"_id": "mens-prod-29", "name": "Slim Folio", "slug": "slim-folio", "description": "Premium slim folio crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1317, "category": {"_id": "cat-7", "name": "Men's Bags", "slug": "mens-bags"}, "categoryName": "Men's Bags", "image": "https://assets.paulsmith.com/paul-smith-products/f_jpg,q_auto,w_1228/v1746718275/STILL/M1A/M1A-8158-TLEPIP-62-0/M1A-8158-TLEPIP-62-0_70", "images": ["https://assets.paulsmith.com/paul-smith-products/f_jpg,q_auto,w_1228/v1746718275/STILL/M1A/M1A-8158-TLEPIP-62-0/M1A-8158-TLEPIP-62-0_70"], "stock": 29, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.8, "numReviews": 63, "tags": ["mens-bags", "luxury", "men", "designer", "featured"], "gender": "men"},
+    {"_id": "mens-prod-30", "name": "Overnight Bag", "slug": "overnight-bag", "description": "Premium overnight bag crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1521, "category": {"_id": "cat-7", "name": "Men's Bags", "slug": "mens-bags"}, "categoryName": "Men's Bags", "image": "https://i.pinimg.com/originals/26/fd/c1/26fdc1f5f94da7456447125c6091d71a.jpg", "images": ["https://i.pinimg.com/originals/26/fd/c1/26fdc1f5f94da7456447125c6091d71a.jpg"], "stock": 11, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.4, "numReviews": 61, "tags": ["mens-bags", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-31", "name": "Executive Attache", "slug": "executive-attache", "description": "Premium executive attache crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1472, "category": {"_id": "cat-7", "name": "Men's Bags", "slug": "mens-bags"}, "categoryName": "Men's Bags", "image": "https://m.media-amazon.com/images/I/51cYl00KmnL._AC_SL1500_.jpg", "images": ["https://m.media-amazon.com/images/I/51cYl00KmnL._AC_SL1500_.jpg"], "stock": 8, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.0, "numReviews": 63, "tags": ["mens-bags", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-32", "name": "Convertible Tote", "slug": "convertible-tote", "description": "Premium convertible tote crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1441, "category": {"_id": "cat-7", "name": "Men's Bags", "slug": "mens-bags"}, "categoryName": "Men's Bags", "image": "https://i.pinimg.com/originals/e0/3a/57/e03a573573a7e46e66ab55e656c8d314.jpg", "images": ["https://i.pinimg.com/originals/e0/3a/57/e03a573573a7e46e66ab55e656c8d314.jpg"], "stock": 27, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.7, "numReviews": 104, "tags": ["mens-bags", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-33", "name": "Tech Backpack", "slug": "tech-backpack", "description": "Premium tech backpack crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1884, "category": {"_id": "cat-7", "name": "Men's Bags", "slug": "mens-bags"}, "categoryName": "Men's Bags", "image": "https://i.pinimg.com/originals/a3/27/e2/a327e289e98b889a2245b0a66b68a316.jpg", "images": ["https://i.pinimg.com/originals/a3/27/e2/a327e289e98b889a2245b0a66b68a316.jpg"], "stock": 33, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.9, "numReviews": 71, "tags": ["mens-bags", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-34", "name": "Garment Bag", "slug": "garment-bag", "description": "Premium garment bag crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1630, "compareAtPrice": 1764, "category": {"_id": "cat-7", "name": "Men's Bags", "slug": "mens-bags"}, "categoryName": "Men's Bags", "image": "https://i.pinimg.com/originals/fd/59/22/fd5922da47781374ef52af1258e917ff.png", "images": ["https://i.pinimg.com/originals/fd/59/22/fd5922da47781374ef52af1258e917ff.png"], "stock": 27, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.8, "numReviews": 152, "tags": ["mens-bags", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-35", "name": "Duffle Weekender", "slug": "duffle-weekender", "description": "Premium duffle weekender crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1863, "compareAtPrice": 2210, "category": {"_id": "cat-7", "name": "Men's Bags", "slug": "mens-bags"}, "categoryName": "Men's Bags", "image": "https://i.etsystatic.com/10448437/r/il/6cc240/1057940132/il_570xN.1057940132_f4mx.jpg", "images": ["https://i.etsystatic.com/10448437/r/il/6cc240/1057940132/il_570xN.1057940132_f4mx.jpg"], "stock": 28, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.5, "numReviews": 153, "tags": ["mens-bags", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-36", "name": "Shoulder Messenger", "slug": "shoulder-messenger", "description": "Premium shoulder messenger crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1837, "category": {"_id": "cat-7", "name": "Men's Bags", "slug": "mens-bags"}, "categoryName": "Men's Bags", "image": "https://i.etsystatic.com/18299285/r/il/910dac/3636133059/il_fullxfull.3636133059_grbg.jpg", "images": ["https://i.etsystatic.com/18299285/r/il/910dac/3636133059/il_fullxfull.3636133059_grbg.jpg"], "stock": 29, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.8, "numReviews": 104, "tags": ["mens-bags", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-37", "name": "Leather Holdall", "slug": "leather-holdall", "description": "Premium leather holdall crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1866, "category": {"_id": "cat-7", "name": "Men's Bags", "slug": "mens-bags"}, "categoryName": "Men's Bags", "image": "https://img.shopstyle-cdn.com/sim/c6/e6/c6e6e795234e9b61ce1f5ec446e9d6d5_best/lakeland-leather-discoverer-large-leather-holdall.jpg", "images": ["https://img.shopstyle-cdn.com/sim/c6/e6/c6e6e795234e9b61ce1f5ec446e9d6d5_best/lakeland-leather-discoverer-large-leather-holdall.jpg"], "stock": 13, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.6, "numReviews": 135, "tags": ["mens-bags", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-38", "name": "Business Bag", "slug": "business-bag", "description": "Premium business bag crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 2177, "category": {"_id": "cat-7", "name": "Men's Bags", "slug": "mens-bags"}, "categoryName": "Men's Bags", "image": "https://i.pinimg.com/originals/43/aa/f2/43aaf20777251db18382306e2b9fb98b.jpg", "images": ["https://i.pinimg.com/originals/43/aa/f2/43aaf20777251db18382306e2b9fb98b.jpg"], "stock": 30, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.8, "numReviews": 84, "tags": ["mens-bags", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-39", "name": "Vintage Satchel", "slug": "vintage-satchel", "description": "Premium vintage satchel crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1990, "category": {"_id": "cat-7", "name": "Men's Bags", "slug": "mens-bags"}, "categoryName": "Men's Bags", "image": "https://i.pinimg.com/originals/d6/65/76/d66576fdfd366ce1da50b366254126a0.jpg", "images": ["https://i.pinimg.com/originals/d6/65/76/d66576fdfd366ce1da50b366254126a0.jpg"], "stock": 29, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.4, "numReviews": 113, "tags": ["mens-bags", "luxury", "men", "designer", "new-arrival", "featured"], "gender": "men"},
+    {"_id": "mens-prod-40", "name": "Premium Carryall", "slug": "premium-carryall", "description": "Premium premium carryall crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 2387, "category": {"_id": "cat-7", "name": "Men's Bags", "slug": "mens-bags"}, "categoryName": "Men's Bags", "image": "https://media.bergdorfgoodman.com/images/f_auto,q_auto:low,ar_5:7,c_fill,dpr_2.0,w_720/01/2832691_100106_a/giorgio-armani-mens-deer-leather-carryall-", "images": ["https://media.bergdorfgoodman.com/images/f_auto,q_auto:low,ar_5:7,c_fill,dpr_2.0,w_720/01/2832691_100106_a/giorgio-armani-mens-deer-leather-carryall-"], "stock": 24, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.6, "numReviews": 35, "tags": ["mens-bags", "luxury", "men", "designer"], "gender": "men"},
+];
+
+export default products;
@@ -0,0 +1,27 @@
+// Men's Shoes - 20 products (generated by product_codegen.py)
+import type { MockProduct } from './types';
+
+const products: MockProduct[] = [
+    {"_id": "mens-prod-41", "name": "Oxford Dress Shoes", "slug": "oxford-dress-shoes", "description": "Premium oxford dress shoes crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 655, "category": {"_id": "cat-8", "name": "Men's Shoes", "slug": "mens-shoes"}, "categoryName": "Men's Shoes", "image": "https://i.pinimg.com/originals/0e/5a/a2/0e5aa290eb6c90bcc3c7b734bf022660.jpg", "images": ["https://i.pinimg.com/originals/0e/5a/a2/0e5aa290eb6c90bcc3c7b734bf022660.jpg"], "stock": 25, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.2, "numReviews": 25, "tags": ["mens-shoes", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-42", "name": "Derby Brogues", "slug": "derby-brogues", "description": "Premium derby brogues crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 727, "category": {"_id": "cat-8", "name": "Men's Shoes", "slug": "mens-shoes"}, "categoryName": "Men's Shoes", "image": "https://www.secretsales.com/cdn-cgi/image/width=640,height=800,fit=contain,format=auto/https://media.secretsales.com/catalog/product/b/5/b5299ed6ccc64e6497be06f9b081cf14.jpg", "images": ["https://www.secretsales.com/cdn-cgi/image/width=640,height=800,fit=contain,format=auto/https://media.secretsales.com/catalog/product/b/5/b5299ed6ccc64e6497be06f9b081cf14.jpg"], "stock": 21, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.8, "numReviews": 49, "tags": ["mens-shoes", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-43", "name": "Leather Loafers", "slug": "leather-loafers", "description": "Premium leather loafers crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 910, "compareAtPrice": 1131, "category": {"_id": "cat-8", "name": "Men's Shoes", "slug": "mens-shoes"}, "categoryName": "Men's Shoes", "image": "https://cdna.lystit.com/photos/lanecrawford/3f00fd7b/allen-edmonds--spring-Street-Tassel-Leather-Loafers.jpeg", "images": ["https://cdna.lystit.com/photos/lanecrawford/3f00fd7b/allen-edmonds--spring-Street-Tassel-Leather-Loafers.jpeg"], "stock": 27, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.8, "numReviews": 20, "tags": ["mens-shoes", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-44", "name": "Chelsea Boots", "slug": "mens-shoes-chelsea-boots", "description": "Premium chelsea boots crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 510, "category": {"_id": "cat-8", "name": "Men's Shoes", "slug": "mens-shoes"}, "categoryName": "Men's Shoes", "image": "https://assets.myntassets.com/h_200,w_200,c_fill,g_auto/h_1440,q_100,w_1080/v1/assets/images/14082248/2022/3/15/5db67ddc-9415-4dc3-a970-6c3636b138391647327773096SaintGMenBlackSolidLeatherFormalChelseaBoots1.jpg", "images": ["https://assets.myntassets.com/h_200,w_200,c_fill,g_auto/h_1440,q_100,w_1080/v1/assets/images/14082248/2022/3/15/5db67ddc-9415-4dc3-a970-6c3636b138391647327773096SaintGMenBlackSolidLeatherFormalChelseaBoots1.jpg"], "stock": 34, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.1, "numReviews": 26, "tags": ["mens-shoes", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-45", "name": "Monk Strap", "slug": "monk-strap", "description": "Premium monk strap crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 988, "category": {"_id": "cat-8", "name": "Men's Shoes", "slug": "mens-shoes"}, "categoryName": "Men's Shoes", "image": "https://i0.wp.com/sveltemag.com/wp-content/uploads/2022/01/black-monk-shoes.jpg?resize=564%2C705&is-pending-load=1#038;ssl=1", "images": ["https://i0.wp.com/sveltemag.com/wp-content/uploads/2022/01/black-monk-shoes.jpg?resize=564%2C705&is-pending-load=1#038;ssl=1"], "stock": 6, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.6, "numReviews": 156, "tags": ["mens-shoes", "luxury", "men", "designer", "featured"], "gender": "men"},
+    {"_id": "mens-prod-46", "name": "Penny Loafers", "slug": "penny-loafers", "description": "Premium penny loafers crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 841, "category": {"_id": "cat-8", "name": "Men's Shoes", "slug": "mens-shoes"}, "categoryName": "Men's Shoes", "image": "https://cdn.luxe.digital/media/2020/03/04095155/loafers-best-men-shoes-luxe-digital.jpg", "images": ["https://cdn.luxe.digital/media/2020/03/04095155/loafers-best-men-shoes-luxe-digital.jpg"], "stock": 13, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.9, "numReviews": 53, "tags": ["mens-shoes", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-47", "name": "Wingtip Oxfords", "slug": "wingtip-oxfords", "description": "Premium wingtip oxfords crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 932, "category": {"_id": "cat-8", "name": "Men's Shoes", "slug": "mens-shoes"}, "categoryName": "Men's Shoes", "image": "https://i.pinimg.com/originals/44/42/de/4442deed26a8c9d86f2d485be3a38e41.jpg", "images": ["https://i.pinimg.com/originals/44/42/de/4442deed26a8c9d86f2d485be3a38e41.jpg"], "stock": 10, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.6, "numReviews": 93, "tags": ["mens-shoes", "luxury", "men", "designer", "featured"], "gender": "men"},
+    {"_id": "mens-prod-48", "name": "Suede Loafers", "slug": "suede-loafers", "description": "Premium suede loafers crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 734, "category": {"_id": "cat-8", "name": "Men's Shoes", "slug": "mens-shoes"}, "categoryName": "Men's Shoes", "image": "https://i.pinimg.com/originals/1b/69/43/1b6943d513943a0412f09e0e0d366399.jpg", "images": ["https://i.pinimg.com/originals/1b/69/43/1b6943d513943a0412f09e0e0d366399.jpg"], "stock": 6, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.7, "numReviews": 155, "tags": ["mens-shoes", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-49", "name": "Dress Boots", "slug": "dress-boots", "description": "Premium dress boots crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 832, "category": {"_id": "cat-8", "name": "Men's Shoes", "slug": "mens-shoes"}, "categoryName": "Men's Shoes", "image": "https://i.pinimg.com/originals/5d/28/0a/5d280aa325d215a2a76828fe54c76f09.jpg", "images": ["https://i.pinimg.com/originals/5d/28/0a/5d280aa325d215a2a76828fe54c76f09.jpg"], "stock": 12, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.8, "numReviews": 71, "tags": ["mens-shoes", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-50", "name": "Cap Toe Oxfords", "slug": "cap-toe-oxfords", "description": "Premium cap toe oxfords crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 927, "category": {"_id": "cat-8", "name": "Men's Shoes", "slug": "mens-shoes"}, "categoryName": "Men's Shoes", "image": "https://i.pinimg.com/originals/92/d5/a6/92d5a61c0489b6469162246342274c41.jpg", "images": ["https://i.pinimg.com/originals/92/d5/a6/92d5a61c0489b6469162246342274c41.jpg"], "stock": 17, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.5, "numReviews": 48, "tags": ["mens-shoes", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-51", "name": "Tassel Loafers", "slug": "tassel-loafers", "description": "Premium tassel loafers crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 905, "category": {"_id": "cat-8", "name": "Men's Shoes", "slug": "mens-shoes"}, "categoryName": "Men's Shoes", "image": "https://cdn.suitsupply.com/image/upload/b_rgb:efefef,c_fill,w_2600,h_3597/b_rgb:efefef,c_pad,dpr_1,w_850,h_1176,f_auto,q_auto,fl_progressive/products/Shoes/default/FW1331_35.jpg", "images": ["https://cdn.suitsupply.com/image/upload/b_rgb:efefef,c_fill,w_2600,h_3597/b_rgb:efefef,c_pad,dpr_1,w_850,h_1176,f_auto,q_auto,fl_progressive/products/Shoes/default/FW1331_35.jpg"], "stock": 27, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.4, "numReviews": 98, "tags": ["mens-shoes", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-52", "name": "Chukka Boots", "slug": "chukka-boots", "description": "Premium chukka boots crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1121, "category": {"_id": "cat-8", "name": "Men's Shoes", "slug": "mens-shoes"}, "categoryName": "Men's Shoes", "image": "https://i.etsystatic.com/39126012/r/il/e45bd6/4545804644/il_fullxfull.4545804644_jn4r.jpg", "images": ["https://i.etsystatic.com/39126012/r/il/e45bd6/4545804644/il_fullxfull.4545804644_jn4r.jpg"], "stock": 16, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.6, "numReviews": 88, "tags": ["mens-shoes", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-53", "name": "Whole Cut", "slug": "whole-cut", "description": "Premium whole cut crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1238, "category": {"_id": "cat-8", "name": "Men's Shoes", "slug": "mens-shoes"}, "categoryName": "Men's Shoes", "image": "https://i.pinimg.com/originals/5c/67/7b/5c677b1ce69bc782efa4b1221332a812.jpg", "images": ["https://i.pinimg.com/originals/5c/67/7b/5c677b1ce69bc782efa4b1221332a812.jpg"], "stock": 10, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.1, "numReviews": 37, "tags": ["mens-shoes", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-54", "name": "Double Monk", "slug": "double-monk", "description": "Premium double monk crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1025, "category": {"_id": "cat-8", "name": "Men's Shoes", "slug": "mens-shoes"}, "categoryName": "Men's Shoes", "image": "https://www.xposedlondon.com/cdn/shop/files/MAIN_310415e1-3faf-4ca5-9d9e-68bca6f0243e.jpg?v=1718720779", "images": ["https://www.xposedlondon.com/cdn/shop/files/MAIN_310415e1-3faf-4ca5-9d9e-68bca6f0243e.jpg?v=1718720779"], "stock": 25, "isNew": true, "isFeatured": false, "isActive": true, "rating": 5.0, "numReviews": 117, "tags": ["mens-shoes", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-55", "name": "Venetian Loafers", "slug": "venetian-loafers", "description": "Premium venetian loafers crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1190, "category": {"_id": "cat-8", "name": "Men's Shoes", "slug": "mens-shoes"}, "categoryName": "Men's Shoes", "image": "https://media.bergdorfgoodman.com/f_auto,q_auto:low,ar_5:7,c_fill,dpr_2.0,w_720/01/bg_4669849_100134_z", "images": ["https://media.bergdorfgoodman.com/f_auto,q_auto:low,ar_5:7,c_fill,dpr_2.0,w_720/01/bg_4669849_100134_z"], "stock": 32, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.7, "numReviews": 84, "tags": ["mens-shoes", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-56", "name": "Jodhpur Boots", "slug": "jodhpur-boots", "description": "Premium jodhpur boots crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1160, "compareAtPrice": 1338, "category": {"_id": "cat-8", "name": "Men's Shoes", "slug": "mens-shoes"}, "categoryName": "Men's Shoes", "image": "https://i.pinimg.com/originals/30/e1/aa/30e1aa23dd749fc1c3720fc2448cb922.jpg", "images": ["https://i.pinimg.com/originals/30/e1/aa/30e1aa23dd749fc1c3720fc2448cb922.jpg"], "stock": 30, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.8, "numReviews": 69, "tags": ["mens-shoes", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-57", "name": "Bit Loafers", "slug": "bit-loafers", "description": "Premium bit loafers crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1487, "category": {"_id": "cat-8", "name": "Men's Shoes", "slug": "mens-shoes"}, "categoryName": "Men's Shoes", "image": "https://brabions.com/cdn/shop/products/image_12c9e16a-60dc-4b06-970e-1220a6a111d6.jpg?v=1594218652&width=1100", "images": ["https://brabions.com/cdn/shop/products/image_12c9e16a-60dc-4b06-970e-1220a6a111d6.jpg?v=1594218652&width=1100"], "stock": 21, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.1, "numReviews": 144, "tags": ["mens-shoes", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-58", "name": "Longwing Brogues", "slug": "longwing-brogues", "description": "Premium longwing brogues crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1203, "compareAtPrice": 1523, "category": {"_id": "cat-8", "name": "Men's Shoes", "slug": "mens-shoes"}, "categoryName": "Men's Shoes", "image": "https://www.santimon.com/cdn/shop/files/A4_1ffb60b5-5ad8-4dd0-8103-15aab61475f7.jpg?v=1701156777", "images": ["https://www.santimon.com/cdn/shop/files/A4_1ffb60b5-5ad8-4dd0-8103-15aab61475f7.jpg?v=1701156777"], "stock": 17, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.5, "numReviews": 139, "tags": ["mens-shoes", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-59", "name": "Side Zip Boots", "slug": "side-zip-boots", "description": "Premium side zip boots crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1274, "compareAtPrice": 1665, "category": {"_id": "cat-8", "name": "Men's Shoes", "slug": "mens-shoes"}, "categoryName": "Men's Shoes", "image": "https://assets.digitalcontent.marksandspencer.app/images/w_1024,q_auto,f_auto/MS_10_T83_8927B_Y0_X_EC_0/Leather-Side-Zip-Chelsea-Boots", "images": ["https://assets.digitalcontent.marksandspencer.app/images/w_1024,q_auto,f_auto/MS_10_T83_8927B_Y0_X_EC_0/Leather-Side-Zip-Chelsea-Boots"], "stock": 21, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.2, "numReviews": 135, "tags": ["mens-shoes", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-60", "name": "Opera Pumps", "slug": "opera-pumps", "description": "Premium opera pumps crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1309, "compareAtPrice": 1646, "category": {"_id": "cat-8", "name": "Men's Shoes", "slug": "mens-shoes"}, "categoryName": "Men's Shoes", "image": "https://i.ebayimg.com/images/g/sM4AAOSw2C1juWZq/s-l1600.jpg", "images": ["https://i.ebayimg.com/images/g/sM4AAOSw2C1juWZq/s-l1600.jpg"], "stock": 22, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.9, "numReviews": 10, "tags": ["mens-shoes", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+];
+
+export default products;
@@ -0,0 +1,27 @@
+// Men's Suits - 20 products (generated by product_codegen.py)
+import type { MockProduct } from './types';
+
+const products: MockProduct[] = [
+    {"_id": "mens-prod-61", "name": "Classic Navy Suit", "slug": "classic-navy-suit", "description": "Premium classic navy suit crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1503, "category": {"_id": "cat-9", "name": "Men's Suits", "slug": "mens-suits"}, "categoryName": "Men's Suits", "image": "https://i.pinimg.com/originals/cd/26/ef/cd26ef86c48ac24bfc9131682286878e.jpg", "images": ["https://i.pinimg.com/originals/cd/26/ef/cd26ef86c48ac24bfc9131682286878e.jpg"], "stock": 24, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.6, "numReviews": 21, "tags": ["mens-suits", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-62", "name": "Charcoal Pinstripe", "slug": "charcoal-pinstripe", "description": "Premium charcoal pinstripe crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1826, "category": {"_id": "cat-9", "name": "Men's Suits", "slug": "mens-suits"}, "categoryName": "Men's Suits", "image": "https://nemersaade.com/wp-content/uploads/2022/11/DSC3843-scaled.jpg", "images": ["https://nemersaade.com/wp-content/uploads/2022/11/DSC3843-scaled.jpg"], "stock": 7, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.6, "numReviews": 108, "tags": ["mens-suits", "luxury", "men", "designer", "featured"], "gender": "men"},
+    {"_id": "mens-prod-63", "name": "Slim Fit Black", "slug": "slim-fit-black", "description": "Premium slim fit black crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1867, "compareAtPrice": 2087, "category": {"_id": "cat-9", "name": "Men's Suits", "slug": "mens-suits"}, "categoryName": "Men's Suits", "image": "https://i.pinimg.com/originals/78/be/c0/78bec05f66cbbf8a157eda312d99c9ac.jpg", "images": ["https://i.pinimg.com/originals/78/be/c0/78bec05f66cbbf8a157eda312d99c9ac.jpg"], "stock": 6, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.0, "numReviews": 11, "tags": ["mens-suits", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-64", "name": "Italian Wool", "slug": "italian-wool", "description": "Premium italian wool crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 1929, "category": {"_id": "cat-9", "name": "Men's Suits", "slug": "mens-suits"}, "categoryName": "Men's Suits", "image": "https://content.moss.co.uk/images/extraextralarge/966916009_02.jpg", "images": ["https://content.moss.co.uk/images/extraextralarge/966916009_02.jpg"], "stock": 21, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.7, "numReviews": 37, "tags": ["mens-suits", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-65", "name": "Double Breasted", "slug": "double-breasted", "description": "Premium double breasted crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 2089, "category": {"_id": "cat-9", "name": "Men's Suits", "slug": "mens-suits"}, "categoryName": "Men's Suits", "image": "https://i.pinimg.com/originals/b5/d0/ba/b5d0ba0fb145be0f3a90ba846c7f53e2.jpg", "images": ["https://i.pinimg.com/originals/b5/d0/ba/b5d0ba0fb145be0f3a90ba846c7f53e2.jpg"], "stock": 34, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.9, "numReviews": 103, "tags": ["mens-suits", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-66", "name": "Peak Lapel", "slug": "peak-lapel", "description": "Premium peak lapel crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 2170, "category": {"_id": "cat-9", "name": "Men's Suits", "slug": "mens-suits"}, "categoryName": "Men's Suits", "image": "https://i.etsystatic.com/37908468/r/il/b2b404/4377755645/il_fullxfull.4377755645_mt1r.jpg", "images": ["https://i.etsystatic.com/37908468/r/il/b2b404/4377755645/il_fullxfull.4377755645_mt1r.jpg"], "stock": 27, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.9, "numReviews": 10, "tags": ["mens-suits", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-67", "name": "Windowpane Check", "slug": "windowpane-check", "description": "Premium windowpane check crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 2263, "category": {"_id": "cat-9", "name": "Men's Suits", "slug": "mens-suits"}, "categoryName": "Men's Suits", "image": "https://handcmediastorage.blob.core.windows.net/productimages/CO/COCLE316-B52-174695-1400px-1820px.jpg", "images": ["https://handcmediastorage.blob.core.windows.net/productimages/CO/COCLE316-B52-174695-1400px-1820px.jpg"], "stock": 32, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.7, "numReviews": 83, "tags": ["mens-suits", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-68", "name": "Herringbone Tweed", "slug": "herringbone-tweed", "description": "Premium herringbone tweed crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 2706, "compareAtPrice": 2969, "category": {"_id": "cat-9", "name": "Men's Suits", "slug": "mens-suits"}, "categoryName": "Men's Suits", "image": "https://content.moss.co.uk/images/extraextralarge/967009422_02.jpg", "images": ["https://content.moss.co.uk/images/extraextralarge/967009422_02.jpg"], "stock": 5, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.9, "numReviews": 54, "tags": ["mens-suits", "luxury", "men", "designer", "new-arrival", "featured"], "gender": "men"},
+    {"_id": "mens-prod-69", "name": "Linen Summer", "slug": "linen-summer", "description": "Premium linen summer crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 2686, "category": {"_id": "cat-9", "name": "Men's Suits", "slug": "mens-suits"}, "categoryName": "Men's Suits", "image": "https://menstuxedousa.com/cdn/shop/files/TailoredFit5.jpg?v=1716462081", "images": ["https://menstuxedousa.com/cdn/shop/files/TailoredFit5.jpg?v=1716462081"], "stock": 28, "isNew": false, "isFeatured": false, "isActive": true, "rating": 5.0, "numReviews": 105, "tags": ["mens-suits", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-70", "name": "Velvet Evening", "slug": "velvet-evening", "description": "Premium velvet evening crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 2885, "category": {"_id": "cat-9", "name": "Men's Suits", "slug": "mens-suits"}, "categoryName": "Men's Suits", "image": "https://assets.paulsmith.com/paul-smith-products/f_jpg,q_auto,w_828/v1697545495/MODEL/ECOM/M1R/M1R-1841P-L01346-79/M1R-1841P-L01346-79_11", "images": ["https://assets.paulsmith.com/paul-smith-products/f_jpg,q_auto,w_828/v1697545495/MODEL/ECOM/M1R/M1R-1841P-L01346-79/M1R-1841P-L01346-79_11"], "stock": 14, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.1, "numReviews": 24, "tags": ["mens-suits", "luxury", "men", "designer", "featured"], "gender": "men"},
+    {"_id": "mens-prod-71", "name": "Tuxedo Set", "slug": "tuxedo-set", "description": "Premium tuxedo set crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 3081, "category": {"_id": "cat-9", "name": "Men's Suits", "slug": "mens-suits"}, "categoryName": "Men's Suits", "image": "https://media.bergdorfgoodman.com/f_auto,q_auto:low,ar_5:7,c_fill,dpr_2.0,w_720/01/bg_4791633_100106_a", "images": ["https://media.bergdorfgoodman.com/f_auto,q_auto:low,ar_5:7,c_fill,dpr_2.0,w_720/01/bg_4791633_100106_a"], "stock": 15, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.1, "numReviews": 21, "tags": ["mens-suits", "luxury", "men", "designer", "new-arrival", "featured"], "gender": "men"},
+    {"_id": "mens-prod-72", "name": "Three Piece", "slug": "three-piece", "description": "Premium three piece crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 2958, "category": {"_id": "cat-9", "name": "Men's Suits", "slug": "mens-suits"}, "categoryName": "Men's Suits", "image": "https://i.pinimg.com/originals/a8/e3/f8/a8e3f80e053265fafc091e12ce3da170.jpg", "images": ["https://i.pinimg.com/originals/a8/e3/f8/a8e3f80e053265fafc091e12ce3da170.jpg"], "stock": 7, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.8, "numReviews": 127, "tags": ["mens-suits", "luxury", "men", "designer", "featured"], "gender": "men"},
+    {"_id": "mens-prod-73", "name": "Morning Coat", "slug": "morning-coat", "description": "Premium morning coat crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 3166, "category": {"_id": "cat-9", "name": "Men's Suits", "slug": "mens-suits"}, "categoryName": "Men's Suits", "image": "https://i.pinimg.com/originals/fd/48/24/fd48248c8add51cfc018adda8e43aff6.jpg", "images": ["https://i.pinimg.com/originals/fd/48/24/fd48248c8add51cfc018adda8e43aff6.jpg"], "stock": 15, "isNew": true, "isFeatured": true, "isActive": true, "rating": 5.0, "numReviews": 34, "tags": ["mens-suits", "luxury", "men", "designer", "new-arrival", "featured"], "gender": "men"},
+    {"_id": "mens-prod-74", "name": "Business Gray", "slug": "business-gray", "description": "Premium business gray crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 3511, "compareAtPrice": 3843, "category": {"_id": "cat-9", "name": "Men's Suits", "slug": "mens-suits"}, "categoryName": "Men's Suits", "image": "https://universaltailor.com/wp-content/uploads/2018/08/how-to-wear-charcoal-grey-suit-for-business.jpg", "images": ["https://universaltailor.com/wp-content/uploads/2018/08/how-to-wear-charcoal-grey-suit-for-business.jpg"], "stock": 19, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.6, "numReviews": 111, "tags": ["mens-suits", "luxury", "men", "designer", "new-arrival", "featured"], "gender": "men"},
+    {"_id": "mens-prod-75", "name": "Midnight Blue", "slug": "midnight-blue", "description": "Premium midnight blue crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 3548, "category": {"_id": "cat-9", "name": "Men's Suits", "slug": "mens-suits"}, "categoryName": "Men's Suits", "image": "https://i.pinimg.com/originals/99/6c/a1/996ca171147beb0866090197418e44f5.jpg", "images": ["https://i.pinimg.com/originals/99/6c/a1/996ca171147beb0866090197418e44f5.jpg"], "stock": 16, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.8, "numReviews": 112, "tags": ["mens-suits", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-76", "name": "Designer Blazer", "slug": "designer-blazer", "description": "Premium designer blazer crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 3686, "category": {"_id": "cat-9", "name": "Men's Suits", "slug": "mens-suits"}, "categoryName": "Men's Suits", "image": "https://stylesatlife.com/wp-content/uploads/2019/10/Designer-blazers-for-wedding-men.jpg", "images": ["https://stylesatlife.com/wp-content/uploads/2019/10/Designer-blazers-for-wedding-men.jpg"], "stock": 30, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.8, "numReviews": 102, "tags": ["mens-suits", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-77", "name": "Cashmere Blend", "slug": "cashmere-blend", "description": "Premium cashmere blend crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 4098, "category": {"_id": "cat-9", "name": "Men's Suits", "slug": "mens-suits"}, "categoryName": "Men's Suits", "image": "https://dtcralphlauren.scene7.com/is/image/PoloGSI/s7-1443679_alternate10?$rl_4x5_pdp$", "images": ["https://dtcralphlauren.scene7.com/is/image/PoloGSI/s7-1443679_alternate10?$rl_4x5_pdp$"], "stock": 27, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.7, "numReviews": 96, "tags": ["mens-suits", "luxury", "men", "designer", "new-arrival", "featured"], "gender": "men"},
+    {"_id": "mens-prod-78", "name": "Sport Coat", "slug": "sport-coat", "description": "Premium sport coat crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 3792, "category": {"_id": "cat-9", "name": "Men's Suits", "slug": "mens-suits"}, "categoryName": "Men's Suits", "image": "https://i.pinimg.com/originals/e1/ea/be/e1eabe852731c71c9f44a24adb575656.jpg", "images": ["https://i.pinimg.com/originals/e1/ea/be/e1eabe852731c71c9f44a24adb575656.jpg"], "stock": 33, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.4, "numReviews": 26, "tags": ["mens-suits", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-79", "name": "Dinner Jacket", "slug": "dinner-jacket", "description": "Premium dinner jacket crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 4185, "category": {"_id": "cat-9", "name": "Men's Suits", "slug": "mens-suits"}, "categoryName": "Men's Suits", "image": "https://i.pinimg.com/originals/f8/7b/98/f87b9861721cd67b996d6bad5f5638c3.jpg", "images": ["https://i.pinimg.com/originals/f8/7b/98/f87b9861721cd67b996d6bad5f5638c3.jpg"], "stock": 16, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.8, "numReviews": 120, "tags": ["mens-suits", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-80", "name": "Modern Fit", "slug": "modern-fit", "description": "Premium modern fit crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 4202, "category": {"_id": "cat-9", "name": "Men's Suits", "slug": "mens-suits"}, "categoryName": "Men's Suits", "image": "https://image.menswearhouse.com/is/image/TMW/TMW_3YC2_14_NAUTICA_2_PIECE_SUITS_BLUEPOSTMAN_MAIN?imPolicy=pgp-sm", "images": ["https://image.menswearhouse.com/is/image/TMW/TMW_3YC2_14_NAUTICA_2_PIECE_SUITS_BLUEPOSTMAN_MAIN?imPolicy=pgp-sm"], "stock": 15, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.8, "numReviews": 65, "tags": ["mens-suits", "luxury", "men", "designer"], "gender": "men"},
+];
+
+export default products;
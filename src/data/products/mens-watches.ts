@@ -0,0 +1,27 @@
+// Men's Watches - 20 products (generated by product_codegen.py)
+import type { MockProduct } from './types';
+
+const products: MockProduct[] = [
+    {"_id": "mens-prod-1", "name": "Chronograph Elite", "slug": "chronograph-elite", "description": "Premium chronograph elite crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 2538, "compareAtPrice": 2840, "category": {"_id": "cat-6", "name": "Men's Watches", "slug": "mens-watches"}, "categoryName": "Men's Watches", "image": "https://timehouse.s3.me-central-1.amazonaws.com/uae-images/27TlkvyF91t.jpg", "images": ["https://timehouse.s3.me-central-1.amazonaws.com/uae-images/27TlkvyF91t.jpg"], "stock": 6, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.2, "numReviews": 65, "tags": ["mens-watches", "luxury", "men", "designer", "featured"], "gender": "men"},
+    {"_id": "mens-prod-2", "name": "Classic Automatic", "slug": "classic-automatic", "description": "Premium classic automatic crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 2932, "compareAtPrice": 3218, "category": {"_id": "cat-6", "name": "Men's Watches", "slug": "mens-watches"}, "categoryName": "Men's Watches", "image": "https://dynamic.zacdn.com/3_Mj36s7JjiwR_P1O4y8ohsDWtg=/filters:quality(70):format(webp)/https://static-my.zacdn.com/p/orient-1794-9955142-1.jpg", "images": ["https://dynamic.zacdn.com/3_Mj36s7JjiwR_P1O4y8ohsDWtg=/filters:quality(70):format(webp)/https://static-my.zacdn.com/p/orient-1794-9955142-1.jpg"], "stock": 26, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.2, "numReviews": 104, "tags": ["mens-watches", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-3", "name": "Diver's Professional", "slug": "divers-professional", "description": "Premium diver's professional crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 3260, "category": {"_id": "cat-6", "name": "Men's Watches", "slug": "mens-watches"}, "categoryName": "Men's Watches", "image": "https://embed.widencdn.net/img/citizenwatch/8usvywgo7q/1000px/Promaster 1000M Professional Diver.png?u=41zuoe", "images": ["https://embed.widencdn.net/img/citizenwatch/8usvywgo7q/1000px/Promaster 1000M Professional Diver.png?u=41zuoe"], "stock": 17, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.7, "numReviews": 81, "tags": ["mens-watches", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-4", "name": "Dress Watch", "slug": "dress-watch", "description": "Premium dress watch crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 3269, "category": {"_id": "cat-6", "name": "Men's Watches", "slug": "mens-watches"}, "categoryName": "Men's Watches", "image": "https://i.pinimg.com/736x/10/99/2c/10992c15101a98c91c816d380072f753.jpg", "images": ["https://i.pinimg.com/736x/10/99/2c/10992c15101a98c91c816d380072f753.jpg"], "stock": 22, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.5, "numReviews": 22, "tags": ["mens-watches", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-5", "name": "Sport Chronometer", "slug": "sport-chronometer", "description": "Premium sport chronometer crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 3404, "category": {"_id": "cat-6", "name": "Men's Watches", "slug": "mens-watches"}, "categoryName": "Men's Watches", "image": "https://www.my-watchsite.com/15684-large_default/ocean-sport-chronograph.jpg", "images": ["https://www.my-watchsite.com/15684-large_default/ocean-sport-chronograph.jpg"], "stock": 9, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.5, "numReviews": 131, "tags": ["mens-watches", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-6", "name": "Pilot Watch", "slug": "pilot-watch", "description": "Premium pilot watch crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 3653, "compareAtPrice": 3956, "category": {"_id": "cat-6", "name": "Men's Watches", "slug": "mens-watches"}, "categoryName": "Men's Watches", "image": "https://i.pinimg.com/originals/d5/73/71/d5737151a68a2ec6eb3ea2fdde81a685.jpg", "images": ["https://i.pinimg.com/originals/d5/73/71/d5737151a68a2ec6eb3ea2fdde81a685.jpg"], "stock": 19, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.7, "numReviews": 49, "tags": ["mens-watches", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-7", "name": "Skeleton Watch", "slug": "skeleton-watch", "description": "Premium skeleton watch crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 3871, "category": {"_id": "cat-6", "name": "Men's Watches", "slug": "mens-watches"}, "categoryName": "Men's Watches", "image": "https://m.media-amazon.com/images/I/71oUf9HimdL._AC_SL1500_.jpg", "images": ["https://m.media-amazon.com/images/I/71oUf9HimdL._AC_SL1500_.jpg"], "stock": 28, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.5, "numReviews": 85, "tags": ["mens-watches", "luxury", "men", "designer", "featured"], "gender": "men"},
+    {"_id": "mens-prod-8", "name": "Moon Phase", "slug": "moon-phase", "description": "Premium moon phase crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 4057, "compareAtPrice": 4227, "category": {"_id": "cat-6", "name": "Men's Watches", "slug": "mens-watches"}, "categoryName": "Men's Watches", "image": "https://i5.walmartimages.com/seo/OLEVS-Men-s-Watches-Chronograph-Multifunction-Sport-Silicone-Luxury-Diamond-Moon-Phase-Quartz-Male-Watch-Waterproof-Wrist-Watch_4c329867-a789-417d-81ba-df807e9a4c5f.ea7eb6088d346d0e80c2c0b76f54bb41.jpeg", "images": ["https://i5.walmartimages.com/seo/OLEVS-Men-s-Watches-Chronograph-Multifunction-Sport-Silicone-Luxury-Diamond-Moon-Phase-Quartz-Male-Watch-Waterproof-Wrist-Watch_4c329867-a789-417d-81ba-df807e9a4c5f.ea7eb6088d346d0e80c2c0b76f54bb41.jpeg"], "stock": 26, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.7, "numReviews": 129, "tags": ["mens-watches", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-9", "name": "GMT Master", "slug": "gmt-master", "description": "Premium gmt master crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 4526, "category": {"_id": "cat-6", "name": "Men's Watches", "slug": "mens-watches"}, "categoryName": "Men's Watches", "image": "https://mywatchllc.com/cdn/shop/files/IMG_9287_9929a6a0-e2a0-4b64-9a3f-a74e977abbc1.jpg?v=1755785803", "images": ["https://mywatchllc.com/cdn/shop/files/IMG_9287_9929a6a0-e2a0-4b64-9a3f-a74e977abbc1.jpg?v=1755785803"], "stock": 12, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.2, "numReviews": 138, "tags": ["mens-watches", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-10", "name": "Day-Date", "slug": "day-date", "description": "Premium day-date crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 4776, "compareAtPrice": 4972, "category": {"_id": "cat-6", "name": "Men's Watches", "slug": "mens-watches"}, "categoryName": "Men's Watches", "image": "https://i.pinimg.com/736x/70/93/13/709313120a6d1b1abc29d9b50dce631e.jpg", "images": ["https://i.pinimg.com/736x/70/93/13/709313120a6d1b1abc29d9b50dce631e.jpg"], "stock": 17, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.5, "numReviews": 113, "tags": ["mens-watches", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-11", "name": "Perpetual Calendar", "slug": "perpetual-calendar", "description": "Premium perpetual calendar crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 4764, "category": {"_id": "cat-6", "name": "Men's Watches", "slug": "mens-watches"}, "categoryName": "Men's Watches", "image": "https://worldofluxuryus.com/cdn/shop/files/2_5217aa81-c5b9-42d4-bb56-c5e6eb5cf2cb.jpg?v=1758714761", "images": ["https://worldofluxuryus.com/cdn/shop/files/2_5217aa81-c5b9-42d4-bb56-c5e6eb5cf2cb.jpg?v=1758714761"], "stock": 33, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.6, "numReviews": 158, "tags": ["mens-watches", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-12", "name": "Tourbillon", "slug": "tourbillon", "description": "Premium tourbillon crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 4988, "category": {"_id": "cat-6", "name": "Men's Watches", "slug": "mens-watches"}, "categoryName": "Men's Watches", "image": "https://m.media-amazon.com/images/I/61NpvvWfFvL._AC_UY1000_.jpg", "images": ["https://m.media-amazon.com/images/I/61NpvvWfFvL._AC_UY1000_.jpg"], "stock": 20, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.2, "numReviews": 92, "tags": ["mens-watches", "luxury", "men", "designer", "featured"], "gender": "men"},
+    {"_id": "mens-prod-13", "name": "Racing Chronograph", "slug": "racing-chronograph", "description": "Premium racing chronograph crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 5364, "compareAtPrice": 5534, "category": {"_id": "cat-6", "name": "Men's Watches", "slug": "mens-watches"}, "categoryName": "Men's Watches", "image": "https://www.jurawatches.co.uk/cdn/shop/files/TAGHeuerWatchFormula1AutomaticChronographxOracleRedBullRacingCBZ2080.FT80914.png?v=1737538424", "images": ["https://www.jurawatches.co.uk/cdn/shop/files/TAGHeuerWatchFormula1AutomaticChronographxOracleRedBullRacingCBZ2080.FT80914.png?v=1737538424"], "stock": 29, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.8, "numReviews": 81, "tags": ["mens-watches", "luxury", "men", "designer", "new-arrival", "featured"], "gender": "men"},
+    {"_id": "mens-prod-14", "name": "Vintage Dress", "slug": "vintage-dress", "description": "Premium vintage dress crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 5270, "compareAtPrice": 5523, "category": {"_id": "cat-6", "name": "Men's Watches", "slug": "mens-watches"}, "categoryName": "Men's Watches", "image": "https://i.pinimg.com/736x/a0/eb/1b/a0eb1b876b33024c494690a2506e56dc.jpg", "images": ["https://i.pinimg.com/736x/a0/eb/1b/a0eb1b876b33024c494690a2506e56dc.jpg"], "stock": 25, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.9, "numReviews": 89, "tags": ["mens-watches", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-15", "name": "Military Field", "slug": "military-field", "description": "Premium military field crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 5361, "compareAtPrice": 5525, "category": {"_id": "cat-6", "name": "Men's Watches", "slug": "mens-watches"}, "categoryName": "Men's Watches", "image": "https://m.media-amazon.com/images/I/71txlyhbZcL._AC_SL1500_.jpg", "images": ["https://m.media-amazon.com/images/I/71txlyhbZcL._AC_SL1500_.jpg"], "stock": 16, "isNew": false, "isFeatured": false, "isActive": true, "rating": 5.0, "numReviews": 32, "tags": ["mens-watches", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-16", "name": "Nautical Timer", "slug": "nautical-timer", "description": "Premium nautical timer crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 5784, "category": {"_id": "cat-6", "name": "Men's Watches", "slug": "mens-watches"}, "categoryName": "Men's Watches", "image": "https://m.media-amazon.com/images/I/81M7baAjK5L._AC_.jpg", "images": ["https://m.media-amazon.com/images/I/81M7baAjK5L._AC_.jpg"], "stock": 11, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.9, "numReviews": 46, "tags": ["mens-watches", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-17", "name": "Executive Gold", "slug": "executive-gold", "description": "Premium executive gold crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 5748, "category": {"_id": "cat-6", "name": "Men's Watches", "slug": "mens-watches"}, "categoryName": "Men's Watches", "image": "https://down-my.img.susercontent.com/file/cn-11134208-7ras8-m4s9d2snzh87a6", "images": ["https://down-my.img.susercontent.com/file/cn-11134208-7ras8-m4s9d2snzh87a6"], "stock": 26, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.0, "numReviews": 22, "tags": ["mens-watches", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-18", "name": "Minimalist Steel", "slug": "minimalist-steel", "description": "Premium minimalist steel crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 6033, "compareAtPrice": 6367, "category": {"_id": "cat-6", "name": "Men's Watches", "slug": "mens-watches"}, "categoryName": "Men's Watches", "image": "https://m.media-amazon.com/images/I/71V-7kkDK1S._AC_UL1300_.jpg", "images": ["https://m.media-amazon.com/images/I/71V-7kkDK1S._AC_UL1300_.jpg"], "stock": 22, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.0, "numReviews": 27, "tags": ["mens-watches", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+    {"_id": "mens-prod-19", "name": "Heritage Bronze", "slug": "heritage-bronze", "description": "Premium heritage bronze crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 6471, "category": {"_id": "cat-6", "name": "Men's Watches", "slug": "mens-watches"}, "categoryName": "Men's Watches", "image": "https://www.ablogtowatch.com/wp-content/uploads/2016/03/Tudor-Heritage-Black-Bay-Bronze-79250BM-5.jpg", "images": ["https://www.ablogtowatch.com/wp-content/uploads/2016/03/Tudor-Heritage-Black-Bay-Bronze-79250BM-5.jpg"], "stock": 19, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.0, "numReviews": 132, "tags": ["mens-watches", "luxury", "men", "designer"], "gender": "men"},
+    {"_id": "mens-prod-20", "name": "Modern Ceramic", "slug": "modern-ceramic", "description": "Premium modern ceramic crafted with the finest materials. Perfect for the distinguished gentleman who appreciates quality and timeless elegance.", "price": 6797, "compareAtPrice": 7096, "category": {"_id": "cat-6", "name": "Men's Watches", "slug": "mens-watches"}, "categoryName": "Men's Watches", "image": "https://watchranker.com/wp-content/uploads/2020/11/Blancpain.jpg", "images": ["https://watchranker.com/wp-content/uploads/2020/11/Blancpain.jpg"], "stock": 34, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.1, "numReviews": 91, "tags": ["mens-watches", "luxury", "men", "designer", "new-arrival"], "gender": "men"},
+];
+
+export default products;
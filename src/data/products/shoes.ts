@@ -0,0 +1,32 @@
+// Shoes - 25 products (generated by product_codegen.py)
+import type { MockProduct } from './types';
+
+const products: MockProduct[] = [
+    {"_id": "prod-51", "name": "Patent Pumps", "slug": "patent-pumps", "description": "Exquisite patent pumps crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 622, "category": {"_id": "cat-3", "name": "Shoes", "slug": "shoes"}, "categoryName": "Shoes", "image": "https://product-images.therealreal.com/VAL77077_2_enlarged.jpg", "images": ["https://product-images.therealreal.com/VAL77077_2_enlarged.jpg"], "stock": 12, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.4, "numReviews": 10, "tags": ["shoes", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-52", "name": "Embellished Sandals", "slug": "embellished-sandals", "description": "Exquisite embellished sandals crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 528, "compareAtPrice": 636, "category": {"_id": "cat-3", "name": "Shoes", "slug": "shoes"}, "categoryName": "Shoes", "image": "https://i.pinimg.com/736x/8d/17/70/8d1770f3b8288e01a5d115c26b5a35c4.jpg", "images": ["https://i.pinimg.com/736x/8d/17/70/8d1770f3b8288e01a5d115c26b5a35c4.jpg"], "stock": 26, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.4, "numReviews": 146, "tags": ["shoes", "luxury", "women", "designer", "new-arrival", "featured"]},
+    {"_id": "prod-53", "name": "Suede Boots", "slug": "suede-boots", "description": "Exquisite suede boots crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 788, "category": {"_id": "cat-3", "name": "Shoes", "slug": "shoes"}, "categoryName": "Shoes", "image": "https://cdn.cliqueinc.com/posts/294856/best-suede-boots-294856-1629524668319-main.900x0c.jpg?interlace=true&quality=70", "images": ["https://cdn.cliqueinc.com/posts/294856/best-suede-boots-294856-1629524668319-main.900x0c.jpg?interlace=true&quality=70"], "stock": 19, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.2, "numReviews": 100, "tags": ["shoes", "luxury", "women", "designer"]},
+    {"_id": "prod-54", "name": "Strappy Mules", "slug": "strappy-mules", "description": "Exquisite strappy mules crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 746, "category": {"_id": "cat-3", "name": "Shoes", "slug": "shoes"}, "categoryName": "Shoes", "image": "https://www.stevemadden.com/cdn/shop/files/STEVEMADDEN_SHOES_STUNNER_BLACK-PATENT_02.jpg?v=1693500785", "images": ["https://www.stevemadden.com/cdn/shop/files/STEVEMADDEN_SHOES_STUNNER_BLACK-PATENT_02.jpg?v=1693500785"], "stock": 33, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.3, "numReviews": 129, "tags": ["shoes", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-55", "name": "Ballet Flats", "slug": "ballet-flats", "description": "Exquisite ballet flats crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 915, "category": {"_id": "cat-3", "name": "Shoes", "slug": "shoes"}, "categoryName": "Shoes", "image": "https://product-images.therealreal.com/CHT66155_3_enlarged.jpg", "images": ["https://product-images.therealreal.com/CHT66155_3_enlarged.jpg"], "stock": 34, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.7, "numReviews": 56, "tags": ["shoes", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-56", "name": "Kitten Slingbacks", "slug": "kitten-slingbacks", "description": "Exquisite kitten slingbacks crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1043, "category": {"_id": "cat-3", "name": "Shoes", "slug": "shoes"}, "categoryName": "Shoes", "image": "https://n.nordstrommedia.com/it/0afd07d1-32e1-4914-ba7f-eaf7c98c586a.jpeg?h=368&w=240&dpr=2", "images": ["https://n.nordstrommedia.com/it/0afd07d1-32e1-4914-ba7f-eaf7c98c586a.jpeg?h=368&w=240&dpr=2"], "stock": 14, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.1, "numReviews": 58, "tags": ["shoes", "luxury", "women", "designer"]},
+    {"_id": "prod-57", "name": "Platform Loafers", "slug": "platform-loafers", "description": "Exquisite platform loafers crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 999, "category": {"_id": "cat-3", "name": "Shoes", "slug": "shoes"}, "categoryName": "Shoes", "image": "https://n.nordstrommedia.com/it/ad120290-9fd5-4d19-8304-6634845fa73b.jpeg?h=368&w=240&dpr=2", "images": ["https://n.nordstrommedia.com/it/ad120290-9fd5-4d19-8304-6634845fa73b.jpeg?h=368&w=240&dpr=2"], "stock": 9, "isNew": true, "isFeatured": true, "isActive": true, "rating": 4.3, "numReviews": 47, "tags": ["shoes", "luxury", "women", "designer", "new-arrival", "featured"]},
+    {"_id": "prod-58", "name": "Velvet Pumps", "slug": "velvet-pumps", "description": "Exquisite velvet pumps crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 725, "category": {"_id": "cat-3", "name": "Shoes", "slug": "shoes"}, "categoryName": "Shoes", "image": "https://i.pinimg.com/originals/e0/aa/46/e0aa466442038d6eed98c04d16bffbd9.jpg", "images": ["https://i.pinimg.com/originals/e0/aa/46/e0aa466442038d6eed98c04d16bffbd9.jpg"], "stock": 32, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.7, "numReviews": 13, "tags": ["shoes", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-59", "name": "Block Heel Sandals", "slug": "block-heel-sandals", "description": "Exquisite block heel sandals crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1116, "compareAtPrice": 1497, "category": {"_id": "cat-3", "name": "Shoes", "slug": "shoes"}, "categoryName": "Shoes", "image": "https://img.ltwebstatic.com/images3_pi/2025/02/07/1f/1738892850628665f67782115baf8f7bd752999db9_thumbnail_900x.jpg", "images": ["https://img.ltwebstatic.com/images3_pi/2025/02/07/1f/1738892850628665f67782115baf8f7bd752999db9_thumbnail_900x.jpg"], "stock": 28, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.2, "numReviews": 17, "tags": ["shoes", "luxury", "women", "designer"]},
+    {"_id": "prod-60", "name": "Ankle Booties", "slug": "ankle-booties", "description": "Exquisite ankle booties crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1005, "category": {"_id": "cat-3", "name": "Shoes", "slug": "shoes"}, "categoryName": "Shoes", "image": "https://media.neimanmarcus.com/f_auto,q_auto:low,ar_4:5,c_fill,dpr_2.0,w_790/01/nm_4844599_100106_c", "images": ["https://media.neimanmarcus.com/f_auto,q_auto:low,ar_4:5,c_fill,dpr_2.0,w_790/01/nm_4844599_100106_c"], "stock": 5, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.6, "numReviews": 104, "tags": ["shoes", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-61", "name": "Pointed Stilettos", "slug": "pointed-stilettos", "description": "Exquisite pointed stilettos crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 914, "category": {"_id": "cat-3", "name": "Shoes", "slug": "shoes"}, "categoryName": "Shoes", "image": "https://img.ltwebstatic.com/images3_pi/2025/02/12/d6/17393396605f844b7fdf12acd1ff28002b08cb15ed_thumbnail_900x.jpg", "images": ["https://img.ltwebstatic.com/images3_pi/2025/02/12/d6/17393396605f844b7fdf12acd1ff28002b08cb15ed_thumbnail_900x.jpg"], "stock": 6, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.3, "numReviews": 60, "tags": ["shoes", "luxury", "women", "designer"]},
+    {"_id": "prod-62", "name": "Lace-Up Heels", "slug": "lace-up-heels", "description": "Exquisite lace-up heels crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 946, "category": {"_id": "cat-3", "name": "Shoes", "slug": "shoes"}, "categoryName": "Shoes", "image": "https://cdn-img.prettylittlething.com/8/f/a/0/8fa01f9cc9ece7348898993dc995bd81a9c41424_cmh5209_1.jpg", "images": ["https://cdn-img.prettylittlething.com/8/f/a/0/8fa01f9cc9ece7348898993dc995bd81a9c41424_cmh5209_1.jpg"], "stock": 33, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.6, "numReviews": 109, "tags": ["shoes", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-63", "name": "Slip-On Mules", "slug": "slip-on-mules", "description": "Exquisite slip-on mules crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1216, "category": {"_id": "cat-3", "name": "Shoes", "slug": "shoes"}, "categoryName": "Shoes", "image": "https://i.pinimg.com/originals/40/d1/42/40d1427968cf874cf373f2c438c831fc.jpg", "images": ["https://i.pinimg.com/originals/40/d1/42/40d1427968cf874cf373f2c438c831fc.jpg"], "stock": 33, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.2, "numReviews": 147, "tags": ["shoes", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-64", "name": "Wedge Sandals", "slug": "wedge-sandals", "description": "Exquisite wedge sandals crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1265, "compareAtPrice": 1588, "category": {"_id": "cat-3", "name": "Shoes", "slug": "shoes"}, "categoryName": "Shoes", "image": "https://is4.fwrdassets.com/images/p/fw/z/SLAU-WZ707_V2.jpg", "images": ["https://is4.fwrdassets.com/images/p/fw/z/SLAU-WZ707_V2.jpg"], "stock": 12, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.8, "numReviews": 99, "tags": ["shoes", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-65", "name": "Combat Boots", "slug": "combat-boots", "description": "Exquisite combat boots crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1165, "compareAtPrice": 1265, "category": {"_id": "cat-3", "name": "Shoes", "slug": "shoes"}, "categoryName": "Shoes", "image": "https://editorialist.com/web/2022/12/023/031/805/23031805~black_0.jpg", "images": ["https://editorialist.com/web/2022/12/023/031/805/23031805~black_0.jpg"], "stock": 16, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.7, "numReviews": 36, "tags": ["shoes", "luxury", "women", "designer"]},
+    {"_id": "prod-66", "name": "Mary Jane Pumps", "slug": "mary-jane-pumps", "description": "Exquisite mary jane pumps crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1324, "category": {"_id": "cat-3", "name": "Shoes", "slug": "shoes"}, "categoryName": "Shoes", "image": "https://cdna.lystit.com/520/650/n/photos/mytheresa/bad17eb8/gianvito-rossi-black-Nuit-Leather-Mary-Jane-Pumps.jpeg", "images": ["https://cdna.lystit.com/520/650/n/photos/mytheresa/bad17eb8/gianvito-rossi-black-Nuit-Leather-Mary-Jane-Pumps.jpeg"], "stock": 15, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.4, "numReviews": 100, "tags": ["shoes", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-67", "name": "Espadrille Wedges", "slug": "espadrille-wedges", "description": "Exquisite espadrille wedges crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1400, "category": {"_id": "cat-3", "name": "Shoes", "slug": "shoes"}, "categoryName": "Shoes", "image": "https://media.bergdorfgoodman.com/images/f_auto,q_auto:low,ar_5:7,c_fill,dpr_2.0,w_720/01/2773430_a/castaner-80mm-wedge-espadrille-with-a", "images": ["https://media.bergdorfgoodman.com/images/f_auto,q_auto:low,ar_5:7,c_fill,dpr_2.0,w_720/01/2773430_a/castaner-80mm-wedge-espadrille-with-a"], "stock": 27, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.0, "numReviews": 130, "tags": ["shoes", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-68", "name": "Gladiator Sandals", "slug": "gladiator-sandals", "description": "Exquisite gladiator sandals crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1356, "category": {"_id": "cat-3", "name": "Shoes", "slug": "shoes"}, "categoryName": "Shoes", "image": "https://media1.popsugar-assets.com/files/thumbor/Gsik7ZQ1xh1hGqTWILEA_NpWZWU=/fit-in/792x1188/filters:format_auto():upscale()/2015/05/06/691/n/1922564/491b0515_35042720_013_b.jpg", "images": ["https://media1.popsugar-assets.com/files/thumbor/Gsik7ZQ1xh1hGqTWILEA_NpWZWU=/fit-in/792x1188/filters:format_auto():upscale()/2015/05/06/691/n/1922564/491b0515_35042720_013_b.jpg"], "stock": 16, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.8, "numReviews": 12, "tags": ["shoes", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-69", "name": "Chelsea Boots", "slug": "chelsea-boots", "description": "Exquisite chelsea boots crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1173, "category": {"_id": "cat-3", "name": "Shoes", "slug": "shoes"}, "categoryName": "Shoes", "image": "https://media1.popsugar-assets.com/files/thumbor/Vv20lflw7ppLXWzzqnqTAZSmgVY=/fit-in/792x1404/filters:format_auto():upscale()/2021/09/15/724/n/1922564/07522b41104dafde_netimgPzRaFI.jpg", "images": ["https://media1.popsugar-assets.com/files/thumbor/Vv20lflw7ppLXWzzqnqTAZSmgVY=/fit-in/792x1404/filters:format_auto():upscale()/2021/09/15/724/n/1922564/07522b41104dafde_netimgPzRaFI.jpg"], "stock": 34, "isNew": false, "isFeatured": false, "isActive": true, "rating": 4.3, "numReviews": 137, "tags": ["shoes", "luxury", "women", "designer"]},
+    {"_id": "prod-70", "name": "D'Orsay Pumps", "slug": "dorsay-pumps", "description": "Exquisite d'orsay pumps crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1578, "category": {"_id": "cat-3", "name": "Shoes", "slug": "shoes"}, "categoryName": "Shoes", "image": "https://n.nordstrommedia.com/it/1e0e2b04-0c7c-4748-b872-a902412288f8.jpeg?h=368&w=240&dpr=2", "images": ["https://n.nordstrommedia.com/it/1e0e2b04-0c7c-4748-b872-a902412288f8.jpeg?h=368&w=240&dpr=2"], "stock": 17, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.8, "numReviews": 115, "tags": ["shoes", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-71", "name": "Cage Heels", "slug": "cage-heels", "description": "Exquisite cage heels crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1556, "category": {"_id": "cat-3", "name": "Shoes", "slug": "shoes"}, "categoryName": "Shoes", "image": "http://cdnd.lystit.com/photos/2013/11/25/michael-kors-black-suede-caged-sandals-casey-strappy-high-heel-product-1-15278249-863304043.jpeg", "images": ["http://cdnd.lystit.com/photos/2013/11/25/michael-kors-black-suede-caged-sandals-casey-strappy-high-heel-product-1-15278249-863304043.jpeg"], "stock": 30, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.0, "numReviews": 159, "tags": ["shoes", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-72", "name": "Knee-High Boots", "slug": "knee-high-boots", "description": "Exquisite knee-high boots crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1365, "category": {"_id": "cat-3", "name": "Shoes", "slug": "shoes"}, "categoryName": "Shoes", "image": "https://n.nordstrommedia.com/it/e3b8b4c9-6e1c-4c88-9b42-3081a8f4ee92.jpeg?h=368&w=240&dpr=2", "images": ["https://n.nordstrommedia.com/it/e3b8b4c9-6e1c-4c88-9b42-3081a8f4ee92.jpeg?h=368&w=240&dpr=2"], "stock": 10, "isNew": false, "isFeatured": true, "isActive": true, "rating": 4.7, "numReviews": 68, "tags": ["shoes", "luxury", "women", "designer", "featured"]},
+    {"_id": "prod-73", "name": "Slide Sandals", "slug": "slide-sandals", "description": "Exquisite slide sandals crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1645, "category": {"_id": "cat-3", "name": "Shoes", "slug": "shoes"}, "categoryName": "Shoes", "image": "https://cdn.cliqueinc.com/posts/287908/best-slide-sandals-287908-1677700733356-main.1200x0c.jpg?interlace=true&quality=70", "images": ["https://cdn.cliqueinc.com/posts/287908/best-slide-sandals-287908-1677700733356-main.1200x0c.jpg?interlace=true&quality=70"], "stock": 30, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.2, "numReviews": 101, "tags": ["shoes", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-74", "name": "Oxford Flats", "slug": "oxford-flats", "description": "Exquisite oxford flats crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1650, "category": {"_id": "cat-3", "name": "Shoes", "slug": "shoes"}, "categoryName": "Shoes", "image": "https://i.pinimg.com/736x/93/7b/4d/937b4d0eb17f1a16ac32b25a5a87913a.jpg", "images": ["https://i.pinimg.com/736x/93/7b/4d/937b4d0eb17f1a16ac32b25a5a87913a.jpg"], "stock": 20, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.3, "numReviews": 155, "tags": ["shoes", "luxury", "women", "designer", "new-arrival"]},
+    {"_id": "prod-75", "name": "Peep Toe Heels", "slug": "peep-toe-heels", "description": "Exquisite peep toe heels crafted with premium materials. Perfect for any occasion with timeless elegance and superior quality.", "price": 1553, "category": {"_id": "cat-3", "name": "Shoes", "slug": "shoes"}, "categoryName": "Shoes", "image": "https://product-images.therealreal.com/MIC47800_3_enlarged.jpg", "images": ["https://product-images.therealreal.com/MIC47800_3_enlarged.jpg"], "stock": 14, "isNew": true, "isFeatured": false, "isActive": true, "rating": 4.1, "numReviews": 38, "tags": ["shoes", "luxury", "women", "designer", "new-arrival"]},
+];
+
+export default products;
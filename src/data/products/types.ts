@@ -0,0 +1,26 @@
+// Generated by product_codegen.py - shared product types
+export interface MockProduct {
+    _id: string;
+    name: string;
+    slug: string;
+    description: string;
+    price: number;
+    compareAtPrice?: number;
+    category: { _id: string; name: string; slug: string; };
+    categoryName: string;
+    image: string;
+    images: string[];
+    imageSrcSet?: string;
+    imageAvifSrcSet?: string;
+    imageWidth?: number;
+    imageHeight?: number;
+    imageSource?: string;
+    stock: number;
+    isNew: boolean;
+    isFeatured: boolean;
+    isActive: boolean;
+    rating: number;
+    numReviews: number;
+    tags: string[];
+    gender?: 'men';
+}
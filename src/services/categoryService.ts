@@ -1,5 +1,5 @@
 import { mockCategories, Category } from '@/data/mockCategories';
-import { mockProducts } from '@/data/mockProducts';
+import { productCategories } from '@/data/products/manifest';
 
 export type { Category };
 
@@ -12,7 +12,7 @@ export interface CategoriesResponse {
 const getCategoriesWithCounts = (): Category[] => {
     return mockCategories.map(cat => ({
         ...cat,
-        productCount: mockProducts.filter(p => p.category.slug === cat.slug).length
+        productCount: productCategories.find(c => c.slug === cat.slug)?.count ?? 0
     }));
 };
 
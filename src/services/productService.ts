@@ -1,4 +1,5 @@
-import { mockProducts, MockProduct } from '@/data/mockProducts';
+import type { MockProduct } from '@/data/products/types';
+import { findProductCategory, loadAllProducts, loadCategoryProducts, loadProducts, productCategories } from '@/data/products/manifest';
 
 export interface Product {
     _id: string;
@@ -120,6 +121,33 @@ const filterProducts = (products: MockProduct[], filters: ProductFilters): MockP
     return filtered;
 };
 
+// Fetch only the category modules a query can match
+const loadProductsFor = (filters: ProductFilters): Promise<MockProduct[]> => {
+    if (filters.category) {
+        const category = findProductCategory(filters.category);
+        return category ? loadCategoryProducts(category.slug) : Promise.resolve([]);
+    }
+    if (filters.gender) {
+        return loadProducts(productCategories.filter(c => c.gender === filters.gender).map(c => c.slug));
+    }
+    return loadAllProducts();
+};
+
+// loadCategoryProducts() arrays are cached apart from loadAllProducts(), so an edit has to reach both
+const replaceInCategory = async (previous: MockProduct, next?: MockProduct) => {
+    const previousList = await loadCategoryProducts(previous.category.slug);
+    const index = previousList.indexOf(previous);
+    if (index !== -1) previousList.splice(index, 1);
+    if (!next) return;
+
+    const nextList = await loadCategoryProducts(next.category.slug);
+    if (nextList === previousList && index !== -1) {
+        nextList.splice(index, 0, next);
+    } else {
+        nextList.push(next);
+    }
+};
+
 const paginateProducts = (products: MockProduct[], page: number, limit: number) => {
     const startIndex = (page - 1) * limit;
     const endIndex = startIndex + limit;
@@ -137,7 +165,7 @@ const paginateProducts = (products: MockProduct[], page: number, limit: number)
 export const productService = {
     async getProducts(filters: ProductFilters = {}): Promise<ProductsResponse> {
         // Use mock data directly (no backend needed)
-        const filtered = filterProducts(mockProducts, filters);
+        const filtered = filterProducts(await loadProductsFor(filters), filters);
         const page = filters.page || 1;
         const limit = filters.limit || 12;
         const { data, pagination } = paginateProducts(filtered, page, limit);
@@ -150,7 +178,8 @@ export const productService = {
     },
 
     async getFeaturedProducts(limit = 8): Promise<ProductsResponse> {
-        const featured = mockProducts.filter(p => p.isFeatured).slice(0, limit);
+        const products = await loadAllProducts();
+        const featured = products.filter(p => p.isFeatured).slice(0, limit);
         return {
             success: true,
             data: featured as Product[]
@@ -158,7 +187,8 @@ export const productService = {
     },
 
     async getNewArrivals(limit = 8): Promise<ProductsResponse> {
-        const newArrivals = mockProducts.filter(p => p.isNew).slice(0, limit);
+        const products = await loadAllProducts();
+        const newArrivals = products.filter(p => p.isNew).slice(0, limit);
         return {
             success: true,
             data: newArrivals as Product[]
@@ -166,7 +196,8 @@ export const productService = {
     },
 
     async getProduct(id: string): Promise<{ success: boolean; data: Product }> {
-        const product = mockProducts.find(p => p._id === id);
+        const products = await loadAllProducts();
+        const product = products.find(p => p._id === id);
         if (!product) {
             throw new Error('Product not found');
         }
@@ -177,7 +208,8 @@ export const productService = {
     },
 
     async getProductBySlug(slug: string): Promise<{ success: boolean; data: Product }> {
-        const product = mockProducts.find(p => p.slug === slug);
+        const products = await loadAllProducts();
+        const product = products.find(p => p.slug === slug);
         if (!product) {
             throw new Error('Product not found');
         }
@@ -188,18 +220,22 @@ export const productService = {
     },
 
     async searchProducts(query: string): Promise<ProductsResponse> {
-        const filtered = filterProducts(mockProducts, { search: query });
+        const products = await loadAllProducts();
+        const filtered = filterProducts(products, { search: query });
         return {
             success: true,
             data: filtered as Product[]
         };
     },
     async updateProduct(id: string, productData: Partial<Product>): Promise<{ success: boolean; data: Product }> {
-        const index = mockProducts.findIndex(p => p._id === id);
+        const products = await loadAllProducts();
+        const index = products.findIndex(p => p._id === id);
         if (index === -1) throw new Error('Product not found');
 
-        const updatedProduct = { ...mockProducts[index], ...productData };
-        mockProducts[index] = updatedProduct;
+        const previousProduct = products[index];
+        const updatedProduct = { ...previousProduct, ...productData };
+        products[index] = updatedProduct;
+        await replaceInCategory(previousProduct, updatedProduct);
 
         return {
             success: true,
@@ -208,19 +244,22 @@ export const productService = {
     },
 
     async deleteProduct(id: string): Promise<{ success: boolean }> {
-        const index = mockProducts.findIndex(p => p._id === id);
+        const products = await loadAllProducts();
+        const index = products.findIndex(p => p._id === id);
         if (index === -1) throw new Error('Product not found');
 
-        mockProducts.splice(index, 1);
+        const [removedProduct] = products.splice(index, 1);
+        await replaceInCategory(removedProduct);
         return { success: true };
     },
 
     async getSimilarProducts(productId: string, limit = 4): Promise<ProductsResponse> {
-        const currentProduct = mockProducts.find(p => p._id === productId);
+        const products = await loadAllProducts();
+        const currentProduct = products.find(p => p._id === productId);
         if (!currentProduct) return { success: false, data: [] };
 
         // Filter by same category or gender, excluding current product
-        const similar = mockProducts.filter(p =>
+        const similar = products.filter(p =>
             p._id !== productId &&
             (p.category._id === currentProduct.category._id || p.categoryName === currentProduct.categoryName) &&
             // Try to match gender if possible (heuristic based on category name)
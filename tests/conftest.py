@@ -0,0 +1,31 @@
+import os
+import sys
+import functools
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# The scrapers are top-level modules in the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def image_urls(tmp_path):
+    """Two real (decodable) JPEGs served over HTTP"""
+    from PIL import Image
+
+    root = tmp_path / "remote"
+    root.mkdir()
+    for i, color in enumerate(("navy", "crimson")):
+        Image.new("RGB", (700, 500), color).save(root / f"bag-{i}.jpg", quality=90)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(QuietHandler, directory=str(root)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield [f"http://127.0.0.1:{server.server_address[1]}/bag-{i}.jpg" for i in range(2)]
+    server.shutdown()
+    server.server_close()
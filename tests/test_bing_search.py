@@ -0,0 +1,33 @@
+import json
+
+from bing_search import BingSearch
+from scrape_cache import SearchCache
+
+URLS = [f"https://images.example.com/{i}.jpg" for i in range(8)]
+
+
+class FakeDriver:
+    """Results page with one a.iusc anchor per URL; execute_script honours the anchor cap like _BING_SCRIPT"""
+
+    def __init__(self):
+        self.pages = []
+
+    def get(self, url):
+        self.pages.append(url)
+
+    def execute_script(self, script, limit=0):
+        anchors = [json.dumps({"murl": url}) for url in URLS]
+        return anchors[:limit] if limit else anchors
+
+
+def test_selenium_search_caches_every_candidate(tmp_path):
+    driver = FakeDriver()
+    search = BingSearch(lambda: driver, backend="selenium", cache=SearchCache(str(tmp_path / "cache.db")))
+
+    assert search.candidates("silk scarf", limit=3) == URLS[:3]
+    assert search.cache.get("silk scarf") == URLS
+
+    # A later, larger request is served from the cache in full
+    assert search.candidates("silk scarf", limit=5) == URLS[:5]
+    assert search.candidates("silk scarf") == URLS
+    assert len(driver.pages) == 1
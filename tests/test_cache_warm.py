@@ -0,0 +1,67 @@
+import json
+import math
+
+import pytest
+
+import cache_warm
+import catalog_db
+import fix_product_images
+from product_codegen import read_generated_images
+
+mongomock = pytest.importorskip("mongomock")
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def db():
+    db = mongomock.MongoClient().lumiere
+    catalog_db.sync_catalog(db, read_generated_images(fix_product_images.WOMENS_PRODUCTS),
+                            read_generated_images(fix_product_images.MENS_PRODUCTS))
+    return db
+
+
+@pytest.fixture
+def client():
+    client = fakeredis.FakeRedis()
+    # Left over from the previous catalog, plus a route the warmer doesn't own
+    client.set("cache:/api/products?category=handbags&sort=price", "[]", ex=60)
+    client.set("cache:/api/products/slug/discontinued-bag", "{}", ex=60)
+    client.set("cache:/api/categories", '{"success":true}', ex=60)
+    return client
+
+
+def cached(client, path):
+    return json.loads(client.get(cache_warm.cache_key(path)))
+
+
+def test_warm_cache_writes_every_product_route(db, client):
+    totals = cache_warm.warm_from_db(db, client)
+
+    products = list(db.products.find({}))
+    pages = math.ceil(len(products) / cache_warm.PAGE_SIZE)
+    assert totals["dropped"] == 2
+    assert totals["written"] == 1 + pages + 2 + 2 * len(products)
+
+    first_page = cached(client, "/api/products")
+    assert first_page == cached(client, "/api/products?page=1")
+    assert first_page["pagination"] == {"page": 1, "limit": 12, "total": len(products), "pages": pages}
+    assert len(cached(client, f"/api/products?page={pages}")["data"]) == len(products) - (pages - 1) * 12
+    assert all(product["isFeatured"] for product in cached(client, "/api/products/featured")["data"])
+    assert all(product["isNew"] for product in cached(client, "/api/products/new")["data"])
+
+    product = products[0]
+    by_slug = cached(client, f"/api/products/slug/{product['slug']}")
+    assert by_slug == cached(client, f"/api/products/{product['_id']}")
+    assert by_slug["data"]["_id"] == str(product["_id"])
+    assert by_slug["data"]["category"]["name"] == product["categoryName"]
+
+    assert 3590 < client.ttl(cache_warm.cache_key("/api/products")) <= cache_warm.CACHE_TTL
+    assert 3590 < client.ttl(cache_warm.cache_key(f"/api/products/{product['_id']}")) <= cache_warm.CACHE_TTL
+
+
+def test_warm_cache_drops_only_stale_product_keys(db, client):
+    cache_warm.warm_from_db(db, client)
+
+    assert client.get("cache:/api/products?category=handbags&sort=price") is None
+    assert client.get("cache:/api/products/slug/discontinued-bag") is None
+    assert client.get("cache:/api/categories") == b'{"success":true}'
@@ -0,0 +1,79 @@
+import re
+
+import pytest
+from bson import ObjectId
+
+import catalog_db
+import fix_product_images
+from product_codegen import read_generated_images
+
+mongomock = pytest.importorskip("mongomock")
+
+
+def seeder_slug(name, product_id):
+    """server/seeders/seedProducts.js (insertMany skips the pre-save hook)"""
+    return re.sub(r"[^a-z0-9-]", "", re.sub(r"\s+", "-", name.lower())) + f"-{product_id}"
+
+
+@pytest.fixture
+def catalog():
+    return (read_generated_images(fix_product_images.WOMENS_PRODUCTS),
+            read_generated_images(fix_product_images.MENS_PRODUCTS))
+
+
+@pytest.fixture
+def db():
+    """Categories created through the admin UI (pre-save slug), products inserted by seedProducts.js"""
+    db = mongomock.MongoClient().lumiere
+    db.categories.insert_many([
+        {"name": "Handbags", "slug": "handbags", "description": "Edited in the admin UI"},
+        {"name": "Men's Watches", "slug": "men-s-watches", "description": ""},
+    ])
+    names = fix_product_images.WOMENS_PRODUCTS["handbags"]["names"][:3]
+    db.products.insert_many([
+        {"name": name, "slug": seeder_slug(name, product_id), "categoryName": "Handbags",
+         "category": ObjectId(), "price": 100}
+        for product_id, name in enumerate(names, 1)
+    ])
+    return db
+
+
+def test_server_slug_matches_pre_save_hook():
+    assert catalog_db.server_slug("Men's Watches") == "men-s-watches"
+    assert catalog_db.server_slug("  Rose & Oud ") == "rose-oud"
+
+
+def test_sync_matches_server_seeded_documents(db, catalog):
+    womens, mens = catalog
+    total_products = sum(len(cat["names"]) for data in catalog for cat in data.values())
+    total_categories = len(womens) + len(mens)
+
+    totals = catalog_db.sync_catalog(db, womens, mens)
+
+    assert totals["categories"]["errors"] == totals["products"]["errors"] == 0
+    assert totals["categories"]["matched"] == 2
+    assert totals["products"]["matched"] == 3
+    assert db.categories.count_documents({}) == total_categories
+    assert db.products.count_documents({}) == total_products
+
+    # Existing documents keep their slug (and admin edits), but point at the synced category
+    handbags = db.categories.find_one({"name": "Handbags"})
+    assert handbags["description"] == "Edited in the admin UI"
+    assert db.categories.find_one({"name": "Men's Watches"})["slug"] == "men-s-watches"
+    seeded = db.products.find_one({"name": "Quilted Shoulder Bag"})
+    assert seeded["slug"] == "quilted-shoulder-bag-1"
+    assert seeded["category"] == handbags["_id"]
+
+    # New documents get the server's slug, made unique across categories
+    assert db.categories.find_one({"name": "Men's Shoes"})["slug"] == "men-s-shoes"
+    slugs = db.products.distinct("slug")
+    assert len(slugs) == total_products
+    assert db.products.find_one({"name": "Chelsea Boots", "categoryName": "Shoes"})["slug"] == "chelsea-boots"
+    assert db.products.find_one({"name": "Chelsea Boots", "categoryName": "Men's Shoes"})["slug"] == \
+        "men-s-shoes-chelsea-boots"
+
+    # A second run only updates
+    totals = catalog_db.sync_catalog(db, womens, mens)
+    assert totals["categories"]["upserted"] == totals["products"]["upserted"] == 0
+    assert totals["products"]["matched"] == total_products
+    assert db.products.count_documents({}) == total_products
@@ -0,0 +1,133 @@
+import os
+import json
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import downloader
+
+BODY = bytes(range(256)) * 64
+ETAG = '"v1"'
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """Serves BODY with Range / If-Range support; the server's `plan` scripts the first responses"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(dict(self.headers))
+        step = server.plan.pop(0) if server.plan else "ok"
+        if step == "busy":
+            return self._send(503, {}, b"busy")
+
+        start = 0
+        range_header = self.headers.get("Range")
+        if range_header and self.headers.get("If-Range") == ETAG:
+            start = int(range_header.split("=")[1].split("-")[0])
+        if step == "wrong-range":
+            # Claims a partial response but sends the file from the beginning
+            return self._send(206, {"Content-Range": f"bytes 0-{len(BODY) - 1}/{len(BODY)}"}, BODY)
+        if start:
+            return self._send(206, {"Content-Range": f"bytes {start}-{len(BODY) - 1}/{len(BODY)}"}, BODY[start:])
+        body = BODY[:len(BODY) // 2] if step == "drop" else BODY
+        self._send(200, {}, body, length=len(BODY))
+
+    def _send(self, status, headers, body, length=None):
+        self.send_response(status)
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(length if length is not None else len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+        if length is not None and length != len(body):
+            # Connection dies mid-transfer
+            self.close_connection = True
+
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setattr(downloader.time, "sleep", lambda seconds: None)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RangeHandler)
+    server.plan = []
+    server.requests = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/original.jpg"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def assert_complete(result, dest):
+    assert result["ok"], result["error"]
+    assert result["size"] == len(BODY)
+    assert result["sha256"] == hashlib.sha256(BODY).hexdigest()
+    with open(dest, "rb") as f:
+        assert f.read() == BODY
+    assert not os.path.exists(f"{dest}.part") and not os.path.exists(f"{dest}.part.json")
+
+
+def test_download_reports_sha256_and_headers(server, tmp_path):
+    dest = str(tmp_path / "original.jpg")
+    result = downloader.download_file(server.url, dest)
+    assert_complete(result, dest)
+    assert result["status"] == 200
+    assert result["headers"]["ETag"] == ETAG
+
+
+def test_partial_file_is_resumed_with_a_range_request(server, tmp_path):
+    dest = str(tmp_path / "original.jpg")
+    with open(f"{dest}.part", "wb") as f:
+        f.write(BODY[:5000])
+    with open(f"{dest}.part.json", "w", encoding="utf-8") as f:
+        json.dump({"validator": ETAG}, f)
+
+    result = downloader.download_file(server.url, dest)
+
+    assert_complete(result, dest)
+    assert result["status"] == 206
+    assert server.requests[0]["Range"] == "bytes=5000-"
+
+
+def test_retries_continue_from_what_already_arrived(server, tmp_path):
+    dest = str(tmp_path / "original.jpg")
+    server.plan = ["busy", "drop"]
+
+    result = downloader.download_file(server.url, dest, retries=3, chunk_size=1024)
+
+    assert_complete(result, dest)
+    assert len(server.requests) == 3
+    assert "Range" not in server.requests[1]
+    assert server.requests[2]["Range"].startswith("bytes=")
+    assert result["status"] == 206
+
+
+def test_mismatched_content_range_restarts_from_zero(server, tmp_path):
+    dest = str(tmp_path / "original.jpg")
+    with open(f"{dest}.part", "wb") as f:
+        f.write(BODY[:5000])
+    with open(f"{dest}.part.json", "w", encoding="utf-8") as f:
+        json.dump({"validator": ETAG}, f)
+    server.plan = ["wrong-range"]
+
+    result = downloader.download_file(server.url, dest)
+
+    assert_complete(result, dest)
+    assert result["status"] == 200
+    assert "Range" not in server.requests[1]
+
+
+def test_gives_up_after_the_retries(server, tmp_path):
+    server.plan = ["busy"] * 3
+    result = downloader.download_file(server.url, str(tmp_path / "original.jpg"), retries=2)
+    assert not result["ok"]
+    assert result["error"] == "HTTP 503"
+    assert len(server.requests) == 3
@@ -0,0 +1,70 @@
+import pytest
+from selenium.common.exceptions import SessionNotCreatedException
+
+import browser_profile
+import driver_cache
+
+
+class FakeManager:
+    """ChromeDriverManager stand-in: each install() hands out a new driver binary"""
+
+    installs = []
+
+    def __init__(self, driver_version=None):
+        self.driver_version = driver_version
+
+    def install(self):
+        path = f"chromedriver-{len(FakeManager.installs) + 1}"
+        open(path, "w").close()
+        FakeManager.installs.append(path)
+        return path
+
+
+class FakeChrome:
+    """Refuses the drivers built for an older Chrome"""
+
+    outdated = set()
+
+    def __init__(self, service, options):
+        if service.path in FakeChrome.outdated:
+            raise SessionNotCreatedException("session not created: This version of ChromeDriver only supports "
+                                             "Chrome version 120")
+        self.service = service
+
+
+@pytest.fixture(autouse=True)
+def fake_manager(tmp_path, monkeypatch):
+    # The driver record lives under ./.cache
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(driver_cache, "ChromeDriverManager", FakeManager)
+    monkeypatch.delenv("CHROMEDRIVER_VERSION", raising=False)
+    FakeManager.installs = []
+    FakeChrome.outdated = set()
+
+
+def test_cached_driver_is_reused_within_ttl():
+    first = driver_cache.resolve_chromedriver()
+    assert driver_cache.resolve_chromedriver() == first
+    assert FakeManager.installs == [first]
+    assert driver_cache.resolve_chromedriver(ttl=0) != first
+
+
+def test_version_mismatch_drops_the_cached_driver_and_retries_once():
+    stale = driver_cache.resolve_chromedriver()
+    FakeChrome.outdated.add(stale)
+
+    driver = browser_profile.start_chrome(browser_profile.Options(), FakeChrome)
+
+    assert driver.service.path != stale
+    assert driver_cache.resolve_chromedriver() == driver.service.path
+    assert len(FakeManager.installs) == 2
+
+
+def test_persistent_mismatch_is_raised_after_one_retry():
+    class BrokenChrome(FakeChrome):
+        def __init__(self, service, options):
+            raise SessionNotCreatedException("session not created")
+
+    with pytest.raises(SessionNotCreatedException):
+        browser_profile.start_chrome(browser_profile.Options(), BrokenChrome)
+    assert len(FakeManager.installs) == 2
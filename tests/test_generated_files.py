@@ -0,0 +1,36 @@
+import os
+
+import pytest
+
+import generated_files
+
+
+def test_unchanged_write_keeps_the_mtime(tmp_path):
+    path = str(tmp_path / "products" / "handbags.ts")
+    assert generated_files.write_if_changed(path, "export default [];\n")
+    os.utime(path, (1_000_000, 1_000_000))
+
+    assert not generated_files.write_if_changed(path, "export default [];\n")
+    assert os.stat(path).st_mtime == 1_000_000
+
+    assert generated_files.write_if_changed(path, "export default [1];\n")
+    assert os.stat(path).st_mtime != 1_000_000
+    assert os.listdir(tmp_path / "products") == ["handbags.ts"]
+
+
+def test_failed_write_leaves_no_temp_file(tmp_path, monkeypatch):
+    path = str(tmp_path / "handbags.ts")
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(generated_files.os, "replace", fail)
+    with pytest.raises(OSError):
+        generated_files.write_if_changed(path, "export default [];\n")
+    assert os.listdir(tmp_path) == []
+
+
+def test_write_modules_returns_only_changed_paths(tmp_path):
+    files = {str(tmp_path / "a.ts"): "a", str(tmp_path / "b.ts"): "b"}
+    assert generated_files.write_modules(files) == list(files)
+    assert generated_files.write_modules({**files, str(tmp_path / "b.ts"): "b2"}) == [str(tmp_path / "b.ts")]
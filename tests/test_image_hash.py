@@ -0,0 +1,64 @@
+import io
+import random
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from image_hash import DEFAULT_MAX_DISTANCE, HASH_FUNCTIONS, BKTree, NearDuplicateIndex, hamming
+
+
+def photo(seed):
+    """A smooth, photo-like 640x480 image"""
+    rng = np.random.default_rng(seed)
+    return Image.fromarray((rng.random((12, 16, 3)) * 255).astype("uint8")).resize((640, 480), Image.BICUBIC)
+
+
+def cdn_copy(image):
+    """The same photo as another CDN serves it: smaller and re-encoded at JPEG q60"""
+    buffer = io.BytesIO()
+    image.resize((400, 300), Image.LANCZOS).save(buffer, "JPEG", quality=60)
+    buffer.seek(0)
+    return Image.open(buffer)
+
+
+def test_hamming():
+    assert hamming(0, 0) == 0
+    assert hamming(0b1011, 0b0001) == 2
+    assert hamming(0, (1 << 64) - 1) == 64
+
+
+@pytest.mark.parametrize("hash_name", sorted(HASH_FUNCTIONS))
+def test_default_distance_separates_copies_from_other_photos(hash_name):
+    hash_func = HASH_FUNCTIONS[hash_name]
+    for seed in range(10):
+        original = hash_func(photo(seed))
+        assert hamming(original, hash_func(cdn_copy(photo(seed)))) <= DEFAULT_MAX_DISTANCE
+        assert hamming(original, hash_func(photo(seed + 100))) > DEFAULT_MAX_DISTANCE
+
+
+def test_bktree_search_matches_a_linear_scan():
+    rng = random.Random(7)
+    keys = [rng.getrandbits(64) for _ in range(500)]
+    # A few near neighbours of the first key, so the radius actually catches something
+    keys += [keys[0] ^ (1 << bit) ^ (1 << (bit + 9)) for bit in range(0, 40, 5)]
+    tree = BKTree()
+    for i, key in enumerate(keys):
+        tree.add(key, i)
+    assert len(tree) == len(keys)
+
+    for query in (keys[0], rng.getrandbits(64), keys[42] ^ 0b111):
+        for radius in (0, 3, DEFAULT_MAX_DISTANCE):
+            expected = sorted(hamming(query, key) for key in keys if hamming(query, key) <= radius)
+            matches = tree.search(query, radius)
+            assert [distance for distance, _ in matches] == expected
+            assert all(hamming(query, keys[item]) == distance for distance, item in matches)
+
+
+def test_index_rejects_a_near_duplicate_within_the_threshold():
+    index = NearDuplicateIndex()
+    original = HASH_FUNCTIONS["dhash"](photo(1))
+    assert index.add("https://a.example/1.jpg", original)
+    assert index.find(HASH_FUNCTIONS["dhash"](cdn_copy(photo(1))))[1] == "https://a.example/1.jpg"
+    assert index.find(HASH_FUNCTIONS["dhash"](photo(2))) is None
+    assert index.find(original ^ ((1 << (DEFAULT_MAX_DISTANCE + 1)) - 1)) is None
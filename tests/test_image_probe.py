@@ -0,0 +1,54 @@
+import io
+
+import pytest
+from PIL import Image
+
+from image_probe import fits, parse_image_header
+
+
+def encode(fmt, size=(321, 123), mode="RGB", **params):
+    buffer = io.BytesIO()
+    Image.new(mode, size, "teal").save(buffer, fmt, **params)
+    return buffer.getvalue()
+
+
+IMAGES = {
+    "png": encode("PNG"),
+    "gif": encode("GIF"),
+    "jpeg": encode("JPEG", quality=85),
+    "jpeg-progressive": encode("JPEG", progressive=True),
+    # A large APP2 block before the frame header, like an embedded ICC profile
+    "jpeg-icc": encode("JPEG", icc_profile=b"\0" * 20000),
+    "webp-lossy": encode("WEBP", quality=80),
+    "webp-lossless": encode("WEBP", lossless=True),
+    "webp-alpha": encode("WEBP", mode="RGBA"),
+}
+
+
+@pytest.mark.parametrize("name", sorted(IMAGES))
+def test_full_header_parses(name):
+    info = parse_image_header(IMAGES[name])
+    assert info == {"format": name.split("-")[0], "width": 321, "height": 123}
+
+
+@pytest.mark.parametrize("name", sorted(IMAGES))
+def test_truncated_header_is_never_misread(name):
+    data = IMAGES[name]
+    expected = parse_image_header(data)
+    for end in range(len(data)):
+        info = parse_image_header(data[:end])
+        assert info is None or info == expected, end
+
+
+def test_unknown_and_empty_data():
+    assert parse_image_header(b"") is None
+    assert parse_image_header(b"<html><body>Not found</body></html>") is None
+
+
+def test_fits():
+    info = {"format": "jpeg", "width": 800, "height": 1000}
+    assert fits(info, min_width=600, min_height=800, min_ratio=0.6, max_ratio=0.9)
+    assert not fits(info, min_width=1000)
+    assert not fits(info, max_ratio=0.7)
+    assert not fits(None)
+    assert not fits({"format": "gif", "width": 0, "height": 10})
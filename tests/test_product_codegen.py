@@ -0,0 +1,102 @@
+import json
+
+import pytest
+
+import fix_product_images
+import product_codegen
+from image_mirror import mirror_images
+
+WOMENS = {
+    "handbags": {
+        "cat_id": "cat-1", "cat_name": "Handbags", "cat_slug": "handbags", "base_price": 800, "price_step": 50,
+        "names": ["Quilted Shoulder Bag", "Structured Tote"],
+    },
+    "shoes": {
+        "cat_id": "cat-3", "cat_name": "Shoes", "cat_slug": "shoes", "base_price": 400, "price_step": 30,
+        "names": ["Chelsea Boots", "Ballet Flats"],
+    },
+}
+MENS = {
+    "mens-shoes": {
+        "cat_id": "mens-cat-3", "cat_name": "Men's Shoes", "cat_slug": "mens-shoes", "base_price": 500,
+        "price_step": 40, "names": ["Chelsea Boots", "Oxford Shoes"],
+    },
+}
+
+
+@pytest.fixture
+def mirrored_catalog(image_urls, tmp_path, monkeypatch):
+    """Generated modules (under tmp_path) with the handbags images mirrored, as after a --mirror run"""
+    monkeypatch.chdir(tmp_path)
+    mirrored = mirror_images(image_urls, processes=1)
+    assert set(mirrored) == set(image_urls)
+
+    womens = {cat: dict(cat_data) for cat, cat_data in WOMENS.items()}
+    womens["handbags"]["images"] = image_urls
+    womens["shoes"]["images"] = ["https://example.com/boots.jpg", "https://example.com/flats.jpg"]
+    product_codegen.write_modules(product_codegen.generate_product_modules(womens, MENS, mirrored))
+    return image_urls
+
+
+def test_mirrored_modules_read_back_their_sources(mirrored_catalog):
+    products = product_codegen.read_generated_products("handbags")
+    assert all(product["image"].startswith("/images/products/") for product in products)
+    assert [product["imageSource"] for product in products] == mirrored_catalog
+    assert "imageSource" not in product_codegen.read_generated_products("shoes")[0]
+
+    womens = product_codegen.read_generated_images(WOMENS)
+    assert womens["handbags"]["images"] == mirrored_catalog
+    assert set(product_codegen.read_generated_mirrored(WOMENS, MENS)) == set(mirrored_catalog)
+
+    # Regenerating from what was read back reproduces the modules exactly
+    files = product_codegen.generate_product_modules(womens, MENS, product_codegen.read_generated_mirrored(WOMENS))
+    assert product_codegen.write_modules(files) == []
+
+
+def test_updating_other_categories_keeps_mirrored_variants(mirrored_catalog):
+    before = product_codegen.read_generated_products("handbags")
+    assert all(product.get("imageSrcSet") and product.get("imageWidth") == 700 for product in before)
+
+    changed = product_codegen.update_category_images(
+        {"shoes": ["https://example.com/mules.jpg", "https://example.com/pumps.jpg"]}, WOMENS, MENS)
+
+    assert changed == ["src/data/products/shoes.ts"]
+    assert product_codegen.read_generated_products("handbags") == before
+    assert product_codegen.read_generated_images(WOMENS)["shoes"]["images"][0] == "https://example.com/mules.jpg"
+
+
+def test_build_product_is_byte_identical_for_the_same_seed():
+    def render(seed):
+        product = product_codegen.build_product(WOMENS["handbags"], 1, 2, "https://example.com/tote.jpg", seed=seed)
+        return json.dumps(product, ensure_ascii=False)
+
+    assert render("luxe-catalog") == render("luxe-catalog")
+    assert render("luxe-catalog") != render("another-seed")
+
+    # A product's values don't depend on what else is in the catalog
+    alone = product_codegen.build_catalogs({"handbags": {**WOMENS["handbags"], "images": ["a", "b"]}}, {})
+    together = product_codegen.build_catalogs(
+        {cat: {**cat_data, "images": ["a", "b"]} for cat, cat_data in WOMENS.items()}, MENS)
+    assert alone[0]["handbags"] == together[0]["handbags"]
+
+
+def test_generated_modules_are_stable_across_runs():
+    womens = {cat: {**cat_data, "images": ["https://example.com/1.jpg"]} for cat, cat_data in WOMENS.items()}
+    mens = {cat: {**cat_data, "images": []} for cat, cat_data in MENS.items()}
+    assert product_codegen.generate_product_modules(womens, mens) == product_codegen.generate_product_modules(womens, mens)
+
+
+def test_unique_slugs_prefix_later_collisions_with_their_category():
+    slugs = product_codegen.unique_slugs(WOMENS, MENS)
+    assert slugs[("shoes", "Chelsea Boots")] == "chelsea-boots"
+    assert slugs[("mens-shoes", "Chelsea Boots")] == "mens-shoes-chelsea-boots"
+    assert slugs[("handbags", "Quilted Shoulder Bag")] == "quilted-shoulder-bag"
+    assert len(set(slugs.values())) == len(slugs)
+
+
+def test_unique_slugs_across_the_real_catalog():
+    slugs = product_codegen.unique_slugs(fix_product_images.WOMENS_PRODUCTS, fix_product_images.MENS_PRODUCTS)
+    total = sum(len(cat["names"]) for data in (fix_product_images.WOMENS_PRODUCTS, fix_product_images.MENS_PRODUCTS)
+                for cat in data.values())
+    assert len(slugs) == total
+    assert len(set(slugs.values())) == total
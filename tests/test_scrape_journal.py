@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+import async_engine
+import fix_product_images
+from benchmark import FakeImageSearchServer, searching
+from bing_search import BingSearch
+from rate_limit import HostRateLimiter
+from scrape_dedup import DedupRegistry
+from scrape_journal import ScrapeJournal
+
+CATEGORY = {
+    "cat_slug": "handbags",
+    "cat_name": "Handbags",
+    "search_suffix": "designer handbag",
+    "names": ["Quilted Chain Bag", "Leather Tote", "Mini Saddle Bag"],
+}
+
+
+@pytest.fixture
+def server():
+    with FakeImageSearchServer(search_latency=0, image_latency=0) as server, searching(server):
+        yield server
+
+
+def journal_lines(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def scrape_threaded(journal):
+    search = BingSearch(backend="http", limiter=HostRateLimiter(0))
+    used_urls = DedupRegistry(journal.used_urls())
+    try:
+        return fix_product_images.scrape_category(search, CATEGORY, used_urls, journal=journal)
+    finally:
+        search.close()
+
+
+def scrape_async(journal):
+    (results,) = async_engine.scrape_all([{"handbags": CATEGORY}], journal=journal, limiter=HostRateLimiter(0),
+                                         used_urls=DedupRegistry(journal.used_urls()))
+    return results["handbags"]["images"]
+
+
+@pytest.mark.parametrize("scrape", [scrape_threaded, scrape_async])
+def test_fresh_run_records_every_product_and_resume_skips_them(server, tmp_path, scrape):
+    path = str(tmp_path / "journal.jsonl")
+
+    journal = ScrapeJournal(path)
+    images = scrape(journal)
+    journal.close()
+
+    records = journal_lines(path)
+    assert sorted((r["category"], r["index"], r["name"]) for r in records) == [
+        ("handbags", i, name) for i, name in enumerate(CATEGORY["names"])
+    ]
+    assert [r["url"] for r in sorted(records, key=lambda r: r["index"])] == images
+
+    searches = server.requests["search"]
+    journal = ScrapeJournal(path, resume=True)
+    assert len(journal) == len(CATEGORY["names"])
+    assert scrape(journal) == images
+    journal.close()
+    assert server.requests["search"] == searches
@@ -0,0 +1,33 @@
+import product_codegen
+import scrape_pipeline
+from image_mirror import mirror_images
+from product_codegen import read_generated_images
+from scrape_dedup import DedupRegistry
+
+
+def test_skipped_product_stages_seed_the_registry():
+    handbags = read_generated_images(scrape_pipeline.fix_product_images.WOMENS_PRODUCTS)["handbags"]["images"]
+    watches = read_generated_images(scrape_pipeline.fix_product_images.MENS_PRODUCTS)["mens-watches"]["images"]
+
+    used_urls = DedupRegistry(scrape_pipeline.published_product_images(("categories", "story")))
+    assert not used_urls.claim(handbags[0])
+    assert not used_urls.claim(watches[0])
+    assert not any(url.startswith(scrape_pipeline.PLACEHOLDER_HOST) for url in used_urls.snapshot())
+
+    # A stage that re-scrapes its products releases its old images
+    urls = scrape_pipeline.published_product_images(("womens", "categories"))
+    assert handbags[0] not in urls and watches[0] in urls
+    assert scrape_pipeline.published_product_images(scrape_pipeline.STAGES) == set()
+
+
+def test_mirrored_product_images_seed_their_source_urls(image_urls, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    womens = {"handbags": {**scrape_pipeline.fix_product_images.WOMENS_PRODUCTS["handbags"], "images": image_urls}}
+    product_codegen.write_modules(
+        product_codegen.generate_product_modules(womens, {}, mirror_images(image_urls, processes=1)))
+    assert product_codegen.read_generated_products("handbags")[0]["image"].startswith("/images/products/")
+
+    # The rest of the category is padded with placeholders, which are left out
+    used_urls = DedupRegistry(scrape_pipeline.published_product_images(("categories", "story")))
+    assert used_urls.snapshot() == set(image_urls)
+    assert not used_urls.claim(image_urls[0])
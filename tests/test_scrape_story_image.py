@@ -0,0 +1,44 @@
+import os
+
+import pytest
+
+from benchmark import FakeImageSearchServer
+from image_store import ImageStore
+from scrape_dedup import DedupRegistry
+from scrape_story_image import download_image
+
+
+@pytest.fixture
+def server():
+    with FakeImageSearchServer(search_latency=0, image_latency=0) as server:
+        yield server
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ImageStore(root=str(tmp_path / "public" / "assets" / "cas"), index_path=str(tmp_path / "cache.db"),
+                      public_root=str(tmp_path / "public"), staging_dir=str(tmp_path / "staging"))
+
+
+def test_failed_download_leaves_the_url_unclaimed(server, store, tmp_path):
+    used_urls = DedupRegistry()
+    save_path = str(tmp_path / "atelier_story.jpg")
+    broken = f"{server.base_url}/img/broken.png"
+
+    assert download_image(broken, save_path, store, claim=used_urls.claim) is None
+    assert broken not in used_urls
+    assert not os.path.exists(save_path)
+
+    image = f"{server.base_url}/img/atelier-1-1200x800.png"
+    assert download_image(image, save_path, store, claim=used_urls.claim).startswith("/assets/cas/")
+    assert image in used_urls
+    assert os.path.exists(save_path)
+
+
+def test_image_claimed_elsewhere_is_not_linked(server, store, tmp_path):
+    image = f"{server.base_url}/img/atelier-2-1200x800.png"
+    used_urls = DedupRegistry([image])
+    save_path = str(tmp_path / "atelier_story.jpg")
+
+    assert download_image(image, save_path, store, claim=used_urls.claim) is None
+    assert not os.path.exists(save_path)